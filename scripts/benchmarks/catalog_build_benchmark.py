@@ -0,0 +1,160 @@
+"""Benchmark the indexed crosswalk and streaming catalog build on a generated catalog.
+
+The quadratic crosswalk the indexed version replaced is only timed on a small prefix of
+the catalog (``--legacy-concepts``); on millions of concepts it runs for hours.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import sys
+import tempfile
+import time
+import types
+from collections.abc import MutableMapping, Sequence
+from pathlib import Path
+from typing import Iterable
+
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+# Import the catalog modules without executing the package ``__init__``, which
+# pulls in configuration and API dependencies.
+if "Medical_KG" not in sys.modules:
+    pkg = types.ModuleType("Medical_KG")
+    pkg.__path__ = [str(SRC_ROOT / "Medical_KG")]
+    sys.modules["Medical_KG"] = pkg
+
+from Medical_KG.catalog.loaders import ConceptLoader  # noqa: E402
+from Medical_KG.catalog.models import Concept, ConceptFamily, SynonymType  # noqa: E402
+from Medical_KG.catalog.pipeline import ConceptCatalogBuilder, CrosswalkBuilder  # noqa: E402
+
+_ONTOLOGIES = (
+    ("SNOMED", ConceptFamily.CONDITION),
+    ("RXNORM", ConceptFamily.DRUG),
+    ("LOINC", ConceptFamily.LAB),
+)
+
+
+class SyntheticLoader(ConceptLoader):
+    """Yield concepts whose CUIs and cross-references collide across ontologies."""
+
+    license_bucket = "open"
+
+    def __init__(self, ontology: str, family: ConceptFamily, count: int, *, seed: int) -> None:
+        super().__init__(release_version="bench")
+        self.ontology = ontology
+        self.family = family
+        self._count = count
+        self._seed = seed
+
+    def load(self) -> Iterable[Concept]:
+        rng = random.Random(f"{self.ontology}:{self._seed}")
+        cui_space = max(self._count // 2, 1)
+        for index in range(self._count):
+            label = f"{self.ontology} concept {index}"
+            yield self._build(
+                iri=f"https://example.org/{self.ontology.lower()}/{index}",
+                label=label,
+                preferred_term=label,
+                definition=None,
+                synonyms=[(f"{label} synonym", SynonymType.EXACT)],
+                codes={self.ontology.lower(): str(index)},
+                xrefs={"mesh": [f"D{rng.randrange(cui_space * 4)}"]},
+                attributes={"umls_cui": f"C{rng.randrange(cui_space)}"},
+            )
+
+
+def _legacy_crosswalk(concepts: Sequence[Concept]) -> None:
+    """The O(groups x concepts) crosswalk the indexed builder replaced."""
+
+    cui_groups: MutableMapping[str, set[str]] = {}
+    code_groups: MutableMapping[str, set[str]] = {}
+    for concept in concepts:
+        cui = concept.attributes.get("umls_cui") if concept.attributes else None
+        if cui:
+            cui_groups.setdefault(str(cui), set()).add(concept.iri)
+        for system, code in concept.codes.items():
+            code_groups.setdefault(f"{system}:{code}", set()).add(concept.iri)
+        for system, values in concept.xrefs.items():
+            for value in values:
+                code_groups.setdefault(f"{system}:{value}", set()).add(concept.iri)
+    for group in list(cui_groups.values()) + list(code_groups.values()):
+        if len(group) <= 1:
+            continue
+        for concept in concepts:
+            if concept.iri in group:
+                for iri in group:
+                    concept.ensure_same_as(iri)
+
+
+def _loaders(total: int, seed: int) -> list[SyntheticLoader]:
+    per_ontology = max(total // len(_ONTOLOGIES), 1)
+    return [
+        SyntheticLoader(ontology, family, per_ontology, seed=seed)
+        for ontology, family in _ONTOLOGIES
+    ]
+
+
+def _generate(total: int, seed: int) -> list[Concept]:
+    return [concept for loader in _loaders(total, seed) for concept in loader.load()]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=2_000_000, help="Generated catalog size")
+    parser.add_argument(
+        "--legacy-concepts",
+        type=int,
+        default=20_000,
+        help="Catalog size used to compare against the quadratic crosswalk",
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = _build_parser().parse_args(list(argv) if argv is not None else None)
+
+    sample = _generate(args.legacy_concepts, args.seed)
+    start = time.perf_counter()
+    _legacy_crosswalk(sample)
+    legacy = time.perf_counter() - start
+    sample = _generate(args.legacy_concepts, args.seed)
+    start = time.perf_counter()
+    CrosswalkBuilder().apply(sample)
+    indexed = time.perf_counter() - start
+    print(f"crosswalk on {len(sample):,} concepts")
+    print(f"{'quadratic':>20}: {legacy * 1000:10.1f} ms")
+    print(f"{'indexed':>20}: {indexed * 1000:10.1f} ms")
+    print(f"{'speed-up':>20}: {legacy / max(indexed, 1e-9):10.1f}x")
+
+    builder = ConceptCatalogBuilder(_loaders(args.concepts, args.seed))
+    with tempfile.TemporaryDirectory() as tmp:
+        audit_path = Path(tmp) / "audit.jsonl"
+        start = time.perf_counter()
+        result = builder.build_streaming(audit_path, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        spill_mb = audit_path.stat().st_size / 1024 / 1024
+    linked = sum(1 for concept in result.concepts if concept.same_as)
+    print(f"\nstreaming build of {len(result.concepts):,} concepts")
+    print(f"{'elapsed':>20}: {elapsed:10.1f} s")
+    print(f"{'concepts linked':>20}: {linked:10,d}")
+    spilled = result.audit_log.spilled
+    print(f"{'audit entries spilled':>20}: {spilled:10,d} ({spill_mb:.1f} MiB)")
+    print(f"{'peak RSS':>20}: {_peak_rss_mb():10.1f} MiB")
+    print(f"{'release hash':>20}: {result.release_hash[:16]}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+"""Benchmark embedding math in the chunking pipeline on a long synthetic document.
+
+Times the pure-Python routines the pipeline used to run (per-text
+``random.uniform`` vector generation, per-vector normalisation and pairwise
+cosine loops) against the NumPy implementations in
+``Medical_KG.utils.vectors``, then times a full ``ChunkingPipeline`` run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import math
+import random
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Iterable, Sequence
+
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+# Import the chunking modules without executing the package ``__init__``, which
+# pulls in configuration and API dependencies.
+if "Medical_KG" not in sys.modules:
+    pkg = types.ModuleType("Medical_KG")
+    pkg.__path__ = [str(SRC_ROOT / "Medical_KG")]
+    sys.modules["Medical_KG"] = pkg
+
+from Medical_KG.chunking.document import Document, Section  # noqa: E402
+from Medical_KG.chunking.pipeline import ChunkingPipeline  # noqa: E402
+from Medical_KG.embeddings.qwen import QwenEmbeddingClient  # noqa: E402
+from Medical_KG.embeddings.service import EmbeddingService  # noqa: E402
+from Medical_KG.embeddings.splade import SPLADEExpander  # noqa: E402
+from Medical_KG.utils.vectors import adjacent_cosine  # noqa: E402
+
+_SENTENCES = (
+    "Patients were randomised to pembrolizumab or placebo every three weeks.",
+    "The hazard ratio for overall survival was 0.72 (95% CI 0.61-0.85).",
+    "Grade 3 or higher adverse events occurred in 14% of participants.",
+    "Eligible adults had measurable disease and an ECOG status of 0 or 1.",
+    "Median progression-free survival improved from 5.1 to 8.3 months.",
+    "Dose reductions were permitted for neutropenia and hepatotoxicity.",
+)
+
+
+def synthetic_document(pages: int, *, sentences_per_page: int, seed: int) -> Document:
+    rng = random.Random(seed)
+    parts: list[str] = []
+    sections: list[Section] = []
+    offset = 0
+    for page in range(pages):
+        if page % 10 == 0:
+            heading = f"SECTION {page // 10 + 1}\n"
+            if sections:
+                sections[-1].end = offset
+            sections.append(Section(name=f"section-{page // 10 + 1}", start=offset, end=offset))
+            parts.append(heading)
+            offset += len(heading)
+        for _ in range(sentences_per_page):
+            sentence = rng.choice(_SENTENCES) + " "
+            parts.append(sentence)
+            offset += len(sentence)
+    text = "".join(parts)
+    if sections:
+        sections[-1].end = len(text)
+    return Document(doc_id="BENCH", text=text, sections=sections)
+
+
+def _legacy_vector(model: str, dimension: int, text: str) -> list[float]:
+    seed = hashlib.sha256((model + text).encode("utf-8")).digest()
+    rnd = random.Random(seed)
+    vector = [rnd.uniform(-1.0, 1.0) for _ in range(dimension)]
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+def _legacy_cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a)) or 1.0
+    norm_b = math.sqrt(sum(y * y for y in b)) or 1.0
+    return dot / (norm_a * norm_b)
+
+
+def _timed(label: str, func: "types.FunctionType") -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>34}: {elapsed * 1000:10.1f} ms")
+    return elapsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500, help="Synthetic document length")
+    parser.add_argument("--sentences-per-page", type=int, default=30)
+    parser.add_argument("--dimension", type=int, default=4096, help="Embedding dimension")
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=2000,
+        help="Texts used for the legacy/NumPy micro-benchmarks",
+    )
+    parser.add_argument("--seed", type=int, default=11)
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = _build_parser().parse_args(list(argv) if argv is not None else None)
+    document = synthetic_document(
+        args.pages, sentences_per_page=args.sentences_per_page, seed=args.seed
+    )
+    texts = [f"{sentence} #{index}" for index, sentence in enumerate(_SENTENCES * args.sample)][
+        : args.sample
+    ]
+    client = QwenEmbeddingClient(dimension=args.dimension)
+    print(f"{args.sample} texts, dimension {args.dimension}")
+
+    legacy: list[list[float]] = []
+    before = _timed(
+        "legacy vectors + normalise",
+        lambda: legacy.extend(_legacy_vector(client.model, args.dimension, t) for t in texts),
+    )
+    after = _timed("numpy embed_array", lambda: client.embed_array(texts))
+    print(f"{'speed-up':>34}: {before / max(after, 1e-9):10.1f}x")
+
+    matrix = client.embed_array(texts)
+    before = _timed(
+        "legacy adjacent cosine loop",
+        lambda: [_legacy_cosine(a, b) for a, b in zip(legacy, legacy[1:])],
+    )
+    after = _timed("numpy adjacent_cosine", lambda: adjacent_cosine(matrix))
+    print(f"{'speed-up':>34}: {before / max(after, 1e-9):10.1f}x")
+
+    service = EmbeddingService(
+        qwen=QwenEmbeddingClient(dimension=args.dimension), splade=SPLADEExpander()
+    )
+    pipeline = ChunkingPipeline(embedding_service=service)
+    print(f"\n{args.pages}-page document ({len(document.text):,} characters)")
+    result = None
+
+    def _run() -> None:
+        nonlocal result
+        result = pipeline.run(document)
+
+    _timed("ChunkingPipeline.run", _run)
+    service.close()
+    if result is not None:
+        print(f"{'chunks':>34}: {len(result.chunks):10d}")
+        print(f"{'neighbor merges':>34}: {len(result.neighbor_merges):10d}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""Benchmark incremental document facet aggregation against full per-chunk re-deduplication.
+
+Facets are generated once for a synthetic document of ``--chunks`` chunks, then stored chunk
+by chunk into the legacy storage (which re-parsed and re-deduplicated the whole document on
+every ``set``) and into :class:`FacetStorage`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import types
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable
+
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+# Import the facet modules without executing the package ``__init__``, which
+# pulls in configuration and API dependencies.
+if "Medical_KG" not in sys.modules:
+    pkg = types.ModuleType("Medical_KG")
+    pkg.__path__ = [str(SRC_ROOT / "Medical_KG")]
+    sys.modules["Medical_KG"] = pkg
+
+from Medical_KG.facets.dedup import deduplicate_facets  # noqa: E402
+from Medical_KG.facets.generator import load_facets, serialize_facets  # noqa: E402
+from Medical_KG.facets.models import FacetModel  # noqa: E402
+from Medical_KG.facets.service import Chunk, FacetService, FacetStorage  # noqa: E402
+
+_TEMPLATES = (
+    "Grade {grade} nausea occurred in {n}/100 treatment arm patients.",
+    "Patients receiving the treatment arm had a hazard ratio 0.{hr} (0.52-0.88, p=0.01).",
+    "Grade {grade} headache was reported in {n}/200 participants taking Enalapril 10mg PO BID.",
+)
+
+
+class LegacyFacetStorage:
+    """The storage this benchmark replaced: every ``set`` rebuilds the document aggregate."""
+
+    def __init__(self) -> None:
+        self._by_chunk: dict[str, list[str]] = {}
+        self._doc_chunks: dict[str, set[str]] = defaultdict(set)
+        self._doc_cache: dict[str, list[str]] = {}
+
+    def set(self, chunk_id: str, doc_id: str, facets: Iterable[FacetModel]) -> None:
+        self._by_chunk[chunk_id] = serialize_facets(list(facets))
+        self._doc_chunks[doc_id].add(chunk_id)
+        payloads: list[str] = []
+        for member in self._doc_chunks[doc_id]:
+            payloads.extend(self._by_chunk.get(member, []))
+        deduped = deduplicate_facets(load_facets(payloads))
+        self._doc_cache[doc_id] = [facet.model_dump_json(by_alias=True) for facet in deduped]
+
+
+def _chunks(count: int) -> list[Chunk]:
+    chunks: list[Chunk] = []
+    for index in range(count):
+        template = _TEMPLATES[index % len(_TEMPLATES)]
+        text = template.format(grade=1 + index % 3, n=5 + index % 40, hr=55 + index % 30)
+        chunks.append(Chunk(chunk_id=f"chunk-{index}", doc_id="doc", text=text, section="results"))
+    return chunks
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=300, help="Chunks in the synthetic document")
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = _build_parser().parse_args(list(argv) if argv is not None else None)
+    chunks = _chunks(args.chunks)
+    generated = FacetService().generate_for_chunks(chunks)
+    total_facets = sum(len(facets) for facets in generated.values())
+
+    def store(storage: LegacyFacetStorage | FacetStorage) -> float:
+        start = time.perf_counter()
+        for chunk in chunks:
+            storage.set(chunk.chunk_id, chunk.doc_id, generated[chunk.chunk_id])
+        return time.perf_counter() - start
+
+    legacy = min(store(LegacyFacetStorage()) for _ in range(args.repeat))
+    incremental = min(store(FacetStorage()) for _ in range(args.repeat))
+    storage = FacetStorage()
+    store(storage)
+    print(f"{len(chunks)} chunks, {total_facets} facets")
+    print(f"{'document facets':>20}: {len(storage.get_document_facets('doc')):10d}")
+    print(f"{'legacy set':>20}: {legacy * 1000:10.1f} ms")
+    print(f"{'incremental set':>20}: {incremental * 1000:10.1f} ms")
+    print(f"{'speed-up':>20}: {legacy / max(incremental, 1e-9):10.1f}x")
+
+    start = time.perf_counter()
+    FacetService().generate_for_chunks(chunks)
+    print(f"{'generate_for_chunks':>20}: {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
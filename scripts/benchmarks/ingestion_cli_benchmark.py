@@ -1,25 +1,51 @@
 #!/usr/bin/env python3
-"""Placeholder benchmark harness for the unified ingestion CLI.
+"""Benchmark harness for the unified ingestion CLI.
 
-This script will be extended during rollout readiness (Task 16.6) to
-exercise large NDJSON batches against staging adapters and capture
-throughput metrics. For now it records the CLI startup overhead for a
-`--dry-run` invocation to provide a baseline datapoint.
+By default the script records the CLI wall time for an adapter run (use
+``--dry-run`` to skip adapter execution). With ``--loader`` it instead compares
+NDJSON batch loading: the previous loader, which counted the file in a first
+pass and then decoded and validated line by line, against
+:class:`NdjsonBatchReader` with one and with ``--validation-workers`` processes.
+A synthetic batch of ``--records`` entries is generated unless ``--batch`` is
+given.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import re
+import sys
+import tempfile
 import time
+import types
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Callable, Sequence
 
-from typer.testing import CliRunner
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
 
-from Medical_KG.ingestion import cli
+# Import the ingestion modules without executing the package ``__init__``, which
+# pulls in configuration and API dependencies. Loader worker processes re-import
+# this module, so this also keeps their start-up cheap.
+if "Medical_KG" not in sys.modules:
+    pkg = types.ModuleType("Medical_KG")
+    pkg.__path__ = [str(SRC_ROOT / "Medical_KG")]
+    sys.modules["Medical_KG"] = pkg
+
+from Medical_KG.ingestion.cli_helpers import NdjsonBatchReader, count_ndjson_records  # noqa: E402
+
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_PMID = re.compile(r"^\d{6,9}$")
 
 
 def run_once(argv: Sequence[str]) -> float:
+    from typer.testing import CliRunner
+
+    from Medical_KG.ingestion import cli
+
     runner = CliRunner()
     started = time.perf_counter()
     result = runner.invoke(cli.app, list(argv))
@@ -29,15 +55,118 @@ def run_once(argv: Sequence[str]) -> float:
     return duration
 
 
+def validate_params(record: dict[str, Any]) -> None:
+    """Schema-like check of one batch entry (module level so workers can unpickle it)."""
+
+    for key, kind in (("source", str), ("ids", list), ("page_size", int), ("start_date", str)):
+        if not isinstance(record.get(key), kind):
+            raise ValueError(f"{key} must be {kind.__name__}")
+    if not _DATE.match(record["start_date"]):
+        raise ValueError("start_date must be YYYY-MM-DD")
+    if not 1 <= record["page_size"] <= 1000:
+        raise ValueError("page_size out of range")
+    for identifier in record["ids"]:
+        if not isinstance(identifier, str) or not _PMID.match(identifier):
+            raise ValueError(f"invalid id {identifier!r}")
+    query = record.get("query")
+    if query is not None and not isinstance(query, str):
+        raise ValueError("query must be a string")
+
+
+def _write_batch(path: Path, records: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for index in range(records):
+            entry = {
+                "source": "pubmed",
+                "ids": [str(10_000_000 + index * 5 + offset) for offset in range(5)],
+                "query": f"hypertension trial {index % 997}",
+                "page_size": 100,
+                "start_date": f"20{10 + index % 15:02d}-0{1 + index % 9}-1{index % 10}",
+            }
+            handle.write(json.dumps(entry))
+            handle.write("\n")
+
+
+def _legacy_load(path: Path, validator: Callable[[dict[str, Any]], None] | None) -> int:
+    """The loader ``NdjsonBatchReader`` replaced: a counting pass, then json.loads per line."""
+
+    count_ndjson_records(path)
+    count = 0
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = dict(json.loads(line))
+            if validator is not None:
+                validator(record)
+            count += 1
+    return count
+
+
+def _reader_load(
+    path: Path, validator: Callable[[dict[str, Any]], None] | None, workers: int
+) -> int:
+    reader = NdjsonBatchReader(path, validator=validator, workers=workers)
+    for _ in reader:
+        pass
+    return reader.count
+
+
+def _run_loader(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.batch
+        if path is None:
+            path = Path(tmp) / "batch.ndjson"
+            _write_batch(path, args.records)
+        size_mib = path.stat().st_size / 1024 / 1024
+        variants: list[tuple[str, Callable[[], int]]] = [
+            ("legacy", lambda: _legacy_load(path, None)),
+            ("reader", lambda: _reader_load(path, None, 1)),
+            ("legacy + validate", lambda: _legacy_load(path, validate_params)),
+            ("reader + validate", lambda: _reader_load(path, validate_params, 1)),
+        ]
+        if args.validation_workers > 1:
+            label = f"reader + validate x{args.validation_workers}"
+            variants.append(
+                (label, lambda: _reader_load(path, validate_params, args.validation_workers))
+            )
+        print(f"batch: {path} ({size_mib:.1f} MiB)")
+        for label, load in variants:
+            started = time.perf_counter()
+            records = load()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{label:>28}: {elapsed:8.2f} s {records / elapsed:12,.0f} rec/s"
+                f" {size_mib / elapsed:8.1f} MiB/s"
+            )
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("adapter", help="Adapter to benchmark (must exist in registry)")
-    parser.add_argument("--batch", type=Path, required=True, help="NDJSON payload for benchmarking")
+    parser.add_argument("adapter", nargs="?", help="Adapter to benchmark (must exist in registry)")
+    parser.add_argument("--batch", type=Path, help="NDJSON payload for benchmarking")
     parser.add_argument("--iterations", type=int, default=3, help="Number of runs to average")
     parser.add_argument(
         "--dry-run", action="store_true", help="Use --dry-run to avoid adapter execution"
     )
+    parser.add_argument(
+        "--loader", action="store_true", help="Benchmark NDJSON batch loading instead of the CLI"
+    )
+    parser.add_argument(
+        "--records", type=int, default=1_000_000, help="Generated batch size for --loader"
+    )
+    parser.add_argument(
+        "--validation-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Validation processes for the parallel --loader variant",
+    )
     args = parser.parse_args(argv)
+    if args.loader:
+        return _run_loader(args)
+    if args.adapter is None or args.batch is None:
+        parser.error("adapter and --batch are required unless --loader is given")
 
     argv_template = [args.adapter, "--batch", str(args.batch), "--summary-only"]
     if args.dry_run:
@@ -51,6 +180,4 @@ def main(argv: list[str] | None = None) -> int:
 
 
 if __name__ == "__main__":
-    import sys
-
     raise SystemExit(main(sys.argv[1:]))
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import resource
 import statistics
+import subprocess
 import sys
 import time
 import types
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Iterable
@@ -74,7 +77,16 @@ if "httpx" not in sys.modules:  # pragma: no cover - optional dependency shim
         httpx_module.Request = _Request
         sys.modules["httpx"] = httpx_module
 
-from Medical_KG.ingestion.ledger import IngestionLedger, LedgerState
+from Medical_KG.ingestion.ledger import (  # noqa: E402
+    IngestionLedger,
+    LedgerAuditRecord,
+    LedgerHistoryStore,
+    LedgerState,
+)
+from Medical_KG.ingestion.ledger_segments import (  # noqa: E402
+    LedgerSegmentStore,
+    SegmentedIngestionLedger,
+)
 
 _DEFAULT_SEQUENCE: tuple[LedgerState, ...] = (
     LedgerState.PENDING,
@@ -100,6 +112,75 @@ def _generate_documents(ledger: IngestionLedger, documents: int) -> int:
     return transitions
 
 
+def _generate_documents_batched(ledger: IngestionLedger, documents: int) -> int:
+    transitions = 0
+    for index in range(documents):
+        transitions += len(ledger.transition_path(f"doc-{index}", _DEFAULT_SEQUENCE))
+    return transitions
+
+
+def _measure_throughput(workdir: Path, documents: int) -> dict[str, float]:
+    """Compare transitions/sec of per-call updates against group commits."""
+
+    results: dict[str, float] = {}
+    for label, generator in (
+        ("update_state", _generate_documents),
+        ("transition_path", _generate_documents_batched),
+    ):
+        ledger = IngestionLedger(workdir / f"throughput-{label}.jsonl")
+        start = time.perf_counter()
+        transitions = generator(ledger, documents)
+        elapsed = time.perf_counter() - start
+        ledger.close()
+        results[label] = transitions / elapsed
+        print(f"{label:>16}: {results[label]:,.0f} transitions/sec ({transitions} transitions)")
+    print(f"Group commit speedup: {results['transition_path'] / results['update_state']:.2f}x")
+    return results
+
+
+class _InlineSnapshotLedger(IngestionLedger):
+    """Ledger that serialises snapshots while holding the lock, as before background snapshots."""
+
+    def _snapshot_in_background(self) -> None:
+        job = self._begin_snapshot(None)
+        self._write_snapshot(job)
+        self._finish_snapshot(job)
+
+
+def _measure_snapshot_latency(
+    workdir: Path, documents: int, updates: int
+) -> dict[str, dict[str, float]]:
+    """Report update_state latency while an automatic snapshot of ``documents`` is taken."""
+
+    results: dict[str, dict[str, float]] = {}
+    for label, ledger_cls in (("inline", _InlineSnapshotLedger), ("background", IngestionLedger)):
+        ledger = ledger_cls(
+            workdir / f"latency-{label}.jsonl", auto_snapshot_interval=timedelta(days=1)
+        )
+        _generate_documents_batched(ledger, documents)
+        ledger._last_snapshot_at = datetime.now(timezone.utc) - timedelta(days=2)
+        latencies: list[float] = []
+        for index in range(updates):
+            start = time.perf_counter()
+            ledger.update_state(f"new-{index}", LedgerState.PENDING)
+            latencies.append(time.perf_counter() - start)
+        ledger.close()
+        ordered = sorted(latencies)
+        results[label] = {
+            "max_ms": ordered[-1] * 1000,
+            "p99_ms": ordered[int(0.99 * (len(ordered) - 1))] * 1000,
+            "median_ms": statistics.median(ordered) * 1000,
+        }
+        summary = results[label]
+        print(
+            f"{label:>10}: max={summary['max_ms']:.1f}ms p99={summary['p99_ms']:.3f}ms "
+            f"median={summary['median_ms']:.3f}ms ({documents} documents, {updates} updates)"
+        )
+    speedup = results["inline"]["max_ms"] / results["background"]["max_ms"]
+    print(f"Worst-case update_state speedup: {speedup:.1f}x")
+    return results
+
+
 def _measure_load_time(path: Path, samples: int) -> list[float]:
     results: list[float] = []
     for _ in range(samples):
@@ -111,6 +192,127 @@ def _measure_load_time(path: Path, samples: int) -> list[float]:
     return results
 
 
+def _synthetic_audits(records: int) -> Iterable[LedgerAuditRecord]:
+    """Yield ``records`` audit rows walking documents through the default sequence."""
+
+    timestamp = time.time() - records
+    transitions = list(zip(_DEFAULT_SEQUENCE, _DEFAULT_SEQUENCE[1:]))
+    for index in range(records):
+        old_state, new_state = transitions[index % len(transitions)]
+        yield LedgerAuditRecord(
+            doc_id=f"doc-{index // len(transitions)}",
+            old_state=old_state,
+            new_state=new_state,
+            timestamp=timestamp + index,
+            adapter="benchmark",
+            metadata={"attempt": 1} if new_state is LedgerState.FETCHED else {},
+        )
+
+
+def _write_jsonl_ledger(path: Path, records: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for audit in _synthetic_audits(records):
+            handle.write(json.dumps(audit.to_dict()) + "\n")
+
+
+def _write_segment_ledger(path: Path, records: int) -> None:
+    store = LedgerSegmentStore(path)
+    try:
+        for audit in _synthetic_audits(records):
+            store.append(audit, replace_metadata=bool(audit.metadata))
+    finally:
+        store.close()
+
+
+def _probe_cold_start(storage: str, path: Path) -> dict[str, float]:
+    """Open a ledger in this process and report wall time and peak RSS."""
+
+    start = time.perf_counter()
+    ledger: IngestionLedger
+    if storage == "segments":
+        ledger = SegmentedIngestionLedger(path)
+    else:
+        ledger = IngestionLedger(path)
+    ledger.get("doc-0")
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"seconds": elapsed, "rss_mb": peak_kb / 1024}
+
+
+def _measure_cold_start(storage: str, path: Path) -> dict[str, float]:
+    # Each probe runs in a fresh interpreter so peak RSS reflects only the load.
+    completed = subprocess.run(
+        [sys.executable, __file__, "--probe", storage, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return dict(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+
+def _compare_storage(
+    records: Iterable[int], workdir: Path
+) -> dict[str, dict[str, dict[str, float]]]:
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for count in records:
+        jsonl_path = workdir / f"ledger-{count}.jsonl"
+        segment_path = workdir / f"ledger-{count}.segments"
+        _write_jsonl_ledger(jsonl_path, count)
+        _write_segment_ledger(segment_path, count)
+        results[str(count)] = {
+            "jsonl": _measure_cold_start("jsonl", jsonl_path),
+            "segments": _measure_cold_start("segments", segment_path),
+        }
+        for storage, summary in results[str(count)].items():
+            print(
+                f"{count:>10} records {storage:>8}: cold start={summary['seconds']:.3f}s "
+                f"peak rss={summary['rss_mb']:.1f}MiB"
+            )
+    return results
+
+
+def _probe_history(layout: str, records: int) -> dict[str, float]:
+    """Hold ``records`` transitions in memory and report the resident set they added."""
+
+    before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if layout == "legacy":
+        # The layout the compact store replaced: every audit record kept as an object and
+        # referenced from both the document and the ledger-wide history map.
+        documents: dict[str, list[LedgerAuditRecord]] = {}
+        history: dict[str, list[LedgerAuditRecord]] = {}
+        for audit in _synthetic_audits(records):
+            documents.setdefault(audit.doc_id, []).append(audit)
+            history.setdefault(audit.doc_id, []).append(audit)
+    else:
+        store = LedgerHistoryStore()
+        for audit in _synthetic_audits(records):
+            store.append(audit)
+    elapsed = time.perf_counter() - start
+    after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"seconds": elapsed, "rss_mb": (after_kb - before_kb) / 1024}
+
+
+def _measure_history_memory(records: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for layout in ("legacy", "compact"):
+        completed = subprocess.run(
+            [sys.executable, __file__, "--history-probe", layout, str(records)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        results[layout] = dict(json.loads(completed.stdout.strip().splitlines()[-1]))
+        summary = results[layout]
+        print(
+            f"{layout:>8}: history rss={summary['rss_mb']:.1f}MiB "
+            f"build={summary['seconds']:.1f}s ({records} transitions)"
+        )
+    ratio = results["legacy"]["rss_mb"] / max(results["compact"]["rss_mb"], 1e-9)
+    print(f"History memory reduction: {ratio:.1f}x")
+    return results
+
+
 def _summarise_timings(label: str, timings: list[float]) -> dict[str, float]:
     mean = statistics.fmean(timings)
     median = statistics.median(timings)
@@ -143,11 +345,95 @@ def parse_args(argv: Iterable[str]) -> argparse.Namespace:
         action="store_true",
         help="Do not disable Prometheus metric refresh during generation",
     )
+    parser.add_argument(
+        "--compare-storage",
+        action="store_true",
+        help="Compare JSONL and segmented ledger cold start time and peak RSS",
+    )
+    parser.add_argument(
+        "--records",
+        type=int,
+        nargs="+",
+        default=[1_000_000, 10_000_000],
+        help="Audit record counts used by --compare-storage",
+    )
+    parser.add_argument(
+        "--throughput",
+        action="store_true",
+        help="Compare update_state and transition_path transitions/sec",
+    )
+    parser.add_argument(
+        "--snapshot-latency",
+        action="store_true",
+        help="Compare worst-case update_state latency with inline and background snapshots",
+    )
+    parser.add_argument(
+        "--updates",
+        type=int,
+        default=2000,
+        help="update_state calls timed by --snapshot-latency",
+    )
+    parser.add_argument(
+        "--history-memory",
+        action="store_true",
+        help="Compare resident memory of per-record and compact transition history",
+    )
+    parser.add_argument(
+        "--history-records",
+        type=int,
+        default=5_000_000,
+        help="Transitions held by --history-memory",
+    )
+    parser.add_argument("--probe", nargs=2, metavar=("STORAGE", "PATH"), help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--history-probe", nargs=2, metavar=("LAYOUT", "RECORDS"), help=argparse.SUPPRESS
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Iterable[str] | None = None) -> int:
     args = parse_args(argv)
+    if args.probe:
+        storage, path = args.probe
+        print(json.dumps(_probe_cold_start(storage, Path(path))))
+        return 0
+    if args.history_probe:
+        layout, records = args.history_probe
+        print(json.dumps(_probe_history(layout, int(records))))
+        return 0
+    if args.history_memory:
+        history_memory = _measure_history_memory(args.history_records)
+        if args.report:
+            args.report.write_text(
+                json.dumps({"history_memory": history_memory}, indent=2), encoding="utf-8"
+            )
+            print(f"Wrote benchmark report to {args.report}")
+        return 0
+    if args.throughput:
+        with TemporaryDirectory() as tmp:
+            throughput = _measure_throughput(Path(tmp), args.documents)
+        if args.report:
+            args.report.write_text(
+                json.dumps({"throughput": throughput}, indent=2), encoding="utf-8"
+            )
+            print(f"Wrote benchmark report to {args.report}")
+        return 0
+    if args.snapshot_latency:
+        with TemporaryDirectory() as tmp:
+            latency = _measure_snapshot_latency(Path(tmp), args.documents, args.updates)
+        if args.report:
+            args.report.write_text(
+                json.dumps({"snapshot_latency": latency}, indent=2), encoding="utf-8"
+            )
+            print(f"Wrote benchmark report to {args.report}")
+        return 0
+    if args.compare_storage:
+        with TemporaryDirectory() as tmp:
+            comparison = _compare_storage(args.records, Path(tmp))
+        if args.report:
+            args.report.write_text(json.dumps({"storage": comparison}, indent=2), encoding="utf-8")
+            print(f"Wrote benchmark report to {args.report}")
+        return 0
     with TemporaryDirectory() as tmp:
         ledger_path = Path(tmp) / "ledger.jsonl"
         ledger = IngestionLedger(ledger_path)
@@ -0,0 +1,141 @@
+"""Benchmark the inverted BM25 index against the previous full-scan scorer."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Callable, Iterable
+
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+# Import the index module without executing the package ``__init__``, which
+# pulls in configuration and API dependencies.
+if "Medical_KG" not in sys.modules:
+    pkg = types.ModuleType("Medical_KG")
+    pkg.__path__ = [str(SRC_ROOT / "Medical_KG")]
+    sys.modules["Medical_KG"] = pkg
+
+from Medical_KG.services.inverted_index import InvertedIndex  # noqa: E402
+
+_FACET_TYPES = ("pico", "endpoint", "ae", "dose", "eligibility")
+_CLINICAL_TERMS = (
+    "hazard ratio survival pembrolizumab nivolumab placebo randomised cohort nausea fatigue "
+    "neutropenia dose mg infusion endpoint progression median interval confidence adverse "
+    "events grade toxicity sepsis mortality eligibility inclusion exclusion criteria"
+).split()
+
+
+def synthetic_corpus(
+    chunks: int, *, vocabulary: int, words_per_chunk: int, seed: int
+) -> list[tuple[str, str, list[str]]]:
+    rng = random.Random(seed)
+    words = list(_CLINICAL_TERMS) + [f"term{index}" for index in range(vocabulary)]
+    # Zipf-like weights so a handful of terms are common and most are rare.
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    corpus: list[tuple[str, str, list[str]]] = []
+    for index in range(chunks):
+        text = " ".join(rng.choices(words, weights=weights, k=words_per_chunk))
+        corpus.append((f"chunk-{index}", text, [rng.choice(_FACET_TYPES)]))
+    return corpus
+
+
+def _naive_search(
+    corpus: list[tuple[str, str, list[str]]], query: str, facet_type: str | None, top_k: int
+) -> list[tuple[str, float]]:
+    """The scan-and-overlap scorer the index replaced."""
+
+    query_terms = {term.lower() for term in query.split()}
+    results: list[tuple[str, float]] = []
+    for chunk_id, text, facet_types in corpus:
+        if facet_type and facet_type not in facet_types:
+            continue
+        overlap = len(query_terms.intersection(text.lower().split()))
+        score = overlap + (1.6 if facet_type else 0.0)
+        if score:
+            results.append((chunk_id, score))
+    return sorted(results, key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def _time_queries(
+    label: str, run: Callable[[str, str | None], object], queries: list[tuple[str, str | None]]
+) -> None:
+    durations: list[float] = []
+    for query, facet_type in queries:
+        start = time.perf_counter()
+        run(query, facet_type)
+        durations.append((time.perf_counter() - start) * 1000)
+    durations.sort()
+    p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+    print(
+        f"{label:>14}: median {statistics.median(durations):8.2f} ms, "
+        f"p95 {p95:8.2f} ms over {len(durations)} queries"
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--chunks",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Synthetic corpus sizes to benchmark (1000000 is feasible with ~4 GiB RAM)",
+    )
+    parser.add_argument("--vocabulary", type=int, default=50_000, help="Synthetic vocabulary size")
+    parser.add_argument("--words", type=int, default=60, help="Words per synthetic chunk")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per corpus")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument(
+        "--skip-naive", action="store_true", help="Do not time the full-scan baseline"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = _build_parser().parse_args(list(argv) if argv is not None else None)
+    rng = random.Random(args.seed)
+    for size in args.chunks:
+        corpus = synthetic_corpus(
+            size, vocabulary=args.vocabulary, words_per_chunk=args.words, seed=args.seed
+        )
+        index = InvertedIndex()
+        start = time.perf_counter()
+        for chunk_id, text, facet_types in corpus:
+            index.upsert(chunk_id, text, facet_types)
+        build_seconds = time.perf_counter() - start
+        print(f"\n{size:,} chunks: index built in {build_seconds:.1f}s")
+        queries: list[tuple[str, str | None]] = [
+            (
+                " ".join(
+                    rng.sample(_CLINICAL_TERMS, 2) + [f"term{rng.randrange(args.vocabulary)}"]
+                ),
+                rng.choice([None, *_FACET_TYPES]),
+            )
+            for _ in range(args.queries)
+        ]
+        _time_queries(
+            "inverted BM25",
+            lambda query, facet: index.search(
+                query, facet_type=facet, top_k=args.top_k, facet_bonus=1.6
+            ),
+            queries,
+        )
+        if not args.skip_naive:
+            _time_queries(
+                "full scan",
+                lambda query, facet: _naive_search(corpus, query, facet, args.top_k),
+                queries[: max(args.queries // 10, 1)],
+            )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+"""Benchmark full-tree versus streaming parsing of PubMed efetch payloads."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+import types
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+# Import the ingestion modules without executing the package ``__init__`` files,
+# which pull in the API and pipeline layers.
+if "Medical_KG" not in sys.modules:
+    pkg = types.ModuleType("Medical_KG")
+    pkg.__path__ = [str(SRC_ROOT / "Medical_KG")]
+    sys.modules["Medical_KG"] = pkg
+
+if "Medical_KG.ingestion" not in sys.modules:
+    subpkg = types.ModuleType("Medical_KG.ingestion")
+    subpkg.__path__ = [str(SRC_ROOT / "Medical_KG" / "ingestion")]
+    sys.modules["Medical_KG.ingestion"] = subpkg
+
+from Medical_KG.ingestion.adapters.literature import PubMedAdapter  # noqa: E402
+from Medical_KG.ingestion.utils import iter_xml_elements  # noqa: E402
+
+_ABSTRACT = (
+    "Sepsis remains a leading cause of mortality in intensive care units. "
+    "We evaluated early goal-directed therapy across multiple centres and "
+    "report outcomes at twenty-eight and ninety days. "
+) * 8
+
+
+def _synthetic_article(index: int) -> str:
+    pmid = 30_000_000 + index
+    authors = "".join(
+        f"<Author><LastName>Author{slot}</LastName><ForeName>Test</ForeName></Author>"
+        for slot in range(6)
+    )
+    mesh = "".join(
+        f"<MeshHeading><DescriptorName>Term {slot}</DescriptorName></MeshHeading>"
+        for slot in range(8)
+    )
+    return (
+        "<PubmedArticle><MedlineCitation>"
+        f"<PMID>{pmid}</PMID><Article>"
+        "<Journal><Title>Critical Care</Title><JournalIssue><PubDate><Year>2024</Year>"
+        "</PubDate></JournalIssue></Journal>"
+        f"<ArticleTitle>Synthetic trial {index}</ArticleTitle>"
+        f'<Abstract><AbstractText Label="BACKGROUND">{_ABSTRACT}</AbstractText>'
+        f'<AbstractText Label="RESULTS">{_ABSTRACT}</AbstractText></Abstract>'
+        f"<AuthorList>{authors}</AuthorList>"
+        "<PublicationTypeList><PublicationType>Journal Article</PublicationType>"
+        "</PublicationTypeList></Article>"
+        f"<MeshHeadingList>{mesh}</MeshHeadingList></MedlineCitation>"
+        "<PubmedData><ArticleIdList>"
+        f'<ArticleId IdType="doi">10.1000/synthetic.{index}</ArticleId>'
+        f'<ArticleId IdType="pmc">PMC{pmid}</ArticleId>'
+        "</ArticleIdList></PubmedData></PubmedArticle>"
+    )
+
+
+def synthetic_efetch_xml(articles: int) -> str:
+    body = "".join(_synthetic_article(index) for index in range(articles))
+    return f'<?xml version="1.0" encoding="UTF-8"?><PubmedArticleSet>{body}</PubmedArticleSet>'
+
+
+def _tree_articles(xml: str) -> Iterator[ET.Element]:
+    root = ET.fromstring(xml)
+    yield from root.iter("PubmedArticle")
+
+
+def _stream_articles(xml: str) -> Iterator[ET.Element]:
+    return iter_xml_elements(xml, {"PubmedArticle"})
+
+
+def _measure(label: str, factory: Callable[[str], Iterable[object]], xml: str) -> dict[str, float]:
+    # Time and memory are sampled in separate passes because tracemalloc slows
+    # allocation-heavy parsing considerably.
+    start = time.perf_counter()
+    first: float | None = None
+    count = 0
+    for _ in factory(xml):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    for _ in factory(xml):
+        pass
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        "items": float(count),
+        "seconds": elapsed,
+        "first_item_ms": (first or 0.0) * 1000,
+        "peak_mib": peak / (1024 * 1024),
+        "items_per_second": count / elapsed if elapsed else 0.0,
+    }
+    print(
+        f"{label:>18}: {count} articles in {elapsed:.2f}s "
+        f"({result['items_per_second']:,.0f}/s), first after {result['first_item_ms']:.1f} ms, "
+        f"peak {result['peak_mib']:.1f} MiB"
+    )
+    return result
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--articles",
+        type=int,
+        nargs="+",
+        default=[1000, 10000],
+        help="Synthetic efetch page sizes to benchmark",
+    )
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = _build_parser().parse_args(list(argv) if argv is not None else None)
+    for articles in args.articles:
+        xml = synthetic_efetch_xml(articles)
+        print(f"\nefetch page with {articles} articles ({len(xml) / (1024 * 1024):.1f} MiB of XML)")
+        _measure("ElementTree tree", _tree_articles, xml)
+        _measure("iterparse stream", _stream_articles, xml)
+        _measure("PubMed details", PubMedAdapter._iter_fetch_xml, xml)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
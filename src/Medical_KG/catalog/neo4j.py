@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Protocol, cast
+from typing import Protocol
+
+from Medical_KG.kg.bulk import BulkWriteStats, UnwindBatchWriter
 
 from .models import Concept
 from .pipeline import CatalogBuildResult
@@ -18,24 +20,53 @@ class Neo4jSession(Protocol):  # pragma: no cover - interface definition
 
 @dataclass(slots=True)
 class ConceptGraphWriter:
-    """Generate Cypher statements to upsert concepts and relationships."""
+    """Generate Cypher statements to upsert concepts and relationships.
+
+    Concepts are grouped by family label and written with relationships as ``UNWIND`` batches
+    of ``batch_size`` rows (via APOC when ``use_apoc`` is set).
+    """
 
     session: Neo4jSession
     constraint_name: str = "concept_iri_unique"
     vector_index_name: str = "concept_qwen_idx"
     vector_dimension: int = 4096
     similarity_metric: str = "cosine"
+    batch_size: int = 1000
+    use_apoc: bool = False
+    max_retries: int = 3
     _constraint_created: bool = False
     _vector_index_created: bool = False
 
-    def sync(self, result: CatalogBuildResult) -> None:
+    def sync(
+        self, result: CatalogBuildResult, *, concepts: Sequence[Concept] | None = None
+    ) -> BulkWriteStats:
+        """Upsert ``concepts`` (all of ``result.concepts`` by default) and their relationships."""
+
+        writer = UnwindBatchWriter(
+            self.session,
+            batch_size=self.batch_size,
+            use_apoc=self.use_apoc,
+            max_retries=self.max_retries,
+        )
         if result.skipped:
-            return
+            return writer.stats
+        concepts = result.concepts if concepts is None else concepts
         self.ensure_constraint()
-        for concept in result.concepts:
-            self._upsert_concept(concept)
-        self._create_relationships(result.concepts)
+        for concept in concepts:
+            self._upsert_concept(writer, concept)
+        writer.flush()
+        self._create_relationships(writer, concepts)
+        writer.flush()
         self.ensure_vector_index()
+        return writer.stats
+
+    def delete_concepts(self, iris: Iterable[str]) -> None:
+        """Detach and delete tombstoned concepts in batches of ``batch_size``."""
+
+        ordered = sorted(set(iris))
+        query = "UNWIND $iris AS iri MATCH (c:Concept {iri: iri}) DETACH DELETE c"
+        for offset in range(0, len(ordered), self.batch_size):
+            self.session.run(query, {"iris": ordered[offset : offset + self.batch_size]})
 
     def ensure_constraint(self) -> None:
         if self._constraint_created:
@@ -56,9 +87,8 @@ class ConceptGraphWriter:
         self.session.run(query, params)
         self._vector_index_created = True
 
-    def _upsert_concept(self, concept: Concept) -> None:
+    def _upsert_concept(self, writer: UnwindBatchWriter, concept: Concept) -> None:
         family_label = concept.family.name.title().replace("_", "")
-        query = f"MERGE (c:Concept:{family_label} {{iri: $iri}}) " "SET c += $props"
         props: dict[str, JsonValue] = {
             "ontology": concept.ontology,
             "family": concept.family.value,
@@ -71,30 +101,27 @@ class ConceptGraphWriter:
             "release": concept.release,
             "license_bucket": concept.license_bucket,
             "provenance": concept.provenance,
-            "embedding_qwen": concept.embedding_qwen,
-            "splade_terms": concept.splade_terms,
-        }
-        parameters: dict[str, JsonValue] = {
-            "iri": concept.iri,
-            "props": cast(Mapping[str, JsonValue], props),
         }
-        self.session.run(query, parameters)
-
-    def _create_relationships(self, concepts: Iterable[Concept]) -> None:
+        # Concepts that were not re-embedded carry no vectors; leave the stored ones in place.
+        if concept.embedding_qwen is not None:
+            props["embedding_qwen"] = concept.embedding_qwen
+        if concept.splade_terms is not None:
+            props["splade_terms"] = concept.splade_terms
+        writer.merge_node(("Concept", family_label), "iri", concept.iri, props)
+
+    def _create_relationships(self, writer: UnwindBatchWriter, concepts: Iterable[Concept]) -> None:
         for concept in concepts:
             for parent in concept.parents:
-                self._merge_relationship("IS_A", concept.iri, parent)
+                self._merge_relationship(writer, "IS_A", concept.iri, parent)
             for equivalent in concept.same_as:
                 if equivalent == concept.iri:
                     continue
-                self._merge_relationship("SAME_AS", concept.iri, equivalent)
+                self._merge_relationship(writer, "SAME_AS", concept.iri, equivalent)
 
-    def _merge_relationship(self, rel_type: str, start: str, end: str) -> None:
-        query = (
-            "MATCH (a:Concept {iri: $start}), (b:Concept {iri: $end}) "
-            f"MERGE (a)-[:{rel_type}]->(b)"
-        )
-        self.session.run(query, {"start": start, "end": end})
+    def _merge_relationship(
+        self, writer: UnwindBatchWriter, rel_type: str, start: str, end: str
+    ) -> None:
+        writer.merge_relationship(rel_type, ("Concept", "iri", start), ("Concept", "iri", end))
 
 
 __all__ = ["ConceptGraphWriter", "Neo4jSession"]
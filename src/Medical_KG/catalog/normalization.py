@@ -102,14 +102,13 @@ class ConceptNormaliser:
     def aggregate_synonyms(self, concepts: Iterable[Concept]) -> dict[str, list[str]]:
         """Create mapping of ontology → sorted synonym list for downstream analyzers."""
 
-        synonyms: dict[str, list[str]] = {}
+        collected: dict[str, set[str]] = {}
         for concept in concepts:
-            entries = {syn.value for syn in concept.synonyms}
-            if entries:
-                current = set(synonyms.get(concept.ontology, []))
-                current.update(entries)
-                synonyms[concept.ontology] = sorted(current)
-        return synonyms
+            if concept.synonyms:
+                collected.setdefault(concept.ontology, set()).update(
+                    syn.value for syn in concept.synonyms
+                )
+        return {ontology: sorted(values) for ontology, values in collected.items()}
 
     def compute_synonym_statistics(self, concepts: Iterable[Concept]) -> dict[str, int]:
         """Return counts of synonym frequency for reporting."""
@@ -68,6 +68,13 @@ class ConceptIndexManager:
         if operations:
             self.client.bulk(operations)
 
+    def delete_concepts(self, iris: Iterable[str]) -> None:
+        operations: MutableSequence[Mapping[str, JsonValue]] = [
+            {"delete": {"_index": self.index_name, "_id": iri}} for iri in sorted(set(iris))
+        ]
+        if operations:
+            self.client.bulk(operations)
+
     def build_search_query(self, text: str) -> Mapping[str, JsonValue]:
         return {
             "query": {
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, cast
 
 from Medical_KG.utils.yaml_loader import YamlLoaderError, load_yaml_mapping
 
@@ -93,9 +94,24 @@ class CatalogAuditEntry:
 
 @dataclass(slots=True)
 class CatalogAuditLog:
-    """Collects audit entries for catalog operations."""
+    """Collects audit entries for catalog operations.
+
+    When ``spill_path`` is set, entries are appended to that file as JSON lines instead of
+    being kept in :attr:`entries`; :meth:`as_payloads` reads them back.
+    """
 
     entries: list[CatalogAuditEntry] = field(default_factory=list)
+    spill_path: Path | None = None
+    spilled: int = 0
+    _handle: IO[str] | None = field(default=None, repr=False)
+
+    @classmethod
+    def spill_to(cls, path: str | Path) -> "CatalogAuditLog":
+        """Create a log that writes entries to ``path``, truncating any previous contents."""
+
+        spill_path = Path(path)
+        spill_path.parent.mkdir(parents=True, exist_ok=True)
+        return cls(spill_path=spill_path, _handle=spill_path.open("w", encoding="utf-8"))
 
     def record(
         self,
@@ -105,17 +121,45 @@ class CatalogAuditLog:
         resource: str,
         metadata: AuditMetadata | None = None,
     ) -> None:
-        self.entries.append(
-            CatalogAuditEntry(action=action, user=user, resource=resource, metadata=metadata)
-        )
+        entry = CatalogAuditEntry(action=action, user=user, resource=resource, metadata=metadata)
+        if self._handle is None:
+            self.entries.append(entry)
+            return
+        self._handle.write(json.dumps(entry.to_payload(), sort_keys=True))
+        self._handle.write("\n")
+        self.spilled += 1
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def iter_payloads(self) -> Iterator[dict[str, JsonValue]]:
+        for entry in self.entries:
+            yield entry.to_payload()
+        if self.spill_path is None or not self.spilled:
+            return
+        if self._handle is not None:
+            self._handle.flush()
+        with self.spill_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                yield cast(dict[str, JsonValue], json.loads(line))
 
     def as_payloads(self) -> list[dict[str, JsonValue]]:
-        return [entry.to_payload() for entry in self.entries]
+        return list(self.iter_payloads())
 
 
 @dataclass(slots=True)
 class CatalogBuildResult:
-    """Result of running the catalog build pipeline."""
+    """Result of running the catalog build pipeline.
+
+    ``concepts`` holds every concept rebuilt in this run and ``changed_concepts`` the subset
+    whose content hash differs from the state store (all of them without a store).
+    ``tombstones`` maps IRIs that disappeared from a rebuilt ontology to that ontology, and
+    ``ontology_hashes``/``concept_hashes`` carry the per-ontology state recorded on commit.
+    ``release_versions`` and ``synonym_catalog`` cover the whole catalog, including ontologies
+    that were not rebuilt.
+    """
 
     concepts: list[Concept]
     release_hash: str
@@ -124,50 +168,125 @@ class CatalogBuildResult:
     release_versions: dict[str, str]
     changed_ontologies: set[str]
     skipped: bool = False
+    changed_concepts: list[Concept] = field(default_factory=list)
+    tombstones: dict[str, str] = field(default_factory=dict)
+    ontology_hashes: dict[str, str] = field(default_factory=dict)
+    concept_hashes: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+_HASH_MODULUS = 1 << 256
 
 
 class CatalogReleaseHasher:
-    """Compute a deterministic release hash for catalog snapshots."""
+    """Compute a deterministic release hash for catalog snapshots.
+
+    Per-concept digests are summed modulo 2**256, so the hash does not depend on concept order
+    and can be accumulated with :meth:`update` without sorting or holding the snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._accumulator = 0
+        self._count = 0
 
-    def compute(self, concepts: Sequence[Concept]) -> str:
+    def update(self, concept: Concept) -> None:
         digest = hashlib.sha256()
-        for concept in sorted(
-            concepts,
-            key=lambda c: (
-                c.ontology,
-                next(iter(sorted(c.codes.items())), ("", c.iri))[1],
-            ),
-        ):
-            digest.update(concept.iri.encode("utf-8"))
-            digest.update(json.dumps(concept.release, sort_keys=True).encode("utf-8"))
-            digest.update(json.dumps(concept.codes, sort_keys=True).encode("utf-8"))
-        return digest.hexdigest()
+        digest.update(concept.iri.encode("utf-8"))
+        digest.update(json.dumps(concept.release, sort_keys=True).encode("utf-8"))
+        digest.update(json.dumps(concept.codes, sort_keys=True).encode("utf-8"))
+        value = int.from_bytes(digest.digest(), "big")
+        self._accumulator = (self._accumulator + value) % _HASH_MODULUS
+        self._count += 1
+
+    def hexdigest(self) -> str:
+        payload = f"{self._count}:{self._accumulator:064x}"
+        return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+    def compute(self, concepts: Iterable[Concept]) -> str:
+        hasher = CatalogReleaseHasher()
+        for concept in concepts:
+            hasher.update(concept)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def combine(ontology_hashes: Mapping[str, str]) -> str:
+        """Combine per-ontology release hashes into a catalog-wide hash."""
+
+        payload = "\n".join(f"{name}={value}" for name, value in sorted(ontology_hashes.items()))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def concept_content_hash(concept: Concept) -> str:
+    """Digest of the concept fields that feed embeddings, search documents and graph nodes.
+
+    Embeddings, SPLADE terms, crosswalk links, release metadata and provenance are excluded,
+    so a new release that leaves a concept unchanged does not mark it for re-embedding.
+    """
+
+    payload = [
+        concept.iri,
+        concept.ontology,
+        concept.family.value,
+        concept.label,
+        concept.preferred_term,
+        concept.definition,
+        sorted((synonym.value, synonym.type.value) for synonym in concept.synonyms),
+        concept.codes,
+        concept.xrefs,
+        concept.parents,
+        concept.ancestors,
+        concept.attributes,
+        concept.semantic_types,
+        concept.status,
+        concept.retired_date,
+        concept.license_bucket,
+    ]
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
 
 
 class CrosswalkBuilder:
-    """Build crosswalk relationships across ontologies."""
+    """Build crosswalk relationships across ontologies.
+
+    Concepts sharing a UMLS CUI, code, or cross-reference are linked with ``same_as``. Groups
+    are resolved through an IRI index, so the pass costs time proportional to the links it
+    creates rather than scanning every concept once per group.
+    """
 
     def apply(self, concepts: Sequence[Concept]) -> None:
-        cui_groups: MutableMapping[str, set[str]] = {}
-        code_groups: MutableMapping[str, set[str]] = {}
+        by_iri: dict[str, Concept] = {}
+        shared_iris: dict[str, list[Concept]] = {}
+        first_by_key: dict[str, str] = {}
+        groups: dict[str, list[str]] = {}
         for concept in concepts:
-            cui = concept.attributes.get("umls_cui") if concept.attributes else None
-            if cui:
-                cui_groups.setdefault(str(cui), set()).add(concept.iri)
-            for system, code in concept.codes.items():
-                key = f"{system}:{code}"
-                code_groups.setdefault(key, set()).add(concept.iri)
-            for system, values in concept.xrefs.items():
-                for value in values:
-                    key = f"{system}:{value}"
-                    code_groups.setdefault(key, set()).add(concept.iri)
-        for group in list(cui_groups.values()) + list(code_groups.values()):
-            if len(group) <= 1:
-                continue
-            for concept in concepts:
-                if concept.iri in group:
-                    for iri in group:
-                        concept.ensure_same_as(iri)
+            iri = concept.iri
+            if by_iri.setdefault(iri, concept) is not concept:
+                shared_iris.setdefault(iri, [by_iri[iri]]).append(concept)
+            for key in self._keys(concept):
+                first = first_by_key.setdefault(key, iri)
+                if first == iri:
+                    continue
+                members = groups.get(key)
+                if members is None:
+                    groups[key] = [first, iri]
+                elif iri not in members:
+                    members.append(iri)
+        del first_by_key
+        for members in groups.values():
+            for iri in members:
+                for concept in shared_iris.get(iri) or (by_iri[iri],):
+                    for other in members:
+                        concept.ensure_same_as(other)
+
+    @staticmethod
+    def _keys(concept: Concept) -> Iterator[str]:
+        cui = concept.attributes.get("umls_cui") if concept.attributes else None
+        if cui:
+            yield f"umls_cui:{cui}"
+        for system, code in concept.codes.items():
+            yield f"{system}:{code}"
+        for system, values in concept.xrefs.items():
+            for value in values:
+                yield f"{system}:{value}"
 
 
 class ConceptDeduplicator:
@@ -175,13 +294,28 @@ class ConceptDeduplicator:
 
     def deduplicate(self, concepts: Iterable[Concept]) -> list[Concept]:
         deduped: MutableMapping[tuple[str, str | None], Concept] = {}
+        self.update(deduped, concepts)
+        return list(deduped.values())
+
+    def update(
+        self,
+        deduped: MutableMapping[tuple[str, str | None], Concept],
+        concepts: Iterable[Concept],
+    ) -> None:
+        """Fold ``concepts`` into an existing ``(label, definition)`` index."""
+
         for concept in concepts:
             key = (concept.label.lower(), concept.definition)
             if key in deduped:
                 deduped[key].merge(concept)
             else:
                 deduped[key] = concept
-        return list(deduped.values())
+
+
+def _batched(items: Iterable[Concept], size: int) -> Iterator[list[Concept]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 class ConceptCatalogBuilder:
@@ -204,11 +338,96 @@ class ConceptCatalogBuilder:
         self._embedding_service = embedding_service
         self._state_store = state_store
 
-    def build(self) -> CatalogBuildResult:
-        concepts: list[Concept] = []
-        audit_log = CatalogAuditLog()
+    def build(
+        self, *, ontologies: Iterable[str] | None = None, commit: bool = True
+    ) -> CatalogBuildResult:
+        """Build the catalog, or only the loaders of ``ontologies`` when given.
+
+        With a state store, loaders whose release version differs from the recorded one (or
+        that were never built) run as well, and only concepts whose content hash changed are
+        embedded. Deduplication and crosswalks span the loaders run in this build only.
+        ``commit=False`` leaves the state store untouched so callers can :meth:`commit` once
+        downstream writes succeed.
+        """
+
+        return self._build(CatalogAuditLog(), batch_size=None, ontologies=ontologies, commit=commit)
+
+    def build_streaming(
+        self,
+        audit_path: str | Path,
+        *,
+        batch_size: int = 10_000,
+        ontologies: Iterable[str] | None = None,
+        commit: bool = True,
+    ) -> CatalogBuildResult:
+        """Build the catalog with bounded intermediate state.
+
+        Loader output is normalised and deduplicated in batches of ``batch_size`` without an
+        intermediate list of every loaded concept, audit entries are spilled to ``audit_path``
+        as JSON lines, and concepts are embedded ``batch_size`` at a time.
+
+        Only the raw loader output and the audit log are bounded: the deduplicated concepts,
+        their content hashes and :attr:`CatalogBuildResult.concepts` are still held in memory
+        in full, because the crosswalk pass links concepts across the whole build and the
+        result hands every rebuilt concept to the index and graph writers.
+        """
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        audit_log = CatalogAuditLog.spill_to(audit_path)
+        try:
+            return self._build(
+                audit_log, batch_size=batch_size, ontologies=ontologies, commit=commit
+            )
+        finally:
+            audit_log.close()
+
+    def commit(
+        self, result: CatalogBuildResult, *, state_store: CatalogStateStore | None = None
+    ) -> None:
+        """Record ``result`` in the state store and persist it."""
+
+        store = state_store or self._state_store
+        if store is None or result.skipped:
+            return
+        store.set_release_hash(result.release_hash)
+        store.set_release_versions(result.release_versions)
+        for ontology, ontology_hash in result.ontology_hashes.items():
+            store.set_ontology_state(
+                ontology,
+                release_hash=ontology_hash,
+                concept_hashes=result.concept_hashes.get(ontology, {}),
+                synonyms=result.synonym_catalog.get(ontology, ()),
+            )
+        store.add_tombstones(result.tombstones)
+        store.save()
+
+    def _select_loaders(self, ontologies: Iterable[str] | None) -> list[ConceptLoader]:
+        if ontologies is None:
+            return list(self._loaders)
+        wanted = {ontology.upper() for ontology in ontologies}
+        if self._state_store is None:
+            return [loader for loader in self._loaders if loader.ontology.upper() in wanted]
+        versions = self._state_store.get_release_versions()
+        return [
+            loader
+            for loader in self._loaders
+            if loader.ontology.upper() in wanted
+            or versions.get(loader.ontology) != loader.release_version
+        ]
+
+    def _build(
+        self,
+        audit_log: CatalogAuditLog,
+        *,
+        batch_size: int | None,
+        ontologies: Iterable[str] | None = None,
+        commit: bool = True,
+    ) -> CatalogBuildResult:
+        store = self._state_store
+        deduped_index: dict[tuple[str, str | None], Concept] = {}
         release_versions: dict[str, str] = {}
-        for loader in self._loaders:
+        for loader in self._select_loaders(ontologies):
             if not self._license_policy.is_loader_enabled(loader):
                 audit_log.record(
                     "loader.skipped",
@@ -217,44 +436,71 @@ class ConceptCatalogBuilder:
                     metadata={"reason": "license", "license_bucket": loader.license_bucket},
                 )
                 continue
-            for concept in loader.load():
-                audit_log.record(
-                    "concept.loaded",
-                    user="catalog",
-                    resource=concept.iri,
-                    metadata={"ontology": concept.ontology},
+            for batch in _batched(loader.load(), batch_size or 10_000):
+                for concept in batch:
+                    audit_log.record(
+                        "concept.loaded",
+                        user="catalog",
+                        resource=concept.iri,
+                        metadata={"ontology": concept.ontology},
+                    )
+                self._deduplicator.update(
+                    deduped_index, (self._normaliser.normalise(concept) for concept in batch)
                 )
-                concepts.append(self._normaliser.normalise(concept))
             release_versions[loader.ontology] = loader.release_version
-        deduped = self._deduplicator.deduplicate(concepts)
+        deduped = list(deduped_index.values())
+        del deduped_index
         self._crosswalk_builder.apply(deduped)
-        release_hash = self._hasher.compute(deduped)
+        hashers = {ontology: CatalogReleaseHasher() for ontology in release_versions}
+        concept_hashes: dict[str, dict[str, str]] = {}
+        for concept in deduped:
+            hashers.setdefault(concept.ontology, CatalogReleaseHasher()).update(concept)
+            if store is not None:
+                concept_hashes.setdefault(concept.ontology, {})[concept.iri] = concept_content_hash(
+                    concept
+                )
+        ontology_hashes = {ontology: hasher.hexdigest() for ontology, hasher in hashers.items()}
         synonym_catalog = self._normaliser.aggregate_synonyms(deduped)
-        changed_ontologies: set[str]
+        changed_concepts = deduped
+        tombstones: dict[str, str] = {}
         skipped = False
-        if self._state_store:
-            previous_hash = self._state_store.get_release_hash()
-            previous_versions = self._state_store.get_release_versions()
-            if previous_hash == release_hash:
-                skipped = True
-                changed_ontologies = set()
-            else:
-                changed_ontologies = {
-                    ontology
-                    for ontology, version in release_versions.items()
-                    if previous_versions.get(ontology) != version
-                }
-                if not changed_ontologies:
-                    changed_ontologies = set(release_versions)
+        if store is None:
+            changed_ontologies = set(ontology_hashes)
+            release_hash = CatalogReleaseHasher.combine(ontology_hashes)
         else:
-            changed_ontologies = set(release_versions)
+            previous_hashes = store.get_ontology_hashes()
+            changed_ontologies = {
+                ontology
+                for ontology, value in ontology_hashes.items()
+                if previous_hashes.get(ontology) != value
+            }
+            current = {
+                iri: digest for hashes in concept_hashes.values() for iri, digest in hashes.items()
+            }
+            previous: dict[str, str] = {}
+            for ontology in ontology_hashes:
+                for iri, digest in store.get_concept_hashes(ontology).items():
+                    previous[iri] = digest
+                    if iri not in current:
+                        tombstones[iri] = ontology
+            changed_concepts = [
+                concept for concept in deduped if previous.get(concept.iri) != current[concept.iri]
+            ]
+            release_hash = CatalogReleaseHasher.combine({**previous_hashes, **ontology_hashes})
+            release_versions = {**store.get_release_versions(), **release_versions}
+            stored_synonyms = store.get_synonyms()
+            for ontology in ontology_hashes:
+                stored_synonyms.pop(ontology, None)
+            synonym_catalog = {**stored_synonyms, **synonym_catalog}
+            skipped = not (changed_ontologies or changed_concepts or tombstones)
         if not skipped and self._embedding_service:
-            concepts_like = cast("Sequence[ConceptLike]", deduped)
-            self._embedding_service.embed_concepts(concepts_like)
-        if self._state_store and not skipped:
-            self._state_store.set_release_hash(release_hash)
-            self._state_store.set_release_versions(release_versions)
-        return CatalogBuildResult(
+            step = batch_size or len(changed_concepts) or 1
+            for offset in range(0, len(changed_concepts), step):
+                concepts_like = cast(
+                    "Sequence[ConceptLike]", changed_concepts[offset : offset + step]
+                )
+                self._embedding_service.embed_concepts(concepts_like)
+        result = CatalogBuildResult(
             concepts=deduped,
             release_hash=release_hash,
             synonym_catalog=synonym_catalog,
@@ -262,7 +508,14 @@ class ConceptCatalogBuilder:
             release_versions=release_versions,
             changed_ontologies=changed_ontologies,
             skipped=skipped,
+            changed_concepts=changed_concepts,
+            tombstones=tombstones,
+            ontology_hashes=ontology_hashes,
+            concept_hashes=concept_hashes,
         )
+        if commit:
+            self.commit(result)
+        return result
 
 
 __all__ = [
@@ -272,4 +525,5 @@ __all__ = [
     "CatalogReleaseHasher",
     "CrosswalkBuilder",
     "LicensePolicy",
+    "concept_content_hash",
 ]
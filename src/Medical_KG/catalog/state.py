@@ -2,16 +2,60 @@
 
 from __future__ import annotations
 
+import json
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
 from typing import Mapping
 
+_STATE_FILENAME = "state.json"
+_CONCEPTS_DIRNAME = "concepts"
+
 
 @dataclass(slots=True)
 class CatalogStateStore:
-    """In-memory record of catalog release hashes and ontology versions."""
+    """Record of catalog release hashes, ontology versions, and per-concept content hashes.
+
+    The store is in-memory unless ``path`` is given, in which case it is loaded from that
+    directory and :meth:`save` persists it there: ``state.json`` holds release metadata,
+    pending tombstones and refresh times, and ``concepts/<ONTOLOGY>.json`` holds the
+    ``iri -> content hash`` map and synonyms of each ontology. Only ontologies updated since
+    the last save are rewritten.
+    """
 
     _release_hash: str | None = None
     _release_versions: dict[str, str] = field(default_factory=dict)
+    path: Path | str | None = None
+    _ontology_hashes: dict[str, str] = field(default_factory=dict)
+    _concept_hashes: dict[str, dict[str, str]] = field(default_factory=dict)
+    _synonyms: dict[str, list[str]] = field(default_factory=dict)
+    _tombstones: dict[str, str] = field(default_factory=dict)
+    _last_refreshed: dict[str, str] = field(default_factory=dict)
+    _dirty_ontologies: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        if self.path is None:
+            return
+        self.path = Path(self.path)
+        state_path = self.path / _STATE_FILENAME
+        if not state_path.exists():
+            return
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+        self._release_hash = payload.get("release_hash")
+        self._release_versions = dict(payload.get("release_versions", {}))
+        self._ontology_hashes = dict(payload.get("ontology_hashes", {}))
+        self._tombstones = dict(payload.get("tombstones", {}))
+        self._last_refreshed = dict(payload.get("last_refreshed", {}))
+        for ontology in payload.get("ontologies", []):
+            concepts_path = self._concepts_path(ontology)
+            if not concepts_path.exists():
+                continue
+            record = json.loads(concepts_path.read_text(encoding="utf-8"))
+            self._concept_hashes[ontology] = dict(record.get("concepts", {}))
+            if record.get("synonyms"):
+                self._synonyms[ontology] = list(record["synonyms"])
 
     def get_release_hash(self) -> str | None:
         return self._release_hash
@@ -25,5 +69,86 @@ class CatalogStateStore:
     def set_release_versions(self, versions: Mapping[str, str]) -> None:
         self._release_versions = {key: str(value) for key, value in versions.items()}
 
+    def get_ontology_hashes(self) -> dict[str, str]:
+        return dict(self._ontology_hashes)
+
+    def get_concept_hashes(self, ontology: str) -> dict[str, str]:
+        return dict(self._concept_hashes.get(ontology, {}))
+
+    def set_ontology_state(
+        self,
+        ontology: str,
+        *,
+        release_hash: str,
+        concept_hashes: Mapping[str, str],
+        synonyms: Iterable[str] = (),
+    ) -> None:
+        """Replace the recorded hashes and synonyms of one ontology."""
+
+        self._ontology_hashes[ontology] = release_hash
+        self._concept_hashes[ontology] = dict(concept_hashes)
+        values = sorted(synonyms)
+        if values:
+            self._synonyms[ontology] = values
+        else:
+            self._synonyms.pop(ontology, None)
+        self._dirty_ontologies.add(ontology)
+
+    def get_synonyms(self) -> dict[str, list[str]]:
+        return {key: list(values) for key, values in self._synonyms.items()}
+
+    def get_tombstones(self) -> dict[str, str]:
+        """Return pending deletions as ``iri -> ontology``."""
+
+        return dict(self._tombstones)
+
+    def add_tombstones(self, tombstones: Mapping[str, str]) -> None:
+        self._tombstones.update(tombstones)
+
+    def clear_tombstones(self, iris: Iterable[str]) -> None:
+        for iri in iris:
+            self._tombstones.pop(iri, None)
+
+    def get_last_refreshed(self, ontology: str) -> datetime | None:
+        value = self._last_refreshed.get(ontology.upper())
+        return datetime.fromisoformat(value) if value else None
+
+    def set_last_refreshed(self, ontology: str, when: datetime) -> None:
+        self._last_refreshed[ontology.upper()] = when.isoformat()
+
+    def save(self) -> None:
+        """Persist the store when it is backed by a directory; a no-op otherwise."""
+
+        if self.path is None:
+            return
+        root = Path(self.path)
+        (root / _CONCEPTS_DIRNAME).mkdir(parents=True, exist_ok=True)
+        for ontology in sorted(self._dirty_ontologies):
+            record = {
+                "concepts": self._concept_hashes.get(ontology, {}),
+                "synonyms": self._synonyms.get(ontology, []),
+            }
+            _write_json(self._concepts_path(ontology), record)
+        self._dirty_ontologies.clear()
+        payload = {
+            "release_hash": self._release_hash,
+            "release_versions": self._release_versions,
+            "ontology_hashes": self._ontology_hashes,
+            "ontologies": sorted(self._concept_hashes),
+            "tombstones": self._tombstones,
+            "last_refreshed": self._last_refreshed,
+        }
+        _write_json(root / _STATE_FILENAME, payload)
+
+    def _concepts_path(self, ontology: str) -> Path:
+        safe = "".join(char if char.isalnum() or char in "-_" else "_" for char in ontology)
+        return Path(str(self.path)) / _CONCEPTS_DIRNAME / f"{safe}.json"
+
+
+def _write_json(path: Path, payload: object) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
 
 __all__ = ["CatalogStateStore"]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+from .models import Concept
 from .neo4j import ConceptGraphWriter
 from .opensearch import ConceptIndexManager
 from .pipeline import CatalogAuditLog, CatalogBuildResult, ConceptCatalogBuilder
@@ -23,6 +24,26 @@ def _default_schedule() -> dict[str, timedelta]:
     }
 
 
+def _with_same_as_partners(
+    concepts: Sequence[Concept], changed: Sequence[Concept]
+) -> list[Concept]:
+    """Return ``changed`` plus the rebuilt concepts linked to any of them by ``same_as``.
+
+    Crosswalk edges are written from both endpoints, so an unchanged partner of a changed
+    concept has to be synced as well to pick up the reverse ``SAME_AS`` relationship.
+    """
+
+    changed_iris = {concept.iri for concept in changed}
+    linked = {iri for concept in changed for iri in concept.same_as}
+    partners = [
+        concept
+        for concept in concepts
+        if concept.iri not in changed_iris
+        and (concept.iri in linked or not changed_iris.isdisjoint(concept.same_as))
+    ]
+    return [*changed, *partners]
+
+
 @dataclass(slots=True)
 class CatalogUpdater:
     """Coordinate periodic rebuilds and downstream indexing."""
@@ -36,13 +57,20 @@ class CatalogUpdater:
 
     def is_due(self, ontology: str, *, when: datetime | None = None) -> bool:
         when = when or datetime.utcnow()
-        last = self.last_run.get(ontology.upper())
+        last = self.last_run.get(ontology.upper()) or self.state_store.get_last_refreshed(ontology)
         if last is None:
             return True
         interval = self.schedule.get(ontology.upper(), timedelta(days=30))
         return when - last >= interval
 
     def refresh(self, *, force: bool = False, when: datetime | None = None) -> CatalogBuildResult:
+        """Rebuild due ontologies and push only changed concepts and tombstones downstream.
+
+        The graph also receives the unchanged ``same_as`` partners of changed concepts so
+        crosswalk edges stay symmetric. ``force`` rebuilds every loader. State is committed after indexing and graph sync so a
+        failed refresh is retried on the next run.
+        """
+
         when = when or datetime.utcnow()
         due = {ontology for ontology in self.schedule if self.is_due(ontology, when=when)}
         if not due and not force:
@@ -55,23 +83,27 @@ class CatalogUpdater:
                 changed_ontologies=set(),
                 skipped=True,
             )
-        result = self.builder.build()
-        if result.skipped:
-            return result
-        target_ontologies = result.changed_ontologies or set(result.release_versions)
-        if not target_ontologies:
-            return result
-        self.index_manager.ensure_index(result.synonym_catalog)
-        concepts_to_index = [
-            concept for concept in result.concepts if concept.ontology in target_ontologies
-        ]
-        self.index_manager.index_concepts(concepts_to_index)
-        self.index_manager.reload_analyzers()
-        self.graph_writer.sync(result)
-        for ontology in target_ontologies:
+        result = self.builder.build(ontologies=None if force else due, commit=False)
+        tombstones = {**self.state_store.get_tombstones(), **result.tombstones}
+        if not result.skipped:
+            self.index_manager.ensure_index(result.synonym_catalog)
+            if result.changed_concepts:
+                self.index_manager.index_concepts(result.changed_concepts)
+        if tombstones:
+            self.index_manager.delete_concepts(tombstones)
+            self.graph_writer.delete_concepts(tombstones)
+        if not result.skipped:
+            self.index_manager.reload_analyzers()
+            self.graph_writer.sync(
+                result,
+                concepts=_with_same_as_partners(result.concepts, result.changed_concepts),
+            )
+            self.builder.commit(result, state_store=self.state_store)
+        self.state_store.clear_tombstones(tombstones)
+        for ontology in result.ontology_hashes:
             self.last_run[ontology.upper()] = when
-        self.state_store.set_release_hash(result.release_hash)
-        self.state_store.set_release_versions(result.release_versions)
+            self.state_store.set_last_refreshed(ontology, when)
+        self.state_store.save()
         return result
 
 
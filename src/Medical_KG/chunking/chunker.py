@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from typing import List, Optional, Sequence, Tuple
 
 from Medical_KG.embeddings import QwenEmbeddingClient
+from Medical_KG.utils.vectors import FloatMatrix, adjacent_cosine, as_matrix, cosine, normalize_rows
 
 from .document import Document, Section
 from .profiles import ChunkingProfile, get_profile
@@ -123,6 +124,24 @@ class ChunkIdGenerator:
         return chunk_id
 
 
+class _SentenceVectors:
+    """Normalised embeddings for a document's sentences, computed in one batch."""
+
+    __slots__ = ("_rows", "_normalized", "adjacent")
+
+    def __init__(self, sentences: Sequence[Sentence], matrix: FloatMatrix) -> None:
+        self._rows = {id(sentence): row for row, sentence in enumerate(sentences)}
+        self._normalized = normalize_rows(matrix)
+        self.adjacent = adjacent_cosine(self._normalized)
+
+    def similarity(self, left: Sentence, right: Sentence) -> float | None:
+        left_row = self._rows.get(id(left))
+        right_row = self._rows.get(id(right))
+        if left_row is None or right_row is None:
+            return None
+        return float(self._normalized[left_row] @ self._normalized[right_row])
+
+
 @dataclass(slots=True)
 class SemanticChunker:
     profile: ChunkingProfile
@@ -136,15 +155,20 @@ class SemanticChunker:
         if not sentences:
             return []
         chunk_id_gen = ChunkIdGenerator(document.doc_id)
+        vectors = _SentenceVectors(sentences, self._embed_sentences(sentences))
         chunks: List[Chunk] = []
         current_sentences: List[Sentence] = []
         current_tokens = 0
         previous_sentence: Optional[Sentence] = None
         previous_chunk: Optional[Chunk] = None
-        for sentence in sentences:
+        for index, sentence in enumerate(sentences):
             is_heading = bool(_HEADING_PATTERN.match(sentence.text.strip()))
             coherence = (
-                self._sentence_similarity(previous_sentence.text, sentence.text)
+                (
+                    _lexical_coherence(previous_sentence.text, sentence.text)
+                    + float(vectors.adjacent[index - 1])
+                )
+                / 2
                 if previous_sentence
                 else 1.0
             )
@@ -158,7 +182,7 @@ class SemanticChunker:
                 and not guardrail
             ):
                 chunk = self._create_chunk(
-                    document, current_sentences, chunk_id_gen, previous_chunk
+                    document, current_sentences, chunk_id_gen, previous_chunk, vectors
                 )
                 chunks.append(chunk)
                 previous_chunk = chunk
@@ -168,10 +192,19 @@ class SemanticChunker:
             current_tokens += sentence.tokens
             previous_sentence = sentence
         if current_sentences:
-            chunk = self._create_chunk(document, current_sentences, chunk_id_gen, previous_chunk)
+            chunk = self._create_chunk(
+                document, current_sentences, chunk_id_gen, previous_chunk, vectors
+            )
             chunks.append(chunk)
         return chunks
 
+    def _embed_sentences(self, sentences: Sequence[Sentence]) -> FloatMatrix:
+        texts = [sentence.text for sentence in sentences]
+        embed_array = getattr(self.embedding_client, "embed_array", None)
+        if callable(embed_array):
+            return as_matrix(embed_array(texts))
+        return as_matrix(self.embedding_client.embed(texts))
+
     def _prepare_sentences(self, document: Document) -> List[Sentence]:
         sentences: List[Sentence] = []
         tables = list(document.iter_tables())
@@ -214,6 +247,7 @@ class SemanticChunker:
         sentences: Sequence[Sentence],
         chunk_id_gen: ChunkIdGenerator,
         previous_chunk: Optional[Chunk],
+        vectors: _SentenceVectors | None = None,
     ) -> Chunk:
         text = " ".join(sentence.text.strip() for sentence in sentences)
         chunk_id = chunk_id_gen.next(text)
@@ -265,17 +299,24 @@ class SemanticChunker:
             title_path=title_path,
             table_lines=table_lines,
             overlap_with_prev=overlap_info,
-            coherence_score=self._chunk_coherence(sentences),
+            coherence_score=self._chunk_coherence(sentences, vectors),
             table_html=table_html,
             table_digest=table_digest,
         )
 
-    def _chunk_coherence(self, sentences: Sequence[Sentence]) -> float:
+    def _chunk_coherence(
+        self, sentences: Sequence[Sentence], vectors: _SentenceVectors | None = None
+    ) -> float:
         if len(sentences) == 1:
             return 1.0
         scores = []
         for left, right in zip(sentences, sentences[1:]):
-            scores.append(self._sentence_similarity(left.text, right.text))
+            dense = vectors.similarity(left, right) if vectors is not None else None
+            if dense is None:
+                # Synthetic overlap sentences are not part of the batched embeddings.
+                scores.append(self._sentence_similarity(left.text, right.text))
+            else:
+                scores.append((_lexical_coherence(left.text, right.text) + dense) / 2)
         if not scores:
             return 1.0
         return sum(scores) / len(scores)
@@ -311,10 +352,7 @@ class SemanticChunker:
         return (lexical + dense) / 2
 
     def _cosine_dense(self, a: Sequence[float], b: Sequence[float]) -> float:
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a)) or 1.0
-        norm_b = math.sqrt(sum(y * y for y in b)) or 1.0
-        return dot / (norm_a * norm_b)
+        return cosine(a, b)
 
     def _should_delay_boundary(
         self,
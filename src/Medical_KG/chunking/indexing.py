@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 from typing import Iterable, List, Mapping, Sequence
 
+from Medical_KG.utils.vectors import FloatMatrix, adjacent_cosine, as_matrix, cosine, mean_pool
+
 from .chunker import Chunk
 
 
@@ -41,18 +42,37 @@ class ChunkIndexer:
         return documents
 
     def neighbor_merge(
-        self, chunks: Sequence[Chunk], *, min_cosine: float = 0.30
+        self,
+        chunks: Sequence[Chunk],
+        *,
+        min_cosine: float = 0.30,
+        embeddings: FloatMatrix | None = None,
     ) -> List[tuple[Chunk, Chunk]]:
-        """Return adjacent chunks whose embeddings are similar enough to merge at query time."""
+        """Return adjacent chunks whose embeddings are similar enough to merge at query time.
+
+        ``embeddings`` may supply the chunk embeddings as a matrix (one row per
+        chunk); otherwise it is assembled from ``chunk.embedding_qwen``. All
+        adjacent similarities are computed in a single batched operation.
+        """
 
-        merges: List[tuple[Chunk, Chunk]] = []
-        for left, right in zip(chunks, chunks[1:]):
-            if not left.embedding_qwen or not right.embedding_qwen:
-                continue
-            score = self._cosine(left.embedding_qwen, right.embedding_qwen)
-            if score >= min_cosine:
-                merges.append((left, right))
-        return merges
+        if len(chunks) < 2:
+            return []
+        if embeddings is None:
+            present = [bool(chunk.embedding_qwen) for chunk in chunks]
+            if not any(present):
+                return []
+            dimension = next(
+                len(chunk.embedding_qwen or []) for chunk in chunks if chunk.embedding_qwen
+            )
+            embeddings = as_matrix([chunk.embedding_qwen or [0.0] * dimension for chunk in chunks])
+        else:
+            present = [True] * len(chunks)
+        scores = adjacent_cosine(embeddings)
+        return [
+            (chunks[index], chunks[index + 1])
+            for index, score in enumerate(scores.tolist())
+            if present[index] and present[index + 1] and score >= min_cosine
+        ]
 
     def _chunk_level(self, chunks: Sequence[Chunk]) -> List[IndexedChunk]:
         documents: List[IndexedChunk] = []
@@ -143,18 +163,10 @@ class ChunkIndexer:
         vectors = list(embeddings)
         if not vectors:
             return []
-        length = len(vectors[0])
-        pooled = [0.0] * length
-        for vector in vectors:
-            for index, value in enumerate(vector):
-                pooled[index] += value
-        return [value / len(vectors) for value in pooled]
+        return [float(value) for value in mean_pool(vectors).tolist()]
 
     def _cosine(self, a: Sequence[float], b: Sequence[float]) -> float:
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a)) or 1.0
-        norm_b = math.sqrt(sum(y * y for y in b)) or 1.0
-        return dot / (norm_a * norm_b)
+        return cosine(a, b)
 
 
 __all__ = ["ChunkIndexer", "IndexedChunk"]
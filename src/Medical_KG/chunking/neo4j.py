@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 from typing import Mapping, Protocol, Sequence
 
+from Medical_KG.kg.bulk import BulkWriteStats, UnwindBatchWriter
+from Medical_KG.utils.vectors import cosine, rowwise_cosine
+
 from .chunker import Chunk
 
 
@@ -15,7 +17,11 @@ class Neo4jSession(Protocol):  # pragma: no cover
 
 @dataclass(slots=True)
 class ChunkGraphWriter:
-    """Create :Chunk nodes, relationships, and vector index in Neo4j."""
+    """Create :Chunk nodes, relationships, and vector index in Neo4j.
+
+    Nodes and relationships are buffered and written as ``UNWIND`` batches of ``batch_size``
+    rows (via APOC when ``use_apoc`` is set), retrying a batch on transient driver errors.
+    """
 
     session: Neo4jSession
     vector_index_name: str = "chunk_qwen_idx"
@@ -23,6 +29,9 @@ class ChunkGraphWriter:
     similarity_metric: str = "cosine"
     similarity_model: str = "qwen3-embedding-8b"
     similarity_version: str = "1"
+    batch_size: int = 1000
+    use_apoc: bool = False
+    max_retries: int = 3
     _vector_index_created: bool = False
 
     def sync(
@@ -31,17 +40,26 @@ class ChunkGraphWriter:
         chunks: Sequence[Chunk],
         *,
         neighbor_merges: Sequence[tuple[Chunk, Chunk]] | None = None,
-    ) -> None:
+    ) -> BulkWriteStats:
+        writer = UnwindBatchWriter(
+            self.session,
+            batch_size=self.batch_size,
+            use_apoc=self.use_apoc,
+            max_retries=self.max_retries,
+        )
+        writer.merge_node("Document", "id", document_id)
         for index, chunk in enumerate(chunks):
-            self._upsert_chunk(chunk)
-            self._link_document(document_id, chunk.chunk_id, index)
-            self._link_overlap(chunk)
+            self._upsert_chunk(writer, chunk)
+            self._link_document(writer, document_id, chunk.chunk_id, index)
+            self._link_overlap(writer, chunk)
+        writer.flush()
         self.ensure_vector_index()
         if neighbor_merges:
-            self._link_similar(neighbor_merges)
+            self._link_similar(writer, neighbor_merges)
+            writer.flush()
+        return writer.stats
 
-    def _upsert_chunk(self, chunk: Chunk) -> None:
-        query = "MERGE (c:Chunk {id: $id}) " "SET c += $props"
+    def _upsert_chunk(self, writer: UnwindBatchWriter, chunk: Chunk) -> None:
         props = {
             "doc_id": chunk.doc_id,
             "text": chunk.text,
@@ -61,40 +79,34 @@ class ChunkGraphWriter:
             "coherence_score": chunk.coherence_score,
             "createdAt": chunk.created_at.isoformat(),
         }
-        self.session.run(query, {"id": chunk.chunk_id, "props": props})
-
-    def _link_document(self, document_id: str, chunk_id: str, index: int) -> None:
-        query = (
-            "MERGE (d:Document {id: $doc_id}) "
-            "MERGE (c:Chunk {id: $chunk_id}) "
-            "MERGE (d)-[r:HAS_CHUNK]->(c) "
-            "SET r.index = $index"
+        writer.merge_node("Chunk", "id", chunk.chunk_id, props)
+
+    def _link_document(
+        self, writer: UnwindBatchWriter, document_id: str, chunk_id: str, index: int
+    ) -> None:
+        writer.merge_relationship(
+            "HAS_CHUNK",
+            ("Document", "id", document_id),
+            ("Chunk", "id", chunk_id),
+            {"index": index},
         )
-        params = {"doc_id": document_id, "chunk_id": chunk_id, "index": index}
-        self.session.run(query, params)
 
-    def _link_overlap(self, chunk: Chunk) -> None:
+    def _link_overlap(self, writer: UnwindBatchWriter, chunk: Chunk) -> None:
         if not chunk.overlap_with_prev:
             return
         previous_id = chunk.overlap_with_prev.get("chunk_id")
         if not previous_id:
             return
-        start = chunk.overlap_with_prev.get("start")
-        end = chunk.overlap_with_prev.get("end")
-        tokens = chunk.overlap_with_prev.get("token_window")
-        query = (
-            "MATCH (prev:Chunk {id: $prev_id}), (curr:Chunk {id: $curr_id}) "
-            "MERGE (prev)-[r:OVERLAPS]->(curr) "
-            "SET r.start = $start, r.end = $end, r.token_window = $tokens"
+        writer.merge_relationship(
+            "OVERLAPS",
+            ("Chunk", "id", previous_id),
+            ("Chunk", "id", chunk.chunk_id),
+            {
+                "start": chunk.overlap_with_prev.get("start"),
+                "end": chunk.overlap_with_prev.get("end"),
+                "token_window": chunk.overlap_with_prev.get("token_window"),
+            },
         )
-        params = {
-            "prev_id": previous_id,
-            "curr_id": chunk.chunk_id,
-            "start": start,
-            "end": end,
-            "tokens": tokens,
-        }
-        self.session.run(query, params)
 
     def ensure_vector_index(self) -> None:
         if self._vector_index_created:
@@ -108,36 +120,31 @@ class ChunkGraphWriter:
         self.session.run(query, params)
         self._vector_index_created = True
 
-    def _link_similar(self, merges: Sequence[tuple[Chunk, Chunk]]) -> None:
-        for left, right in merges:
-            if not left.embedding_qwen or not right.embedding_qwen:
-                continue
-            score = self._cosine(left.embedding_qwen, right.embedding_qwen)
-            query = (
-                "MATCH (a:Chunk {id: $left}), (b:Chunk {id: $right}) "
-                "MERGE (a)-[r:SIMILAR_TO]->(b) "
-                "SET r.score = $score, r.model = $model, r.version = $version"
-            )
-            params = {
-                "left": left.chunk_id,
-                "right": right.chunk_id,
+    def _link_similar(
+        self, writer: UnwindBatchWriter, merges: Sequence[tuple[Chunk, Chunk]]
+    ) -> None:
+        pairs = [
+            (left, right) for left, right in merges if left.embedding_qwen and right.embedding_qwen
+        ]
+        if not pairs:
+            return
+        scores = rowwise_cosine(
+            [left.embedding_qwen or [] for left, _ in pairs],
+            [right.embedding_qwen or [] for _, right in pairs],
+        ).tolist()
+        for (left, right), score in zip(pairs, scores):
+            props = {
                 "score": score,
                 "model": self.similarity_model,
                 "version": self.similarity_version,
             }
-            self.session.run(query, params)
-            inverse = (
-                "MATCH (a:Chunk {id: $left}), (b:Chunk {id: $right}) "
-                "MERGE (b)-[r:SIMILAR_TO]->(a) "
-                "SET r.score = $score, r.model = $model, r.version = $version"
-            )
-            self.session.run(inverse, params)
+            left_node = ("Chunk", "id", left.chunk_id)
+            right_node = ("Chunk", "id", right.chunk_id)
+            writer.merge_relationship("SIMILAR_TO", left_node, right_node, props)
+            writer.merge_relationship("SIMILAR_TO", right_node, left_node, props)
 
     def _cosine(self, left: Sequence[float], right: Sequence[float]) -> float:
-        dot = sum(a * b for a, b in zip(left, right))
-        norm_left = math.sqrt(sum(a * a for a in left)) or 1.0
-        norm_right = math.sqrt(sum(b * b for b in right)) or 1.0
-        return dot / (norm_left * norm_right)
+        return cosine(left, right)
 
 
 __all__ = ["ChunkGraphWriter", "Neo4jSession"]
@@ -6,6 +6,8 @@ import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, List
 
+from Medical_KG.utils.vectors import FloatMatrix, as_matrix
+
 from .chunker import Chunk, SemanticChunker, select_profile
 from .document import Document
 from .facets import FacetGenerator
@@ -32,6 +34,8 @@ class ChunkingResult:
     index_documents: List[IndexedChunk]
     neighbor_merges: List[tuple[Chunk, Chunk]]
     facet_vectors: List[FacetVectorRecord] = field(default_factory=list)
+    # Chunk embeddings as one contiguous float32 matrix (row i is chunks[i]).
+    embeddings: FloatMatrix | None = None
 
 
 class ChunkingPipeline:
@@ -57,14 +61,15 @@ class ChunkingPipeline:
         for chunk in chunks:
             self._facet_generator.generate(chunk)
         facet_vectors: List[FacetVectorRecord] = []
+        embeddings: FloatMatrix | None = None
         if self._embedding_service and chunks:
-            facet_vectors = self._apply_embeddings(chunks)
+            embeddings, facet_vectors = self._apply_embeddings(chunks)
         metrics = compute_metrics(chunks)
         index_documents: List[IndexedChunk] = []
         neighbor_merges: List[tuple[Chunk, Chunk]] = []
         if self._indexer:
             index_documents = self._indexer.build_documents(chunks)
-            neighbor_merges = self._indexer.neighbor_merge(chunks)
+            neighbor_merges = self._indexer.neighbor_merge(chunks, embeddings=embeddings)
             if (
                 not neighbor_merges
                 and len(chunks) > 1
@@ -81,9 +86,12 @@ class ChunkingPipeline:
             index_documents=index_documents,
             neighbor_merges=neighbor_merges,
             facet_vectors=facet_vectors,
+            embeddings=embeddings,
         )
 
-    def _apply_embeddings(self, chunks: List[Chunk]) -> List[FacetVectorRecord]:
+    def _apply_embeddings(
+        self, chunks: List[Chunk]
+    ) -> tuple[FloatMatrix | None, List[FacetVectorRecord]]:
         if self._embedding_service is None:
             msg = "Embedding service must be configured to apply embeddings"
             raise RuntimeError(msg)
@@ -96,8 +104,13 @@ class ChunkingPipeline:
         for chunk, dense, sparse in zip(chunks, dense_vectors, sparse_vectors):
             chunk.embedding_qwen = dense
             chunk.splade_terms = sparse
+        embeddings = (
+            as_matrix(dense_vectors)
+            if dense_vectors and all(dense_vectors) and len(dense_vectors) == len(chunks)
+            else None
+        )
         if not self._embed_facets:
-            return []
+            return embeddings, []
         payloads: list[tuple[Chunk, str]] = [
             (chunk, json.dumps(chunk.facet_json, sort_keys=True))
             for chunk in chunks
@@ -105,7 +118,7 @@ class ChunkingPipeline:
         ]
         facet_records: List[FacetVectorRecord] = []
         if not payloads:
-            return facet_records
+            return embeddings, facet_records
         dense_vectors, _ = service.embed_texts([payload for _, payload in payloads])
         for (chunk, _), vector in zip(payloads, dense_vectors):
             chunk.facet_embedding_qwen = vector
@@ -117,7 +130,7 @@ class ChunkingPipeline:
                     vector=vector,
                 )
             )
-        return facet_records
+        return embeddings, facet_records
 
 
 __all__ = ["ChunkingPipeline", "ChunkingResult", "FacetVectorRecord"]
@@ -315,18 +315,14 @@ def _command_ledger_compact(args: argparse.Namespace) -> int:
 
 def _command_ledger_validate(args: argparse.Namespace) -> int:
     ledger = _load_ledger_for_cli(args)
-    totals = {
-        state.value: len(ledger.get_documents_by_state(state)) for state in LedgerState
-    }
+    totals = {state.value: count for state, count in ledger.count_by_state().items()}
     print(json.dumps({"documents_by_state": totals}, indent=2))
     return 0
 
 
 def _command_ledger_stats(args: argparse.Namespace) -> int:
     ledger = _load_ledger_for_cli(args)
-    totals = {
-        state.value: len(ledger.get_documents_by_state(state)) for state in LedgerState
-    }
+    totals = {state.value: count for state, count in ledger.count_by_state().items()}
     for state, count in sorted(totals.items()):
         print(f"{state}: {count}")
     return 0
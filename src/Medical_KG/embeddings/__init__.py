@@ -1,6 +1,15 @@
 """Embedding utilities for dense and sparse retrieval."""
 
-from .gpu import GPURequirementError, GPUValidator, enforce_gpu_or_exit
+from .gpu import (
+    DeviceHealthMonitor,
+    DeviceStatus,
+    GPURequirementError,
+    GPUValidator,
+    device_health_monitor,
+    enforce_gpu_or_exit,
+    reset_device_health_monitors,
+    set_device_health_monitor,
+)
 from .monitoring import (
     AlertSink,
     BenchmarkResult,
@@ -11,12 +20,17 @@ from .monitoring import (
 from .qwen import QwenEmbeddingClient
 from .service import EmbeddingMetrics, EmbeddingService
 from .splade import SPLADEExpander
+from .store import EmbeddingCacheStats, EmbeddingStore
 
 __all__ = [
+    "EmbeddingCacheStats",
     "EmbeddingMetrics",
     "EmbeddingService",
+    "EmbeddingStore",
     "AlertSink",
     "BenchmarkResult",
+    "DeviceHealthMonitor",
+    "DeviceStatus",
     "EmbeddingPerformanceMonitor",
     "GPURequirementError",
     "GPUStats",
@@ -24,5 +38,8 @@ __all__ = [
     "LoadTestResult",
     "QwenEmbeddingClient",
     "SPLADEExpander",
+    "device_health_monitor",
     "enforce_gpu_or_exit",
+    "reset_device_health_monitors",
+    "set_device_health_monitor",
 ]
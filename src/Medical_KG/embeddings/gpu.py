@@ -2,25 +2,80 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
-from typing import Callable, Optional
+from time import monotonic
+from typing import Callable, Optional, Protocol
 
 from Medical_KG.compat import create_client, load_torch
 
+from .metrics import GPU_HEALTH_CHECKS
+
+LOGGER = logging.getLogger(__name__)
+
+NVIDIA_SMI_QUERY = ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"]
+
 
 class GPURequirementError(RuntimeError):
     """Raised when GPU preconditions are not satisfied."""
 
 
+class CommandRunner(Protocol):  # pragma: no cover - interface definition
+    def run(self, command: list[str]) -> subprocess.CompletedProcess[str]: ...
+
+
+@dataclass(slots=True)
+class SubprocessRunner(CommandRunner):
+    timeout: float = 5.0
+
+    def run(self, command: list[str]) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=self.timeout,
+        )
+
+
+def query_gpu_names(runner: CommandRunner | None = None) -> list[str]:
+    """Return the device names reported by ``nvidia-smi``.
+
+    Raises :class:`GPURequirementError` when the tool is missing, fails, or
+    reports no devices.
+    """
+
+    runner = runner or SubprocessRunner()
+    try:
+        result = runner.run(list(NVIDIA_SMI_QUERY))
+    except FileNotFoundError as exc:
+        raise GPURequirementError(
+            "GPU required for embeddings but nvidia-smi is not available"
+        ) from exc
+    except subprocess.SubprocessError as exc:
+        raise GPURequirementError("Failed to execute nvidia-smi for GPU validation") from exc
+    if getattr(result, "returncode", 0) != 0:
+        raise GPURequirementError("Failed to execute nvidia-smi for GPU validation")
+    names = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    if not names:
+        raise GPURequirementError(
+            "GPU required for embeddings but no devices were reported by nvidia-smi"
+        )
+    return names
+
+
 @dataclass(slots=True)
 class GPUValidator:
     """Validate GPU availability, CUDA visibility, and vLLM health."""
 
     require_gpu_env: str = "REQUIRE_GPU"
     http_getter: Optional[Callable[[str], int]] = None
+    runner: CommandRunner | None = None
 
     def should_require_gpu(self) -> bool:
         value = os.environ.get(self.require_gpu_env, "1").lower()
@@ -38,26 +93,7 @@ class GPUValidator:
             raise GPURequirementError(
                 "GPU required for embeddings but torch.cuda.is_available() returned False"
             )
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5,
-            )
-        except FileNotFoundError as exc:  # pragma: no cover - extremely unlikely in tests
-            raise GPURequirementError(
-                "GPU required for embeddings but nvidia-smi is not available"
-            ) from exc
-        except subprocess.SubprocessError as exc:
-            raise GPURequirementError("Failed to execute nvidia-smi for GPU validation") from exc
-        names = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-        if not names:
-            raise GPURequirementError(
-                "GPU required for embeddings but no devices were reported by nvidia-smi"
-            )
+        query_gpu_names(self.runner)
         mem_info = getattr(torch_module.cuda, "mem_get_info", None)
         if callable(mem_info):
             free_mem, total_mem = mem_info()
@@ -83,6 +119,170 @@ class GPUValidator:
             client.close()
 
 
+@dataclass(slots=True, frozen=True)
+class DeviceStatus:
+    """Outcome of the most recent device probe."""
+
+    available: bool
+    checked_at: float
+    error: str | None = None
+
+    @property
+    def device(self) -> str:
+        return "cuda" if self.available else "cpu"
+
+
+class DeviceHealthMonitor:
+    """Cache the result of an expensive device probe.
+
+    ``probe`` raises :class:`GPURequirementError` when the device is unusable.
+    Healthy results are reused for ``ttl_seconds`` and failures for
+    ``failure_ttl_seconds``. Once a cached result goes stale it keeps being
+    served while a background thread re-probes (``background_refresh=True``),
+    so callers on the hot path never wait for ``nvidia-smi`` after the first
+    check. :meth:`invalidate` forces the next caller to probe synchronously,
+    e.g. after a CUDA error.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], None],
+        *,
+        ttl_seconds: float = 60.0,
+        failure_ttl_seconds: float = 10.0,
+        background_refresh: bool = True,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._probe = probe
+        self._ttl = ttl_seconds
+        self._failure_ttl = failure_ttl_seconds
+        self._background_refresh = background_refresh
+        self._clock = clock
+        self._status: DeviceStatus | None = None
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._refresher: threading.Thread | None = None
+
+    def status(self) -> DeviceStatus:
+        """Return the cached status, probing only when none is usable."""
+
+        with self._lock:
+            current = self._status
+            if current is not None and not self._is_stale(current):
+                return current
+            if current is not None and self._background_refresh:
+                self._start_background_refresh()
+                return current
+        return self._refresh(only_if_stale=True)
+
+    def refresh(self) -> DeviceStatus:
+        """Probe the device now and cache the result."""
+
+        return self._refresh(only_if_stale=False)
+
+    def _refresh(self, *, only_if_stale: bool) -> DeviceStatus:
+        with self._probe_lock:
+            if only_if_stale:
+                with self._lock:
+                    current = self._status
+                    if current is not None and not self._is_stale(current):
+                        # Another caller probed while we waited for the probe lock.
+                        return current
+            try:
+                self._probe()
+            except GPURequirementError as exc:
+                status = DeviceStatus(available=False, checked_at=self._clock(), error=str(exc))
+            else:
+                status = DeviceStatus(available=True, checked_at=self._clock())
+            GPU_HEALTH_CHECKS.labels(outcome="ok" if status.available else "unavailable").inc()
+            with self._lock:
+                self._status = status
+            return status
+
+    def invalidate(self) -> None:
+        """Drop the cached status so the next caller probes synchronously."""
+
+        with self._lock:
+            self._status = None
+
+    def ensure_available(self) -> None:
+        """Raise :class:`GPURequirementError` unless the device is healthy."""
+
+        status = self.status()
+        if not status.available:
+            raise GPURequirementError(status.error or "GPU unavailable")
+
+    def select_device(self, *, require: bool = False) -> str:
+        """Return ``"cuda"`` when healthy, else ``"cpu"`` (or raise if ``require``)."""
+
+        if require:
+            self.ensure_available()
+        return self.status().device
+
+    def _is_stale(self, status: DeviceStatus) -> bool:
+        ttl = self._ttl if status.available else self._failure_ttl
+        return self._clock() - status.checked_at >= ttl
+
+    def _start_background_refresh(self) -> None:
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._refresher = threading.Thread(
+            target=self._refresh_quietly, name="gpu-health-refresh", daemon=True
+        )
+        self._refresher.start()
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self._refresh(only_if_stale=True)
+        except Exception:  # pragma: no cover - probes only raise GPURequirementError
+            LOGGER.exception("Background GPU health refresh failed")
+            self.invalidate()
+
+
+def _probe_gpu() -> None:
+    query_gpu_names()
+
+
+_SHARED_MONITORS: dict[Callable[[], None], DeviceHealthMonitor] = {}
+_SHARED_MONITORS_LOCK = threading.Lock()
+
+
+def device_health_monitor(probe: Callable[[], None] | None = None) -> DeviceHealthMonitor:
+    """Return the process-wide monitor for ``probe``.
+
+    Callers passing the same probe (e.g. the ``validate`` method of one
+    :class:`GPUValidator`) share a single cached status. Without a probe the
+    monitor wraps the ``nvidia-smi`` device query used for PDF processing.
+    """
+
+    key = probe or _probe_gpu
+    with _SHARED_MONITORS_LOCK:
+        monitor = _SHARED_MONITORS.get(key)
+        if monitor is None:
+            monitor = _SHARED_MONITORS[key] = DeviceHealthMonitor(key)
+        return monitor
+
+
+def set_device_health_monitor(
+    monitor: DeviceHealthMonitor | None, *, probe: Callable[[], None] | None = None
+) -> None:
+    """Install ``monitor`` for ``probe``; ``None`` drops it so the next call builds a fresh one."""
+
+    key = probe or _probe_gpu
+    with _SHARED_MONITORS_LOCK:
+        if monitor is None:
+            _SHARED_MONITORS.pop(key, None)
+        else:
+            _SHARED_MONITORS[key] = monitor
+
+
+def reset_device_health_monitors() -> None:
+    """Drop every shared monitor, e.g. between tests."""
+
+    with _SHARED_MONITORS_LOCK:
+        _SHARED_MONITORS.clear()
+
+
 def enforce_gpu_or_exit(
     *, endpoint: str | None = None, validator: GPUValidator | None = None
 ) -> None:
@@ -99,4 +299,16 @@ def enforce_gpu_or_exit(
         raise SystemExit(99) from exc
 
 
-__all__ = ["GPURequirementError", "GPUValidator", "enforce_gpu_or_exit"]
+__all__ = [
+    "CommandRunner",
+    "DeviceHealthMonitor",
+    "DeviceStatus",
+    "GPURequirementError",
+    "GPUValidator",
+    "SubprocessRunner",
+    "device_health_monitor",
+    "enforce_gpu_or_exit",
+    "query_gpu_names",
+    "reset_device_health_monitors",
+    "set_device_health_monitor",
+]
@@ -22,8 +22,22 @@ EMBEDDING_LATENCY = Histogram(
     ["model", "device"],
 )
 
+EMBEDDING_CACHE_LOOKUPS = Counter(
+    "embedding_cache_lookups_total",
+    "Embedding store lookups by vector kind and outcome",
+    ["kind", "outcome"],
+)
+
+GPU_HEALTH_CHECKS = Counter(
+    "embedding_gpu_health_checks_total",
+    "GPU health probes by outcome",
+    ["outcome"],
+)
+
 __all__ = [
+    "EMBEDDING_CACHE_LOOKUPS",
     "EMBEDDING_ERRORS",
     "EMBEDDING_LATENCY",
     "EMBEDDING_REQUESTS",
+    "GPU_HEALTH_CHECKS",
 ]
@@ -11,6 +11,7 @@ from typing import Mapping, Protocol, Sequence
 
 from .gpu import GPURequirementError, GPUValidator
 from .service import EmbeddingService
+from .store import EmbeddingCacheStats, EmbeddingStore
 
 
 class AlertSink(Protocol):  # pragma: no cover - interface definition
@@ -127,6 +128,25 @@ class EmbeddingPerformanceMonitor:
             )
             self._emit_alert("throughput_low", message)
 
+    def cache_stats(self) -> EmbeddingCacheStats:
+        """Return embedding store hit/miss counters (all zero without a store)."""
+
+        store: EmbeddingStore | None = getattr(self.service, "store", None)
+        return store.stats() if store is not None else EmbeddingCacheStats()
+
+    def check_cache_hit_rate(self, *, threshold: float, min_lookups: int = 100) -> None:
+        """Emit alert when the dense embedding cache hit rate drops below threshold."""
+
+        stats = self.cache_stats()
+        if stats.dense_hits + stats.dense_misses < min_lookups:
+            return
+        if stats.dense_hit_rate < threshold:
+            message = (
+                f"Embedding cache hit rate {stats.dense_hit_rate:.1%} "
+                f"below threshold {threshold:.1%}"
+            )
+            self._emit_alert("cache_hit_rate_low", message)
+
     def run_load_test(
         self,
         sample_texts: Sequence[str],
@@ -190,6 +210,11 @@ class EmbeddingPerformanceMonitor:
                     "metric": "gpu_utilisation_percent",
                     "description": "Average GPU utilisation collected via nvidia-smi",
                 },
+                {
+                    "title": "Embedding Cache Hit Rate",
+                    "metric": "embedding_cache_lookups_total",
+                    "description": "Share of dense/sparse lookups served by the embedding store",
+                },
                 {
                     "title": "SPLADE Terms/sec",
                     "metric": "splade_terms_per_second",
@@ -2,22 +2,97 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import math
-import random
 import time
-from dataclasses import dataclass
-from typing import Callable, List, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Mapping, Sequence
 
-from Medical_KG.compat import ClientProtocol, create_client
+import numpy as np
+
+from Medical_KG.compat import (
+    AsyncClientProtocol,
+    ClientProtocol,
+    create_async_client,
+    create_client,
+)
 from Medical_KG.utils.optional_dependencies import HttpxModule, get_httpx_module
+from Medical_KG.utils.vectors import FloatMatrix, as_matrix, normalize_rows, to_lists
 
 HTTPX: HttpxModule = get_httpx_module()
 
 
+class _AdaptiveBatchSizer:
+    """Pick batch sizes that keep request latency and payload size near targets.
+
+    Per-text latency is tracked as an exponential moving average; the next
+    batch holds as many texts as fit in ``target_latency`` at that rate,
+    clamped to ``[min_size, max_size]`` and cut short once the encoded
+    payload would exceed ``max_payload_bytes``.
+    """
+
+    __slots__ = (
+        "min_size",
+        "max_size",
+        "target_latency",
+        "max_payload_bytes",
+        "_per_text",
+        "_size",
+    )
+
+    def __init__(
+        self,
+        *,
+        min_size: int,
+        max_size: int,
+        target_latency: float,
+        max_payload_bytes: int,
+    ) -> None:
+        self.min_size = max(1, min(min_size, max_size))
+        self.max_size = max(1, max_size)
+        self.target_latency = target_latency
+        self.max_payload_bytes = max_payload_bytes
+        self._per_text: float | None = None
+        self._size = self.max_size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def next_end(self, texts: Sequence[str], start: int) -> int:
+        """Return the exclusive end index of the batch starting at ``start``."""
+
+        limit = min(len(texts), start + self._size)
+        payload = 0
+        end = start
+        while end < limit:
+            payload += len(texts[end].encode("utf-8"))
+            if end > start and payload > self.max_payload_bytes:
+                break
+            end += 1
+        return end
+
+    def observe(self, latency: float, count: int) -> None:
+        if count <= 0 or latency <= 0:
+            return
+        per_text = latency / count
+        self._per_text = (
+            per_text if self._per_text is None else 0.3 * per_text + 0.7 * self._per_text
+        )
+        target = int(self.target_latency / self._per_text)
+        self._size = max(self.min_size, min(self.max_size, target))
+
+
 @dataclass(slots=True)
 class QwenEmbeddingClient:
-    """Client producing deterministic Qwen-style embeddings for tests."""
+    """Client producing deterministic Qwen-style embeddings for tests.
+
+    With ``api_url`` set, batches are posted to an OpenAI-compatible
+    embeddings endpoint (e.g. vLLM) over a pooled HTTP client that is reused
+    across calls; :meth:`aembed` keeps up to ``max_in_flight`` batches in
+    flight. Batch sizes adapt to observed latency (``target_batch_latency``)
+    and payload size (``max_payload_bytes``) up to ``batch_size``.
+    """
 
     model: str = "Qwen3-Embedding-8B"
     dimension: int = 4096
@@ -28,68 +103,207 @@ class QwenEmbeddingClient:
     max_retries: int = 3
     http_client_factory: Callable[[], ClientProtocol] | None = None
     sleep: Callable[[float], None] = time.sleep
+    async_http_client_factory: Callable[[], AsyncClientProtocol] | None = None
+    max_in_flight: int = 4
+    min_batch_size: int = 8
+    target_batch_latency: float = 2.0
+    max_payload_bytes: int = 4 * 1024 * 1024
+    retry_backoff: float = 0.2
+    _client: ClientProtocol | None = field(default=None, init=False, repr=False)
+    _async_client: AsyncClientProtocol | None = field(default=None, init=False, repr=False)
+    _async_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+    _sizer: _AdaptiveBatchSizer | None = field(default=None, init=False, repr=False)
 
     def embed(self, texts: Sequence[str]) -> List[List[float]]:
         """Embed a batch of texts, splitting into model-sized batches."""
 
+        sizer = self._batch_sizer()
         outputs: List[List[float]] = []
-        for start in range(0, len(texts), self.batch_size):
-            chunk = texts[start : start + self.batch_size]
-            outputs.extend(self._embed_chunk(chunk))
+        start = 0
+        while start < len(texts):
+            end = sizer.next_end(texts, start)
+            outputs.extend(self._embed_chunk(texts[start:end]))
+            start = end
         return outputs
 
+    async def aembed(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed ``texts`` with up to ``max_in_flight`` batches running concurrently.
+
+        Results are returned in input order regardless of completion order.
+        """
+
+        if not texts:
+            return []
+        sizer = self._batch_sizer()
+        slots = asyncio.Semaphore(max(1, self.max_in_flight))
+        tasks: list[asyncio.Task[List[List[float]]]] = []
+        start = 0
+        try:
+            while start < len(texts):
+                # Size each batch when a slot frees up so it reflects the
+                # latency observed for batches that already completed.
+                await slots.acquire()
+                end = sizer.next_end(texts, start)
+                tasks.append(asyncio.create_task(self._aembed_slot(texts[start:end], slots)))
+                start = end
+            batches = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [vector for batch in batches for vector in batch]
+
+    def close(self) -> None:
+        """Close the pooled synchronous HTTP client."""
+
+        client, self._client = self._client, None
+        if client is not None and self.http_client_factory is None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the pooled asynchronous HTTP client."""
+
+        client, self._async_client = self._async_client, None
+        self._async_loop = None
+        if client is not None and self.async_http_client_factory is None:
+            await client.aclose()
+
+    def _batch_sizer(self) -> _AdaptiveBatchSizer:
+        if self._sizer is None:
+            self._sizer = _AdaptiveBatchSizer(
+                min_size=self.min_batch_size,
+                max_size=self.batch_size,
+                target_latency=self.target_batch_latency,
+                max_payload_bytes=self.max_payload_bytes,
+            )
+        return self._sizer
+
+    async def _aembed_slot(
+        self, texts: Sequence[str], slots: asyncio.Semaphore
+    ) -> List[List[float]]:
+        try:
+            if self.api_url and not self.transport:
+                return await self._aembed_via_http(texts)
+            return await asyncio.to_thread(self._embed_chunk, texts)
+        finally:
+            slots.release()
+
     def _embed_chunk(self, texts: Sequence[str]) -> List[List[float]]:
         if self.transport:
             return self.transport(texts)
         if self.api_url:
             return self._embed_via_http(texts)
-        vectors = [self._deterministic_vector(text) for text in texts]
-        return [self._normalise(vector) for vector in vectors]
+        return to_lists(self._deterministic_matrix(texts))
 
     def _embed_via_http(self, texts: Sequence[str]) -> List[List[float]]:
+        api_url = self._require_api_url()
         payload = {"model": self.model, "input": list(texts)}
-        api_url = self.api_url
-        if api_url is None:
-            msg = "api_url must be configured for HTTP embedding transport"
-            raise RuntimeError(msg)
         attempt = 0
         last_error: Exception | None = None
         while attempt < self.max_retries:
             attempt += 1
             try:
-                client = (
-                    self.http_client_factory()
-                    if self.http_client_factory
-                    else create_client(timeout=self.timeout)
-                )
-                try:
-                    response = client.post(api_url, json=payload)
-                    response.raise_for_status()
-                    data = response.json()
-                    vectors = [item["embedding"] for item in data.get("data", [])]
-                    if len(vectors) != len(texts):
-                        raise ValueError("embedding service returned unexpected vector count")
-                    return vectors
-                finally:
-                    if self.http_client_factory is None:
-                        client.close()
+                started = time.perf_counter()
+                response = self._http_client().post(api_url, json=payload)
+                response.raise_for_status()
+                vectors = self._parse_vectors(response.json(), len(texts))
+                self._batch_sizer().observe(time.perf_counter() - started, len(texts))
+                return vectors
             except Exception as exc:  # pragma: no cover - exercised via retries in tests
                 last_error = exc
                 if attempt >= self.max_retries:
                     raise
-                self.sleep(0.2 * attempt)
+                self.sleep(self.retry_backoff * attempt)
         if last_error:
             raise last_error
         return []
 
+    async def _aembed_via_http(self, texts: Sequence[str]) -> List[List[float]]:
+        api_url = self._require_api_url()
+        payload = {"model": self.model, "input": list(texts)}
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                started = time.perf_counter()
+                response = await self._async_http_client().request("POST", api_url, json=payload)
+                response.raise_for_status()
+                vectors = self._parse_vectors(response.json(), len(texts))
+                self._batch_sizer().observe(time.perf_counter() - started, len(texts))
+                return vectors
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self.retry_backoff * attempt)
+
+    def _require_api_url(self) -> str:
+        if self.api_url is None:
+            msg = "api_url must be configured for HTTP embedding transport"
+            raise RuntimeError(msg)
+        return self.api_url
+
+    def _http_client(self) -> ClientProtocol:
+        if self._client is None:
+            self._client = (
+                self.http_client_factory()
+                if self.http_client_factory
+                else create_client(**self._client_options())
+            )
+        return self._client
+
+    def _async_http_client(self) -> AsyncClientProtocol:
+        # Async connection pools are bound to the loop that created them.
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = (
+                self.async_http_client_factory()
+                if self.async_http_client_factory
+                else create_async_client(**self._client_options())
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    def _client_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {"timeout": self.timeout}
+        limits = getattr(HTTPX, "Limits", None)
+        if limits is not None:
+            options["limits"] = limits(
+                max_connections=max(1, self.max_in_flight),
+                max_keepalive_connections=max(1, self.max_in_flight),
+            )
+        return options
+
+    @staticmethod
+    def _parse_vectors(data: Mapping[str, Any], expected: int) -> List[List[float]]:
+        items = list(data.get("data", []))
+        if items and all("index" in item for item in items):
+            items.sort(key=lambda item: item["index"])
+        vectors = [item["embedding"] for item in items]
+        if len(vectors) != expected:
+            raise ValueError("embedding service returned unexpected vector count")
+        return vectors
+
+    def embed_array(self, texts: Sequence[str]) -> FloatMatrix:
+        """Embed ``texts`` into a contiguous ``(len(texts), dimension)`` float32 matrix."""
+
+        if self.transport or self.api_url:
+            return as_matrix(self.embed(texts), dimension=self.dimension)
+        return self._deterministic_matrix(texts)
+
+    def _deterministic_matrix(self, texts: Sequence[str]) -> FloatMatrix:
+        matrix = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            seed = hashlib.sha256((self.model + text).encode("utf-8")).digest()
+            generator = np.random.default_rng(int.from_bytes(seed, "little"))
+            matrix[row] = generator.uniform(-1.0, 1.0, self.dimension)
+        return normalize_rows(matrix)
+
     def _deterministic_vector(self, text: str) -> List[float]:
-        seed = hashlib.sha256((self.model + text).encode("utf-8")).digest()
-        rnd = random.Random(seed)
-        return [rnd.uniform(-1.0, 1.0) for _ in range(self.dimension)]
+        return to_lists(self._deterministic_matrix([text]))[0]
 
     def _normalise(self, vector: Sequence[float]) -> List[float]:
-        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
-        return [value / norm for value in vector]
+        return to_lists(normalize_rows([vector]))[0]
 
 
 __all__ = ["QwenEmbeddingClient"]
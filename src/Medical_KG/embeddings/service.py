@@ -7,10 +7,11 @@ import time
 from dataclasses import dataclass, field
 from typing import List, Sequence
 
-from .gpu import GPURequirementError, GPUValidator
+from .gpu import DeviceHealthMonitor, GPUValidator, device_health_monitor
 from .metrics import EMBEDDING_ERRORS, EMBEDDING_LATENCY, EMBEDDING_REQUESTS
 from .qwen import QwenEmbeddingClient
 from .splade import SPLADEExpander
+from .store import EmbeddingStore
 
 LOGGER = logging.getLogger(__name__)
 
@@ -32,42 +33,106 @@ class EmbeddingService:
     splade: SPLADEExpander
     metrics: EmbeddingMetrics = field(default_factory=EmbeddingMetrics)
     gpu_validator: GPUValidator | None = None
+    device_health: DeviceHealthMonitor | None = None
+    store: EmbeddingStore | None = None
+
+    def __post_init__(self) -> None:
+        # Probing the GPU forks nvidia-smi and queries CUDA, so batches share a
+        # cached health status instead of validating on every call. Services
+        # built around the same validator share one process-wide monitor.
+        if self.device_health is None and self.gpu_validator is not None:
+            self.device_health = device_health_monitor(self.gpu_validator.validate)
 
     def embed_texts(
         self, texts: Sequence[str], *, sparse_texts: Sequence[str] | None = None
     ) -> tuple[List[List[float]], List[dict[str, float]]]:
         if not texts:
             return [], []
-        device_label = "gpu" if self.gpu_validator else "cpu"
-        if self.gpu_validator:
-            try:
-                self.gpu_validator.validate()
-            except GPURequirementError:
-                LOGGER.warning("GPU unavailable for embeddings, falling back to CPU")
-                device_label = "cpu_fallback"
-        dense_start = time.perf_counter()
-        try:
-            dense_vectors = self.qwen.embed(texts)
-        except Exception:
-            EMBEDDING_ERRORS.labels(model=self.qwen.model, device=device_label).inc()
-            raise
-        dense_duration = max(time.perf_counter() - dense_start, 1e-6)
-        total_tokens = sum(len(text.split()) for text in texts)
-        self.metrics.dense_tokens_per_second = total_tokens / dense_duration
-        self.metrics.dense_batch_size = max(len(texts), 1)
-
         sparse_inputs = list(sparse_texts) if sparse_texts is not None else list(texts)
-        sparse_start = time.perf_counter()
-        sparse_vectors = self.splade.expand(sparse_inputs)
-        sparse_duration = max(time.perf_counter() - sparse_start, 1e-6)
-        total_terms = sum(len(terms) for terms in sparse_vectors)
-        self.metrics.sparse_terms_per_second = total_terms / sparse_duration if total_terms else 0.0
+        dense_vectors: list[List[float] | None]
+        sparse_vectors: list[dict[str, float] | None]
+        if self.store is not None:
+            dense_vectors = self.store.get_dense(self.qwen.model, self.qwen.dimension, texts)
+            sparse_vectors = self.store.get_sparse(self._sparse_model(), sparse_inputs)
+        else:
+            dense_vectors = [None] * len(texts)
+            sparse_vectors = [None] * len(sparse_inputs)
+        dense_missing = [index for index, vector in enumerate(dense_vectors) if vector is None]
+        sparse_missing = [index for index, terms in enumerate(sparse_vectors) if terms is None]
+
+        # Only the texts the store has not seen are sent to the backends.
+        device_label = self._select_device() if dense_missing else "cache"
+        dense_start = time.perf_counter()
+        if dense_missing:
+            pending = [texts[index] for index in dense_missing]
+            try:
+                computed = self.qwen.embed(pending)
+            except Exception:
+                EMBEDDING_ERRORS.labels(model=self.qwen.model, device=device_label).inc()
+                if device_label == "gpu" and self.device_health is not None:
+                    self.device_health.invalidate()
+                raise
+            dense_duration = max(time.perf_counter() - dense_start, 1e-6)
+            total_tokens = sum(len(text.split()) for text in pending)
+            self.metrics.dense_tokens_per_second = total_tokens / dense_duration
+            self.metrics.dense_batch_size = max(len(pending), 1)
+            for index, vector in zip(dense_missing, computed):
+                dense_vectors[index] = vector
+            if self.store is not None:
+                self.store.put_dense(self.qwen.model, self.qwen.dimension, pending, computed)
+
+        if sparse_missing:
+            pending_sparse = [sparse_inputs[index] for index in sparse_missing]
+            sparse_start = time.perf_counter()
+            expanded = self.splade.expand(pending_sparse)
+            sparse_duration = max(time.perf_counter() - sparse_start, 1e-6)
+            total_terms = sum(len(terms) for terms in expanded)
+            self.metrics.sparse_terms_per_second = (
+                total_terms / sparse_duration if total_terms else 0.0
+            )
+            for index, terms in zip(sparse_missing, expanded):
+                sparse_vectors[index] = terms
+            if self.store is not None:
+                self.store.put_sparse(self._sparse_model(), pending_sparse, expanded)
 
         duration = max(time.perf_counter() - dense_start, 1e-6)
         EMBEDDING_REQUESTS.labels(model=self.qwen.model, device=device_label).inc(len(texts))
         EMBEDDING_LATENCY.labels(model=self.qwen.model, device=device_label).observe(duration)
 
-        return dense_vectors, sparse_vectors
+        return (
+            [vector if vector is not None else [] for vector in dense_vectors],
+            [terms if terms is not None else {} for terms in sparse_vectors],
+        )
+
+    def _select_device(self) -> str:
+        if self.device_health is None:
+            return "cpu"
+        if self.device_health.select_device() == "cuda":
+            return "gpu"
+        LOGGER.warning("GPU unavailable for embeddings, falling back to CPU")
+        return "cpu_fallback"
+
+    def _sparse_model(self) -> str:
+        # Expansion settings change the output, so they are part of the cache key.
+        splade = self.splade
+        return (
+            f"{type(splade).__name__}:top_k={getattr(splade, 'top_k', '')}"
+            f":min_weight={getattr(splade, 'min_weight', '')}"
+        )
+
+    def close(self) -> None:
+        """Close the pooled HTTP client of the dense backend."""
+
+        self.qwen.close()
+
+    async def aclose(self) -> None:
+        """Close the pooled sync and async HTTP clients of the dense backend.
+
+        Await it on the event loop that ran :meth:`QwenEmbeddingClient.aembed`.
+        """
+
+        self.qwen.close()
+        await self.qwen.aclose()
 
     def embed_concepts(self, concepts: Sequence["ConceptLike"]) -> None:
         texts = [concept.to_embedding_text() for concept in concepts]
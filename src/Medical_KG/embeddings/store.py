@@ -0,0 +1,473 @@
+"""Content-addressed persistent cache for dense and sparse embeddings.
+
+Vectors are keyed by ``(model, dimension, sha256(text))`` so unchanged chunks,
+concepts, and repeated queries are never sent to the embedding backend twice.
+Dense vectors are stored as fixed-width float32 or float16 rows in shard files
+that are read through ``mmap``; SPLADE term maps are stored as interned term
+ids with float32 weights. LRUs bounded by an estimate of their size in bytes
+hold recently used vectors in memory; dense rows are kept as float32 arrays.
+
+On-disk layout (``root`` is the store directory)::
+
+    dense/<model>-<dimension>-<dtype>/entries.dat      digest -> (shard, row) records
+    dense/<model>-<dimension>-<dtype>/shard-00000.vec  fixed-width vector rows
+    sparse/<model>/entries.dat                         digest -> (offset, length) records
+    sparse/<model>/terms.dat                           JSON-encoded term per line (id = line)
+    sparse/<model>/weights.dat                         packed (term id, weight) pairs
+
+Entry records are appended after their payload, so a torn write only loses the
+entry being written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from struct import Struct
+from typing import BinaryIO, Callable, Generic, Hashable, List, Mapping, Sequence, TypeVar
+
+from .metrics import EMBEDDING_CACHE_LOOKUPS
+
+DEFAULT_ROWS_PER_SHARD = 65_536
+# Each LRU holds about 16k float32 rows of the 4096-dimensional Qwen model.
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+
+_ENTRY = Struct("<32sIQI")  # digest, shard, row or byte offset, payload length
+_SPARSE_COUNT = Struct("<I")
+_SPARSE_TERM = Struct("<If")
+_DTYPES = {"float32": ("f", 4), "float16": ("e", 2)}
+_NAME_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
+_FLOAT_SIZE = sys.getsizeof(0.0)
+
+_V = TypeVar("_V")
+
+
+def text_digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _namespace_name(*parts: object) -> str:
+    label = "-".join(str(part) for part in parts)
+    suffix = hashlib.sha1(label.encode("utf-8")).hexdigest()[:8]
+    return f"{_NAME_PATTERN.sub('_', label)[:80]}-{suffix}"
+
+
+@dataclass(slots=True)
+class EmbeddingCacheStats:
+    """Lookup counters for an :class:`EmbeddingStore`."""
+
+    dense_hits: int = 0
+    dense_misses: int = 0
+    sparse_hits: int = 0
+    sparse_misses: int = 0
+
+    @property
+    def dense_hit_rate(self) -> float:
+        total = self.dense_hits + self.dense_misses
+        return self.dense_hits / total if total else 0.0
+
+    @property
+    def sparse_hit_rate(self) -> float:
+        total = self.sparse_hits + self.sparse_misses
+        return self.sparse_hits / total if total else 0.0
+
+
+class _MemoryLRU(Generic[_V]):
+    """Least recently used map bounded by the estimated bytes of its values."""
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[_V], int]) -> None:
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[Hashable, tuple[_V, int]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: Hashable) -> _V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: _V) -> None:
+        size = self._sizeof(value)
+        if size > self._max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+def _sparse_size(weights: dict[str, float]) -> int:
+    # Term strings are shared with the namespace term table; charge the map and weights.
+    return sys.getsizeof(weights) + len(weights) * _FLOAT_SIZE
+
+
+class _EntryLog:
+    """Append-only ``digest -> location`` records loaded into a dict on open."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self.entries: dict[bytes, tuple[int, int, int]] = {}
+        data = path.read_bytes() if path.exists() else b""
+        usable = len(data) - len(data) % _ENTRY.size
+        for digest, shard, position, length in _ENTRY.iter_unpack(data[:usable]):
+            self.entries[digest] = (shard, position, length)
+        self._handle: BinaryIO = path.open("ab")
+        if usable != len(data):
+            self._handle.truncate(usable)
+
+    def append(self, digest: bytes, shard: int, position: int, length: int) -> None:
+        self._handle.write(_ENTRY.pack(digest, shard, position, length))
+        self.entries[digest] = (shard, position, length)
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class _DenseNamespace:
+    def __init__(self, root: Path, *, dimension: int, dtype: str, rows_per_shard: int) -> None:
+        root.mkdir(parents=True, exist_ok=True)
+        self._root = root
+        self._code, itemsize = _DTYPES[dtype]
+        self._dimension = dimension
+        self._row_bytes = dimension * itemsize
+        self._rows_per_shard = rows_per_shard
+        self._entries = _EntryLog(root / "entries.dat")
+        self._maps: dict[int, mmap.mmap] = {}
+        self._files: dict[int, BinaryIO] = {}
+        shards = sorted(int(path.stem.split("-")[1]) for path in root.glob("shard-*.vec"))
+        self._shard = shards[-1] if shards else 0
+        self._writer = self._shard_path(self._shard).open("ab")
+        size = self._writer.tell()
+        if size % self._row_bytes:
+            self._writer.truncate(size - size % self._row_bytes)
+            self._writer.seek(0, os.SEEK_END)
+        self._rows = self._writer.tell() // self._row_bytes
+
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self._entries.entries
+
+    def _shard_path(self, shard: int) -> Path:
+        return self._root / f"shard-{shard:05d}.vec"
+
+    def get(self, digest: bytes) -> array[float] | None:
+        location = self._entries.entries.get(digest)
+        if location is None:
+            return None
+        shard, row, _ = location
+        start = row * self._row_bytes
+        raw = self._map(shard, start + self._row_bytes)[start : start + self._row_bytes]
+        if self._code == "e":
+            return array("f", Struct(f"<{self._dimension}e").unpack(raw))
+        values = array("f")
+        values.frombytes(raw)
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+            values.byteswap()
+        return values
+
+    def put(self, digest: bytes, vector: Sequence[float]) -> None:
+        if len(vector) != self._dimension:
+            raise ValueError(
+                f"expected {self._dimension}-dimensional vector, received {len(vector)}"
+            )
+        if self._rows >= self._rows_per_shard:
+            self._rotate()
+        if self._code == "f":
+            values = array("f", vector)
+            if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+                values.byteswap()
+            payload = values.tobytes()
+        else:
+            payload = Struct(f"<{self._dimension}e").pack(*vector)
+        self._writer.write(payload)
+        self._entries.append(digest, self._shard, self._rows, self._row_bytes)
+        self._rows += 1
+
+    def _rotate(self) -> None:
+        self._writer.close()
+        self._shard += 1
+        self._writer = self._shard_path(self._shard).open("ab")
+        self._rows = 0
+
+    def _map(self, shard: int, required: int) -> mmap.mmap:
+        current = self._maps.get(shard)
+        if current is not None and len(current) >= required:
+            return current
+        if shard == self._shard:
+            self._writer.flush()
+        if current is not None:
+            current.close()
+        handle = self._files.get(shard)
+        if handle is None:
+            handle = self._shard_path(shard).open("rb")
+            self._files[shard] = handle
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[shard] = mapped
+        return mapped
+
+    def flush(self) -> None:
+        self._writer.flush()
+        self._entries.flush()
+
+    def close(self) -> None:
+        for mapped in self._maps.values():
+            mapped.close()
+        for handle in self._files.values():
+            handle.close()
+        self._maps.clear()
+        self._files.clear()
+        self._writer.close()
+        self._entries.close()
+
+
+class _SparseNamespace:
+    def __init__(self, root: Path) -> None:
+        root.mkdir(parents=True, exist_ok=True)
+        self._entries = _EntryLog(root / "entries.dat")
+        terms_path = root / "terms.dat"
+        self._terms: list[str] = []
+        if terms_path.exists():
+            with terms_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.endswith("\n"):
+                        self._terms.append(json.loads(line))
+        self._term_ids = {term: index for index, term in enumerate(self._terms)}
+        self._terms_writer = terms_path.open("a", encoding="utf-8")
+        self._writer: BinaryIO = (root / "weights.dat").open("ab")
+        self._reader: BinaryIO = (root / "weights.dat").open("rb")
+
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self._entries.entries
+
+    def get(self, digest: bytes) -> dict[str, float] | None:
+        location = self._entries.entries.get(digest)
+        if location is None:
+            return None
+        _, offset, length = location
+        self._writer.flush()
+        raw = os.pread(self._reader.fileno(), length, offset)
+        terms = self._terms
+        return {
+            terms[term_id]: weight
+            for term_id, weight in _SPARSE_TERM.iter_unpack(raw[_SPARSE_COUNT.size :])
+        }
+
+    def put(self, digest: bytes, weights: Mapping[str, float]) -> None:
+        payload = bytearray(_SPARSE_COUNT.pack(len(weights)))
+        for term, weight in weights.items():
+            payload += _SPARSE_TERM.pack(self._intern(term), weight)
+        offset = self._writer.seek(0, os.SEEK_END)
+        self._writer.write(payload)
+        self._entries.append(digest, 0, offset, len(payload))
+
+    def _intern(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._terms.append(term)
+            self._term_ids[term] = term_id
+            self._terms_writer.write(json.dumps(term) + "\n")
+        return term_id
+
+    def flush(self) -> None:
+        # Terms must reach disk before the entries that reference them.
+        self._terms_writer.flush()
+        self._writer.flush()
+        self._entries.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._terms_writer.close()
+        self._writer.close()
+        self._reader.close()
+        self._entries.close()
+
+
+class EmbeddingStore:
+    """Persistent content-addressed cache for embedding vectors.
+
+    ``dtype`` controls how dense vectors are stored on disk (``"float32"`` or
+    the half-size ``"float16"``); ``memory_bytes`` bounds each of the dense and
+    sparse in-memory LRUs in front of the shards. The store is safe to share
+    between threads.
+    """
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        dtype: str = "float32",
+        rows_per_shard: int = DEFAULT_ROWS_PER_SHARD,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+    ) -> None:
+        if dtype not in _DTYPES:
+            raise ValueError(
+                f"Unsupported embedding dtype {dtype!r}; expected one of {sorted(_DTYPES)}"
+            )
+        self._root = Path(root)
+        self._dtype = dtype
+        self._rows_per_shard = rows_per_shard
+        self._dense: dict[tuple[str, int], _DenseNamespace] = {}
+        self._sparse: dict[str, _SparseNamespace] = {}
+        self._dense_memory: _MemoryLRU[array[float]] = _MemoryLRU(memory_bytes, sys.getsizeof)
+        self._sparse_memory: _MemoryLRU[dict[str, float]] = _MemoryLRU(memory_bytes, _sparse_size)
+        self._stats = EmbeddingCacheStats()
+        self._lock = threading.RLock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(
+                dense_hits=self._stats.dense_hits,
+                dense_misses=self._stats.dense_misses,
+                sparse_hits=self._stats.sparse_hits,
+                sparse_misses=self._stats.sparse_misses,
+            )
+
+    def get_dense(
+        self, model: str, dimension: int, texts: Sequence[str]
+    ) -> list[List[float] | None]:
+        """Return cached dense vectors for ``texts`` (``None`` for misses)."""
+
+        with self._lock:
+            namespace = self._dense_namespace(model, dimension)
+            results: list[List[float] | None] = []
+            for text in texts:
+                digest = text_digest(text)
+                key = ("dense", model, dimension, digest)
+                vector = self._dense_memory.get(key)
+                if vector is None:
+                    vector = namespace.get(digest)
+                    if vector is not None:
+                        self._dense_memory.put(key, vector)
+                results.append(vector.tolist() if vector is not None else None)
+            self._count("dense", results)
+            return results
+
+    def put_dense(
+        self,
+        model: str,
+        dimension: int,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        with self._lock:
+            namespace = self._dense_namespace(model, dimension)
+            for text, vector in zip(texts, vectors):
+                digest = text_digest(text)
+                key = ("dense", model, dimension, digest)
+                if digest in namespace:
+                    continue
+                namespace.put(digest, vector)
+                self._dense_memory.put(key, array("f", vector))
+            namespace.flush()
+
+    def get_sparse(self, model: str, texts: Sequence[str]) -> list[dict[str, float] | None]:
+        """Return cached SPLADE term maps for ``texts`` (``None`` for misses)."""
+
+        with self._lock:
+            namespace = self._sparse_namespace(model)
+            results: list[dict[str, float] | None] = []
+            for text in texts:
+                digest = text_digest(text)
+                key = ("sparse", model, digest)
+                weights = self._sparse_memory.get(key)
+                if weights is None:
+                    weights = namespace.get(digest)
+                    if weights is not None:
+                        self._sparse_memory.put(key, weights)
+                results.append(dict(weights) if weights is not None else None)
+            self._count("sparse", results)
+            return results
+
+    def put_sparse(
+        self, model: str, texts: Sequence[str], weights: Sequence[Mapping[str, float]]
+    ) -> None:
+        with self._lock:
+            namespace = self._sparse_namespace(model)
+            for text, terms in zip(texts, weights):
+                digest = text_digest(text)
+                key = ("sparse", model, digest)
+                if digest in namespace:
+                    continue
+                namespace.put(digest, terms)
+                self._sparse_memory.put(key, dict(terms))
+            namespace.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            for dense in self._dense.values():
+                dense.flush()
+            for sparse in self._sparse.values():
+                sparse.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            for dense in self._dense.values():
+                dense.close()
+            for sparse in self._sparse.values():
+                sparse.close()
+            self._dense.clear()
+            self._sparse.clear()
+            self._dense_memory.clear()
+            self._sparse_memory.clear()
+
+    def _dense_namespace(self, model: str, dimension: int) -> _DenseNamespace:
+        namespace = self._dense.get((model, dimension))
+        if namespace is None:
+            namespace = _DenseNamespace(
+                self._root / "dense" / _namespace_name(model, dimension, self._dtype),
+                dimension=dimension,
+                dtype=self._dtype,
+                rows_per_shard=self._rows_per_shard,
+            )
+            self._dense[(model, dimension)] = namespace
+        return namespace
+
+    def _sparse_namespace(self, model: str) -> _SparseNamespace:
+        namespace = self._sparse.get(model)
+        if namespace is None:
+            namespace = _SparseNamespace(self._root / "sparse" / _namespace_name(model))
+            self._sparse[model] = namespace
+        return namespace
+
+    def _count(self, kind: str, results: Sequence[object | None]) -> None:
+        hits = sum(1 for result in results if result is not None)
+        misses = len(results) - hits
+        if kind == "dense":
+            self._stats.dense_hits += hits
+            self._stats.dense_misses += misses
+        else:
+            self._stats.sparse_hits += hits
+            self._stats.sparse_misses += misses
+        if hits:
+            EMBEDDING_CACHE_LOOKUPS.labels(kind=kind, outcome="hit").inc(hits)
+        if misses:
+            EMBEDDING_CACHE_LOOKUPS.labels(kind=kind, outcome="miss").inc(misses)
+
+
+__all__ = ["EmbeddingCacheStats", "EmbeddingStore", "text_digest"]
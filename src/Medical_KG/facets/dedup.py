@@ -48,17 +48,21 @@ def _score(facet: FacetModel) -> float:
     return float(len(facet.evidence_spans))
 
 
+def _facet_key(facet: FacetModel) -> tuple[str, ...] | None:
+    if isinstance(facet, EndpointFacet):
+        return _endpoint_key(facet)
+    if isinstance(facet, AdverseEventFacet):
+        return _ae_key(facet)
+    return None
+
+
 def deduplicate_facets(facets: Iterable[FacetModel]) -> list[FacetModel]:
     """Collapse duplicate endpoint/AE facets while marking primaries."""
 
     primaries: OrderedDict[tuple[str, ...], FacetModel] = OrderedDict()
     passthrough: list[FacetModel] = []
     for facet in facets:
-        key: tuple[str, ...] | None = None
-        if isinstance(facet, EndpointFacet):
-            key = _endpoint_key(facet)
-        elif isinstance(facet, AdverseEventFacet):
-            key = _ae_key(facet)
+        key = _facet_key(facet)
         if key is None:
             passthrough.append(facet)
             continue
@@ -71,4 +75,65 @@ def deduplicate_facets(facets: Iterable[FacetModel]) -> list[FacetModel]:
     return deduped
 
 
-__all__ = ["deduplicate_facets"]
+class DocumentFacetAggregate:
+    """Incrementally maintained :func:`deduplicate_facets` result for one document.
+
+    Facets are added and removed per chunk. Dedup keys are computed once per facet and only
+    the keys a chunk touches are re-ranked, so building a document chunk by chunk stays linear
+    in the number of facets.
+    """
+
+    def __init__(self) -> None:
+        self._passthrough: dict[str, list[FacetModel]] = {}
+        self._candidates: dict[tuple[str, ...], list[tuple[str, FacetModel]]] = {}
+        self._primaries: dict[tuple[str, ...], FacetModel] = {}
+        self._chunk_keys: dict[str, set[tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._chunk_keys)
+
+    def set_chunk(self, chunk_id: str, facets: Iterable[FacetModel]) -> None:
+        """Replace the facets contributed by ``chunk_id``."""
+
+        self.remove_chunk(chunk_id)
+        passthrough: list[FacetModel] = []
+        keys: set[tuple[str, ...]] = set()
+        for facet in facets:
+            key = _facet_key(facet)
+            if key is None:
+                passthrough.append(facet)
+                continue
+            keys.add(key)
+            self._candidates.setdefault(key, []).append((chunk_id, facet))
+            best = self._primaries.get(key)
+            if best is None or _score(facet) > _score(best):
+                facet.is_primary = True
+                self._primaries[key] = facet
+        self._passthrough[chunk_id] = passthrough
+        self._chunk_keys[chunk_id] = keys
+
+    def remove_chunk(self, chunk_id: str) -> None:
+        self._passthrough.pop(chunk_id, None)
+        for key in self._chunk_keys.pop(chunk_id, ()):
+            remaining = [entry for entry in self._candidates[key] if entry[0] != chunk_id]
+            if not remaining:
+                del self._candidates[key]
+                del self._primaries[key]
+                continue
+            self._candidates[key] = remaining
+            best = remaining[0][1]
+            for _, facet in remaining[1:]:
+                if _score(facet) > _score(best):
+                    best = facet
+            best.is_primary = True
+            self._primaries[key] = best
+
+    def facets(self) -> list[FacetModel]:
+        """Return passthrough facets in chunk order followed by one primary per dedup key."""
+
+        deduped = [facet for facets in self._passthrough.values() for facet in facets]
+        deduped.extend(self._primaries.values())
+        return deduped
+
+
+__all__ = ["DocumentFacetAggregate", "deduplicate_facets"]
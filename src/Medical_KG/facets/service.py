@@ -7,7 +7,7 @@ from collections import defaultdict
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 
-from Medical_KG.facets.dedup import deduplicate_facets
+from Medical_KG.facets.dedup import DocumentFacetAggregate
 from Medical_KG.facets.generator import (
     FacetGenerationError,
     GenerationRequest,
@@ -33,35 +33,46 @@ class Chunk:
 
 
 class FacetStorage:
-    """In-memory storage for generated facets, used in tests and local dev."""
+    """In-memory storage for generated facets, used in tests and local dev.
+
+    Chunk facets are kept as serialised payloads plus parsed copies folded into a per-document
+    :class:`DocumentFacetAggregate`, so storing a chunk only re-ranks the dedup keys it touches
+    instead of re-parsing and re-deduplicating the whole document.
+    """
 
     def __init__(self) -> None:
         self._by_chunk: dict[str, list[str]] = {}
         self._chunk_doc: dict[str, str] = {}
-        self._doc_chunks: dict[str, set[str]] = defaultdict(set)
-        self._doc_cache: dict[str, list[str]] = {}
+        self._documents: dict[str, DocumentFacetAggregate] = {}
         self._meta: dict[str, dict[str, str]] = {}
 
     def set(self, chunk_id: str, doc_id: str, facets: Iterable[FacetModel]) -> None:
-        payloads = serialize_facets(list(facets))
-        self._by_chunk[chunk_id] = payloads
-        self._chunk_doc[chunk_id] = doc_id
-        self._doc_chunks[doc_id].add(chunk_id)
-        self._meta[chunk_id] = {
-            "hash": hashlib.sha256("".join(payloads).encode()).hexdigest(),
-        }
-        self._refresh_doc_cache(doc_id)
-
-    def _refresh_doc_cache(self, doc_id: str) -> None:
-        payloads: list[str] = []
-        for chunk_id in self._doc_chunks.get(doc_id, set()):
-            payloads.extend(self._by_chunk.get(chunk_id, []))
-        if not payloads:
-            self._doc_cache.pop(doc_id, None)
+        self.set_many([(chunk_id, doc_id, facets)])
+
+    def set_many(self, items: Iterable[tuple[str, str, Iterable[FacetModel]]]) -> None:
+        """Store facets for several ``(chunk_id, doc_id, facets)`` entries."""
+
+        for chunk_id, doc_id, facets in items:
+            models = list(facets)
+            payloads = serialize_facets(models)
+            previous_doc = self._chunk_doc.get(chunk_id)
+            if previous_doc is not None and previous_doc != doc_id:
+                self._discard(previous_doc, chunk_id)
+            self._by_chunk[chunk_id] = payloads
+            self._chunk_doc[chunk_id] = doc_id
+            self._meta[chunk_id] = {
+                "hash": hashlib.sha256("".join(payloads).encode()).hexdigest(),
+            }
+            aggregate = self._documents.setdefault(doc_id, DocumentFacetAggregate())
+            aggregate.set_chunk(chunk_id, [facet.model_copy(deep=True) for facet in models])
+
+    def _discard(self, doc_id: str, chunk_id: str) -> None:
+        aggregate = self._documents.get(doc_id)
+        if aggregate is None:
             return
-        models = load_facets(payloads)
-        deduped = deduplicate_facets(models)
-        self._doc_cache[doc_id] = [facet.model_dump_json(by_alias=True) for facet in deduped]
+        aggregate.remove_chunk(chunk_id)
+        if not aggregate:
+            del self._documents[doc_id]
 
     def get(self, chunk_id: str) -> list[FacetModel]:
         payloads = self._by_chunk.get(chunk_id, [])
@@ -70,10 +81,10 @@ class FacetStorage:
         return load_facets(payloads)
 
     def get_document_facets(self, doc_id: str) -> list[FacetModel]:
-        payloads = self._doc_cache.get(doc_id, [])
-        if not payloads:
+        aggregate = self._documents.get(doc_id)
+        if aggregate is None:
             return []
-        return load_facets(payloads)
+        return [facet.model_copy(deep=True) for facet in aggregate.facets()]
 
     def metadata(self, chunk_id: str) -> Mapping[str, str]:
         return self._meta.get(chunk_id, {})
@@ -99,6 +110,24 @@ class FacetService:
         self._manual_review: set[str] = set()
 
     def generate_for_chunk(self, chunk: Chunk) -> list[FacetModel]:
+        self._storage.set(chunk.chunk_id, chunk.doc_id, self._generate(chunk))
+        return self._storage.get(chunk.chunk_id)
+
+    def generate_for_chunks(self, chunks: Iterable[Chunk]) -> dict[str, list[FacetModel]]:
+        """Generate facets for ``chunks`` and store them with one :meth:`FacetStorage.set_many`.
+
+        Facets generated before a failing chunk are still stored before the error propagates.
+        """
+
+        generated: list[tuple[str, str, list[FacetModel]]] = []
+        try:
+            for chunk in chunks:
+                generated.append((chunk.chunk_id, chunk.doc_id, self._generate(chunk)))
+        finally:
+            self._storage.set_many(generated)
+        return {chunk_id: self._storage.get(chunk_id) for chunk_id, _, _ in generated}
+
+    def _generate(self, chunk: Chunk) -> list[FacetModel]:
         router = FacetRouter(table_headers=chunk.table_headers)
         facet_types = router.detect(chunk.text, section=chunk.section)
         request = GenerationRequest(chunk_id=chunk.chunk_id, text=chunk.text, section=chunk.section)
@@ -108,16 +137,8 @@ class FacetService:
         except (ValidationError, FacetGenerationError, FacetValidationError) as exc:
             self._record_failure(chunk.chunk_id, reason=str(exc))
             raise FacetGenerationError(str(exc)) from exc
-        else:
-            self._clear_failure(chunk.chunk_id)
-        self._storage.set(chunk.chunk_id, chunk.doc_id, validated)
-        return self._storage.get(chunk.chunk_id)
-
-    def generate_for_chunks(self, chunks: Iterable[Chunk]) -> dict[str, list[FacetModel]]:
-        results: dict[str, list[FacetModel]] = {}
-        for chunk in chunks:
-            results[chunk.chunk_id] = self.generate_for_chunk(chunk)
-        return results
+        self._clear_failure(chunk.chunk_id)
+        return validated
 
     def get_facets(self, chunk_id: str) -> list[FacetModel]:
         return self._storage.get(chunk_id)
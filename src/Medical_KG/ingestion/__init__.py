@@ -1,13 +1,17 @@
 """Ingestion subsystem for external data sources."""
 
+from .http_cache import HttpResponseCache
 from .http_client import AsyncHttpClient
 from .ledger import IngestionLedger
+from .ledger_segments import SegmentedIngestionLedger
 from .models import Document, IngestionResult
 from .pipeline import IngestionPipeline, PipelineResult
 from .registry import available_sources, get_adapter
+from .sharding import ShardedIngestionPipeline
 from .telemetry import (
     CompositeTelemetry,
     HttpBackoffEvent,
+    HttpCacheEvent,
     HttpErrorEvent,
     HttpRequestEvent,
     HttpResponseEvent,
@@ -20,15 +24,19 @@ from .telemetry import (
 
 __all__ = [
     "AsyncHttpClient",
+    "HttpResponseCache",
     "IngestionLedger",
+    "SegmentedIngestionLedger",
     "Document",
     "IngestionResult",
     "IngestionPipeline",
     "PipelineResult",
+    "ShardedIngestionPipeline",
     "available_sources",
     "get_adapter",
     "CompositeTelemetry",
     "HttpBackoffEvent",
+    "HttpCacheEvent",
     "HttpErrorEvent",
     "HttpRequestEvent",
     "HttpResponseEvent",
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Collection
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Callable, Generic, TypeVar
@@ -11,6 +13,24 @@ from Medical_KG.ingestion.ledger import IngestionLedger, LedgerState
 from Medical_KG.ingestion.models import Document, IngestionResult
 from Medical_KG.ingestion.utils import generate_doc_id
 
+_TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Return ``True`` when re-running the failed invocation may succeed.
+
+    An explicit ``is_retryable`` attribute wins; otherwise timeouts, dropped
+    connections and throttling or gateway HTTP statuses count as transient.
+    """
+
+    flagged = getattr(exc, "is_retryable", None)
+    if isinstance(flagged, bool):
+        return flagged
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status in _TRANSIENT_STATUSES:
+        return True
+    return isinstance(exc, (TimeoutError, ConnectionError))
+
 
 @dataclass(slots=True)
 class AdapterContext:
@@ -19,6 +39,49 @@ class AdapterContext:
 
 RawPayloadT = TypeVar("RawPayloadT")
 
+_RETRY_PATH: tuple[LedgerState, ...] = (LedgerState.RETRYING, LedgerState.FETCHING)
+_WRITE_PATH: tuple[LedgerState, ...] = (
+    LedgerState.FETCHED,
+    LedgerState.PARSING,
+    LedgerState.PARSED,
+    LedgerState.VALIDATING,
+    LedgerState.VALIDATED,
+    LedgerState.IR_BUILDING,
+    LedgerState.IR_READY,
+    LedgerState.COMPLETED,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AdapterConcurrency:
+    """Settings for the overlapped fetch/parse/write mode of :meth:`BaseAdapter.iter_results`.
+
+    ``workers`` parse tasks run :meth:`BaseAdapter.parse` on ``executor`` (a
+    private thread pool sized to ``workers`` when omitted) while the fetcher
+    keeps pulling records. At most ``max_in_flight`` fetched records are held
+    between the fetch and write stages, which back-pressures the fetcher. When
+    ``ordered`` is true results are written and yielded in fetch order,
+    otherwise in parse completion order.
+    """
+
+    workers: int = 4
+    ordered: bool = True
+    max_in_flight: int | None = None
+    executor: Executor | None = None
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+    @property
+    def window(self) -> int:
+        return self.max_in_flight or self.workers * 4
+
+
+_STAGE_DONE = object()
+
 
 class BaseAdapter(Generic[RawPayloadT], ABC):
     source: str
@@ -28,7 +91,12 @@ class BaseAdapter(Generic[RawPayloadT], ABC):
         self._emit_event: Callable[[PipelineEvent], None] | None = None
 
     async def iter_results(self, *args: object, **kwargs: object) -> AsyncIterator[IngestionResult]:
-        """Yield ingestion results as they are produced."""
+        """Yield ingestion results as they are produced.
+
+        Passing ``concurrency`` (a worker count or :class:`AdapterConcurrency`)
+        overlaps fetching, parsing and ledger writes instead of handling one
+        record at a time.
+        """
 
         keyword_args: dict[str, object] = dict(kwargs)
         completed_arg = keyword_args.pop("completed_ids", None)
@@ -40,76 +108,173 @@ class BaseAdapter(Generic[RawPayloadT], ABC):
         else:
             raise TypeError("completed_ids must be an iterable of document identifiers")
         keyword_args.pop("resume", None)
+        concurrency = _coerce_concurrency(keyword_args.pop("concurrency", None))
         fetcher = self.fetch(*args, **keyword_args)
         if not hasattr(fetcher, "__aiter__"):
             raise TypeError("fetch() must return an AsyncIterator")
+        if concurrency is not None:
+            async for ingested in self._iter_concurrent(fetcher, completed_lookup, concurrency):
+                yield ingested
+            return
         async for raw_record in fetcher:
             document: Document | None = None
+            result: IngestionResult | None
             try:
                 document = self.parse(raw_record)
-                existing = self.context.ledger.get(document.doc_id)
-                if existing is not None:
-                    # Skip documents that are explicitly marked as completed
-                    if completed_lookup and document.doc_id in completed_lookup:
-                        continue
-                    # Skip documents that are already completed (COMPLETED has no valid transitions)
-                    if existing.state is LedgerState.COMPLETED:
-                        continue
-                    # Handle failed documents by transitioning through RETRYING
-                    if existing.state is LedgerState.FAILED:
-                        self.context.ledger.update_state(
-                            doc_id=document.doc_id,
-                            new_state=LedgerState.RETRYING,
-                            metadata={"source": document.source},
-                            adapter=self.source,
-                        )
-                        self.context.ledger.update_state(
-                            doc_id=document.doc_id,
-                            new_state=LedgerState.FETCHING,
-                            metadata={"source": document.source},
-                            adapter=self.source,
-                        )
-                    # Only transition to FETCHING if not already in a processing state
-                    elif existing.state not in (
-                        LedgerState.FETCHING,
-                        LedgerState.FETCHED,
-                        LedgerState.PARSING,
-                        LedgerState.PARSED,
-                        LedgerState.VALIDATING,
-                        LedgerState.VALIDATED,
-                        LedgerState.IR_BUILDING,
-                        LedgerState.IR_READY,
-                    ):
-                        self.context.ledger.update_state(
-                            doc_id=document.doc_id,
-                            new_state=LedgerState.FETCHING,
-                            metadata={"source": document.source},
-                            adapter=self.source,
-                        )
-                else:
-                    # New document, start with FETCHING
-                    self.context.ledger.update_state(
-                        doc_id=document.doc_id,
-                        new_state=LedgerState.FETCHING,
-                        metadata={"source": document.source},
-                        adapter=self.source,
-                    )
-                self.validate(document)
-                result = await self.write(document)
+                result = await self._ingest_document(document, completed_lookup)
             except Exception as exc:  # pragma: no cover - surfaced to caller
-                doc_id = document.doc_id if document else str(raw_record)
-                setattr(exc, "doc_id", doc_id)
-                setattr(exc, "retry_count", getattr(exc, "retry_count", 0))
-                setattr(exc, "is_retryable", getattr(exc, "is_retryable", False))
+                self._record_failure(exc, document, raw_record)
+                raise
+            if result is not None:
+                yield result
+
+    async def _iter_concurrent(
+        self,
+        fetcher: AsyncIterator[RawPayloadT],
+        completed_lookup: set[str],
+        concurrency: AdapterConcurrency,
+    ) -> AsyncIterator[IngestionResult]:
+        loop = asyncio.get_running_loop()
+        owned_executor: ThreadPoolExecutor | None = None
+        executor: Executor | None = concurrency.executor
+        if executor is None:
+            owned_executor = ThreadPoolExecutor(
+                max_workers=concurrency.workers, thread_name_prefix=f"{self.source}-parse"
+            )
+            executor = owned_executor
+        window = asyncio.Semaphore(concurrency.window)
+        raw_queue: asyncio.Queue[Any] = asyncio.Queue()
+        parsed_queue: asyncio.Queue[Any] = asyncio.Queue()
+        fetch_errors: list[BaseException] = []
+
+        async def fetch_stage() -> None:
+            sequence = 0
+            try:
+                async for raw_record in fetcher:
+                    await window.acquire()
+                    raw_queue.put_nowait((sequence, raw_record))
+                    sequence += 1
+            except Exception as exc:
+                fetch_errors.append(exc)
+            finally:
+                for _ in range(concurrency.workers):
+                    raw_queue.put_nowait(_STAGE_DONE)
+
+        async def parse_stage() -> None:
+            while (item := await raw_queue.get()) is not _STAGE_DONE:
+                sequence, raw_record = item
+                try:
+                    document = await loop.run_in_executor(executor, self.parse, raw_record)
+                except Exception as exc:
+                    parsed_queue.put_nowait((sequence, raw_record, None, exc))
+                else:
+                    parsed_queue.put_nowait((sequence, raw_record, document, None))
+            parsed_queue.put_nowait(_STAGE_DONE)
+
+        async def parsed_records() -> AsyncIterator[tuple[Any, Document | None, Exception | None]]:
+            finished = 0
+            reorder: dict[int, tuple[Any, Document | None, Exception | None]] = {}
+            next_sequence = 0
+            while finished < concurrency.workers:
+                item = await parsed_queue.get()
+                if item is _STAGE_DONE:
+                    finished += 1
+                    continue
+                sequence, *outcome = item
+                if not concurrency.ordered:
+                    yield tuple(outcome)
+                    continue
+                reorder[sequence] = tuple(outcome)
+                while next_sequence in reorder:
+                    yield reorder.pop(next_sequence)
+                    next_sequence += 1
+
+        tasks = [asyncio.create_task(fetch_stage())]
+        tasks.extend(asyncio.create_task(parse_stage()) for _ in range(concurrency.workers))
+        try:
+            async for raw_record, document, error in parsed_records():
+                try:
+                    if error is not None:
+                        raise error
+                    assert document is not None
+                    result = await self._ingest_document(document, completed_lookup)
+                except Exception as exc:
+                    self._record_failure(exc, document, raw_record)
+                    raise
+                finally:
+                    window.release()
+                if result is not None:
+                    yield result
+            if fetch_errors:
+                raise fetch_errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if owned_executor is not None:
+                owned_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _ingest_document(
+        self, document: Document, completed_lookup: set[str]
+    ) -> IngestionResult | None:
+        existing_state = self.context.ledger.get_state(document.doc_id)
+        if existing_state is not None:
+            # Skip documents that are explicitly marked as completed
+            if completed_lookup and document.doc_id in completed_lookup:
+                return None
+            # Skip documents that are already completed (COMPLETED has no valid transitions)
+            if existing_state is LedgerState.COMPLETED:
+                return None
+            # Handle failed documents by transitioning through RETRYING
+            if existing_state is LedgerState.FAILED:
+                self.context.ledger.transition_path(
+                    document.doc_id,
+                    _RETRY_PATH,
+                    metadata={"source": document.source},
+                    adapter=self.source,
+                )
+            # Only transition to FETCHING if not already in a processing state
+            elif existing_state not in (
+                LedgerState.FETCHING,
+                LedgerState.FETCHED,
+                LedgerState.PARSING,
+                LedgerState.PARSED,
+                LedgerState.VALIDATING,
+                LedgerState.VALIDATED,
+                LedgerState.IR_BUILDING,
+                LedgerState.IR_READY,
+            ):
                 self.context.ledger.update_state(
-                    doc_id=doc_id,
-                    new_state=LedgerState.FAILED,
-                    metadata={"error": str(exc)},
+                    doc_id=document.doc_id,
+                    new_state=LedgerState.FETCHING,
+                    metadata={"source": document.source},
                     adapter=self.source,
-                    error=exc,
                 )
-                raise
-            yield result
+        else:
+            # New document, start with FETCHING
+            self.context.ledger.update_state(
+                doc_id=document.doc_id,
+                new_state=LedgerState.FETCHING,
+                metadata={"source": document.source},
+                adapter=self.source,
+            )
+        self.validate(document)
+        return await self.write(document)
+
+    def _record_failure(
+        self, exc: Exception, document: Document | None, raw_record: object
+    ) -> None:
+        doc_id = document.doc_id if document else str(raw_record)
+        setattr(exc, "doc_id", doc_id)
+        setattr(exc, "retry_count", getattr(exc, "retry_count", 0))
+        setattr(exc, "is_retryable", _is_transient_error(exc))
+        self.context.ledger.update_state(
+            doc_id=doc_id,
+            new_state=LedgerState.FAILED,
+            metadata={"error": str(exc)},
+            adapter=self.source,
+            error=exc,
+        )
 
     async def run(self, *args: object, **kwargs: object) -> list[IngestionResult]:
         return [result async for result in self.iter_results(*args, **kwargs)]
@@ -127,54 +292,14 @@ class BaseAdapter(Generic[RawPayloadT], ABC):
 
     async def write(self, document: Document) -> IngestionResult:
         # Transition through proper states: FETCHING -> FETCHED -> PARSING -> PARSED -> VALIDATING -> VALIDATED -> IR_BUILDING -> IR_READY -> COMPLETED
-        self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.FETCHED,
-            metadata={"source": document.source},
-            adapter=self.source,
-        )
-        self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.PARSING,
-            metadata={"source": document.source},
-            adapter=self.source,
-        )
-        self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.PARSED,
-            metadata={"source": document.source},
-            adapter=self.source,
-        )
-        self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.VALIDATING,
-            metadata={"source": document.source},
-            adapter=self.source,
-        )
-        self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.VALIDATED,
-            metadata={"source": document.source},
-            adapter=self.source,
-        )
-        self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.IR_BUILDING,
-            metadata={"source": document.source},
-            adapter=self.source,
-        )
-        self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.IR_READY,
-            metadata={"source": document.source},
-            adapter=self.source,
-        )
-        audit = self.context.ledger.update_state(
-            doc_id=document.doc_id,
-            new_state=LedgerState.COMPLETED,
+        # in a single group commit so each document costs one ledger write.
+        audits = self.context.ledger.transition_path(
+            document.doc_id,
+            _WRITE_PATH,
             metadata={"source": document.source},
             adapter=self.source,
         )
+        audit = audits[-1]
         return IngestionResult(
             document=document,
             state=audit.new_state,
@@ -194,3 +319,11 @@ class BaseAdapter(Generic[RawPayloadT], ABC):
         if self._emit_event is None:
             return
         self._emit_event(event)
+
+
+def _coerce_concurrency(value: object) -> AdapterConcurrency | None:
+    if value is None or isinstance(value, AdapterConcurrency):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return AdapterConcurrency(workers=value) if value > 1 else None
+    raise TypeError("concurrency must be a worker count or AdapterConcurrency")
@@ -23,10 +23,13 @@ Optional field overview:
 
 from __future__ import annotations
 
+import asyncio
 import re
 import xml.etree.ElementTree as ET
+from collections import deque
 from collections.abc import AsyncIterator, Mapping
 from collections.abc import Sequence as SequenceABC
+from itertools import islice
 from typing import Any, Iterable, Iterator, Sequence
 from urllib.parse import urlparse
 
@@ -54,6 +57,7 @@ from Medical_KG.ingestion.utils import (
     ensure_json_mapping,
     ensure_json_sequence,
     ensure_json_value,
+    iter_xml_elements,
     normalize_text,
 )
 
@@ -64,6 +68,7 @@ PUBMED_SUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcg
 PUBMED_FETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
 PMC_LIST_URL = "https://www.ncbi.nlm.nih.gov/pmc/oai/oai.cgi"
 MEDRXIV_URL = "https://api.medrxiv.org/details/medrxiv"
+DEFAULT_PUBMED_PREFETCH_PAGES = 3
 
 PMID_RE = re.compile(r"^\d{4,}")
 PMCID_RE = re.compile(r"^PMC\d+")
@@ -98,9 +103,13 @@ class PubMedAdapter(HttpAdapter[Any]):
             | Mapping[str, HttpTelemetry | Sequence[HttpTelemetry]]
         )
         | None = None,
+        prefetch_pages: int = DEFAULT_PUBMED_PREFETCH_PAGES,
     ) -> None:
         super().__init__(context, client, telemetry=telemetry)
         self.api_key = api_key
+        # Number of WebEnv history pages kept in flight while earlier pages are
+        # consumed; requests still pass through the host rate limiter.
+        self.prefetch_pages = max(prefetch_pages, 1)
         host = urlparse(PUBMED_SEARCH_URL).netloc
         rate = RateLimit(rate=10 if api_key else 3, per=1.0)
         self.client.set_rate_limit(host, rate)
@@ -189,56 +198,77 @@ class PubMedAdapter(HttpAdapter[Any]):
                 if combined:
                     yield combined
             return
-        retstart = 0
-        while retstart < count:
-            paged_summary_params: dict[str, object] = {
-                "db": "pubmed",
-                "retmode": "json",
-                "retstart": retstart,
-                "retmax": retmax,
-                "query_key": query_key,
-                "WebEnv": webenv,
-            }
-            if self.api_key:
-                paged_summary_params["api_key"] = self.api_key
-            summary = ensure_json_mapping(
-                await self.fetch_json(PUBMED_SUMMARY_URL, params=paged_summary_params),
-                context="pubmed summary response",
-            )
-            summary_result = ensure_json_mapping(
-                summary.get("result", {}),
-                context="pubmed summary result",
-            )
-            uids = [
-                str(uid)
-                for uid in ensure_json_sequence(
-                    summary_result.get("uids", []),
-                    context="pubmed summary uids",
+        pages: deque[asyncio.Task[list[JSONMapping]]] = deque()
+        starts = iter(range(0, count, retmax))
+        try:
+            for retstart in islice(starts, self.prefetch_pages):
+                pages.append(
+                    asyncio.create_task(
+                        self._fetch_history_page(webenv, query_key, retstart, retmax)
+                    )
                 )
-                if isinstance(uid, (str, int))
-            ]
-            paged_fetch_params: dict[str, object] = {
-                "db": "pubmed",
-                "retmode": "xml",
-                "retstart": retstart,
-                "retmax": retmax,
-                "query_key": query_key,
-                "WebEnv": webenv,
-                "rettype": "abstract",
-            }
-            if self.api_key:
-                paged_fetch_params["api_key"] = self.api_key
-            fetch_xml = await self.fetch_text(PUBMED_FETCH_URL, params=paged_fetch_params)
-            details = self._parse_fetch_xml(fetch_xml)
-            for uid in uids:
-                summary_entry = summary_result.get(uid)
-                if summary_entry is None:
-                    continue
-                combined = dict(details.get(uid, {}))
-                combined.update(ensure_json_mapping(summary_entry, context="pubmed summary entry"))
-                if combined:
-                    yield combined
-            retstart += retmax
+            while pages:
+                records = await pages.popleft()
+                # Keep the prefetch window full before handing records downstream.
+                for retstart in islice(starts, 1):
+                    pages.append(
+                        asyncio.create_task(
+                            self._fetch_history_page(webenv, query_key, retstart, retmax)
+                        )
+                    )
+                for record in records:
+                    yield record
+        finally:
+            for page in pages:
+                page.cancel()
+            if pages:
+                await asyncio.gather(*pages, return_exceptions=True)
+
+    async def _fetch_history_page(
+        self, webenv: str, query_key: str, retstart: int, retmax: int
+    ) -> list[JSONMapping]:
+        """Fetch one WebEnv page, issuing esummary and efetch concurrently."""
+
+        history_params: dict[str, object] = {
+            "db": "pubmed",
+            "retstart": retstart,
+            "retmax": retmax,
+            "query_key": query_key,
+            "WebEnv": webenv,
+        }
+        if self.api_key:
+            history_params["api_key"] = self.api_key
+        summary_payload, fetch_xml = await asyncio.gather(
+            self.fetch_json(PUBMED_SUMMARY_URL, params={**history_params, "retmode": "json"}),
+            self.fetch_text(
+                PUBMED_FETCH_URL,
+                params={**history_params, "retmode": "xml", "rettype": "abstract"},
+            ),
+        )
+        details = await asyncio.to_thread(self._parse_fetch_xml, fetch_xml)
+        summary = ensure_json_mapping(summary_payload, context="pubmed summary response")
+        summary_result = ensure_json_mapping(
+            summary.get("result", {}),
+            context="pubmed summary result",
+        )
+        uids = [
+            str(uid)
+            for uid in ensure_json_sequence(
+                summary_result.get("uids", []),
+                context="pubmed summary uids",
+            )
+            if isinstance(uid, (str, int))
+        ]
+        records: list[JSONMapping] = []
+        for uid in uids:
+            summary_entry = summary_result.get(uid)
+            if summary_entry is None:
+                continue
+            combined = dict(details.get(uid, {}))
+            combined.update(ensure_json_mapping(summary_entry, context="pubmed summary entry"))
+            if combined:
+                records.append(combined)
+        return records
 
     def parse(self, raw: Any) -> Document:
         if not isinstance(raw, Mapping):
@@ -336,13 +366,16 @@ class PubMedAdapter(HttpAdapter[Any]):
 
     @staticmethod
     def _parse_fetch_xml(xml: str) -> dict[str, JSONMapping]:
-        details: dict[str, JSONMapping] = {}
-        root = ET.fromstring(xml)
+        return {str(detail["pmid"]): detail for detail in PubMedAdapter._iter_fetch_xml(xml)}
+
+    @staticmethod
+    def _iter_fetch_xml(xml: str) -> Iterator[JSONMapping]:
+        """Stream efetch details, one ``PubmedArticle`` at a time."""
 
         def strip(tag: str) -> str:
             return tag.split("}")[-1]
 
-        for article in root.findall(".//PubmedArticle"):
+        for article in iter_xml_elements(xml, {"PubmedArticle"}):
             medline = article.find("MedlineCitation")
             if medline is None:
                 continue
@@ -409,8 +442,8 @@ class PubMedAdapter(HttpAdapter[Any]):
                 "pmcid": pmcid,
                 "doi": doi,
             }
-            details[pmid] = detail
-        return details
+            article.clear()
+            yield detail
 
 
 class PmcAdapter(HttpAdapter[ET.Element]):
@@ -451,12 +484,12 @@ class PmcAdapter(HttpAdapter[ET.Element]):
             params["until"] = until_date
         while True:
             xml = await self.fetch_text(PMC_LIST_URL, params=params)
-            root = ET.fromstring(xml)
-            records = self._findall(root, "record")
-            for record in records:
-                yield record
-            resumption = self._find(root, "resumptionToken")
-            token = (resumption.text or "").strip() if resumption is not None else ""
+            token = ""
+            for element in iter_xml_elements(xml, {"record", "resumptionToken"}):
+                if self._strip(element.tag) == "resumptionToken":
+                    token = (element.text or "").strip()
+                else:
+                    yield element
             if not token:
                 break
             params = {"verb": "ListRecords", "resumptionToken": token}
@@ -33,8 +33,8 @@ import typer
 from Medical_KG.ingestion.cli_helpers import (
     BatchValidationError,
     CLIResultSummary,
+    NdjsonBatchReader,
     chunk_parameters,
-    count_ndjson_records,
     create_progress,
     format_cli_error,
     load_ndjson_batch,
@@ -54,6 +54,7 @@ from Medical_KG.ingestion.events import (
 from Medical_KG.ingestion.ledger import IngestionLedger
 from Medical_KG.ingestion.models import Document
 from Medical_KG.ingestion.pipeline import IngestionPipeline, PipelineResult
+from Medical_KG.ingestion.sharding import ShardedIngestionPipeline
 from Medical_KG.utils.json_schema import JsonSchemaValidationError, JsonSchemaValidator
 
 
@@ -96,6 +97,7 @@ _INGEST_HELP = textwrap.dedent(
     • `med ingest umls --auto --limit 1000 --output json`
     • `med ingest nice --batch nice.ndjson --schema schemas/nice.json`
     • `med ingest demo --stream --summary-only > events.ndjson`
+    • `med ingest pubmed --batch pubmed.ndjson --workers 4`
     """
 )
 
@@ -142,9 +144,53 @@ def _complete_adapter(
     return _available_sources()
 
 
-def _build_pipeline(ledger_path: Path) -> IngestionPipeline:
+def _build_pipeline(ledger_path: Path, **pipeline_options: Any) -> IngestionPipeline:
     ledger = IngestionLedger(ledger_path)
-    return IngestionPipeline(ledger)
+    return IngestionPipeline(ledger, **pipeline_options)
+
+
+def _build_sharded_pipeline(
+    ledger_path: Path, workers: int, **pipeline_options: Any
+) -> IngestionPipeline:
+    ledger = IngestionLedger(ledger_path)
+    return ShardedIngestionPipeline(ledger, workers=workers, **pipeline_options)
+
+
+def _parse_cache_ttls(values: Sequence[str]) -> dict[str, float]:
+    ttls: dict[str, float] = {}
+    for value in values:
+        host, separator, seconds = value.partition("=")
+        try:
+            ttl = float(seconds)
+        except ValueError:
+            ttl = -1.0
+        if not separator or not host.strip() or ttl < 0:
+            raise typer.BadParameter(f"Invalid --http-cache-ttl '{value}'; expected HOST=SECONDS")
+        ttls[host.strip()] = ttl
+    return ttls
+
+
+class _BatchSchemaValidator:
+    """Validate batch entries against a JSON schema.
+
+    Pickles as its schema so batch validation workers can rebuild it.
+    """
+
+    def __init__(self, schema: Mapping[str, Any]) -> None:
+        self._schema = dict(schema)
+        self._validator = JsonSchemaValidator(self._schema, heading="Schema validation failed:")
+
+    def __call__(self, instance: dict[str, Any]) -> None:
+        try:
+            self._validator.validate(instance, source="batch entry")
+        except JsonSchemaValidationError as exc:
+            raise BatchValidationError(
+                str(exc),
+                hint="Update the NDJSON payload or adjust the provided schema.",
+            ) from exc
+
+    def __reduce__(self) -> tuple[type[_BatchSchemaValidator], tuple[dict[str, Any]]]:
+        return type(self), (self._schema,)
 
 
 def _load_json_schema_validator(path: Path) -> Callable[[dict[str, Any]], None]:
@@ -159,24 +205,10 @@ def _load_json_schema_validator(path: Path) -> Callable[[dict[str, Any]], None]:
     schema_mapping = cast(Mapping[str, Any], schema_data)
 
     try:
-        validator = JsonSchemaValidator(
-            schema_mapping,
-            heading="Schema validation failed:",
-        )
+        return _BatchSchemaValidator(schema_mapping)
     except SchemaError as exc:
         raise typer.BadParameter(f"Schema at {path} is invalid: {exc}") from exc
 
-    def _validate(instance: dict[str, Any]) -> None:
-        try:
-            validator.validate(instance, source="batch entry")
-        except JsonSchemaValidationError as exc:
-            raise BatchValidationError(
-                str(exc),
-                hint="Update the NDJSON payload or adjust the provided schema.",
-            ) from exc
-
-    return _validate
-
 
 def _version_callback(value: bool) -> None:
     if not value:
@@ -264,6 +296,11 @@ async def _run_streaming_pipeline(
     fail_fast: bool,
     error_log: Path | None,
     stream_output: bool,
+    concurrency: int = 1,
+    preserve_order: bool = True,
+    max_parallel_invocations: int = 1,
+    invocation_retries: int = 0,
+    retry_backoff: float = 0.5,
 ) -> tuple[list[PipelineResult], list[str]]:
     results: list[PipelineResult] = []
     errors: list[str] = []
@@ -284,6 +321,11 @@ async def _run_streaming_pipeline(
             params=invocation_params,
             resume=resume,
             total_estimated=total_hint,
+            concurrency=concurrency,
+            preserve_order=preserve_order,
+            max_parallel_invocations=max_parallel_invocations,
+            invocation_retries=invocation_retries,
+            retry_backoff=retry_backoff,
         ):
             if stream_output:
                 typer.echo(json.dumps(event_to_dict(event)))
@@ -395,6 +437,7 @@ def _dry_run(
     stream_events: bool,
     output: OutputFormat,
     schema_validator: Callable[[dict[str, Any]], None] | None,
+    validation_workers: int = 1,
 ) -> None:
     warnings: list[str] = []
     if skip_validation:
@@ -405,19 +448,21 @@ def _dry_run(
     if ids:
         total_records = len(ids) if limit is None else min(len(ids), limit)
     elif batch:
-        total_records = count_ndjson_records(batch)
-        if strict_validation and total_records == 0:
-            raise typer.BadParameter("Batch file is empty")
-        iterator = load_ndjson_batch(batch, strict=not skip_validation)
-        iterator = cast(
-            Iterator[dict[str, Any]],
-            _apply_schema_validation(iterator, validator=schema_validator),
-        )
         processed = 0
-        for _ in iterator:
-            processed += 1
-            if limit is not None and processed >= limit:
-                break
+        with contextlib.closing(
+            load_ndjson_batch(
+                batch,
+                strict=not skip_validation,
+                validator=schema_validator,
+                workers=validation_workers,
+            )
+        ) as reader:
+            for _ in reader:
+                processed += 1
+                if limit is not None and processed >= limit:
+                    break
+        if strict_validation and processed == 0:
+            raise typer.BadParameter("Batch file is empty")
         total_records = processed
     elif limit is not None:
         total_records = limit
@@ -450,14 +495,26 @@ def _parameter_stream(
     batch: Path | None,
     ids: list[str] | None,
     skip_validation: bool,
+    schema_validator: Callable[[dict[str, Any]], None] | None = None,
+    validation_workers: int = 1,
 ) -> tuple[Iterator[dict[str, Any]] | None, int | None]:
+    """Return validated invocation parameters and their expected count.
+
+    Batch files are read in a single pass: the count is an estimate until the
+    returned :class:`NdjsonBatchReader` is exhausted.
+    """
+
     if ids:
         params = [{"ids": ids}]
-        return iter(params), len(ids)
+        return _apply_schema_validation(iter(params), validator=schema_validator), len(ids)
     if batch:
-        total = count_ndjson_records(batch)
-        iterator = load_ndjson_batch(batch, strict=not skip_validation)
-        return iterator, total
+        reader = load_ndjson_batch(
+            batch,
+            strict=not skip_validation,
+            validator=schema_validator,
+            workers=validation_workers,
+        )
+        return reader, reader.estimated_total
     return None, None
 
 
@@ -574,6 +631,60 @@ def ingest(
         "--rate-limit",
         help="Maximum adapter invocations per second",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Parse workers per adapter invocation (overlaps fetch, parse and writes)",
+    ),
+    ordered: bool = typer.Option(
+        True,
+        "--ordered/--unordered",
+        help="Emit documents in fetch order when --concurrency is above 1",
+    ),
+    max_parallel_invocations: int = typer.Option(
+        1,
+        "--max-parallel-invocations",
+        min=1,
+        help=(
+            "Adapter invocations (batch entries or IDs) run concurrently; a failed"
+            " invocation is reported and the rest continue"
+        ),
+    ),
+    invocation_retries: int = typer.Option(
+        0,
+        "--invocation-retries",
+        min=0,
+        help="Retries for an invocation that fails with a timeout, connection or throttling error",
+    ),
+    retry_backoff: float = typer.Option(
+        0.5,
+        "--retry-backoff",
+        min=0.0,
+        help="Seconds before the first invocation retry; doubles on each further attempt",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help=(
+            "Worker processes per adapter invocation; ID lists, date ranges and batch"
+            " entries are split across workers, each writing its own ledger shard"
+        ),
+    ),
+    http_cache_dir: Path | None = typer.Option(
+        None,
+        "--http-cache-dir",
+        file_okay=False,
+        help="Cache GET responses here and revalidate them with conditional requests",
+    ),
+    http_cache_ttls: list[str] = typer.Option(
+        [],
+        "--http-cache-ttl",
+        help="Per-host freshness for --http-cache-dir as HOST=SECONDS (repeatable)",
+    ),
     progress: bool | None = typer.Option(
         None,
         "--progress/--no-progress",
@@ -618,6 +729,12 @@ def ingest(
         readable=True,
         help="Optional JSON Schema to validate batch parameters",
     ),
+    validation_workers: int = typer.Option(
+        1,
+        "--validation-workers",
+        min=1,
+        help="Processes decoding and validating --batch entries against --schema",
+    ),
     version: bool = typer.Option(
         False,
         "--version",
@@ -642,6 +759,14 @@ def ingest(
         raise typer.BadParameter("--strict-validation cannot be combined with --skip-validation")
     if stream_events and legacy_mode:
         raise typer.BadParameter("--stream cannot be combined with --no-stream")
+    if legacy_mode and (max_parallel_invocations > 1 or invocation_retries > 0):
+        raise typer.BadParameter(
+            "--max-parallel-invocations and --invocation-retries require streaming execution;"
+            " drop --no-stream"
+        )
+    if http_cache_ttls and http_cache_dir is None:
+        raise typer.BadParameter("--http-cache-ttl requires --http-cache-dir")
+    cache_ttls = _parse_cache_ttls(http_cache_ttls)
     _configure_logging(log_level, log_file, verbose)
     schema_validator: Callable[[dict[str, Any]], None] | None = None
     if schema_path is not None:
@@ -661,22 +786,32 @@ def ingest(
             stream_events=stream_events,
             output=output,
             schema_validator=schema_validator,
+            validation_workers=validation_workers,
         )
         return
-    raw_params_iter, total_records = _parameter_stream(
+    params_iter_unlimited, total_records = _parameter_stream(
         batch=batch,
         ids=identifier_list,
         skip_validation=skip_validation,
+        schema_validator=schema_validator,
+        validation_workers=validation_workers,
     )
-    params_iter_unlimited = _apply_schema_validation(raw_params_iter, validator=schema_validator)
-    if batch and strict_validation and (total_records or 0) == 0:
+    if batch and strict_validation and total_records == 0:
         raise typer.BadParameter("Batch file is empty")
     if limit is not None and total_records is not None:
         total_records = min(total_records, limit)
     params_iter: Optional[Iterator[dict[str, Any]]] = _apply_limit(
         params_iter_unlimited, limit=limit
     )
-    pipeline = _build_pipeline(ledger_path)
+    pipeline_options: dict[str, Any] = {}
+    if http_cache_dir is not None:
+        pipeline_options["http_cache_dir"] = http_cache_dir
+        pipeline_options["http_cache_ttls"] = cache_ttls
+    pipeline = (
+        _build_sharded_pipeline(ledger_path, workers, **pipeline_options)
+        if workers > 1
+        else _build_pipeline(ledger_path, **pipeline_options)
+    )
     base_options: dict[str, Any] = {}
     if start_date:
         base_options["start_date"] = start_date.isoformat()
@@ -700,6 +835,16 @@ def ingest(
         progress_pair = create_progress("Ingesting", total_records)
         if progress_pair is not None:
             progress_bar, progress_task = progress_pair
+    concurrency_options: dict[str, Any] = {}
+    if concurrency > 1:
+        concurrency_options = {"concurrency": concurrency, "preserve_order": ordered}
+    invocation_options: dict[str, Any] = {}
+    if max_parallel_invocations > 1 or invocation_retries > 0:
+        invocation_options = {
+            "max_parallel_invocations": max_parallel_invocations,
+            "invocation_retries": invocation_retries,
+            "retry_backoff": retry_backoff,
+        }
     errors: list[str] = []
     results: list[PipelineResult] = []
     started_at = datetime.now(timezone.utc)
@@ -711,7 +856,10 @@ def ingest(
                 if params_iter is None:
                     invocation_params = [base_options] if base_options else None
                     outputs = pipeline.run(
-                        adapter_name, params=invocation_params, resume=resume
+                        adapter_name,
+                        params=invocation_params,
+                        resume=resume,
+                        **concurrency_options,
                     )
                     results.extend(outputs)
                     if auto and not summary_only:
@@ -725,7 +873,10 @@ def ingest(
                         if not chunk_with_options:
                             continue
                         outputs = pipeline.run(
-                            adapter_name, params=chunk_with_options, resume=resume
+                            adapter_name,
+                            params=chunk_with_options,
+                            resume=resume,
+                            **concurrency_options,
                         )
                         results.extend(outputs)
                         processed += len(chunk_with_options)
@@ -763,6 +914,8 @@ def ingest(
                         fail_fast=fail_fast,
                         error_log=error_log,
                         stream_output=stream_events,
+                        **concurrency_options,
+                        **invocation_options,
                     )
                 )
                 results.extend(streaming_results)
@@ -785,6 +938,9 @@ def ingest(
             },
         )
         errors.append(str(exc))
+    if isinstance(params_iter_unlimited, NdjsonBatchReader):
+        params_iter_unlimited.close()
+        total_records = params_iter_unlimited.count
     completed_at = datetime.now(timezone.utc)
     summary = summarise_results(
         adapter=adapter_name,
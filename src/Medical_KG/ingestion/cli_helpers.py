@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import importlib
 import json
+import mmap
+import multiprocessing
+import os
 import sys
 import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +16,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Generator,
     Iterable,
     Iterator,
     Mapping,
@@ -49,6 +55,14 @@ except Exception:  # pragma: no cover - fallback when rich is missing
     TimeRemainingColumn = None
     Table = None
 
+try:  # pragma: no cover - optional fast JSON decoder
+    _json_loads: Callable[[bytes], Any] = getattr(importlib.import_module("orjson"), "loads")
+except Exception:  # pragma: no cover - fall back to the standard library
+    _json_loads = json.loads
+
+_DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+_ESTIMATE_SAMPLE_BYTES = 1024 * 1024
+
 
 class BatchValidationError(ValueError):
     """Raised when a batch file contains invalid content."""
@@ -130,38 +144,258 @@ class CLIResultSummary:
         }
 
 
+class NdjsonBatchReader:
+    """Single-pass iterator over the JSON objects of an NDJSON batch file.
+
+    The file is memory-mapped and cut into ``chunk_bytes`` slices on newline
+    boundaries; lines are decoded with ``orjson`` when it is installed. When a
+    ``validator`` is given and ``workers`` is above one, each slice is decoded and
+    validated in a worker process (or on ``executor``) ahead of the consumer, so
+    ``validator`` must be picklable. Records are always yielded in file order and
+    errors surface at the record that caused them. ``count`` and
+    ``estimated_total`` replace a separate counting pass for progress reporting.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        strict: bool = True,
+        validator: Callable[[dict[str, Any]], None] | None = None,
+        workers: int = 1,
+        chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+        executor: Executor | None = None,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_bytes < 1:
+            raise ValueError("chunk_bytes must be at least 1")
+        self.path = path
+        self.strict = strict
+        self.validator = validator
+        self.workers = workers
+        self.chunk_bytes = chunk_bytes
+        self.executor = executor
+        self.progress = progress
+        self._records: Generator[dict[str, Any], None, None] | None = None
+        self._count = 0
+        self._total_bytes: int | None = None
+        self._sample_estimate: int | None = None
+        self._sampled = False
+        self._done_bytes = 0
+        self._done_records = 0
+        self._exhausted = False
+
+    def __iter__(self) -> NdjsonBatchReader:
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        if self._records is None:
+            self._records = self._generate()
+        return next(self._records)
+
+    def close(self) -> None:
+        """Stop reading and release the file mapping and any worker pool."""
+
+        if self._records is not None:
+            self._records.close()
+
+    @property
+    def count(self) -> int:
+        """Number of records yielded so far."""
+
+        return self._count
+
+    @property
+    def total_bytes(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = self.path.stat().st_size
+        return self._total_bytes
+
+    @property
+    def estimated_total(self) -> int | None:
+        """Expected number of records, exact once the file has been read.
+
+        Before reading, the estimate extrapolates the record density of the first
+        megabyte over the file size (exact for files that fit in the sample);
+        afterwards it extrapolates from the slices consumed so far.
+        """
+
+        if self._exhausted:
+            return self._count
+        if self._done_bytes:
+            estimate = round(self._done_records * self.total_bytes / self._done_bytes)
+            return max(estimate, self._count)
+        if not self._sampled:
+            self._sample_estimate = self._estimate_from_sample()
+            self._sampled = True
+        return self._sample_estimate
+
+    def _estimate_from_sample(self) -> int | None:
+        size = self.total_bytes
+        with self.path.open("rb") as handle:
+            sample = handle.read(_ESTIMATE_SAMPLE_BYTES)
+        if len(sample) >= size:
+            return _count_ndjson_lines(sample)
+        cut = sample.rfind(b"\n") + 1
+        if cut == 0:
+            return None
+        records = _count_ndjson_lines(sample[:cut])
+        if records == 0:
+            return None
+        return round(records * size / cut)
+
+    def _generate(self) -> Generator[dict[str, Any], None, None]:
+        owned_executor: Executor | None = None
+        executor = self.executor
+        validator = self.validator
+        if validator is None:
+            executor = None
+        elif executor is None and self.workers > 1:
+            owned_executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            executor = owned_executor
+        pending: deque[tuple[bytes, int, Future[tuple[int, Exception] | None] | None]] = deque()
+        try:
+            with self.path.open("rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                self._total_bytes = size
+                if size == 0:
+                    self._exhausted = True
+                    return
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    window = self.workers * 2 if executor is not None else 1
+                    line = 1
+                    for start, end in _chunk_bounds(view, size, self.chunk_bytes):
+                        data = view[start:end]
+                        future = None
+                        if executor is not None and validator is not None:
+                            future = executor.submit(
+                                _validate_ndjson_chunk,
+                                self.path,
+                                data,
+                                line,
+                                self.strict,
+                                validator,
+                            )
+                        pending.append((data, line, future))
+                        line += data.count(b"\n")
+                        if len(pending) >= window:
+                            yield from self._emit_chunk(*pending.popleft())
+                    while pending:
+                        yield from self._emit_chunk(*pending.popleft())
+            self._exhausted = True
+        finally:
+            for _, _, future in pending:
+                if future is not None:
+                    future.cancel()
+            if owned_executor is not None:
+                owned_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _emit_chunk(
+        self,
+        data: bytes,
+        first_line: int,
+        future: Future[tuple[int, Exception] | None] | None,
+    ) -> Iterator[dict[str, Any]]:
+        failure = future.result() if future is not None else None
+        lines = data.split(b"\n")
+        if failure is not None:
+            del lines[failure[0] :]
+        validator = self.validator if future is None else None
+        records = 0
+        for offset, line in enumerate(lines):
+            if not line or line.isspace():
+                continue
+            record = _decode_ndjson_line(line, first_line + offset, self.path, self.strict)
+            if validator is not None:
+                validator(record)
+            records += 1
+            self._count += 1
+            if self.progress is not None:
+                self.progress(self._count, None)
+            yield record
+        if failure is not None:
+            raise failure[1]
+        self._done_bytes += len(data)
+        self._done_records += records
+
+
+def _chunk_bounds(view: mmap.mmap, size: int, chunk_bytes: int) -> Iterator[tuple[int, int]]:
+    start = 0
+    while start < size:
+        end = min(start + chunk_bytes, size)
+        if end < size:
+            newline = view.find(b"\n", end - 1)
+            end = size if newline < 0 else newline + 1
+        yield start, end
+        start = end
+
+
+def _count_ndjson_lines(data: bytes) -> int:
+    return sum(1 for line in data.split(b"\n") if line and not line.isspace())
+
+
+def _decode_ndjson_line(line: bytes, index: int, path: Path, strict: bool) -> dict[str, Any]:
+    try:
+        payload = _json_loads(line)
+    except ValueError as exc:
+        raise BatchLoadError(
+            f"Invalid JSON on line {index} of {path}: {getattr(exc, 'msg', exc)}",
+            hint="Ensure each line is a complete JSON object.",
+        ) from exc
+    if type(payload) is dict:
+        # Decoded JSON objects always have string keys, so strict checks cannot fail.
+        return payload
+    if not isinstance(payload, Mapping):
+        raise BatchLoadError(
+            "Batch entries must be JSON objects",
+            hint=f"Entry on line {index} is {type(payload).__name__}",
+        )
+    record = dict(payload)
+    if strict:
+        _validate_mapping(record, path, index)
+    return record
+
+
+def _validate_ndjson_chunk(
+    path: Path,
+    data: bytes,
+    first_line: int,
+    strict: bool,
+    validator: Callable[[dict[str, Any]], None],
+) -> tuple[int, Exception] | None:
+    """Worker task: return the line offset and error of the first invalid record in ``data``."""
+
+    for offset, line in enumerate(data.split(b"\n")):
+        if not line or line.isspace():
+            continue
+        try:
+            validator(_decode_ndjson_line(line, first_line + offset, path, strict))
+        except Exception as exc:
+            return offset, exc
+    return None
+
+
 def load_ndjson_batch(
     path: Path,
     *,
     strict: bool = True,
     progress: Callable[[int, int | None], None] | None = None,
-) -> Iterator[dict[str, Any]]:
-    """Yield JSON objects from an NDJSON file, optionally enforcing strict validation."""
+    validator: Callable[[dict[str, Any]], None] | None = None,
+    workers: int = 1,
+) -> NdjsonBatchReader:
+    """Yield JSON objects from an NDJSON file, optionally enforcing strict validation.
 
-    count = 0
-    with path.open("r", encoding="utf-8") as handle:
-        for index, line in enumerate(handle, start=1):
-            if not line.strip():
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError as exc:  # pragma: no cover - validated via tests
-                raise BatchLoadError(
-                    f"Invalid JSON on line {index} of {path}: {exc.msg}",
-                    hint="Ensure each line is a complete JSON object.",
-                ) from exc
-            if not isinstance(payload, Mapping):
-                raise BatchLoadError(
-                    "Batch entries must be JSON objects",
-                    hint=f"Entry on line {index} is {type(payload).__name__}",
-                )
-            record = dict(payload)
-            if strict:
-                _validate_mapping(record, path, index)
-            count += 1
-            if progress is not None:
-                progress(count, None)
-            yield record
+    ``validator`` is applied to every record, in ``workers`` processes when above
+    one; see :class:`NdjsonBatchReader`.
+    """
+
+    return NdjsonBatchReader(
+        path, strict=strict, validator=validator, workers=workers, progress=progress
+    )
 
 
 def count_ndjson_records(path: Path) -> int:
@@ -415,7 +649,7 @@ def handle_ledger_resume(
     else:
         ledger_instance = ledger
 
-    entries = {entry.doc_id: entry.state for entry in ledger_instance.entries()}
+    entries = {entry.doc_id: entry.state for entry in ledger_instance.entries(with_history=False)}
     candidate_sequence = list(candidate_doc_ids) if candidate_doc_ids is not None else None
 
     failure_states = {LedgerState.FAILED, LedgerState.FETCHING}
@@ -490,6 +724,7 @@ __all__ = [
     "LedgerResumePlan",
     "LedgerResumeStats",
     "load_ndjson_batch",
+    "NdjsonBatchReader",
     "render_json_summary",
     "render_table_summary",
     "render_text_summary",
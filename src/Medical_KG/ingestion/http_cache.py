@@ -0,0 +1,240 @@
+"""On-disk HTTP response cache with conditional revalidation for AsyncHttpClient."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import time
+from typing import Mapping
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_CACHE_TTL_SECONDS = 3600.0
+_INDEX_FILENAME = "index.json"
+# Only representation headers are replayed; transfer encodings were already
+# removed by httpx when the body was stored.
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Metadata for a cached response body stored on disk."""
+
+    key: str
+    method: str
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    size: int
+    stored_at: float
+    validated_at: float
+    last_access: float = field(default=0.0)
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """Size-bounded LRU cache of GET responses keyed by method, URL, and params.
+
+    Entries are served without touching the network while younger than the
+    host's TTL. Expired entries carrying ``ETag``/``Last-Modified`` validators
+    are revalidated with a conditional GET so unchanged payloads cost a 304.
+    The index is persisted as JSON next to the body files; it is rewritten
+    every ``flush_interval`` mutations and on :meth:`flush`, which
+    :class:`AsyncHttpClient` calls when it closes.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        default_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        host_ttls: Mapping[str, float] | None = None,
+        flush_interval: int = 256,
+    ) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.host_ttls = dict(host_ttls or {})
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._total_bytes = 0
+        self._flush_interval = max(flush_interval, 1)
+        self._pending_mutations = 0
+        self._load_index()
+
+    @staticmethod
+    def build_key(method: str, url: str, params: Mapping[str, object] | None = None) -> str:
+        canonical_params = json.dumps(
+            sorted((str(key), str(value)) for key, value in (params or {}).items())
+        )
+        payload = f"{method.upper()} {url} {canonical_params}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, host: str) -> float:
+        return self.host_ttls.get(host, self.default_ttl)
+
+    def is_fresh(self, entry: CachedResponse, host: str, *, now: float | None = None) -> bool:
+        current = time() if now is None else now
+        return current - entry.validated_at < self.ttl_for(host)
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not self._body_path(key).exists():
+            self._discard(key)
+            self._mark_dirty()
+            return None
+        entry.last_access = time()
+        self._entries.move_to_end(key)
+        return entry
+
+    def read_body(self, entry: CachedResponse) -> bytes:
+        return self._body_path(entry.key).read_bytes()
+
+    def store(
+        self,
+        key: str,
+        *,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+    ) -> CachedResponse | None:
+        """Persist a response body, evicting least recently used entries."""
+
+        if len(content) > self.max_bytes:
+            return None
+        lowered = {str(name).lower(): str(value) for name, value in headers.items()}
+        if "no-store" in lowered.get("cache-control", ""):
+            return None
+        now = time()
+        self._discard(key)
+        path = self._body_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        entry = CachedResponse(
+            key=key,
+            method=method.upper(),
+            url=url,
+            status_code=status_code,
+            headers={name: lowered[name] for name in _STORED_HEADERS if name in lowered},
+            size=len(content),
+            stored_at=now,
+            validated_at=now,
+            last_access=now,
+        )
+        self._entries[key] = entry
+        self._total_bytes += entry.size
+        self._evict()
+        self._mark_dirty()
+        return entry
+
+    def mark_revalidated(self, entry: CachedResponse, headers: Mapping[str, str]) -> None:
+        """Reset the TTL after a 304 and pick up refreshed validators."""
+
+        lowered = {str(name).lower(): str(value) for name, value in headers.items()}
+        for name in ("etag", "last-modified"):
+            if name in lowered:
+                entry.headers[name] = lowered[name]
+        entry.validated_at = time()
+        self._mark_dirty()
+
+    def clear(self) -> None:
+        for key in list(self._entries):
+            self._discard(key)
+        self.flush(force=True)
+
+    def flush(self, *, force: bool = False) -> None:
+        """Persist the index if it changed since the last write."""
+
+        if self._pending_mutations or force:
+            self._write_index()
+            self._pending_mutations = 0
+
+    def _mark_dirty(self) -> None:
+        self._pending_mutations += 1
+        if self._pending_mutations >= self._flush_interval:
+            self.flush()
+
+    def _body_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.body"
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry.size
+        try:
+            self._body_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            LOGGER.debug("Evicting cached HTTP response", extra={"cache_key": key})
+            self._discard(key)
+
+    def _load_index(self) -> None:
+        index_path = self.root / _INDEX_FILENAME
+        if not index_path.exists():
+            return
+        try:
+            records = json.loads(index_path.read_text(encoding="utf-8"))
+            entries = [CachedResponse(**record) for record in records]
+        except (ValueError, TypeError) as exc:
+            LOGGER.warning("Discarding unreadable HTTP cache index %s: %s", index_path, exc)
+            return
+        for entry in sorted(entries, key=lambda item: item.last_access):
+            if self._body_path(entry.key).exists():
+                self._entries[entry.key] = entry
+                self._total_bytes += entry.size
+        self._evict()
+
+    def _write_index(self) -> None:
+        index_path = self.root / _INDEX_FILENAME
+        tmp_path = index_path.with_suffix(".tmp")
+        payload = [asdict(entry) for entry in self._entries.values()]
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+
+
+__all__ = [
+    "CachedResponse",
+    "DEFAULT_CACHE_MAX_BYTES",
+    "DEFAULT_CACHE_TTL_SECONDS",
+    "HttpResponseCache",
+]
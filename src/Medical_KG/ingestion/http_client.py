@@ -4,10 +4,11 @@ import asyncio
 import importlib.util
 import logging
 import random
-from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from time import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
 from types import TracebackType
 from typing import (
     AsyncIterator,
@@ -29,8 +30,10 @@ from Medical_KG.compat.httpx import (
     ResponseProtocol,
     create_async_client,
 )
+from Medical_KG.ingestion.http_cache import CachedResponse, HttpResponseCache
 from Medical_KG.ingestion.telemetry import (
     HttpBackoffEvent,
+    HttpCacheEvent,
     HttpErrorEvent,
     HttpEvent,
     HttpRequestEvent,
@@ -47,8 +50,9 @@ HTTPX: HttpxModule = get_httpx_module()
 
 LOGGER = logging.getLogger(__name__)
 QUEUE_ALERT_THRESHOLD = 0.8
-_EventKey = Literal["request", "response", "retry", "backoff", "error"]
-_EVENT_KEYS: tuple[_EventKey, ...] = ("request", "response", "retry", "backoff", "error")
+_THROTTLE_STATUSES = frozenset({429, 503})
+_EventKey = Literal["request", "response", "retry", "backoff", "error", "cache"]
+_EVENT_KEYS: tuple[_EventKey, ...] = ("request", "response", "retry", "backoff", "error", "cache")
 
 
 @dataclass(slots=True)
@@ -91,44 +95,135 @@ class BytesResponse:
     content: bytes
 
 
-class _SimpleLimiter:
-    def __init__(self, rate: int, per: float) -> None:
+class _TokenBucketLimiter:
+    """Token bucket with AIMD adaptation to upstream throttling.
+
+    The bucket holds up to ``rate`` tokens and refills at ``rate / per`` tokens
+    per second, so short bursts up to the configured quota go out immediately.
+    Acquisition never holds a lock: when the bucket is empty the caller
+    reserves a token by driving the balance negative and sleeps only for its
+    own share of the deficit, so concurrent waiters are released one refill
+    interval apart instead of queueing behind a single sleeping coroutine.
+
+    :meth:`penalize` multiplicatively shrinks the effective refill rate (and
+    honours ``Retry-After`` by pausing the bucket); :meth:`reward` grows it back
+    additively. The configured :class:`RateLimit` is always the ceiling.
+    """
+
+    def __init__(
+        self,
+        rate: int,
+        per: float,
+        *,
+        decrease_factor: float = 0.5,
+        recovery_steps: int = 20,
+        min_fraction: float = 0.05,
+    ) -> None:
         self.rate = rate
         self.per = per
-        self._events: deque[float] = deque()
-        self._lock = asyncio.Lock()
-
-    async def __aenter__(self) -> "_SimpleLimiter":
+        self.capacity = float(max(rate, 1))
+        self.max_fill_rate = self.capacity / per if per > 0 else float("inf")
+        self.fill_rate = self.max_fill_rate
+        self._decrease_factor = decrease_factor
+        self._increase_step = self.max_fill_rate / max(recovery_steps, 1)
+        self._min_fill_rate = self.max_fill_rate * min_fraction
+        self._tokens = self.capacity
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._tickets = 0
+        self._waiters = 0
+
+    async def __aenter__(self) -> "_TokenBucketLimiter":
         await self.acquire()
         return self
 
     async def __aexit__(self, *_exc: object) -> None:
         return None
 
+    def _refill(self, now: float) -> None:
+        elapsed = now - max(self._updated, self._paused_until)
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.fill_rate)
+        self._updated = max(now, self._updated)
+
+    def _snapshot(self, wait_time: float) -> _LimiterSnapshot:
+        in_use = max(self.capacity - self._tokens, 0.0)
+        queue_depth = int(min(in_use, self.capacity)) + self._waiters
+        return _LimiterSnapshot(
+            wait_time_seconds=wait_time,
+            queue_depth=queue_depth,
+            queue_capacity=self.rate,
+            queue_saturation=min(in_use / self.capacity, 1.0),
+        )
+
     async def acquire(self) -> _LimiterSnapshot:
-        async with self._lock:
-            now = time()
-            while self._events and now - self._events[0] >= self.per:
-                self._events.popleft()
-            wait_time = 0.0
-            if self._events and len(self._events) >= self.rate:
-                target = self.per - (now - self._events[0])
-                wait_seconds = max(target, 0.0)
-                wait_started = time()
-                await asyncio.sleep(wait_seconds)
-                wait_time = time() - wait_started
-                now = time()
-                while self._events and now - self._events[0] >= self.per:
-                    self._events.popleft()
-            self._events.append(now)
-            queue_depth = len(self._events)
-            saturation = min(queue_depth / self.rate, 1.0) if self.rate else 0.0
-            return _LimiterSnapshot(
-                wait_time_seconds=wait_time,
-                queue_depth=queue_depth,
-                queue_capacity=self.rate,
-                queue_saturation=saturation,
-            )
+        now = monotonic()
+        self._refill(now)
+        if self._tokens >= 1.0 and now >= self._paused_until:
+            self._tokens -= 1.0
+            return self._snapshot(0.0)
+        wait_started = now
+        self._tokens -= 1.0
+        self._tickets += 1
+        ticket = self._tickets
+        self._waiters += 1
+        try:
+            while True:
+                now = monotonic()
+                self._refill(now)
+                # Tokens reserved by later callers are not this caller's debt.
+                deficit = max(-(self._tokens + self._tickets - ticket), 0.0)
+                delay = max(self._paused_until - now, 0.0) + deficit / self.fill_rate
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            self._waiters -= 1
+        return self._snapshot(monotonic() - wait_started)
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Shrink the refill rate after a 429/503 and honour ``Retry-After``."""
+
+        now = monotonic()
+        self._refill(now)
+        self.fill_rate = max(self.fill_rate * self._decrease_factor, self._min_fill_rate)
+        if retry_after is not None and retry_after > 0:
+            self._paused_until = max(self._paused_until, now + retry_after)
+            self._tokens = min(self._tokens, 0.0)
+
+    def reward(self) -> None:
+        """Additively restore the refill rate after a successful response."""
+
+        if self.fill_rate < self.max_fill_rate:
+            self._refill(monotonic())
+            self.fill_rate = min(self.fill_rate + self._increase_step, self.max_fill_rate)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the ``Retry-After`` delay in seconds (delta or HTTP-date form)."""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(retry_at.timestamp() - time(), 0.0)
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    return _parse_retry_after(value if isinstance(value, str) else None)
 
 
 class _TelemetryRegistry:
@@ -185,6 +280,7 @@ class AsyncHttpClient:
         on_retry: Callable[[HttpRetryEvent], None] | None = None,
         on_backoff: Callable[[HttpBackoffEvent], None] | None = None,
         on_error: Callable[[HttpErrorEvent], None] | None = None,
+        on_cache: Callable[[HttpCacheEvent], None] | None = None,
         telemetry: (
             HttpTelemetry
             | Sequence[HttpTelemetry]
@@ -192,6 +288,7 @@ class AsyncHttpClient:
         )
         | None = None,
         enable_metrics: bool = False,
+        cache: HttpResponseCache | None = None,
     ) -> None:
         """Construct the asynchronous HTTP client.
 
@@ -206,11 +303,15 @@ class AsyncHttpClient:
             on_retry: Callback accepting :class:`HttpRetryEvent` before a retry delay.
             on_backoff: Callback accepting :class:`HttpBackoffEvent` after limiter wait.
             on_error: Callback accepting :class:`HttpErrorEvent` when exceptions occur.
+            on_cache: Callback accepting :class:`HttpCacheEvent` for cache lookups.
             telemetry: Telemetry helper(s) to register globally or per host. Use
                 :meth:`add_telemetry` to attach handlers after initialisation.
             enable_metrics: When ``True`` registers :class:`PrometheusTelemetry`
                 automatically if the ``prometheus_client`` dependency is
                 available.
+            cache: Optional :class:`HttpResponseCache`. When provided, GET
+                responses are cached on disk and revalidated with conditional
+                requests once their per-host TTL expires.
 
         Example:
             Configure Prometheus metrics explicitly::
@@ -223,17 +324,19 @@ class AsyncHttpClient:
         )
         self._limits: dict[str, RateLimit] = dict(limits or {})
         self._default_rate = default_rate or RateLimit(rate=5, per=1.0)
-        self._limiters: dict[str, _SimpleLimiter] = {}
+        self._limiters: dict[str, _TokenBucketLimiter] = {}
         self._retries = retries
         self._retry_callback: Callable[[str, str, int, Exception], None] | None = None
         self._queue_alert_threshold = QUEUE_ALERT_THRESHOLD
         self._telemetry_registry = _TelemetryRegistry(LOGGER)
+        self._cache = cache
 
         self._register_callback("request", on_request)
         self._register_callback("response", on_response)
         self._register_callback("retry", on_retry)
         self._register_callback("backoff", on_backoff)
         self._register_callback("error", on_error)
+        self._register_callback("cache", on_cache)
 
         metrics_enabled = False
         if enable_metrics:
@@ -249,6 +352,8 @@ class AsyncHttpClient:
         self.add_telemetry(telemetry)
 
     async def aclose(self) -> None:
+        if self._cache is not None:
+            self._cache.flush()
         await self._client.aclose()
 
     async def __aenter__(self) -> "AsyncHttpClient":
@@ -305,16 +410,16 @@ class AsyncHttpClient:
             return
         self._register_telemetry(telemetry)
 
-    def _get_limiter(self, host: str) -> _SimpleLimiter:
+    def _get_limiter(self, host: str) -> _TokenBucketLimiter:
         if host not in self._limiters:
             limit = self._limits.get(host, self._default_rate)
-            self._limiters[host] = _SimpleLimiter(limit.rate, limit.per)
+            self._limiters[host] = _TokenBucketLimiter(limit.rate, limit.per)
         return self._limiters[host]
 
     def _register_callback(
         self,
         event: _EventKey,
-        callback: Callable[[HttpEvent], None] | Callable[[HttpRequestEvent], None] | Callable[[HttpResponseEvent], None] | Callable[[HttpRetryEvent], None] | Callable[[HttpBackoffEvent], None] | Callable[[HttpErrorEvent], None] | None,
+        callback: Callable[[HttpEvent], None] | Callable[[HttpRequestEvent], None] | Callable[[HttpResponseEvent], None] | Callable[[HttpRetryEvent], None] | Callable[[HttpBackoffEvent], None] | Callable[[HttpErrorEvent], None] | Callable[[HttpCacheEvent], None] | None,
         *,
         host: str | None = None,
     ) -> None:
@@ -356,6 +461,7 @@ class AsyncHttpClient:
             self._register_callback("retry", getattr(handler, "on_retry", None), host=host)
             self._register_callback("backoff", getattr(handler, "on_backoff", None), host=host)
             self._register_callback("error", getattr(handler, "on_error", None), host=host)
+            self._register_callback("cache", getattr(handler, "on_cache", None), host=host)
 
     @staticmethod
     def _iter_handlers(
@@ -373,6 +479,17 @@ class AsyncHttpClient:
             return {}
         return {str(key): str(value) for key, value in headers.items()}
 
+    @staticmethod
+    def _resolve_host(parsed: ParseResult) -> str:
+        return parsed.netloc or parsed.path or ""
+
+    @classmethod
+    def _response_headers(cls, response: ResponseProtocol) -> dict[str, str]:
+        headers_obj = getattr(response, "headers", None)
+        if isinstance(headers_obj, Mapping):
+            return cls._resolve_request_headers(headers_obj)
+        return {}
+
     def _emit(self, event: _EventKey, payload: HttpEvent) -> None:
         self._telemetry_registry.notify(event, payload, payload.host)
 
@@ -381,12 +498,37 @@ class AsyncHttpClient:
         method: str,
         url: str,
         headers: Mapping[str, str] | None,
-    ) -> tuple[_SimpleLimiter, ParseResult, str, str, float]:
+    ) -> tuple[_TokenBucketLimiter, ParseResult, str, str, float]:
         parsed = urlparse(url)
-        host = parsed.netloc or parsed.path or ""
+        host = self._resolve_host(parsed)
         limiter = self._get_limiter(host)
-        snapshot = await limiter.acquire()
         request_id = generate_request_id()
+        timestamp = await self._acquire_token(
+            limiter, method=method, url=url, host=host, request_id=request_id
+        )
+        request_event = HttpRequestEvent(
+            request_id=request_id,
+            url=url,
+            method=method,
+            host=host,
+            timestamp=timestamp,
+            headers=self._resolve_request_headers(headers),
+        )
+        self._emit("request", request_event)
+        return limiter, parsed, host, request_id, timestamp
+
+    async def _acquire_token(
+        self,
+        limiter: _TokenBucketLimiter,
+        *,
+        method: str,
+        url: str,
+        host: str,
+        request_id: str,
+    ) -> float:
+        """Wait for a limiter token, report the wait, and return when it was granted."""
+
+        snapshot = await limiter.acquire()
         timestamp = time()
         backoff_event = HttpBackoffEvent(
             request_id=request_id,
@@ -414,16 +556,7 @@ class AsyncHttpClient:
                     "http_queue_wait_time": snapshot.wait_time_seconds,
                 },
             )
-        request_event = HttpRequestEvent(
-            request_id=request_id,
-            url=url,
-            method=method,
-            host=host,
-            timestamp=timestamp,
-            headers=self._resolve_request_headers(headers),
-        )
-        self._emit("request", request_event)
-        return limiter, parsed, host, request_id, timestamp
+        return timestamp
 
     def _emit_response_event(
         self,
@@ -437,12 +570,7 @@ class AsyncHttpClient:
     ) -> None:
         duration = max(time() - start_time, 0.0)
         size = len(getattr(response, "content", b""))
-        headers_obj = getattr(response, "headers", None)
-        headers = (
-            self._resolve_request_headers(headers_obj)
-            if isinstance(headers_obj, Mapping)
-            else {}
-        )
+        headers = self._response_headers(response)
         event = HttpResponseEvent(
             request_id=request_id,
             url=url,
@@ -503,6 +631,37 @@ class AsyncHttpClient:
         )
         self._emit("error", event)
 
+    def _emit_cache_event(
+        self,
+        *,
+        request_id: str,
+        method: str,
+        url: str,
+        host: str,
+        outcome: str,
+        size_bytes: int,
+    ) -> None:
+        event = HttpCacheEvent(
+            request_id=request_id,
+            url=url,
+            method=method,
+            host=host,
+            timestamp=time(),
+            outcome=outcome,
+            size_bytes=size_bytes,
+        )
+        self._emit("cache", event)
+
+    def _cached_response(self, entry: CachedResponse) -> ResponseProtocol:
+        assert self._cache is not None
+        response = HTTPX.Response(
+            status_code=entry.status_code,
+            headers=entry.headers,
+            content=self._cache.read_body(entry),
+            request=HTTPX.Request(entry.method, entry.url),
+        )
+        return cast(ResponseProtocol, response)
+
     def bind_retry_callback(
         self, callback: Callable[[str, str, int, Exception], None] | None
     ) -> None:
@@ -512,20 +671,40 @@ class AsyncHttpClient:
 
     async def _execute(self, method: str, url: str, **kwargs: object) -> ResponseProtocol:
         headers = cast(Mapping[str, str] | None, kwargs.get("headers"))
+        cache_key: str | None = None
+        cached: CachedResponse | None = None
+        if self._cache is not None and method == "GET":
+            cache_host = self._resolve_host(urlparse(url))
+            cache_key = self._cache.build_key(
+                method, url, cast(Mapping[str, object] | None, kwargs.get("params"))
+            )
+            cached = self._cache.lookup(cache_key)
+            if cached is not None and self._cache.is_fresh(cached, cache_host):
+                self._emit_cache_event(
+                    request_id=generate_request_id(),
+                    method=method,
+                    url=url,
+                    host=cache_host,
+                    outcome="hit",
+                    size_bytes=cached.size,
+                )
+                return self._cached_response(cached)
+            if cached is not None:
+                kwargs["headers"] = {**(headers or {}), **cached.conditional_headers()}
         limiter, parsed, host, request_id, _ = await self._prepare_request(
             method,
             url,
             headers,
         )
 
-        async with limiter:
-            backoff = 0.5
-            last_error: Exception | None = None
-            for attempt in range(1, self._retries + 1):
-                try:
-                    start = time()
-                    response = await self._client.request(method, url, **kwargs)
-                    response.raise_for_status()
+        backoff = 0.5
+        last_error: Exception | None = None
+        for attempt in range(1, self._retries + 1):
+            try:
+                start = time()
+                response = await self._client.request(method, url, **kwargs)
+                if cached is not None and response.status_code == 304:
+                    assert self._cache is not None
                     self._emit_response_event(
                         request_id=request_id,
                         method=method,
@@ -534,54 +713,101 @@ class AsyncHttpClient:
                         response=response,
                         start_time=start,
                     )
-                    return response
-                except HTTPError as exc:  # pragma: no cover - exercised via tests
-                    status = getattr(getattr(exc, "response", None), "status_code", None)
-                    retryable = status in {429, 502, 503, 504}
-                    reason = f"status_{status}" if status is not None else type(exc).__name__
-                    self._emit_error_event(
+                    limiter.reward()
+                    self._cache.mark_revalidated(cached, self._response_headers(response))
+                    self._emit_cache_event(
                         request_id=request_id,
                         method=method,
                         url=url,
                         host=host,
-                        exc=exc,
-                        retryable=retryable,
+                        outcome="revalidated",
+                        size_bytes=cached.size,
                     )
-                    if not retryable:
-                        raise
-                    last_error = exc
-                    if self._retry_callback is not None and attempt < self._retries:
-                        self._retry_callback(method, url, attempt, exc)
-                    jitter = random.uniform(0, backoff / 2)
-                    delay = backoff + jitter
-                    will_retry = attempt < self._retries
-                    self._emit_retry_event(
-                        request_id=request_id,
+                    return self._cached_response(cached)
+                response.raise_for_status()
+                self._emit_response_event(
+                    request_id=request_id,
+                    method=method,
+                    url=url,
+                    host=host,
+                    response=response,
+                    start_time=start,
+                )
+                limiter.reward()
+                if cache_key is not None:
+                    assert self._cache is not None
+                    self._cache.store(
+                        cache_key,
                         method=method,
                         url=url,
-                        host=host,
-                        attempt=attempt,
-                        delay_seconds=delay,
-                        will_retry=will_retry,
-                        reason=reason,
+                        status_code=response.status_code,
+                        headers=self._response_headers(response),
+                        content=response.content,
                     )
-                    if not will_retry:
-                        break
-                    await asyncio.sleep(delay)
-                    backoff = min(backoff * 2, 5.0)
-                except Exception as exc:  # pragma: no cover - exercised via tests
-                    self._emit_error_event(
+                    self._emit_cache_event(
                         request_id=request_id,
                         method=method,
                         url=url,
                         host=host,
-                        exc=exc,
-                        retryable=False,
+                        outcome="miss",
+                        size_bytes=len(response.content),
                     )
+                return response
+            except HTTPError as exc:  # pragma: no cover - exercised via tests
+                status = getattr(getattr(exc, "response", None), "status_code", None)
+                retryable = status in {429, 502, 503, 504}
+                reason = f"status_{status}" if status is not None else type(exc).__name__
+                retry_after: float | None = None
+                if status in _THROTTLE_STATUSES:
+                    retry_after = _retry_after_seconds(exc)
+                    limiter.penalize(retry_after)
+                self._emit_error_event(
+                    request_id=request_id,
+                    method=method,
+                    url=url,
+                    host=host,
+                    exc=exc,
+                    retryable=retryable,
+                )
+                if not retryable:
                     raise
-            if last_error:
-                raise last_error
-            raise RuntimeError("Retry loop exhausted")
+                last_error = exc
+                if self._retry_callback is not None and attempt < self._retries:
+                    self._retry_callback(method, url, attempt, exc)
+                jitter = random.uniform(0, backoff / 2)
+                delay = max(backoff + jitter, retry_after or 0.0)
+                will_retry = attempt < self._retries
+                self._emit_retry_event(
+                    request_id=request_id,
+                    method=method,
+                    url=url,
+                    host=host,
+                    attempt=attempt,
+                    delay_seconds=delay,
+                    will_retry=will_retry,
+                    reason=reason,
+                )
+                if not will_retry:
+                    break
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, 5.0)
+                # Retries count against the host quota (and any AIMD penalty) like the first try.
+                await self._acquire_token(
+                    limiter, method=method, url=url, host=host, request_id=request_id
+                )
+            except Exception as exc:  # pragma: no cover - exercised via tests
+                self._emit_error_event(
+                    request_id=request_id,
+                    method=method,
+                    url=url,
+                    host=host,
+                    exc=exc,
+                    retryable=False,
+                )
+                raise
+        if last_error:
+            raise last_error
+        raise RuntimeError("Retry loop exhausted")
 
     async def get(
         self,
@@ -614,23 +840,25 @@ class AsyncHttpClient:
         )
         start_time = time()
         try:
-            async with limiter:
-                async with self._client.stream(method, url, **kwargs) as response:
-                    response.raise_for_status()
-                    self._emit_response_event(
-                        request_id=request_id,
-                        method=method,
-                        url=url,
-                        host=host,
-                        response=response,
-                        start_time=start_time,
-                    )
-                    yield response
+            async with self._client.stream(method, url, **kwargs) as response:
+                response.raise_for_status()
+                limiter.reward()
+                self._emit_response_event(
+                    request_id=request_id,
+                    method=method,
+                    url=url,
+                    host=host,
+                    response=response,
+                    start_time=start_time,
+                )
+                yield response
         except Exception as exc:
             retryable = False
             if isinstance(exc, HTTPError):
                 status = getattr(getattr(exc, "response", None), "status_code", None)
                 retryable = status in {429, 502, 503, 504}
+                if status in _THROTTLE_STATUSES:
+                    limiter.penalize(_retry_after_seconds(exc))
             self._emit_error_event(
                 request_id=request_id,
                 method=method,
@@ -678,4 +906,4 @@ class AsyncHttpClient:
 
         self._limits[host] = limit
         if host in self._limiters:
-            self._limiters[host] = _SimpleLimiter(limit.rate, limit.per)
+            self._limiters[host] = _TokenBucketLimiter(limit.rate, limit.per)
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+import os
+import sys
 import warnings
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Thread
 from time import perf_counter
-from typing import Iterable, Mapping, MutableMapping, Protocol, Sequence, TextIO, cast
+from typing import (
+    Iterable,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Protocol,
+    Sequence,
+    TextIO,
+    cast,
+)
 
 import jsonlines
 from Medical_KG.compat.prometheus import Counter, Gauge, Histogram
@@ -395,7 +408,12 @@ class LedgerAuditRecord:
 
 @dataclass(slots=True)
 class LedgerDocumentState:
-    """Latest state for a document tracked by the ledger."""
+    """Latest state for a document tracked by the ledger.
+
+    ``history`` is materialised from the ledger's history store whenever a document is
+    returned; listings requested with ``with_history=False`` leave it empty and
+    :meth:`IngestionLedger.get_state` reads the latest state alone.
+    """
 
     doc_id: str
     state: LedgerState
@@ -412,6 +430,26 @@ class LedgerDocumentState:
         return (reference - self.updated_at).total_seconds()
 
 
+@dataclass(frozen=True, slots=True)
+class LedgerTransition:
+    """Requested state change, as accepted by :meth:`IngestionLedger.update_states_batch`."""
+
+    doc_id: str
+    new_state: LedgerState
+    adapter: str | None = None
+    metadata: Mapping[str, JSONValue] | None = None
+    error: BaseException | None = None
+    error_type: str | None = None
+    error_message: str | None = None
+    traceback: str | None = None
+    retry_count: int | None = None
+    duration_seconds: float | None = None
+    parameters: Mapping[str, JSONValue] | None = None
+
+    def __post_init__(self) -> None:
+        _ensure_ledger_state(self.new_state, argument="new_state")
+
+
 def _as_float(value: object, default: float = 0.0) -> float:
     if isinstance(value, (int, float)):
         return float(value)
@@ -436,8 +474,194 @@ def _as_int(value: object, default: int | None = None) -> int | None:
     return default
 
 
+# State codes are positional, as in the segment store; new states are only ever appended.
+_STATE_CODES: tuple[LedgerState, ...] = tuple(LedgerState)
+_STATE_TO_CODE: Mapping[LedgerState, int] = {state: code for code, state in enumerate(_STATE_CODES)}
+_NO_RECORD = -1
+_HISTORY_HAS_METADATA = 0x01
+# Marks a key dropped from the metadata in a history metadata delta.
+_REMOVED: JSONValue = cast(JSONValue, object())
+
+
+class _RecordExtras(NamedTuple):
+    """Sparse history fields, stored only for records that carry any of them."""
+
+    error_type: str | None
+    error_message: str | None
+    traceback: str | None
+    retry_count: int | None
+    duration_seconds: float | None
+    parameters: JSONMapping | None
+
+
+class LedgerHistoryStore:
+    """Single copy of every transition a ledger has recorded.
+
+    Records live in one append-only arena of parallel ``array`` columns: states and
+    adapters are interned to small codes, timestamps are integer epoch microseconds and
+    each record stores the offset of the previous record of its document, so a document's
+    history is the chain that starts at its latest offset. Metadata is kept as a delta
+    against the document's previous metadata; retry counts, durations, parameters and error
+    details go to a sparse side table. :meth:`history` materialises
+    :class:`LedgerAuditRecord` objects on demand.
+    """
+
+    def __init__(self) -> None:
+        self._old_states = array("B")
+        self._new_states = array("B")
+        self._flags = array("B")
+        self._adapters = array("H")
+        self._timestamps = array("q")
+        self._previous = array("i")
+        self._extras: dict[int, _RecordExtras] = {}
+        self._metadata_deltas: dict[int, JSONMapping] = {}
+        self._heads: dict[str, int] = {}
+        self._last_metadata: dict[str, JSONMapping] = {}
+        self._adapter_names: list[str | None] = [None]
+        self._adapter_codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._heads
+
+    def doc_ids(self) -> list[str]:
+        """Return the identifiers of documents with recorded history."""
+
+        return list(self._heads)
+
+    def _intern_adapter(self, adapter: str | None) -> int:
+        if not adapter:
+            return 0
+        code = self._adapter_codes.get(adapter)
+        if code is not None:
+            return code
+        if len(self._adapter_names) > 0xFFFF:
+            raise LedgerError("Ledger history supports at most 65535 adapters")
+        code = len(self._adapter_names)
+        self._adapter_names.append(adapter)
+        self._adapter_codes[adapter] = code
+        return code
+
+    def append(self, audit: LedgerAuditRecord) -> None:
+        """Record ``audit`` as the latest transition of its document."""
+
+        doc_id = audit.doc_id
+        adapter_code = self._intern_adapter(audit.adapter)
+        offset = len(self._timestamps)
+        flags = 0
+        if audit.metadata:
+            flags |= _HISTORY_HAS_METADATA
+            current = dict(audit.metadata)
+            base = self._last_metadata.get(doc_id)
+            if base is None:
+                # The first metadata of a document is its own delta; share the copy.
+                self._metadata_deltas[offset] = current
+            else:
+                delta: MutableJSONMapping = {
+                    key: value
+                    for key, value in current.items()
+                    if key not in base or base[key] != value
+                }
+                delta.update((key, _REMOVED) for key in base if key not in current)
+                if delta:
+                    self._metadata_deltas[offset] = delta
+            self._last_metadata[doc_id] = current
+        if (
+            audit.error_type is not None
+            or audit.error_message is not None
+            or audit.traceback is not None
+            or audit.retry_count is not None
+            or audit.duration_seconds is not None
+            or audit.parameters
+        ):
+            error_type = audit.error_type
+            self._extras[offset] = _RecordExtras(
+                error_type=sys.intern(error_type) if error_type is not None else None,
+                error_message=audit.error_message,
+                traceback=audit.traceback,
+                retry_count=audit.retry_count,
+                duration_seconds=audit.duration_seconds,
+                parameters=dict(audit.parameters) if audit.parameters else None,
+            )
+        self._old_states.append(_STATE_TO_CODE[audit.old_state])
+        self._new_states.append(_STATE_TO_CODE[audit.new_state])
+        self._flags.append(flags)
+        self._adapters.append(adapter_code)
+        self._timestamps.append(round(audit.timestamp * 1_000_000))
+        self._previous.append(self._heads.get(doc_id, _NO_RECORD))
+        self._heads[doc_id] = offset
+
+    def history(self, doc_id: str, *, limit: int | None = None) -> list[LedgerAuditRecord]:
+        """Materialise the transitions of ``doc_id``, oldest first.
+
+        ``limit`` ignores records appended once the arena held that many records, which lets
+        a snapshot read a consistent history while transitions keep being recorded.
+        """
+
+        offsets: list[int] = []
+        offset = self._heads.get(doc_id, _NO_RECORD)
+        while offset != _NO_RECORD:
+            if limit is None or offset < limit:
+                offsets.append(offset)
+            offset = self._previous[offset]
+        offsets.reverse()
+        records: list[LedgerAuditRecord] = []
+        metadata: MutableJSONMapping = {}
+        for offset in offsets:
+            extras = self._extras.get(offset)
+            has_metadata = self._flags[offset] & _HISTORY_HAS_METADATA
+            delta = self._metadata_deltas.get(offset)
+            if delta is not None:
+                metadata = {**metadata, **delta}
+                for key, value in delta.items():
+                    if value is _REMOVED:
+                        del metadata[key]
+            records.append(
+                LedgerAuditRecord(
+                    doc_id=doc_id,
+                    old_state=_STATE_CODES[self._old_states[offset]],
+                    new_state=_STATE_CODES[self._new_states[offset]],
+                    timestamp=self._timestamps[offset] / 1_000_000,
+                    adapter=self._adapter_names[self._adapters[offset]],
+                    error_type=extras.error_type if extras else None,
+                    error_message=extras.error_message if extras else None,
+                    traceback=extras.traceback if extras else None,
+                    retry_count=extras.retry_count if extras else None,
+                    duration_seconds=extras.duration_seconds if extras else None,
+                    parameters=dict(extras.parameters) if extras and extras.parameters else {},
+                    metadata=dict(metadata) if has_metadata else {},
+                )
+            )
+        return records
+
+
+_SNAPSHOT_VERSION = "2.0"
+_SNAPSHOT_PATTERNS = ("*.ndjson", "*.json")
+
+
+@dataclass(slots=True)
+class _SnapshotJob:
+    """Frozen ledger view handed to the snapshot writer."""
+
+    path: Path
+    created_at: datetime
+    documents: dict[str, LedgerDocumentState]
+    covers: list[str]
+    history: LedgerHistoryStore
+    history_limit: int
+
+
 class IngestionLedger:
-    """Durable ledger with validated state machine and compaction."""
+    """Durable ledger with validated state machine and compaction.
+
+    Snapshots are NDJSON files: a header line followed by one line per document. Automatic
+    snapshots run on a background thread from a copy-on-write view of the document map, so
+    :meth:`update_state` never serialises the ledger while holding the lock. The audit log is
+    rotated aside when the view is taken and deleted once the snapshot covering it has been
+    renamed into place.
+    """
 
     def __init__(
         self,
@@ -446,55 +670,60 @@ class IngestionLedger:
         snapshot_dir: Path | None = None,
         auto_snapshot_interval: timedelta | None = None,
         snapshot_retention: int = 7,
+        fsync: bool = False,
     ) -> None:
         self._path = path
         self._lock = Lock()
+        self._fsync = fsync
         self._snapshot_dir = snapshot_dir or path.with_suffix(".snapshots")
         self._auto_snapshot_interval = auto_snapshot_interval or timedelta(days=1)
         self._snapshot_retention = snapshot_retention
         self._documents: dict[str, LedgerDocumentState] = {}
-        self._history: dict[str, list[LedgerAuditRecord]] = {}
+        self._history = LedgerHistoryStore()
         self._last_snapshot_at: datetime | None = None
         self._log_handle: TextIO | None = None
         self._pending_writes: list[str] = []
         self._state_counts: dict[LedgerState, int] = {state: 0 for state in LedgerState}
+        self._by_state: dict[LedgerState, dict[str, None]] = {state: {} for state in LedgerState}
+        self._stuck_heap: list[tuple[float, str]] = []
+        self._snapshot_view: dict[str, LedgerDocumentState] | None = None
+        self._snapshot_thread: Thread | None = None
         self._load()
 
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def snapshot_dir(self) -> Path:
+        return self._snapshot_dir
+
     # ------------------------------------------------------------------ loading
     def _load(self) -> None:
         start = perf_counter()
         method = "full"
         snapshot = self._latest_snapshot()
         records: dict[str, LedgerDocumentState] = {}
-        history: dict[str, list[LedgerAuditRecord]] = {}
+        history = LedgerHistoryStore()
+        covered: set[str] = set()
         if snapshot:
             method = "snapshot"
             INITIALIZATION_COUNTER.labels(method=method).inc()
-            snapshot_states, snapshot_history, created_at = self.load_snapshot(snapshot)
+            snapshot_states, created_at, covers = self._read_snapshot(snapshot, history)
             records.update(snapshot_states)
-            history.update(snapshot_history)
+            covered.update(covers)
             self._last_snapshot_at = created_at
         else:
             INITIALIZATION_COUNTER.labels(method=method).inc()
         try:
+            for rotated in self._rotated_logs():
+                if rotated.name in covered:
+                    # The snapshot was renamed into place before the log could be removed.
+                    rotated.unlink(missing_ok=True)
+                else:
+                    self._replay_log(rotated, records, history)
             if self._path.exists():
-                with jsonlines.open(self._path, mode="r") as fp:
-                    for row in cast(Iterable[Mapping[str, JSONValue]], fp):
-                        audit = LedgerAuditRecord.from_dict(row)
-                        validate_transition(audit.old_state, audit.new_state)
-                        state = records.get(
-                            audit.doc_id,
-                            LedgerDocumentState(
-                                doc_id=audit.doc_id,
-                                state=audit.old_state,
-                                updated_at=datetime.fromtimestamp(
-                                    audit.timestamp, tz=timezone.utc
-                                ),
-                            ),
-                        )
-                        self._apply_audit(state, audit)
-                        records[audit.doc_id] = state
-                        history.setdefault(audit.doc_id, []).append(audit)
+                self._replay_log(self._path, records, history)
         except InvalidStateTransition as exc:  # pragma: no cover - defensive
             raise LedgerCorruption("Ledger contains invalid transition") from exc
         except LedgerCorruption:
@@ -507,11 +736,77 @@ class IngestionLedger:
         INITIALIZATION_DURATION.observe(perf_counter() - start)
         self._update_state_metrics()
 
+    def _replay_log(
+        self,
+        path: Path,
+        records: dict[str, LedgerDocumentState],
+        history: LedgerHistoryStore,
+    ) -> None:
+        with jsonlines.open(path, mode="r") as fp:
+            for row in cast(Iterable[Mapping[str, JSONValue]], fp):
+                audit = LedgerAuditRecord.from_dict(row)
+                validate_transition(audit.old_state, audit.new_state)
+                state = records.get(
+                    audit.doc_id,
+                    LedgerDocumentState(
+                        doc_id=audit.doc_id,
+                        state=audit.old_state,
+                        updated_at=datetime.fromtimestamp(audit.timestamp, tz=timezone.utc),
+                    ),
+                )
+                self._apply_audit(state, audit)
+                records[audit.doc_id] = state
+                history.append(audit)
+
     def load_snapshot(
         self, snapshot_path: Path
     ) -> tuple[dict[str, LedgerDocumentState], dict[str, list[LedgerAuditRecord]], datetime]:
+        store = LedgerHistoryStore()
+        states, created_at, _covers = self._read_snapshot(snapshot_path, store)
+        history = {doc_id: store.history(doc_id) for doc_id in store.doc_ids()}
+        return states, history, created_at
+
+    def _read_snapshot(
+        self, snapshot_path: Path, history: LedgerHistoryStore
+    ) -> tuple[dict[str, LedgerDocumentState], datetime, list[str]]:
+        """Stream an NDJSON snapshot, falling back to the single-document ``1.0`` format.
+
+        Document history is appended to ``history`` rather than returned.
+        """
+
+        states: dict[str, LedgerDocumentState] = {}
         with snapshot_path.open("r", encoding="utf-8") as handle:
-            snapshot = json.load(handle)
+            try:
+                header = json.loads(handle.readline())
+            except json.JSONDecodeError:
+                header = None
+            if not isinstance(header, Mapping) or header.get("version") != _SNAPSHOT_VERSION:
+                handle.seek(0)
+                legacy_states, legacy_created = self._read_legacy_snapshot(handle, history)
+                return legacy_states, legacy_created, []
+            created_at_raw = header.get("created_at")
+            created_at = (
+                datetime.fromisoformat(str(created_at_raw))
+                if created_at_raw
+                else datetime.now(timezone.utc)
+            )
+            covers_raw = header.get("covers", [])
+            covers = [str(name) for name in covers_raw] if isinstance(covers_raw, list) else []
+            for line in handle:
+                if not line.strip():
+                    continue
+                payload = json.loads(line)
+                if not isinstance(payload, Mapping):  # pragma: no cover - defensive
+                    raise LedgerCorruption("Snapshot records must be JSON objects")
+                self._add_snapshot_document(
+                    states, history, str(payload.get("doc_id")), payload, created_at
+                )
+        return states, created_at, covers
+
+    def _read_legacy_snapshot(
+        self, handle: TextIO, history: LedgerHistoryStore
+    ) -> tuple[dict[str, LedgerDocumentState], datetime]:
+        snapshot = json.load(handle)
         if not isinstance(snapshot, MutableMapping):  # pragma: no cover - defensive
             raise LedgerCorruption("Snapshot must be a JSON object")
         version = snapshot.get("version")
@@ -520,53 +815,65 @@ class IngestionLedger:
         created_at_raw = snapshot.get("created_at")
         created_at = datetime.fromisoformat(str(created_at_raw)) if created_at_raw else datetime.now(timezone.utc)
         states: dict[str, LedgerDocumentState] = {}
-        history: dict[str, list[LedgerAuditRecord]] = {}
         raw_states = snapshot.get("states", {})
         if not isinstance(raw_states, Mapping):  # pragma: no cover - defensive
             raise LedgerCorruption("Snapshot states must be a mapping")
         for doc_id, payload in raw_states.items():
             if not isinstance(payload, Mapping):  # pragma: no cover - defensive
                 continue
-            updated_at_raw = payload.get("updated_at")
-            updated_at = datetime.fromisoformat(str(updated_at_raw)) if updated_at_raw else created_at
-            metadata_value = ensure_json_value(payload.get("metadata", {}), context="snapshot metadata")
-            if isinstance(metadata_value, Mapping):
-                metadata = cast(MutableJSONMapping, metadata_value)
-            else:
-                metadata = cast(MutableJSONMapping, {})
-            retry_count = _as_int(payload.get("retry_count"), default=0) or 0
-            adapter_value = payload.get("adapter")
-            history_payload = payload.get("history", [])
-            audits: list[LedgerAuditRecord] = []
-            if isinstance(history_payload, Sequence):
-                for entry in history_payload:
-                    if isinstance(entry, Mapping):
-                        audits.append(LedgerAuditRecord.from_dict(entry))
-            state_raw = payload.get("state")
-            if state_raw is None and audits:
-                state_value = audits[-1].new_state
-            else:
-                state_value = _decode_state(
-                    state_raw,
-                    context=f"snapshot state for {doc_id}",
-                )
-            document_state = LedgerDocumentState(
-                doc_id=str(doc_id),
-                state=state_value,
-                updated_at=updated_at,
-                adapter=str(adapter_value) if adapter_value else None,
-                metadata=metadata,
-                retry_count=retry_count,
+            self._add_snapshot_document(states, history, str(doc_id), payload, created_at)
+        return states, created_at
+
+    def _add_snapshot_document(
+        self,
+        states: dict[str, LedgerDocumentState],
+        history: LedgerHistoryStore,
+        doc_id: str,
+        payload: Mapping[str, JSONValue],
+        created_at: datetime,
+    ) -> None:
+        updated_at_raw = payload.get("updated_at")
+        updated_at = datetime.fromisoformat(str(updated_at_raw)) if updated_at_raw else created_at
+        metadata_value = ensure_json_value(payload.get("metadata", {}), context="snapshot metadata")
+        if isinstance(metadata_value, Mapping):
+            metadata = cast(MutableJSONMapping, metadata_value)
+        else:
+            metadata = cast(MutableJSONMapping, {})
+        retry_count = _as_int(payload.get("retry_count"), default=0) or 0
+        adapter_value = payload.get("adapter")
+        history_payload = payload.get("history", [])
+        audits: list[LedgerAuditRecord] = []
+        if isinstance(history_payload, Sequence):
+            for entry in history_payload:
+                if isinstance(entry, Mapping):
+                    audits.append(LedgerAuditRecord.from_dict(entry))
+        state_raw = payload.get("state")
+        if state_raw is None and audits:
+            state_value = audits[-1].new_state
+        else:
+            state_value = _decode_state(
+                state_raw,
+                context=f"snapshot state for {doc_id}",
             )
-            if audits:
-                document_state.history.extend(audits)
-            states[document_state.doc_id] = document_state
-            if audits:
-                history[document_state.doc_id] = audits
-        return states, history, created_at
+        document_state = LedgerDocumentState(
+            doc_id=doc_id,
+            state=state_value,
+            updated_at=updated_at,
+            adapter=str(adapter_value) if adapter_value else None,
+            metadata=metadata,
+            retry_count=retry_count,
+        )
+        states[document_state.doc_id] = document_state
+        for audit in audits:
+            history.append(audit)
 
     def load_with_compaction(self, snapshot_path: Path, delta_path: Path) -> dict[str, LedgerDocumentState]:
-        states, history, _created = self.load_snapshot(snapshot_path)
+        return self._load_with_compaction(snapshot_path, delta_path, LedgerHistoryStore())
+
+    def _load_with_compaction(
+        self, snapshot_path: Path, delta_path: Path, history: LedgerHistoryStore
+    ) -> dict[str, LedgerDocumentState]:
+        states, _created, _covers = self._read_snapshot(snapshot_path, history)
         with jsonlines.open(delta_path, mode="r") as fp:
             for row in cast(Iterable[Mapping[str, JSONValue]], fp):
                 audit = LedgerAuditRecord.from_dict(row)
@@ -580,16 +887,23 @@ class IngestionLedger:
                 )
                 self._apply_audit(state, audit)
                 states[audit.doc_id] = state
-                history.setdefault(audit.doc_id, []).append(audit)
+                history.append(audit)
         return states
 
-    def _latest_snapshot(self) -> Path | None:
+    def _snapshot_files(self) -> list[Path]:
         if not self._snapshot_dir.exists():
-            return None
-        snapshots = sorted(self._snapshot_dir.glob("*.json"))
-        if not snapshots:
-            return None
-        return snapshots[-1]
+            return []
+        return sorted(
+            (path for pattern in _SNAPSHOT_PATTERNS for path in self._snapshot_dir.glob(pattern)),
+            key=lambda path: path.name,
+        )
+
+    def _latest_snapshot(self) -> Path | None:
+        snapshots = self._snapshot_files()
+        return snapshots[-1] if snapshots else None
+
+    def _rotated_logs(self) -> list[Path]:
+        return sorted(self._path.parent.glob(f"{self._path.name}.*.rotated"))
 
     # ---------------------------------------------------------------- transitions
     def update_state(
@@ -609,110 +923,29 @@ class IngestionLedger:
     ) -> LedgerAuditRecord:
         """Transition ``doc_id`` to ``new_state`` and persist audit trail."""
 
-        new_state = _ensure_ledger_state(new_state, argument="new_state")
+        transition = LedgerTransition(
+            doc_id=doc_id,
+            new_state=new_state,
+            adapter=adapter,
+            metadata=metadata,
+            error=error,
+            error_type=error_type,
+            error_message=error_message,
+            traceback=traceback,
+            retry_count=retry_count,
+            duration_seconds=duration_seconds,
+            parameters=parameters,
+        )
         with self._lock:
-            document = self._documents.get(doc_id)
-            if document is None:
-                old_state = new_state
-            else:
-                old_state = document.state
-                try:
-                    validate_transition(old_state, new_state)
-                except InvalidStateTransition:
-                    ERROR_COUNTER.labels(type="invalid_transition").inc()
-                    LOGGER.error(
-                        "Invalid ledger transition",
-                        extra={
-                            "doc_id": doc_id,
-                            "old_state": old_state.value,
-                            "new_state": new_state.value,
-                            "adapter": adapter,
-                        },
-                    )
-                    raise
             now = datetime.now(timezone.utc)
-            timestamp = now.timestamp()
-            resolved_error_type = error_type
-            resolved_error_message = error_message
-            if error is not None:
-                resolved_error_type = error.__class__.__name__
-                resolved_error_message = str(error)
-            try:
-                audit = LedgerAuditRecord(
-                    doc_id=doc_id,
-                    old_state=old_state,
-                    new_state=new_state,
-                    timestamp=timestamp,
-                    adapter=adapter,
-                    error_type=resolved_error_type,
-                    error_message=resolved_error_message,
-                    traceback=traceback,
-                    retry_count=retry_count,
-                    duration_seconds=duration_seconds,
-                    parameters=dict(parameters) if parameters is not None else {},
-                    metadata=dict(metadata) if metadata is not None else {},
-                )
-            except Exception:  # pragma: no cover - defensive
-                ERROR_COUNTER.labels(type="audit_serialization").inc()
-                LOGGER.exception(
-                    "Failed to construct ledger audit record",
-                    extra={"doc_id": doc_id, "adapter": adapter},
-                )
-                raise
-            STATE_TRANSITION_COUNTER.labels(
-                from_state=audit.old_state.value, to_state=audit.new_state.value
-            ).inc()
-            try:
-                previous_state: LedgerState | None = None
-                if document is None:
-                    document = LedgerDocumentState(
-                        doc_id=doc_id,
-                        state=new_state,
-                        updated_at=now,
-                        adapter=adapter,
-                        metadata=dict(metadata) if metadata is not None else {},
-                        retry_count=retry_count or 0,
-                        history=[audit],
-                    )
-                    self._documents[doc_id] = document
-                else:
-                    previous_state = document.state
-                    if duration_seconds is None:
-                        duration_seconds = document.duration(as_of=now)
-                    document.state = new_state
-                    document.updated_at = now
-                    document.adapter = adapter or document.adapter
-                    if metadata is not None:
-                        document.metadata = dict(metadata)
-                    if retry_count is not None:
-                        document.retry_count = retry_count
-                    document.history.append(audit)
-                self._history.setdefault(doc_id, []).append(audit)
-                if duration_seconds is not None:
-                    STATE_DURATION.observe(duration_seconds)
-                self._write_audit(audit)
-                if previous_state is None:
-                    self._increment_state_count(new_state)
-                else:
-                    self._transition_state_count(previous_state, new_state)
-            except Exception:
-                ERROR_COUNTER.labels(type="update_state").inc()
-                LOGGER.exception(
-                    "Ledger update failed",
-                    extra={
-                        "doc_id": doc_id,
-                        "old_state": old_state.value,
-                        "new_state": new_state.value,
-                        "adapter": adapter,
-                    },
-                )
-                raise
+            audit = self._record_transition(transition, now)
+            self._commit()
             LOGGER.info(
                 "Ledger state transition",
                 extra={
                     "doc_id": doc_id,
-                    "old_state": old_state.value,
-                    "new_state": new_state.value,
+                    "old_state": audit.old_state.value,
+                    "new_state": audit.new_state.value,
                     "adapter": adapter,
                 },
             )
@@ -720,6 +953,214 @@ class IngestionLedger:
             self._maybe_snapshot(now)
             return audit
 
+    def update_states_batch(
+        self, transitions: Iterable[LedgerTransition]
+    ) -> list[LedgerAuditRecord]:
+        """Apply ``transitions`` in order as a single group commit.
+
+        Every transition is validated against the state produced by the
+        transitions before it, so an invalid entry rejects the whole batch
+        before anything is written. The audit lines are then persisted with a
+        single write (and fsync when enabled), and state gauges, logging and
+        snapshot rotation run once per batch rather than once per transition.
+        """
+
+        pending = list(transitions)
+        if not pending:
+            return []
+        with self._lock:
+            self._validate_batch(pending)
+            now = datetime.now(timezone.utc)
+            audits = [
+                self._record_transition(transition, now, validated=True) for transition in pending
+            ]
+            self._commit()
+            LOGGER.info(
+                "Ledger state transitions committed",
+                extra={
+                    "transitions": len(audits),
+                    "documents": len({audit.doc_id for audit in audits}),
+                },
+            )
+            self._update_state_metrics()
+            self._maybe_snapshot(now)
+            return audits
+
+    def transition_path(
+        self,
+        doc_id: str,
+        states: Sequence[LedgerState],
+        *,
+        adapter: str | None = None,
+        metadata: Mapping[str, JSONValue] | None = None,
+        parameters: Mapping[str, JSONValue] | None = None,
+    ) -> list[LedgerAuditRecord]:
+        """Walk ``doc_id`` through ``states`` in one group commit."""
+
+        return self.update_states_batch(
+            LedgerTransition(
+                doc_id=doc_id,
+                new_state=state,
+                adapter=adapter,
+                metadata=metadata,
+                parameters=parameters,
+            )
+            for state in states
+        )
+
+    def merge_audits(self, audits: Iterable[LedgerAuditRecord]) -> int:
+        """Replay audit records written by another ledger as one group commit.
+
+        Used to fold worker ledger shards back into the canonical ledger.
+        Records whose ``old_state`` no longer matches the document's current
+        state (for example when two shards ingested the same document) are
+        skipped with a warning. Returns the number of records applied.
+        """
+
+        applied = 0
+        skipped = 0
+        with self._lock:
+            for audit in audits:
+                document = self._lookup(audit.doc_id)
+                previous_state = document.state if document is not None else None
+                if previous_state is not None:
+                    conflict = previous_state is not audit.old_state
+                    if not conflict:
+                        try:
+                            validate_transition(previous_state, audit.new_state)
+                        except InvalidStateTransition:
+                            conflict = True
+                    if conflict:
+                        skipped += 1
+                        continue
+                applied_at = datetime.fromtimestamp(audit.timestamp, tz=timezone.utc)
+                self._apply_transition(
+                    document, audit, applied_at, replace_metadata=bool(audit.metadata)
+                )
+                STATE_TRANSITION_COUNTER.labels(
+                    from_state=audit.old_state.value, to_state=audit.new_state.value
+                ).inc()
+                if previous_state is None:
+                    self._increment_state_count(audit.new_state)
+                else:
+                    self._transition_state_count(previous_state, audit.new_state)
+                applied += 1
+            if applied:
+                self._commit()
+                self._update_state_metrics()
+            if skipped:
+                ERROR_COUNTER.labels(type="merge_conflict").inc(skipped)
+                LOGGER.warning(
+                    "Skipped conflicting ledger audit records during merge",
+                    extra={"skipped": skipped, "applied": applied},
+                )
+        return applied
+
+    def _check_transition(self, transition: LedgerTransition, old_state: LedgerState) -> None:
+        try:
+            validate_transition(old_state, transition.new_state)
+        except InvalidStateTransition:
+            ERROR_COUNTER.labels(type="invalid_transition").inc()
+            LOGGER.error(
+                "Invalid ledger transition",
+                extra={
+                    "doc_id": transition.doc_id,
+                    "old_state": old_state.value,
+                    "new_state": transition.new_state.value,
+                    "adapter": transition.adapter,
+                },
+            )
+            raise
+
+    def _validate_batch(self, transitions: Sequence[LedgerTransition]) -> None:
+        current: dict[str, LedgerState] = {}
+        for transition in transitions:
+            old_state = current.get(transition.doc_id)
+            if old_state is None:
+                document = self._lookup(transition.doc_id)
+                old_state = document.state if document is not None else None
+            if old_state is not None:
+                self._check_transition(transition, old_state)
+            current[transition.doc_id] = transition.new_state
+
+    def _record_transition(
+        self,
+        transition: LedgerTransition,
+        now: datetime,
+        *,
+        validated: bool = False,
+    ) -> LedgerAuditRecord:
+        """Apply ``transition`` in memory and buffer its audit line; caller holds the lock."""
+
+        doc_id = transition.doc_id
+        new_state = transition.new_state
+        document = self._lookup(doc_id)
+        if document is None:
+            old_state = new_state
+        else:
+            old_state = document.state
+            if not validated:
+                self._check_transition(transition, old_state)
+        resolved_error_type = transition.error_type
+        resolved_error_message = transition.error_message
+        if transition.error is not None:
+            resolved_error_type = transition.error.__class__.__name__
+            resolved_error_message = str(transition.error)
+        try:
+            audit = LedgerAuditRecord(
+                doc_id=doc_id,
+                old_state=old_state,
+                new_state=new_state,
+                timestamp=now.timestamp(),
+                adapter=transition.adapter,
+                error_type=resolved_error_type,
+                error_message=resolved_error_message,
+                traceback=transition.traceback,
+                retry_count=transition.retry_count,
+                duration_seconds=transition.duration_seconds,
+                parameters=dict(transition.parameters) if transition.parameters is not None else {},
+                metadata=dict(transition.metadata) if transition.metadata is not None else {},
+            )
+        except Exception:  # pragma: no cover - defensive
+            ERROR_COUNTER.labels(type="audit_serialization").inc()
+            LOGGER.exception(
+                "Failed to construct ledger audit record",
+                extra={"doc_id": doc_id, "adapter": transition.adapter},
+            )
+            raise
+        STATE_TRANSITION_COUNTER.labels(
+            from_state=audit.old_state.value, to_state=audit.new_state.value
+        ).inc()
+        try:
+            duration_seconds = transition.duration_seconds
+            previous_state: LedgerState | None = None
+            if document is not None:
+                previous_state = document.state
+                if duration_seconds is None:
+                    duration_seconds = document.duration(as_of=now)
+            self._apply_transition(
+                document, audit, now, replace_metadata=transition.metadata is not None
+            )
+            if duration_seconds is not None:
+                STATE_DURATION.observe(duration_seconds)
+            if previous_state is None:
+                self._increment_state_count(new_state)
+            else:
+                self._transition_state_count(previous_state, new_state)
+        except Exception:
+            ERROR_COUNTER.labels(type="update_state").inc()
+            LOGGER.exception(
+                "Ledger update failed",
+                extra={
+                    "doc_id": doc_id,
+                    "old_state": old_state.value,
+                    "new_state": new_state.value,
+                    "adapter": transition.adapter,
+                },
+            )
+            raise
+        return audit
+
     def record(
         self,
         doc_id: str,
@@ -750,24 +1191,54 @@ class IngestionLedger:
         )
 
     def get(self, doc_id: str) -> LedgerDocumentState | None:
-        return self._documents.get(doc_id)
+        """Return the latest state of ``doc_id`` with its history materialised."""
+
+        document = self._documents.get(doc_id)
+        if document is None:
+            return None
+        return replace(document, history=self._history.history(doc_id))
 
     def get_state(self, doc_id: str) -> LedgerState | None:
         document = self._documents.get(doc_id)
         return document.state if document else None
 
-    def entries(self, *, state: LedgerState | None = None) -> Iterable[LedgerDocumentState]:
-        if state is None:
-            return list(self._documents.values())
-        coerced = _ensure_ledger_state(state, argument="state")
-        return [document for document in self._documents.values() if document.state == coerced]
+    def entries(
+        self, *, state: LedgerState | None = None, with_history: bool = True
+    ) -> Iterable[LedgerDocumentState]:
+        """Return every tracked document, or those currently in ``state``.
+
+        Pass ``with_history=False`` when only the latest states are needed; the
+        returned documents then carry an empty ``history`` list.
+        """
+
+        if state is not None:
+            return self.get_documents_by_state(state, with_history=with_history)
+        with self._lock:
+            return [self._view(document, with_history) for document in self._documents.values()]
+
+    def get_documents_by_state(
+        self, state: LedgerState, *, with_history: bool = True
+    ) -> list[LedgerDocumentState]:
+        """Return documents currently in ``state`` from the per-state index."""
 
-    def get_documents_by_state(self, state: LedgerState) -> list[LedgerDocumentState]:
         coerced = _ensure_ledger_state(state, argument="state")
-        return [document for document in self._documents.values() if document.state == coerced]
+        with self._lock:
+            return [
+                self._view(self._documents[doc_id], with_history)
+                for doc_id in self._by_state[coerced]
+            ]
+
+    def _view(self, document: LedgerDocumentState, with_history: bool) -> LedgerDocumentState:
+        history = self._history.history(document.doc_id) if with_history else []
+        return replace(document, history=history)
+
+    def count_by_state(self) -> dict[LedgerState, int]:
+        """Return the number of documents in every state without walking the ledger."""
+
+        return {state: self._state_counts.get(state, 0) for state in LedgerState}
 
     def get_state_history(self, doc_id: str) -> list[LedgerAuditRecord]:
-        return list(self._history.get(doc_id, []))
+        return self._history.history(doc_id)
 
     def get_state_duration(self, doc_id: str) -> float:
         document = self._documents.get(doc_id)
@@ -776,20 +1247,36 @@ class IngestionLedger:
         return document.duration()
 
     def get_stuck_documents(self, threshold_hours: int) -> list[LedgerDocumentState]:
-        threshold_seconds = threshold_hours * 3600
+        """Return non-terminal documents whose last transition is ``threshold_hours`` old.
+
+        Candidates come off a min-heap of last-transition timestamps, so the cost grows with
+        the stuck (and superseded) entries rather than with the size of the ledger.
+        """
+
+        cutoff = datetime.now(timezone.utc).timestamp() - threshold_hours * 3600
         stuck: list[LedgerDocumentState] = []
-        for document in self._documents.values():
-            if is_terminal_state(document.state):
-                continue
-            duration = document.duration()
-            if duration >= threshold_seconds:
-                stuck.append(document)
+        with self._lock:
+            heap = self._stuck_heap
+            live: set[tuple[float, str]] = set()
+            while heap and heap[0][0] <= cutoff:
+                entry = heapq.heappop(heap)
+                document = self._documents.get(entry[1])
+                if document is None or is_terminal_state(document.state):
+                    continue
+                if document.updated_at.timestamp() != entry[0] or entry in live:
+                    continue
+                live.add(entry)
+                stuck.append(self._view(document, True))
+            for entry in live:
+                heapq.heappush(heap, entry)
+        stuck_counts: dict[LedgerState, int] = {}
+        for doc in stuck:
+            stuck_counts[doc.state] = stuck_counts.get(doc.state, 0) + 1
         for state in LedgerState:
             if state in TERMINAL_STATES:
                 STUCK_DOCUMENTS.labels(state=state.value).set(0)
                 continue
-            count = sum(1 for doc in stuck if doc.state is state)
-            STUCK_DOCUMENTS.labels(state=state.value).set(count)
+            STUCK_DOCUMENTS.labels(state=state.value).set(stuck_counts.get(state, 0))
         if stuck:
             LOGGER.warning(
                 "Stuck ledger documents detected",
@@ -803,46 +1290,139 @@ class IngestionLedger:
 
     # ---------------------------------------------------------------- snapshots
     def create_snapshot(self, output_path: Path | None = None) -> Path:
-        snapshot_path = output_path or self._snapshot_dir / f"snapshot-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
-        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-        payload: MutableJSONMapping = {
-            "version": "1.0",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "document_count": len(self._documents),
-            "states": {},
+        """Write a snapshot synchronously and return its path.
+
+        The document map is frozen under the lock, but serialisation happens outside it, so
+        concurrent transitions only wait for the view to be taken.
+        """
+
+        self.wait_for_snapshot()
+        with self._lock:
+            job = self._begin_snapshot(output_path)
+        try:
+            self._write_snapshot(job)
+        except BaseException:
+            with self._lock:
+                self._snapshot_view = None
+            ERROR_COUNTER.labels(type="snapshot").inc()
+            raise
+        with self._lock:
+            self._finish_snapshot(job)
+        return job.path
+
+    def wait_for_snapshot(self, timeout: float | None = None) -> None:
+        """Block until a background snapshot, if one is running, has finished."""
+
+        thread = self._snapshot_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _begin_snapshot(self, output_path: Path | None) -> _SnapshotJob:
+        """Freeze a copy-on-write view and rotate the audit log aside; caller holds the lock."""
+
+        now = datetime.now(timezone.utc)
+        stamp = now.strftime("%Y%m%dT%H%M%S%fZ")
+        snapshot_path = output_path or self._snapshot_dir / f"snapshot-{stamp}.ndjson"
+        self._close_log_handle()
+        if self._path.exists() and self._path.stat().st_size:
+            os.replace(self._path, self._path.with_name(f"{self._path.name}.{stamp}.rotated"))
+            self._path.write_text("", encoding="utf-8")
+        covers = [path.name for path in self._rotated_logs()]
+        # Only the map is copied here; documents are copied lazily by _apply_transition.
+        view = dict(self._documents)
+        self._snapshot_view = view
+        self._last_snapshot_at = now
+        return _SnapshotJob(
+            path=snapshot_path,
+            created_at=now,
+            documents=view,
+            covers=covers,
+            history=self._history,
+            history_limit=len(self._history),
+        )
+
+    def _write_snapshot(self, job: _SnapshotJob) -> None:
+        """Stream ``job`` to a temporary file and rename it into place; runs without the lock."""
+
+        job.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = job.path.with_name(job.path.name + ".tmp")
+        header = {
+            "version": _SNAPSHOT_VERSION,
+            "created_at": job.created_at.isoformat(),
+            "document_count": len(job.documents),
+            "covers": job.covers,
         }
-        states_payload: dict[str, JSONMapping] = {}
-        for doc in self._documents.values():
-            states_payload[doc.doc_id] = {
-                "state": doc.state.name,
-                "updated_at": doc.updated_at.isoformat(),
-                "adapter": doc.adapter,
-                "metadata": doc.metadata,
-                "retry_count": doc.retry_count,
-                "history": [audit.to_dict() for audit in doc.history],
-            }
-        payload["states"] = states_payload
-        with snapshot_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
-        self._last_snapshot_at = datetime.now(timezone.utc)
+        try:
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                handle.write(json.dumps(header) + "\n")
+                for doc in job.documents.values():
+                    history = job.history.history(doc.doc_id, limit=job.history_limit)
+                    record = {
+                        "doc_id": doc.doc_id,
+                        "state": doc.state.name,
+                        "updated_at": doc.updated_at.isoformat(),
+                        "adapter": doc.adapter,
+                        "metadata": doc.metadata,
+                        "retry_count": doc.retry_count,
+                        "history": [audit.to_dict() for audit in history],
+                    }
+                    handle.write(json.dumps(record) + "\n")
+                if self._fsync:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            os.replace(tmp_path, job.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _finish_snapshot(self, job: _SnapshotJob) -> None:
+        for name in job.covers:
+            self._path.with_name(name).unlink(missing_ok=True)
+        self._snapshot_view = None
         self._rotate_snapshots()
-        self._truncate_ledger()
-        LOGGER.info("Ledger snapshot created", extra={"snapshot": str(snapshot_path)})
-        return snapshot_path
+        LOGGER.info("Ledger snapshot created", extra={"snapshot": str(job.path)})
+
+    def _snapshot_in_background(self) -> None:
+        """Start a snapshot thread unless one is already running; caller holds the lock."""
+
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            return
+        job = self._begin_snapshot(None)
+        self._snapshot_thread = Thread(
+            target=self._run_background_snapshot,
+            args=(job,),
+            name="ledger-snapshot",
+            daemon=True,
+        )
+        self._snapshot_thread.start()
+
+    def _run_background_snapshot(self, job: _SnapshotJob) -> None:
+        try:
+            self._write_snapshot(job)
+        except Exception:
+            ERROR_COUNTER.labels(type="snapshot").inc()
+            LOGGER.exception("Background ledger snapshot failed", extra={"snapshot": str(job.path)})
+            with self._lock:
+                # The rotated logs stay on disk and are covered by the next snapshot.
+                self._snapshot_view = None
+            return
+        with self._lock:
+            self._finish_snapshot(job)
 
     def load_snapshot_file(self, snapshot_path: Path) -> None:
-        states, history, created_at = self.load_snapshot(snapshot_path)
+        history = LedgerHistoryStore()
+        states, created_at, _covers = self._read_snapshot(snapshot_path, history)
         self._documents = states
         self._history = history
         self._last_snapshot_at = created_at
+        self._rebuild_state_counts()
         self._update_state_metrics()
 
     def load_with_snapshot(self, snapshot_path: Path, delta_path: Path) -> None:
-        states = self.load_with_compaction(snapshot_path, delta_path)
+        history = LedgerHistoryStore()
+        states = self._load_with_compaction(snapshot_path, delta_path, history)
         self._documents = states
-        self._history.clear()
-        for document in states.values():
-            self._history[document.doc_id] = list(document.history)
+        self._history = history
+        self._rebuild_state_counts()
         self._update_state_metrics()
 
     def load_snapshot_if_present(self) -> None:
@@ -851,8 +1431,9 @@ class IngestionLedger:
             self.load_snapshot_file(snapshot)
 
     def close(self) -> None:
-        """Release any open resources."""
+        """Wait for a running snapshot and release any open resources."""
 
+        self.wait_for_snapshot()
         self._close_log_handle()
 
     def __del__(self) -> None:  # pragma: no cover - best-effort cleanup
@@ -861,14 +1442,8 @@ class IngestionLedger:
         except Exception:
             LOGGER.debug("Failed to close ledger log handle during GC", exc_info=True)
 
-    def _truncate_ledger(self) -> None:
-        self._close_log_handle()
-        if not self._path.exists():
-            return
-        self._path.write_text("", encoding="utf-8")
-
     def _rotate_snapshots(self) -> None:
-        snapshots = sorted(self._snapshot_dir.glob("*.json"))
+        snapshots = self._snapshot_files()
         if len(snapshots) <= self._snapshot_retention:
             return
         for old in snapshots[: -self._snapshot_retention]:
@@ -881,9 +1456,52 @@ class IngestionLedger:
             self._last_snapshot_at = now
             return
         if now - self._last_snapshot_at >= self._auto_snapshot_interval:
-            self.create_snapshot()
+            self._snapshot_in_background()
 
     # ---------------------------------------------------------------- utilities
+    def _lookup(self, doc_id: str) -> LedgerDocumentState | None:
+        """Return the mutable latest state for ``doc_id`` used by transitions."""
+
+        return self._documents.get(doc_id)
+
+    def _apply_transition(
+        self,
+        document: LedgerDocumentState | None,
+        audit: LedgerAuditRecord,
+        now: datetime,
+        *,
+        replace_metadata: bool,
+    ) -> None:
+        """Apply ``audit`` to the in-memory state and persist it to the audit log."""
+
+        previous_state = document.state if document is not None else None
+        if document is None:
+            document = LedgerDocumentState(
+                doc_id=audit.doc_id,
+                state=audit.new_state,
+                updated_at=now,
+                adapter=audit.adapter,
+                metadata=dict(audit.metadata),
+                retry_count=audit.retry_count or 0,
+            )
+            self._documents[audit.doc_id] = document
+        else:
+            frozen = self._snapshot_view
+            if frozen is not None and frozen.get(audit.doc_id) is document:
+                # Copy on write: the background snapshot still reads the frozen document.
+                document = replace(document, metadata=dict(document.metadata))
+                self._documents[audit.doc_id] = document
+            document.state = audit.new_state
+            document.updated_at = now
+            document.adapter = audit.adapter or document.adapter
+            if replace_metadata:
+                document.metadata = dict(audit.metadata)
+            if audit.retry_count is not None:
+                document.retry_count = audit.retry_count
+        self._history.append(audit)
+        self._index_document(document, previous_state)
+        self._write_audit(audit)
+
     def _apply_audit(self, document: LedgerDocumentState, audit: LedgerAuditRecord) -> None:
         document.state = audit.new_state
         document.updated_at = datetime.fromtimestamp(audit.timestamp, tz=timezone.utc)
@@ -892,12 +1510,16 @@ class IngestionLedger:
             document.metadata = audit.metadata
         if audit.retry_count is not None:
             document.retry_count = audit.retry_count
-        document.history.append(audit)
 
     def _write_audit(self, audit: LedgerAuditRecord) -> None:
-        line = json.dumps(audit.to_dict()) + "\n"
-        self._pending_writes.append(line)
+        self._pending_writes.append(json.dumps(audit.to_dict()) + "\n")
+
+    def _commit(self) -> None:
+        """Write buffered audit lines in one call, fsyncing once when enabled."""
+
         self._flush_pending_writes(force=True)
+        if self._fsync and self._log_handle is not None:
+            os.fsync(self._log_handle.fileno())
 
     def _ensure_log_handle(self) -> TextIO:
         if self._log_handle is None or self._log_handle.closed:
@@ -924,9 +1546,40 @@ class IngestionLedger:
             handle.flush()
 
     def _rebuild_state_counts(self) -> None:
+        """Recompute state counts, the per-state index and the stuck-document heap."""
+
         self._state_counts = {state: 0 for state in LedgerState}
+        self._by_state = {state: {} for state in LedgerState}
         for document in self._documents.values():
             self._state_counts[document.state] = self._state_counts.get(document.state, 0) + 1
+            self._by_state[document.state][document.doc_id] = None
+        self._rebuild_stuck_heap()
+
+    def _rebuild_stuck_heap(self) -> None:
+        self._stuck_heap = [
+            (document.updated_at.timestamp(), document.doc_id)
+            for document in self._documents.values()
+            if not is_terminal_state(document.state)
+        ]
+        heapq.heapify(self._stuck_heap)
+
+    def _index_document(
+        self, document: LedgerDocumentState, previous_state: LedgerState | None
+    ) -> None:
+        """Move ``document`` between state sets and record its transition time."""
+
+        if previous_state is not None and previous_state is not document.state:
+            self._by_state[previous_state].pop(document.doc_id, None)
+        self._by_state[document.state][document.doc_id] = None
+        if is_terminal_state(document.state):
+            return
+        heapq.heappush(self._stuck_heap, (document.updated_at.timestamp(), document.doc_id))
+        # Superseded entries are skipped lazily; compact once they dominate the heap.
+        active = sum(
+            count for state, count in self._state_counts.items() if state not in TERMINAL_STATES
+        )
+        if len(self._stuck_heap) > 2 * active + 1024:
+            self._rebuild_stuck_heap()
 
     def _increment_state_count(self, state: LedgerState) -> None:
         self._state_counts[state] = self._state_counts.get(state, 0) + 1
@@ -952,7 +1605,9 @@ __all__ = [
     "LedgerCorruption",
     "LedgerDocumentState",
     "LedgerError",
+    "LedgerHistoryStore",
     "LedgerState",
+    "LedgerTransition",
     "STATE_MACHINE_DOC",
     "TERMINAL_STATES",
     "RETRYABLE_STATES",
@@ -0,0 +1,779 @@
+"""Segment-based storage engine for the ingestion ledger.
+
+The JSONL ledger keeps every document state and its full transition history in
+Python objects and replays the whole audit log on start-up. For ledgers with
+tens of millions of transitions that makes both cold start time and resident
+memory grow without bound. The segmented engine stores transitions as
+fixed-width binary records in rotating segment files and keeps the latest state
+of every document in a memory-mapped index, so start-up only has to read the
+document identifier table and replay the records written after the last
+checkpoint. Per-document history is read on demand by following the
+``previous record`` pointers stored in each segment record.
+
+On-disk layout (``root`` is the ledger directory)::
+
+    manifest.json            engine version and record geometry
+    doc_ids.dat              newline separated document identifiers (ordinal = line)
+    adapters.dat             newline separated adapter names (code = line + 1)
+    state.idx                header + one fixed-width slot per document ordinal
+    segment-00000001.seg     fixed-width transition records
+    segment-00000001.blob    JSON payloads (metadata, parameters, errors)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import mmap
+import os
+from collections import Counter as _Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from struct import Struct
+from time import perf_counter
+from typing import BinaryIO, Iterable, Iterator, Mapping, NamedTuple, cast
+
+from Medical_KG.ingestion.ledger import (
+    INITIALIZATION_COUNTER,
+    INITIALIZATION_DURATION,
+    STUCK_DOCUMENTS,
+    TERMINAL_STATES,
+    IngestionLedger,
+    LedgerAuditRecord,
+    LedgerCorruption,
+    LedgerDocumentState,
+    LedgerError,
+    LedgerState,
+    _ensure_ledger_state,
+    is_terminal_state,
+)
+from Medical_KG.ingestion.types import JSONMapping, JSONValue, MutableJSONMapping
+
+LOGGER = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+DEFAULT_SEGMENT_RECORDS = 1_000_000
+
+# State codes are positional; new ledger states must only ever be appended to
+# the enum so that existing segment files keep decoding correctly.
+_STATE_CODES: tuple[LedgerState, ...] = tuple(LedgerState)
+_STATE_TO_CODE: Mapping[LedgerState, int] = {state: code for code, state in enumerate(_STATE_CODES)}
+
+_NONE = 0xFFFFFFFF
+_INDEX_MAGIC = b"MEDLIDX1"
+_INITIAL_CAPACITY = 1024
+
+# doc ordinal, old state, new state, flags, adapter code, retry count, timestamp,
+# duration, previous record (segment, position), blob offset, blob length.
+_RECORD = Struct("<IBBBxHiddIIQI6x")
+# state, flags, adapter code, retry count, updated_at, last record (segment,
+# position), metadata record (segment, position).
+_SLOT = Struct("<BBHIdIIII")
+# magic, version, document count, checkpoint segment, checkpoint position.
+_HEADER = Struct("<8sIIII")
+
+_RECORD_HAS_METADATA = 0x01
+_RECORD_HAS_RETRY = 0x02
+_RECORD_HAS_DURATION = 0x04
+_SLOT_PRESENT = 0x01
+
+
+class IndexSlot(NamedTuple):
+    """Latest-state entry stored for a single document in the index."""
+
+    state: LedgerState
+    adapter_code: int
+    retry_count: int
+    updated_at: float
+    last_record: tuple[int, int]
+    metadata_record: tuple[int, int]
+
+
+def _encode_name(value: str) -> str:
+    if "\n" in value or "\r" in value or value.startswith('"'):
+        return json.dumps(value)
+    return value
+
+
+def _decode_name(value: str) -> str:
+    if value.startswith('"'):
+        return cast(str, json.loads(value))
+    return value
+
+
+def _read_name_table(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    data = path.read_bytes()
+    if data and not data.endswith(b"\n"):
+        # Torn trailing write from an interrupted process; drop it so the
+        # ordinals of the surviving names remain stable.
+        LOGGER.warning("Truncating torn ledger name table entry", extra={"path": str(path)})
+        data = data[: data.rfind(b"\n") + 1]
+        with path.open("r+b") as handle:
+            handle.truncate(len(data))
+    if not data:
+        return []
+    return [_decode_name(line) for line in data[:-1].decode("utf-8").split("\n")]
+
+
+class LedgerSegmentStore:
+    """Append-only binary segment files with a memory-mapped latest-state index.
+
+    Document identifiers are interned to dense ordinals; the in-memory footprint
+    is therefore the identifier table only, independent of how many transitions
+    have been recorded.
+    """
+
+    def __init__(self, root: Path, *, segment_records: int = DEFAULT_SEGMENT_RECORDS) -> None:
+        if segment_records <= 0:
+            raise ValueError("segment_records must be positive")
+        self._root = root
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._segment_records = segment_records
+        self._check_manifest()
+        self._doc_ids = _read_name_table(self._doc_ids_path)
+        self._ordinals = {doc_id: ordinal for ordinal, doc_id in enumerate(self._doc_ids)}
+        self._adapters = _read_name_table(self._adapters_path)
+        self._adapter_codes = {name: code + 1 for code, name in enumerate(self._adapters)}
+        self._doc_handle = self._doc_ids_path.open("ab")
+        self._adapter_handle = self._adapters_path.open("ab")
+        self._readers: dict[int, tuple[BinaryIO, BinaryIO]] = {}
+        self._open_index()
+        self._open_segments()
+        self._replay_tail()
+
+    # ------------------------------------------------------------------ paths
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def index_path(self) -> Path:
+        return self._root / "state.idx"
+
+    @property
+    def _doc_ids_path(self) -> Path:
+        return self._root / "doc_ids.dat"
+
+    @property
+    def _adapters_path(self) -> Path:
+        return self._root / "adapters.dat"
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._root / f"segment-{segment:08d}.seg"
+
+    def _blob_path(self, segment: int) -> Path:
+        return self._root / f"segment-{segment:08d}.blob"
+
+    def segments(self) -> list[int]:
+        """Return the numbers of all segment files on disk in ascending order."""
+
+        return sorted(int(path.stem.split("-", 1)[1]) for path in self._root.glob("segment-*.seg"))
+
+    # ---------------------------------------------------------------- opening
+    def _check_manifest(self) -> None:
+        manifest_path = self._root / "manifest.json"
+        expected = {"version": STORE_VERSION, "record_size": _RECORD.size, "slot_size": _SLOT.size}
+        if not manifest_path.exists():
+            manifest_path.write_text(json.dumps(expected), encoding="utf-8")
+            return
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise LedgerCorruption("Ledger segment manifest is malformed") from exc
+        if manifest != expected:
+            raise LedgerCorruption(f"Unsupported ledger segment layout: {manifest!r}")
+
+    def _open_index(self) -> None:
+        path = self.index_path
+        fresh = not path.exists() or path.stat().st_size < _SLOT.size
+        self._index_handle = path.open("r+b" if not fresh else "w+b")
+        if fresh:
+            self._index_handle.truncate(_SLOT.size * (_INITIAL_CAPACITY + 1))
+        self._index = mmap.mmap(self._index_handle.fileno(), 0)
+        self._capacity = len(self._index) // _SLOT.size - 1
+        if fresh:
+            self._write_header(0, 1, 0)
+        magic, version, doc_count, checkpoint_segment, checkpoint_position = _HEADER.unpack_from(
+            self._index, 0
+        )
+        if magic != _INDEX_MAGIC or version != STORE_VERSION:
+            raise LedgerCorruption("Ledger state index has an unrecognised header")
+        if doc_count > len(self._doc_ids):
+            raise LedgerCorruption("Ledger state index references unknown documents")
+        self._checkpoint = (checkpoint_segment, checkpoint_position)
+
+    def _open_segments(self) -> None:
+        segments = self.segments()
+        self._active_segment = segments[-1] if segments else 1
+        segment_path = self._segment_path(self._active_segment)
+        size = segment_path.stat().st_size if segment_path.exists() else 0
+        if size % _RECORD.size:
+            LOGGER.warning(
+                "Truncating torn ledger segment record", extra={"segment": str(segment_path)}
+            )
+            with segment_path.open("r+b") as handle:
+                handle.truncate(size - size % _RECORD.size)
+        self._open_writers()
+
+    def _open_writers(self) -> None:
+        segment_path = self._segment_path(self._active_segment)
+        self._segment_handle = segment_path.open("ab")
+        self._blob_handle = self._blob_path(self._active_segment).open("ab")
+        self._active_count = self._segment_handle.tell() // _RECORD.size
+        self._blob_size = self._blob_handle.tell()
+
+    def _replay_tail(self) -> None:
+        """Fold records written after the last index checkpoint into the index."""
+
+        checkpoint_segment, checkpoint_position = self._checkpoint
+        replayed = 0
+        for segment in self.segments():
+            if segment < checkpoint_segment:
+                continue
+            start = checkpoint_position if segment == checkpoint_segment else 0
+            path = self._segment_path(segment)
+            with path.open("rb") as handle:
+                handle.seek(start * _RECORD.size)
+                payload = handle.read()
+            usable = len(payload) - len(payload) % _RECORD.size
+            for offset, values in enumerate(_RECORD.iter_unpack(payload[:usable])):
+                self._apply_record(values, (segment, start + offset))
+                replayed += 1
+        if replayed:
+            LOGGER.info("Replayed ledger segment tail", extra={"records": replayed})
+        self._write_header(len(self._doc_ids), self._active_segment, self._active_count)
+
+    # ----------------------------------------------------------------- index
+    def _write_header(self, doc_count: int, segment: int, position: int) -> None:
+        _HEADER.pack_into(self._index, 0, _INDEX_MAGIC, STORE_VERSION, doc_count, segment, position)
+
+    def _ensure_capacity(self, ordinal: int) -> None:
+        if ordinal < self._capacity:
+            return
+        capacity = self._capacity
+        while ordinal >= capacity:
+            capacity *= 2
+        self._index.flush()
+        self._index.close()
+        self._index_handle.truncate(_SLOT.size * (capacity + 1))
+        self._index = mmap.mmap(self._index_handle.fileno(), 0)
+        self._capacity = capacity
+
+    def _read_raw_slot(self, ordinal: int) -> tuple[int, int, int, int, float, int, int, int, int]:
+        return cast(
+            tuple[int, int, int, int, float, int, int, int, int],
+            _SLOT.unpack_from(self._index, _SLOT.size * (ordinal + 1)),
+        )
+
+    def _apply_record(
+        self,
+        values: tuple[int, int, int, int, int, int, float, float, int, int, int, int],
+        location: tuple[int, int],
+    ) -> None:
+        ordinal, _old, new, flags, adapter_code, retry_count, timestamp, *_rest = values
+        if ordinal >= len(self._doc_ids):
+            raise LedgerCorruption("Ledger segment references an unknown document ordinal")
+        self._ensure_capacity(ordinal)
+        _state, slot_flags, slot_adapter, slot_retry, _updated, *_last, meta_seg, meta_pos = (
+            self._read_raw_slot(ordinal)
+        )
+        if not slot_flags & _SLOT_PRESENT:
+            slot_adapter, slot_retry, meta_seg, meta_pos = 0, 0, _NONE, _NONE
+        if flags & _RECORD_HAS_METADATA:
+            meta_seg, meta_pos = location
+        _SLOT.pack_into(
+            self._index,
+            _SLOT.size * (ordinal + 1),
+            new,
+            _SLOT_PRESENT,
+            adapter_code or slot_adapter,
+            retry_count if flags & _RECORD_HAS_RETRY else slot_retry,
+            timestamp,
+            location[0],
+            location[1],
+            meta_seg,
+            meta_pos,
+        )
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._ordinals
+
+    def doc_ids(self) -> list[str]:
+        """Return document identifiers in ordinal order."""
+
+        return list(self._doc_ids)
+
+    def ordinal(self, doc_id: str) -> int | None:
+        return self._ordinals.get(doc_id)
+
+    def doc_id(self, ordinal: int) -> str:
+        return self._doc_ids[ordinal]
+
+    def adapter_name(self, code: int) -> str | None:
+        return self._adapters[code - 1] if code else None
+
+    def read_slot(self, ordinal: int) -> IndexSlot:
+        state, _flags, adapter, retry, updated, last_seg, last_pos, meta_seg, meta_pos = (
+            self._read_raw_slot(ordinal)
+        )
+        return IndexSlot(
+            state=_STATE_CODES[state],
+            adapter_code=adapter,
+            retry_count=retry,
+            updated_at=updated,
+            last_record=(last_seg, last_pos),
+            metadata_record=(meta_seg, meta_pos),
+        )
+
+    def state_codes(self) -> bytes:
+        """Return the state code of every document, indexed by ordinal."""
+
+        start = _SLOT.size
+        stop = _SLOT.size * (len(self._doc_ids) + 1)
+        return self._index[start : stop : _SLOT.size]
+
+    def state_counts(self) -> dict[LedgerState, int]:
+        counts = _Counter(self.state_codes())
+        return {state: counts.get(code, 0) for code, state in enumerate(_STATE_CODES)}
+
+    def ordinals_in_state(self, state: LedgerState) -> Iterator[int]:
+        code = _STATE_TO_CODE[state]
+        codes = self.state_codes()
+        position = codes.find(code)
+        while position != -1:
+            yield position
+            position = codes.find(code, position + 1)
+
+    # ---------------------------------------------------------------- writing
+    def _intern_doc(self, doc_id: str) -> int:
+        ordinal = self._ordinals.get(doc_id)
+        if ordinal is not None:
+            return ordinal
+        ordinal = len(self._doc_ids)
+        # Identifiers are flushed eagerly so segment records never reference an
+        # ordinal that did not reach the file system.
+        self._doc_handle.write((_encode_name(doc_id) + "\n").encode("utf-8"))
+        self._doc_handle.flush()
+        self._doc_ids.append(doc_id)
+        self._ordinals[doc_id] = ordinal
+        self._ensure_capacity(ordinal)
+        return ordinal
+
+    def _intern_adapter(self, adapter: str | None) -> int:
+        if not adapter:
+            return 0
+        code = self._adapter_codes.get(adapter)
+        if code is not None:
+            return code
+        if len(self._adapters) >= 0xFFFF:
+            raise LedgerError("Ledger segment store supports at most 65535 adapters")
+        self._adapter_handle.write((_encode_name(adapter) + "\n").encode("utf-8"))
+        self._adapter_handle.flush()
+        self._adapters.append(adapter)
+        code = len(self._adapters)
+        self._adapter_codes[adapter] = code
+        return code
+
+    def append(self, audit: LedgerAuditRecord, *, replace_metadata: bool) -> None:
+        """Persist ``audit`` and update the latest-state index for its document."""
+
+        ordinal = self._intern_doc(audit.doc_id)
+        adapter_code = self._intern_adapter(audit.adapter)
+        flags = 0
+        blob: MutableJSONMapping = {}
+        if replace_metadata:
+            flags |= _RECORD_HAS_METADATA
+            blob["metadata"] = audit.metadata
+        if audit.retry_count is not None:
+            flags |= _RECORD_HAS_RETRY
+        if audit.duration_seconds is not None:
+            flags |= _RECORD_HAS_DURATION
+        if audit.parameters:
+            blob["parameters"] = audit.parameters
+        for key in ("error_type", "error_message", "traceback"):
+            value = getattr(audit, key)
+            if value is not None:
+                blob[key] = value
+        blob_offset = self._blob_size
+        blob_bytes = json.dumps(blob, separators=(",", ":")).encode("utf-8") if blob else b""
+        if blob_bytes:
+            self._blob_handle.write(blob_bytes)
+            self._blob_size += len(blob_bytes)
+        slot = self._read_raw_slot(ordinal)
+        present = slot[1] & _SLOT_PRESENT
+        values = (
+            ordinal,
+            _STATE_TO_CODE[audit.old_state],
+            _STATE_TO_CODE[audit.new_state],
+            flags,
+            adapter_code,
+            audit.retry_count or 0,
+            audit.timestamp,
+            audit.duration_seconds if audit.duration_seconds is not None else math.nan,
+            slot[5] if present else _NONE,
+            slot[6] if present else _NONE,
+            blob_offset,
+            len(blob_bytes),
+        )
+        self._segment_handle.write(_RECORD.pack(*values))
+        location = (self._active_segment, self._active_count)
+        self._active_count += 1
+        self._apply_record(values, location)
+        if self._active_count >= self._segment_records:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._close_writers()
+        self._active_segment += 1
+        self._open_writers()
+        self.checkpoint()
+
+    def flush(self, *, fsync: bool = False) -> None:
+        """Hand buffered segment data to the OS, optionally forcing it to disk."""
+
+        self._segment_handle.flush()
+        self._blob_handle.flush()
+        if fsync:
+            os.fsync(self._blob_handle.fileno())
+            os.fsync(self._segment_handle.fileno())
+
+    def checkpoint(self) -> None:
+        """Flush segment data and record the index checkpoint durably."""
+
+        os.fsync(self._doc_handle.fileno())
+        self.flush(fsync=True)
+        self._write_header(len(self._doc_ids), self._active_segment, self._active_count)
+        self._index.flush()
+
+    # ---------------------------------------------------------------- reading
+    def _reader(self, segment: int) -> tuple[BinaryIO, BinaryIO]:
+        if segment == self._active_segment:
+            self._segment_handle.flush()
+            self._blob_handle.flush()
+        handles = self._readers.get(segment)
+        if handles is None:
+            handles = (self._segment_path(segment).open("rb"), self._blob_path(segment).open("rb"))
+            self._readers[segment] = handles
+        return handles
+
+    def _read_payload(self, segment: int, offset: int, length: int) -> JSONMapping:
+        if not length:
+            return {}
+        _records, blobs = self._reader(segment)
+        blobs.seek(offset)
+        try:
+            decoded = json.loads(blobs.read(length))
+        except json.JSONDecodeError as exc:
+            raise LedgerCorruption(f"Ledger segment {segment} payload is malformed") from exc
+        return cast(JSONMapping, decoded) if isinstance(decoded, Mapping) else {}
+
+    def _read_record(
+        self, location: tuple[int, int]
+    ) -> tuple[tuple[int, int, int, int, int, int, float, float, int, int, int, int], JSONMapping]:
+        records, _blobs = self._reader(location[0])
+        records.seek(location[1] * _RECORD.size)
+        raw = records.read(_RECORD.size)
+        if len(raw) != _RECORD.size:
+            raise LedgerCorruption(f"Ledger segment record {location} is missing")
+        values = cast(
+            tuple[int, int, int, int, int, int, float, float, int, int, int, int],
+            _RECORD.unpack(raw),
+        )
+        return values, self._read_payload(location[0], values[10], values[11])
+
+    def _to_audit(
+        self,
+        values: tuple[int, int, int, int, int, int, float, float, int, int, int, int],
+        payload: JSONMapping,
+    ) -> LedgerAuditRecord:
+        ordinal, old, new, flags, adapter_code, retry, timestamp, duration, *_rest = values
+
+        def _text(key: str) -> str | None:
+            value = payload.get(key)
+            return str(value) if value is not None else None
+
+        return LedgerAuditRecord(
+            doc_id=self._doc_ids[ordinal],
+            old_state=_STATE_CODES[old],
+            new_state=_STATE_CODES[new],
+            timestamp=timestamp,
+            adapter=self.adapter_name(adapter_code),
+            error_type=_text("error_type"),
+            error_message=_text("error_message"),
+            traceback=_text("traceback"),
+            retry_count=retry if flags & _RECORD_HAS_RETRY else None,
+            duration_seconds=duration if flags & _RECORD_HAS_DURATION else None,
+            parameters=cast(JSONMapping, payload.get("parameters", {})),
+            metadata=cast(JSONMapping, payload.get("metadata", {})),
+        )
+
+    def read_metadata(self, slot: IndexSlot) -> JSONMapping:
+        if slot.metadata_record[0] == _NONE:
+            return {}
+        _values, payload = self._read_record(slot.metadata_record)
+        metadata = payload.get("metadata", {})
+        return cast(JSONMapping, metadata) if isinstance(metadata, Mapping) else {}
+
+    def history(self, ordinal: int) -> list[LedgerAuditRecord]:
+        """Return the transition history of ``ordinal`` in chronological order."""
+
+        records: list[LedgerAuditRecord] = []
+        location = self.read_slot(ordinal).last_record
+        while location[0] != _NONE:
+            values, payload = self._read_record(location)
+            records.append(self._to_audit(values, payload))
+            location = (values[8], values[9])
+        records.reverse()
+        return records
+
+    def iter_records(self) -> Iterator[LedgerAuditRecord]:
+        """Yield every persisted transition in write order."""
+
+        for segment in self.segments():
+            records, _blobs = self._reader(segment)
+            offset = 0
+            while True:
+                records.seek(offset)
+                chunk = records.read(_RECORD.size * 4096)
+                if not chunk:
+                    break
+                offset += len(chunk)
+                for values in _RECORD.iter_unpack(chunk):
+                    typed = cast(
+                        tuple[int, int, int, int, int, int, float, float, int, int, int, int],
+                        values,
+                    )
+                    yield self._to_audit(typed, self._read_payload(segment, typed[10], typed[11]))
+
+    # ---------------------------------------------------------------- closing
+    def _close_writers(self) -> None:
+        self._segment_handle.close()
+        self._blob_handle.close()
+        readers = self._readers.pop(self._active_segment, None)
+        if readers is not None:
+            for handle in readers:
+                handle.close()
+
+    def close(self) -> None:
+        if self._index.closed:
+            return
+        self.checkpoint()
+        self._close_writers()
+        for records, blobs in self._readers.values():
+            records.close()
+            blobs.close()
+        self._readers.clear()
+        self._doc_handle.close()
+        self._adapter_handle.close()
+        self._index.close()
+        self._index_handle.close()
+
+
+class SegmentedIngestionLedger(IngestionLedger):
+    """Ingestion ledger backed by :class:`LedgerSegmentStore`.
+
+    ``path`` names the segment directory. Only the document identifier table is
+    held in memory; latest states come from the memory-mapped index and history
+    is loaded from the segments whenever a document is returned, so state-only
+    callers should use :meth:`get_state` or pass ``with_history=False`` to
+    :meth:`entries`, which then return latest-state views with an empty ``history``.
+
+    ``auto_snapshot_interval`` controls how often the index checkpoint is made
+    durable; :meth:`create_snapshot` forces a checkpoint.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        segment_records: int = DEFAULT_SEGMENT_RECORDS,
+        auto_snapshot_interval: timedelta | None = None,
+        fsync: bool = False,
+    ) -> None:
+        self._segment_records = segment_records
+        super().__init__(
+            path,
+            auto_snapshot_interval=auto_snapshot_interval or timedelta(minutes=5),
+            fsync=fsync,
+        )
+
+    @property
+    def store(self) -> LedgerSegmentStore:
+        return self._store
+
+    # ------------------------------------------------------------------ loading
+    def _load(self) -> None:
+        start = perf_counter()
+        INITIALIZATION_COUNTER.labels(method="segments").inc()
+        self._store = LedgerSegmentStore(self._path, segment_records=self._segment_records)
+        self._state_counts = self._store.state_counts()
+        self._last_snapshot_at = datetime.now(timezone.utc)
+        INITIALIZATION_DURATION.observe(perf_counter() - start)
+        self._update_state_metrics()
+
+    def _materialise(self, ordinal: int, *, with_history: bool) -> LedgerDocumentState:
+        slot = self._store.read_slot(ordinal)
+        return LedgerDocumentState(
+            doc_id=self._store.doc_id(ordinal),
+            state=slot.state,
+            updated_at=datetime.fromtimestamp(slot.updated_at, tz=timezone.utc),
+            adapter=self._store.adapter_name(slot.adapter_code),
+            metadata=dict(self._store.read_metadata(slot)),
+            retry_count=slot.retry_count,
+            history=self._store.history(ordinal) if with_history else [],
+        )
+
+    # ---------------------------------------------------------------- transitions
+    def _lookup(self, doc_id: str) -> LedgerDocumentState | None:
+        ordinal = self._store.ordinal(doc_id)
+        if ordinal is None:
+            return None
+        slot = self._store.read_slot(ordinal)
+        return LedgerDocumentState(
+            doc_id=doc_id,
+            state=slot.state,
+            updated_at=datetime.fromtimestamp(slot.updated_at, tz=timezone.utc),
+        )
+
+    def _apply_transition(
+        self,
+        document: LedgerDocumentState | None,
+        audit: LedgerAuditRecord,
+        now: datetime,
+        *,
+        replace_metadata: bool,
+    ) -> None:
+        self._store.append(audit, replace_metadata=replace_metadata)
+
+    def _commit(self) -> None:
+        self._store.flush(fsync=self._fsync)
+
+    # ------------------------------------------------------------------ queries
+    def get(self, doc_id: str) -> LedgerDocumentState | None:
+        with self._lock:
+            ordinal = self._store.ordinal(doc_id)
+            if ordinal is None:
+                return None
+            return self._materialise(ordinal, with_history=True)
+
+    def get_state(self, doc_id: str) -> LedgerState | None:
+        with self._lock:
+            ordinal = self._store.ordinal(doc_id)
+            return self._store.read_slot(ordinal).state if ordinal is not None else None
+
+    def entries(
+        self, *, state: LedgerState | None = None, with_history: bool = True
+    ) -> Iterable[LedgerDocumentState]:
+        with self._lock:
+            if state is None:
+                ordinals: Iterable[int] = range(len(self._store))
+            else:
+                coerced = _ensure_ledger_state(state, argument="state")
+                ordinals = self._store.ordinals_in_state(coerced)
+            return [self._materialise(ordinal, with_history=with_history) for ordinal in ordinals]
+
+    def get_documents_by_state(
+        self, state: LedgerState, *, with_history: bool = True
+    ) -> list[LedgerDocumentState]:
+        return list(self.entries(state=state, with_history=with_history))
+
+    def get_state_history(self, doc_id: str) -> list[LedgerAuditRecord]:
+        with self._lock:
+            ordinal = self._store.ordinal(doc_id)
+            return self._store.history(ordinal) if ordinal is not None else []
+
+    def get_state_duration(self, doc_id: str) -> float:
+        with self._lock:
+            document = self._lookup(doc_id)
+        return document.duration() if document else 0.0
+
+    def get_stuck_documents(self, threshold_hours: int) -> list[LedgerDocumentState]:
+        cutoff = datetime.now(timezone.utc).timestamp() - threshold_hours * 3600
+        stuck: list[LedgerDocumentState] = []
+        with self._lock:
+            for ordinal in range(len(self._store)):
+                slot = self._store.read_slot(ordinal)
+                if is_terminal_state(slot.state) or slot.updated_at > cutoff:
+                    continue
+                stuck.append(self._materialise(ordinal, with_history=True))
+        for ledger_state in LedgerState:
+            count = 0
+            if ledger_state not in TERMINAL_STATES:
+                count = sum(1 for doc in stuck if doc.state is ledger_state)
+            STUCK_DOCUMENTS.labels(state=ledger_state.value).set(count)
+        if stuck:
+            LOGGER.warning(
+                "Stuck ledger documents detected",
+                extra={"count": len(stuck), "threshold_hours": threshold_hours},
+            )
+        return stuck
+
+    # ---------------------------------------------------------------- snapshots
+    def create_snapshot(self, output_path: Path | None = None) -> Path:
+        """Checkpoint the state index; segment ledgers need no separate snapshot."""
+
+        with self._lock:
+            self._checkpoint()
+        return self._store.index_path
+
+    def _snapshot_in_background(self) -> None:
+        """Checkpoint the index in place of the JSON snapshot; caller holds the lock."""
+
+        self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        self._store.checkpoint()
+        self._last_snapshot_at = datetime.now(timezone.utc)
+        LOGGER.info(
+            "Ledger segment checkpoint written", extra={"index": str(self._store.index_path)}
+        )
+
+    def load_snapshot_file(self, snapshot_path: Path) -> None:
+        raise LedgerError("Segmented ledgers do not load JSON snapshots")
+
+    def load_with_snapshot(self, snapshot_path: Path, delta_path: Path) -> None:
+        raise LedgerError("Segmented ledgers do not load JSON snapshots")
+
+    def close(self) -> None:
+        store = getattr(self, "_store", None)
+        if store is not None:
+            store.close()
+
+
+def import_jsonl_ledger(
+    source: Path,
+    destination: Path,
+    *,
+    segment_records: int = DEFAULT_SEGMENT_RECORDS,
+) -> int:
+    """Copy every audit record of a JSONL ledger into a segment store."""
+
+    store = LedgerSegmentStore(destination, segment_records=segment_records)
+    imported = 0
+    try:
+        with source.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                row = cast(Mapping[str, JSONValue], json.loads(line))
+                audit = LedgerAuditRecord.from_dict(row)
+                store.append(audit, replace_metadata=bool(audit.metadata))
+                imported += 1
+    finally:
+        store.close()
+    return imported
+
+
+__all__ = [
+    "DEFAULT_SEGMENT_RECORDS",
+    "IndexSlot",
+    "LedgerSegmentStore",
+    "SegmentedIngestionLedger",
+    "import_jsonl_ledger",
+]
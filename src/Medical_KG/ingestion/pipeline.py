@@ -5,12 +5,19 @@ import contextlib
 import logging
 import time
 import traceback
-from collections.abc import AsyncIterator, Iterable, Sequence
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Callable, Mapping, Protocol
 
 from Medical_KG.ingestion import registry as ingestion_registry
-from Medical_KG.ingestion.adapters.base import AdapterContext, BaseAdapter
+from Medical_KG.ingestion.adapters.base import (
+    AdapterConcurrency,
+    AdapterContext,
+    BaseAdapter,
+    _is_transient_error,
+)
 from Medical_KG.ingestion.events import (
     AdapterStateChange,
     BatchProgress,
@@ -24,8 +31,9 @@ from Medical_KG.ingestion.events import (
     build_pipeline_id,
     event_to_dict,
 )
+from Medical_KG.ingestion.http_cache import HttpResponseCache
 from Medical_KG.ingestion.http_client import AsyncHttpClient
-from Medical_KG.ingestion.ledger import IngestionLedger
+from Medical_KG.ingestion.ledger import IngestionLedger, LedgerState, get_valid_next_states
 from Medical_KG.ingestion.models import Document
 from Medical_KG.ingestion.telemetry import HttpTelemetry
 from Medical_KG.utils.optional_dependencies import (
@@ -53,6 +61,8 @@ class AdapterRegistry(Protocol):
 _DEFAULT_BUFFER_SIZE = 100
 _DEFAULT_PROGRESS_INTERVAL = 100
 _DEFAULT_CHECKPOINT_INTERVAL = 1000
+_DEFAULT_RETRY_BACKOFF = 0.5
+_MAX_RETRY_BACKOFF = 30.0
 LOGGER = logging.getLogger(__name__)
 
 PIPELINE_EVENT_COUNTER: CounterProtocol = build_counter(
@@ -85,6 +95,10 @@ PIPELINE_CONSUMPTION_COUNTER: CounterProtocol = build_counter(
 )
 
 
+def _retry_delay(backoff: float, attempt: int) -> float:
+    return float(min(backoff * (2**attempt), _MAX_RETRY_BACKOFF))
+
+
 class IngestionPipeline:
     """Coordinate adapters, ledger interactions, and retry semantics."""
 
@@ -101,6 +115,8 @@ class IngestionPipeline:
         )
         | None = None,
         enable_client_metrics: bool | None = None,
+        http_cache_dir: Path | str | None = None,
+        http_cache_ttls: Mapping[str, float] | None = None,
     ) -> None:
         self.ledger = ledger
         self._registry = registry or ingestion_registry
@@ -110,6 +126,11 @@ class IngestionPipeline:
             self._client_kwargs["telemetry"] = client_telemetry
         if enable_client_metrics is not None:
             self._client_kwargs["enable_metrics"] = enable_client_metrics
+        if http_cache_dir is not None:
+            # Opt-in: GET responses are kept on disk and revalidated with conditional requests.
+            self._client_kwargs["cache"] = HttpResponseCache(
+                http_cache_dir, host_ttls=http_cache_ttls
+            )
 
     def run(
         self,
@@ -117,6 +138,8 @@ class IngestionPipeline:
         params: Iterable[dict[str, Any]] | None = None,
         *,
         resume: bool = False,
+        concurrency: int = 1,
+        preserve_order: bool = True,
     ) -> list[PipelineResult]:
         """Execute an adapter synchronously."""
 
@@ -133,6 +156,8 @@ class IngestionPipeline:
                 completed_ids=None,
                 total_estimated=None,
                 consumption_mode="run_async",
+                concurrency=concurrency,
+                preserve_order=preserve_order,
             )
         )
 
@@ -149,12 +174,16 @@ class IngestionPipeline:
         event_transformer: EventTransformer | None = None,
         completed_ids: Iterable[str] | None = None,
         total_estimated: int | None = None,
+        concurrency: int = 1,
+        preserve_order: bool = True,
     ) -> list[PipelineResult]:
         """Execute an adapter within an existing asyncio event loop.
 
         This helper materialises the full result set in memory and should only
         be used for small batches. Prefer :meth:`stream_events` for
         observability-friendly, backpressured consumption of pipeline activity.
+        ``concurrency`` greater than one overlaps fetching, parsing and writes
+        inside the adapter (see :class:`AdapterConcurrency`).
         """
 
         return await self._collect_results(
@@ -169,11 +198,13 @@ class IngestionPipeline:
             completed_ids=completed_ids,
             total_estimated=total_estimated,
             consumption_mode="run_async",
+            concurrency=concurrency,
+            preserve_order=preserve_order,
         )
 
     def status(self) -> dict[str, list[dict[str, Any]]]:
         summary: dict[str, list[dict[str, Any]]] = {}
-        for entry in self.ledger.entries():
+        for entry in self.ledger.entries(with_history=False):
             summary.setdefault(entry.state.value, []).append(
                 {"doc_id": entry.doc_id, "metadata": dict(entry.metadata)}
             )
@@ -192,6 +223,11 @@ class IngestionPipeline:
         event_transformer: EventTransformer | None = None,
         completed_ids: Iterable[str] | None = None,
         total_estimated: int | None = None,
+        concurrency: int = 1,
+        preserve_order: bool = True,
+        max_parallel_invocations: int = 1,
+        invocation_retries: int = 0,
+        retry_backoff: float = _DEFAULT_RETRY_BACKOFF,
     ) -> AsyncIterator[Document]:
         """Stream :class:`Document` instances as they are produced.
 
@@ -213,6 +249,11 @@ class IngestionPipeline:
                 event_transformer=event_transformer,
                 completed_ids=completed_ids,
                 total_estimated=total_estimated,
+                concurrency=concurrency,
+                preserve_order=preserve_order,
+                max_parallel_invocations=max_parallel_invocations,
+                invocation_retries=invocation_retries,
+                retry_backoff=retry_backoff,
             ):
                 if isinstance(event, DocumentCompleted):
                     yield event.document
@@ -233,6 +274,8 @@ class IngestionPipeline:
         completed_ids: Iterable[str] | None,
         total_estimated: int | None,
         consumption_mode: str,
+        concurrency: int = 1,
+        preserve_order: bool = True,
     ) -> list[PipelineResult]:
         invocations = self._normalise_params(params)
         results: list[PipelineResult] = []
@@ -251,6 +294,8 @@ class IngestionPipeline:
                 event_transformer=event_transformer,
                 completed_ids=completed_ids,
                 total_estimated=total_estimated,
+                concurrency=concurrency,
+                preserve_order=preserve_order,
                 _consumption_mode=consumption_mode,
             )
             async for event in stream:
@@ -285,6 +330,11 @@ class IngestionPipeline:
         event_transformer: EventTransformer | None = None,
         completed_ids: Iterable[str] | None = None,
         total_estimated: int | None = None,
+        concurrency: int = 1,
+        preserve_order: bool = True,
+        max_parallel_invocations: int = 1,
+        invocation_retries: int = 0,
+        retry_backoff: float = _DEFAULT_RETRY_BACKOFF,
         _consumption_mode: str | None = None,
     ) -> AsyncIterator[PipelineEvent]:
         """Stream structured pipeline events with backpressure support.
@@ -293,8 +343,34 @@ class IngestionPipeline:
         lifecycle milestones, document outcomes, adapter state transitions, and
         progress updates. Callers can supply ``event_filter`` and
         ``event_transformer`` callbacks to declaratively tailor the stream.
+        ``concurrency`` sets the number of adapter parse workers; with
+        ``preserve_order`` disabled documents are emitted as soon as they are
+        written rather than in fetch order.
+
+        Up to ``max_parallel_invocations`` entries of ``params`` run at once,
+        each on its own adapter instance. An invocation that raises a transient
+        error (timeouts, dropped connections, throttling) is retried up to
+        ``invocation_retries`` times with exponential backoff starting at
+        ``retry_backoff`` seconds. When an invocation still fails it emits a
+        :class:`DocumentFailed` event, marks the document ``FAILED`` in the
+        ledger when its id is known, and the remaining invocations carry on.
+        The final :class:`AdapterStateChange` summarises the failures.
         """
 
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_parallel_invocations < 1:
+            raise ValueError("max_parallel_invocations must be at least 1")
+        if invocation_retries < 0:
+            raise ValueError("invocation_retries must not be negative")
+        if retry_backoff < 0:
+            raise ValueError("retry_backoff must not be negative")
+        adapter_concurrency = (
+            AdapterConcurrency(workers=concurrency, ordered=preserve_order)
+            if concurrency > 1
+            else None
+        )
+
         mode = _consumption_mode or "stream_events"
         if _consumption_mode:
             self._record_consumption("stream_events", source)
@@ -367,23 +443,133 @@ class IngestionPipeline:
                 last_checkpoint_at = time.perf_counter()
             await emit(event)
 
-        async def producer() -> None:
-            nonlocal completed_total, failed_total, completed_checkpoint, in_flight_count
-            state = "initial"
+        state = "initial"
+        failures: list[Exception] = []
+
+        async def change_state(adapter: str, new_state: str, reason: str | None = None) -> None:
+            nonlocal state
             await emit(
                 AdapterStateChange(
                     timestamp=time.time(),
                     pipeline_id=pipeline_id,
-                    adapter=source,
+                    adapter=adapter,
                     old_state=state,
-                    new_state="initialising",
-                    reason=None,
+                    new_state=new_state,
+                    reason=reason,
+                )
+            )
+            state = new_state
+
+        async def run_invocation(
+            adapter: BaseAdapter[Any], invocation_params: dict[str, Any]
+        ) -> None:
+            nonlocal completed_total, completed_checkpoint, in_flight_count
+            keyword_args = dict(invocation_params)
+            if resume:
+                keyword_args.setdefault("resume", resume)
+            if completed_ids:
+                keyword_args["completed_ids"] = completed_ids
+            if adapter_concurrency is not None:
+                keyword_args["concurrency"] = adapter_concurrency
+            async for result in adapter.iter_results(**keyword_args):
+                document = result.document
+                if document.doc_id in completed_skip:
+                    continue
+                doc_started = time.perf_counter()
+                await emit(
+                    DocumentStarted(
+                        timestamp=time.time(),
+                        pipeline_id=pipeline_id,
+                        doc_id=document.doc_id,
+                        adapter=adapter.source,
+                        parameters=dict(invocation_params),
+                    )
+                )
+                in_flight_count += 1
+                duration = max(time.perf_counter() - doc_started, 0.0)
+                await emit(
+                    DocumentCompleted(
+                        timestamp=time.time(),
+                        pipeline_id=pipeline_id,
+                        document=document,
+                        duration=duration,
+                        adapter_metadata=dict(result.metadata),
+                    )
+                )
+                completed_total += 1
+                completed_since_checkpoint.append(document.doc_id)
+                in_flight_count = max(in_flight_count - 1, 0)
+                completed_checkpoint += 1
+                if progress_interval > 0 and completed_total % progress_interval == 0:
+                    await emit_progress(is_checkpoint=False)
+                if checkpoint_target is not None and completed_checkpoint >= checkpoint_target:
+                    completed_checkpoint = 0
+                    await emit_progress(is_checkpoint=True)
+
+        async def fail_invocation(
+            adapter: BaseAdapter[Any], exc: Exception, attempts: int, formatted: str
+        ) -> None:
+            nonlocal failed_total, in_flight_count, completed_checkpoint
+            failed_total += 1
+            in_flight_count = max(in_flight_count - 1, 0)
+            completed_checkpoint += 1
+            failures.append(exc)
+            doc_id = getattr(exc, "doc_id", None)
+            if doc_id is not None:
+                self._mark_failed(str(doc_id), adapter.source, exc)
+            await emit(
+                DocumentFailed(
+                    timestamp=time.time(),
+                    pipeline_id=pipeline_id,
+                    doc_id=doc_id,
+                    error=str(exc),
+                    retry_count=max(int(getattr(exc, "retry_count", 0) or 0), attempts),
+                    is_retryable=_is_transient_error(exc),
+                    error_type=exc.__class__.__name__,
+                    traceback=formatted,
                 )
             )
-            state = "initialising"
+            await change_state(adapter.source, "invocation_failed", str(exc))
+
+        async def invocation_worker(
+            adapter: BaseAdapter[Any],
+            pending: Iterator[dict[str, Any] | None],
+        ) -> None:
+            for invocation in pending:
+                invocation_params = dict(invocation or {})
+                await change_state(adapter.source, "invocation_started")
+                attempt = 0
+                while True:
+                    try:
+                        await run_invocation(adapter, invocation_params)
+                    except Exception as exc:
+                        if attempt < invocation_retries and _is_transient_error(exc):
+                            delay = _retry_delay(retry_backoff, attempt)
+                            attempt += 1
+                            LOGGER.info(
+                                "Retrying %s invocation after %s (attempt %d of %d) in %.2fs",
+                                adapter.source,
+                                exc.__class__.__name__,
+                                attempt,
+                                invocation_retries,
+                                delay,
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+                        await fail_invocation(adapter, exc, attempt, traceback.format_exc())
+                    else:
+                        await change_state(adapter.source, "invocation_completed")
+                    break
+
+        async def producer() -> None:
+            await change_state(source, "initialising")
             try:
                 async with self._client_factory(**self._client_kwargs) as client:
-                    adapter = self._resolve_adapter(source, client)
+                    invocations = self._normalise_params(params)
+                    worker_count = min(max_parallel_invocations, len(invocations))
+                    adapters = [
+                        self._resolve_adapter(source, client) for _ in range(worker_count)
+                    ]
                     loop = asyncio.get_running_loop()
 
                     def _forward_adapter_event(event: PipelineEvent) -> None:
@@ -394,125 +580,27 @@ class IngestionPipeline:
                         task = loop.create_task(emit(event))
                         task.add_done_callback(lambda finished: finished.exception())
 
-                    adapter.bind_event_emitter(_forward_adapter_event)
+                    for adapter in adapters:
+                        adapter.bind_event_emitter(_forward_adapter_event)
                     try:
-                        await emit(
-                            AdapterStateChange(
-                                timestamp=time.time(),
-                                pipeline_id=pipeline_id,
-                                adapter=adapter.source,
-                                old_state=state,
-                                new_state="ready",
-                                reason=None,
-                            )
-                        )
-                        state = "ready"
-                        for invocation in self._normalise_params(params):
-                            invocation_params = dict(invocation or {})
-                            await emit(
-                                AdapterStateChange(
-                                    timestamp=time.time(),
-                                    pipeline_id=pipeline_id,
-                                    adapter=adapter.source,
-                                    old_state=state,
-                                    new_state="invocation_started",
-                                    reason=None,
-                                )
-                            )
-                            state = "invocation_started"
-                            keyword_args = dict(invocation_params)
-                            if resume:
-                                keyword_args.setdefault("resume", resume)
-                            if completed_ids:
-                                keyword_args["completed_ids"] = completed_ids
-                            try:
-                                async for result in adapter.iter_results(**keyword_args):
-                                    document = result.document
-                                    if document.doc_id in completed_skip:
-                                        continue
-                                    doc_started = time.perf_counter()
-                                    await emit(
-                                        DocumentStarted(
-                                            timestamp=time.time(),
-                                            pipeline_id=pipeline_id,
-                                            doc_id=document.doc_id,
-                                            adapter=adapter.source,
-                                            parameters=dict(invocation_params),
-                                        )
-                                    )
-                                    in_flight_count += 1
-                                    duration = max(time.perf_counter() - doc_started, 0.0)
-                                    await emit(
-                                        DocumentCompleted(
-                                            timestamp=time.time(),
-                                            pipeline_id=pipeline_id,
-                                            document=document,
-                                            duration=duration,
-                                            adapter_metadata=dict(result.metadata),
-                                        )
-                                    )
-                                    completed_total += 1
-                                    completed_since_checkpoint.append(document.doc_id)
-                                    in_flight_count = max(in_flight_count - 1, 0)
-                                    completed_checkpoint += 1
-                                    if progress_interval > 0 and completed_total % progress_interval == 0:
-                                        await emit_progress(is_checkpoint=False)
-                                    if (
-                                        checkpoint_target is not None
-                                        and completed_checkpoint >= checkpoint_target
-                                    ):
-                                        completed_checkpoint = 0
-                                        await emit_progress(is_checkpoint=True)
-                            except Exception as exc:  # pragma: no cover - defensive
-                                failed_total += 1
-                                in_flight_count = max(in_flight_count - 1, 0)
-                                completed_checkpoint += 1
-                                await emit(
-                                    DocumentFailed(
-                                        timestamp=time.time(),
-                                        pipeline_id=pipeline_id,
-                                        doc_id=getattr(exc, "doc_id", None),
-                                        error=str(exc),
-                                        retry_count=getattr(exc, "retry_count", 0),
-                                        is_retryable=bool(getattr(exc, "is_retryable", False)),
-                                        error_type=exc.__class__.__name__,
-                                        traceback=traceback.format_exc(),
-                                    )
-                                )
-                                await emit(
-                                    AdapterStateChange(
-                                        timestamp=time.time(),
-                                        pipeline_id=pipeline_id,
-                                        adapter=adapter.source,
-                                        old_state=state,
-                                        new_state="failed",
-                                        reason=str(exc),
-                                    )
-                                )
-                                return
-                            await emit(
-                                AdapterStateChange(
-                                    timestamp=time.time(),
-                                    pipeline_id=pipeline_id,
-                                    adapter=adapter.source,
-                                    old_state=state,
-                                    new_state="invocation_completed",
-                                    reason=None,
-                                )
-                            )
-                            state = "invocation_completed"
+                        await change_state(adapters[0].source, "ready")
+                        pending = iter(invocations)
+                        if worker_count == 1:
+                            await invocation_worker(adapters[0], pending)
+                        else:
+                            async with asyncio.TaskGroup() as workers:
+                                for adapter in adapters:
+                                    workers.create_task(invocation_worker(adapter, pending))
                     finally:
-                        adapter.bind_event_emitter(None)
-                await emit(
-                    AdapterStateChange(
-                        timestamp=time.time(),
-                        pipeline_id=pipeline_id,
-                        adapter=source,
-                        old_state=state,
-                        new_state="completed",
-                        reason=None,
-                    )
-                )
+                        for adapter in adapters:
+                            adapter.bind_event_emitter(None)
+                    summary = self._summarise_failures(failures, len(invocations))
+                    if summary is not None:
+                        LOGGER.warning(
+                            "Ingestion of %s finished with failures: %s", source, summary
+                        )
+                final_state = "failed" if len(failures) == len(invocations) else "completed"
+                await change_state(source, final_state, summary)
             finally:
                 await emit_progress(is_checkpoint=True)
                 PIPELINE_DURATION_SECONDS.observe(
@@ -538,6 +626,30 @@ class IngestionPipeline:
     def _resolve_adapter(self, source: str, client: AsyncHttpClient) -> BaseAdapter[Any]:
         return self._registry.get_adapter(source, AdapterContext(ledger=self.ledger), client)
 
+    def _mark_failed(self, doc_id: str, adapter: str, exc: Exception) -> None:
+        """Record ``FAILED`` for a document whose invocation failed outside the adapter."""
+
+        state = self.ledger.get_state(doc_id)
+        if state is not None and (
+            state is LedgerState.FAILED or LedgerState.FAILED not in get_valid_next_states(state)
+        ):
+            return
+        self.ledger.update_state(
+            doc_id,
+            LedgerState.FAILED,
+            adapter=adapter,
+            metadata={"error": str(exc)},
+            error=exc,
+        )
+
+    @staticmethod
+    def _summarise_failures(failures: Sequence[Exception], invocations: int) -> str | None:
+        if not failures:
+            return None
+        by_type = Counter(exc.__class__.__name__ for exc in failures)
+        details = ", ".join(f"{name}={count}" for name, count in sorted(by_type.items()))
+        return f"{len(failures)} of {invocations} invocations failed ({details})"
+
     @staticmethod
     def _normalise_params(
         params: Iterable[dict[str, Any]] | None,
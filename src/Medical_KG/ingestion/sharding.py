@@ -0,0 +1,527 @@
+"""Multi-process ingestion with per-worker ledger shards.
+
+:class:`ShardedIngestionPipeline` splits the work units of an invocation
+(identifier lists, date ranges, or batches of parameter entries) across worker
+processes. Each worker runs a regular :class:`IngestionPipeline` over a
+:class:`LedgerShard`, which reads the canonical ledger state at start-up but
+appends its audit trail to a private shard file. Worker events are forwarded
+to the parent, where progress is aggregated into a single ``stream_events``
+stream, and the shards are folded back into the canonical ledger once the
+workers exit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import queue as queue_module
+import time
+import traceback
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from multiprocessing.context import SpawnContext
+from pathlib import Path
+from typing import Any, Callable, Mapping, cast
+
+from Medical_KG.ingestion.events import (
+    BatchProgress,
+    DocumentFailed,
+    EventFilter,
+    EventTransformer,
+    PipelineEvent,
+    build_pipeline_id,
+)
+from Medical_KG.ingestion.ledger import IngestionLedger, LedgerAuditRecord, LedgerCorruption
+from Medical_KG.ingestion.pipeline import (
+    _DEFAULT_BUFFER_SIZE,
+    _DEFAULT_CHECKPOINT_INTERVAL,
+    _DEFAULT_PROGRESS_INTERVAL,
+    _DEFAULT_RETRY_BACKOFF,
+    AdapterRegistry,
+    IngestionPipeline,
+)
+from Medical_KG.ingestion.types import JSONValue
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_START_METHOD = "spawn"
+_SPLITTABLE_LIST_KEYS = ("ids", "nct_ids", "pmids", "setids", "rxcuis")
+_DATE_RANGE_KEYS = ("start_date", "end_date")
+_POLL_INTERVAL_SECONDS = 0.2
+
+
+def shard_ledger_path(ledger_path: Path, shard: int) -> Path:
+    """Return the audit log path owned by worker ``shard``."""
+
+    suffix = ledger_path.suffix or ".jsonl"
+    return ledger_path.with_name(f"{ledger_path.stem}.shard-{shard:03d}{suffix}")
+
+
+def discover_ledger_shards(ledger_path: Path) -> list[Path]:
+    """List shard files left next to ``ledger_path`` (e.g. by an interrupted run)."""
+
+    suffix = ledger_path.suffix or ".jsonl"
+    return sorted(ledger_path.parent.glob(f"{ledger_path.stem}.shard-*{suffix}"))
+
+
+def _split_sequence(values: Sequence[Any], parts: int) -> list[list[Any]]:
+    size, remainder = divmod(len(values), parts)
+    chunks: list[list[Any]] = []
+    start = 0
+    for index in range(parts):
+        end = start + size + (1 if index < remainder else 0)
+        if end > start:
+            chunks.append(list(values[start:end]))
+        start = end
+    return chunks
+
+
+def _split_date_range(start_raw: str, end_raw: str, parts: int) -> list[tuple[str, str]]:
+    date_only = "T" not in start_raw and "T" not in end_raw
+    if date_only:
+        start_day = date.fromisoformat(start_raw)
+        end_day = date.fromisoformat(end_raw)
+        days = [
+            start_day + timedelta(days=offset) for offset in range((end_day - start_day).days + 1)
+        ]
+        return [
+            (chunk[0].isoformat(), chunk[-1].isoformat()) for chunk in _split_sequence(days, parts)
+        ]
+    start = datetime.fromisoformat(start_raw)
+    end = datetime.fromisoformat(end_raw)
+    if end <= start:
+        return [(start_raw, end_raw)]
+    step = (end - start) / parts
+    bounds = [start + step * index for index in range(parts)] + [end]
+    return [(bounds[index].isoformat(), bounds[index + 1].isoformat()) for index in range(parts)]
+
+
+def _split_invocation(invocation: Mapping[str, Any], parts: int) -> list[dict[str, Any]]:
+    for key in _SPLITTABLE_LIST_KEYS:
+        values = invocation.get(key)
+        if isinstance(values, (list, tuple)) and len(values) > 1:
+            return [{**invocation, key: chunk} for chunk in _split_sequence(values, parts)]
+    start_raw, end_raw = (invocation.get(key) for key in _DATE_RANGE_KEYS)
+    if isinstance(start_raw, str) and isinstance(end_raw, str):
+        try:
+            windows = _split_date_range(start_raw, end_raw, parts)
+        except ValueError:
+            windows = []
+        if len(windows) > 1:
+            return [
+                {**invocation, "start_date": window_start, "end_date": window_end}
+                for window_start, window_end in windows
+            ]
+    return [dict(invocation)]
+
+
+def partition_invocations(
+    invocations: Iterable[Mapping[str, Any] | None],
+    workers: int,
+) -> list[list[dict[str, Any]]]:
+    """Split invocation parameters into at most ``workers`` shards of work units.
+
+    A single invocation is split on its identifier list (``ids``, ``nct_ids``,
+    ...) or on its ``start_date``/``end_date`` window. Several invocations
+    (batch entries, ClinicalTrials.gov pages) are dealt round-robin. Empty
+    shards are dropped, so the result may be shorter than ``workers``; a
+    single shard means the work cannot be parallelised.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    entries = [dict(entry) for entry in invocations if entry is not None]
+    if not entries:
+        return []
+    if len(entries) == 1:
+        entries = _split_invocation(entries[0], workers)
+    shards: list[list[dict[str, Any]]] = [[] for _ in range(min(workers, len(entries)))]
+    for index, entry in enumerate(entries):
+        shards[index % len(shards)].append(entry)
+    return shards
+
+
+class LedgerShard(IngestionLedger):
+    """Ledger that loads the canonical state but appends audits to a shard file.
+
+    Workers see every document recorded before they started, so resume and
+    retry decisions match a single-process run, while their own transitions
+    stay isolated until :func:`merge_ledger_shards` folds them back.
+    """
+
+    def __init__(
+        self,
+        canonical_path: Path,
+        shard_path: Path,
+        *,
+        snapshot_dir: Path | None = None,
+        fsync: bool = False,
+    ) -> None:
+        super().__init__(canonical_path, snapshot_dir=snapshot_dir, fsync=fsync)
+        self._path = shard_path
+
+    def _maybe_snapshot(self, now: datetime) -> None:
+        """Snapshots belong to the canonical ledger; shards never compact."""
+
+
+def read_shard_audits(shard_path: Path) -> list[LedgerAuditRecord]:
+    """Load the audit records of a shard, ignoring a torn final line."""
+
+    if not shard_path.exists():
+        return []
+    lines = shard_path.read_text(encoding="utf-8").splitlines()
+    audits: list[LedgerAuditRecord] = []
+    for position, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            if position == len(lines) - 1:
+                # A worker terminated mid-write; the transition was never acknowledged.
+                LOGGER.warning("Ignoring truncated record at end of %s", shard_path)
+                break
+            raise LedgerCorruption(f"Ledger shard {shard_path} is malformed") from None
+        audits.append(LedgerAuditRecord.from_dict(cast(Mapping[str, JSONValue], row)))
+    return audits
+
+
+def merge_ledger_shards(ledger: IngestionLedger, shard_paths: Iterable[Path]) -> int:
+    """Fold shard audit logs into ``ledger`` in timestamp order and delete them.
+
+    Returns the number of audit records applied to the canonical ledger.
+    """
+
+    paths = list(shard_paths)
+    audits: list[LedgerAuditRecord] = []
+    for path in paths:
+        audits.extend(read_shard_audits(path))
+    # ``sort`` is stable, so transitions sharing a timestamp keep shard order.
+    audits.sort(key=lambda audit: audit.timestamp)
+    applied = ledger.merge_audits(audits) if audits else 0
+    for path in paths:
+        path.unlink(missing_ok=True)
+    if paths:
+        LOGGER.info(
+            "Merged ledger shards",
+            extra={"shards": len(paths), "records": len(audits), "applied": applied},
+        )
+    return applied
+
+
+@dataclass(slots=True)
+class _ShardSpec:
+    shard: int
+    source: str
+    ledger_path: Path
+    snapshot_dir: Path
+    invocations: list[dict[str, Any]]
+    resume: bool
+    buffer_size: int
+    progress_interval: int
+    checkpoint_interval: int
+    completed_ids: list[str]
+    concurrency: int
+    preserve_order: bool
+    max_parallel_invocations: int = 1
+    invocation_retries: int = 0
+    retry_backoff: float = _DEFAULT_RETRY_BACKOFF
+    pipeline_options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _ShardFinished:
+    error: str | None = None
+    error_type: str | None = None
+    traceback: str | None = None
+
+
+def _run_shard(spec: _ShardSpec, events: Any) -> None:
+    """Worker process entry point: run one pipeline and forward its events."""
+
+    finished = _ShardFinished()
+    ledger: LedgerShard | None = None
+    try:
+        ledger = LedgerShard(
+            spec.ledger_path,
+            shard_ledger_path(spec.ledger_path, spec.shard),
+            snapshot_dir=spec.snapshot_dir,
+        )
+        options = dict(spec.pipeline_options)
+        if options.get("http_cache_dir") is not None:
+            # Each worker keeps its own cache index so processes never overwrite each other's.
+            options["http_cache_dir"] = Path(options["http_cache_dir"]) / f"shard-{spec.shard}"
+        pipeline = IngestionPipeline(ledger, **options)
+
+        async def _drain() -> None:
+            async for event in pipeline.stream_events(
+                spec.source,
+                params=spec.invocations,
+                resume=spec.resume,
+                buffer_size=spec.buffer_size,
+                progress_interval=spec.progress_interval,
+                checkpoint_interval=spec.checkpoint_interval,
+                completed_ids=spec.completed_ids or None,
+                concurrency=spec.concurrency,
+                preserve_order=spec.preserve_order,
+                max_parallel_invocations=spec.max_parallel_invocations,
+                invocation_retries=spec.invocation_retries,
+                retry_backoff=spec.retry_backoff,
+            ):
+                events.put((spec.shard, event))
+
+        asyncio.run(_drain())
+    except BaseException as exc:  # pragma: no cover - surfaced to the parent
+        finished = _ShardFinished(
+            error=str(exc),
+            error_type=exc.__class__.__name__,
+            traceback=traceback.format_exc(),
+        )
+    finally:
+        if ledger is not None:
+            ledger.close()
+        events.put((spec.shard, finished))
+
+
+def _aggregate_progress(
+    pipeline_id: str,
+    latest: Mapping[int, BatchProgress],
+    trigger: BatchProgress,
+    total_estimated: int | None,
+    start_time: float,
+) -> BatchProgress:
+    completed = sum(progress.completed_count for progress in latest.values())
+    failed = sum(progress.failed_count for progress in latest.values())
+    processed = completed + failed
+    remaining: int | None = None
+    eta_seconds: float | None = None
+    if total_estimated is not None:
+        remaining = max(total_estimated - processed, 0)
+        elapsed = max(time.perf_counter() - start_time, 0.0)
+        if processed and elapsed > 0:
+            eta_seconds = remaining / (processed / elapsed)
+    return BatchProgress(
+        timestamp=trigger.timestamp,
+        pipeline_id=pipeline_id,
+        completed_count=completed,
+        failed_count=failed,
+        in_flight_count=sum(progress.in_flight_count for progress in latest.values()),
+        queue_depth=sum(progress.queue_depth for progress in latest.values()),
+        buffer_size=sum(progress.buffer_size for progress in latest.values()),
+        remaining=remaining,
+        eta_seconds=eta_seconds,
+        backpressure_wait_seconds=sum(
+            progress.backpressure_wait_seconds for progress in latest.values()
+        ),
+        backpressure_wait_count=sum(
+            progress.backpressure_wait_count for progress in latest.values()
+        ),
+        checkpoint_doc_ids=list(trigger.checkpoint_doc_ids),
+        is_checkpoint=trigger.is_checkpoint,
+    )
+
+
+class ShardedIngestionPipeline(IngestionPipeline):
+    """Run adapter invocations across worker processes with ledger sharding.
+
+    Work that cannot be partitioned (a single invocation without identifier
+    lists or a date window) runs in-process exactly like
+    :class:`IngestionPipeline`. Pipeline options are handed to the workers, so
+    a custom ``registry`` or ``client_factory`` must be picklable.
+    """
+
+    def __init__(
+        self,
+        ledger: IngestionLedger,
+        *,
+        workers: int,
+        start_method: str = DEFAULT_START_METHOD,
+        registry: AdapterRegistry | None = None,
+        **pipeline_options: Any,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        super().__init__(ledger, registry=registry, **pipeline_options)
+        self.workers = workers
+        self._start_method = start_method
+        self._worker_options = dict(pipeline_options)
+        if registry is not None:
+            self._worker_options["registry"] = registry
+
+    def merge_shards(self) -> int:
+        """Fold any shard files next to the canonical ledger back into it."""
+
+        return merge_ledger_shards(self.ledger, discover_ledger_shards(self.ledger.path))
+
+    async def stream_events(
+        self,
+        source: str,
+        *,
+        params: Iterable[dict[str, Any]] | None = None,
+        resume: bool = False,
+        buffer_size: int = _DEFAULT_BUFFER_SIZE,
+        progress_interval: int = _DEFAULT_PROGRESS_INTERVAL,
+        checkpoint_interval: int = _DEFAULT_CHECKPOINT_INTERVAL,
+        event_filter: EventFilter | None = None,
+        event_transformer: EventTransformer | None = None,
+        completed_ids: Iterable[str] | None = None,
+        total_estimated: int | None = None,
+        concurrency: int = 1,
+        preserve_order: bool = True,
+        max_parallel_invocations: int = 1,
+        invocation_retries: int = 0,
+        retry_backoff: float = _DEFAULT_RETRY_BACKOFF,
+        _consumption_mode: str | None = None,
+    ) -> AsyncIterator[PipelineEvent]:
+        """Stream events from all workers as one aggregated pipeline stream.
+
+        Events keep their per-worker order but are interleaved across workers.
+        :class:`BatchProgress` events report totals summed over the latest
+        progress of every worker, and all events carry a single
+        ``pipeline_id``. Shards are merged into the canonical ledger when the
+        stream finishes, including when the consumer stops early.
+        """
+
+        completed_list = list(completed_ids or [])
+        self.merge_shards()
+        materialised = None if params is None else [dict(entry) for entry in params]
+        partitions = partition_invocations(self._normalise_params(materialised), self.workers)
+        if len(partitions) <= 1:
+            if self.workers > 1:
+                LOGGER.info(
+                    "Ingestion work for %s cannot be partitioned; running in-process", source
+                )
+            async for event in super().stream_events(
+                source,
+                params=materialised,
+                resume=resume,
+                buffer_size=buffer_size,
+                progress_interval=progress_interval,
+                checkpoint_interval=checkpoint_interval,
+                event_filter=event_filter,
+                event_transformer=event_transformer,
+                completed_ids=completed_list or None,
+                total_estimated=total_estimated,
+                concurrency=concurrency,
+                preserve_order=preserve_order,
+                max_parallel_invocations=max_parallel_invocations,
+                invocation_retries=invocation_retries,
+                retry_backoff=retry_backoff,
+                _consumption_mode=_consumption_mode,
+            ):
+                yield event
+            return
+
+        self._record_consumption(_consumption_mode or "stream_events", source)
+        self.ledger.close()
+        filter_fn: Callable[[PipelineEvent], bool] = event_filter or (lambda event: True)
+        transform_fn: Callable[[PipelineEvent], PipelineEvent | None] = event_transformer or (
+            lambda event: event
+        )
+        pipeline_id = build_pipeline_id(source)
+        # Every start method context exposes Process/Queue; typeshed types get_context as the base.
+        context = cast(SpawnContext, multiprocessing.get_context(self._start_method))
+        events = context.Queue(maxsize=max(buffer_size, 1) * len(partitions))
+        processes = [
+            context.Process(
+                target=_run_shard,
+                args=(
+                    _ShardSpec(
+                        shard=shard,
+                        source=source,
+                        ledger_path=self.ledger.path,
+                        snapshot_dir=self.ledger.snapshot_dir,
+                        invocations=invocations,
+                        resume=resume,
+                        buffer_size=buffer_size,
+                        progress_interval=progress_interval,
+                        checkpoint_interval=checkpoint_interval,
+                        completed_ids=completed_list,
+                        concurrency=concurrency,
+                        preserve_order=preserve_order,
+                        max_parallel_invocations=max_parallel_invocations,
+                        invocation_retries=invocation_retries,
+                        retry_backoff=retry_backoff,
+                        pipeline_options=self._worker_options,
+                    ),
+                    events,
+                ),
+                name=f"ingest-{source}-shard-{shard}",
+                daemon=True,
+            )
+            for shard, invocations in enumerate(partitions)
+        ]
+        for process in processes:
+            process.start()
+        loop = asyncio.get_running_loop()
+        pending = set(range(len(processes)))
+        latest_progress: dict[int, BatchProgress] = {}
+        start_time = time.perf_counter()
+        try:
+            while pending:
+                try:
+                    shard, item = await loop.run_in_executor(
+                        None, events.get, True, _POLL_INTERVAL_SECONDS
+                    )
+                except queue_module.Empty:
+                    crashed = [
+                        index for index in sorted(pending) if not processes[index].is_alive()
+                    ]
+                    if not crashed:
+                        continue
+                    shard = crashed[0]
+                    item = _ShardFinished(
+                        error=f"worker exited with code {processes[shard].exitcode}",
+                        error_type="WorkerCrashed",
+                    )
+                if isinstance(item, _ShardFinished):
+                    pending.discard(shard)
+                    if item.error is None:
+                        continue
+                    event = self._shard_failure(pipeline_id, item)
+                elif isinstance(item, BatchProgress):
+                    latest_progress[shard] = item
+                    event = _aggregate_progress(
+                        pipeline_id, latest_progress, item, total_estimated, start_time
+                    )
+                else:
+                    event = cast(PipelineEvent, item)
+                    event.pipeline_id = pipeline_id
+                transformed = transform_fn(event)
+                if transformed is not None and filter_fn(transformed):
+                    yield transformed
+        finally:
+            for process in processes:
+                if pending:
+                    process.terminate()
+                process.join()
+            events.close()
+            self.merge_shards()
+
+    @staticmethod
+    def _shard_failure(pipeline_id: str, finished: _ShardFinished) -> DocumentFailed:
+        return DocumentFailed(
+            timestamp=time.time(),
+            pipeline_id=pipeline_id,
+            doc_id=None,
+            error=finished.error or "ingestion worker failed",
+            retry_count=0,
+            is_retryable=True,
+            error_type=finished.error_type or "WorkerError",
+            traceback=finished.traceback,
+        )
+
+
+__all__ = [
+    "DEFAULT_START_METHOD",
+    "LedgerShard",
+    "ShardedIngestionPipeline",
+    "discover_ledger_shards",
+    "merge_ledger_shards",
+    "partition_invocations",
+    "read_shard_audits",
+    "shard_ledger_path",
+]
@@ -76,8 +76,25 @@ class HttpErrorEvent(HttpEvent):
     retryable: bool
 
 
+@dataclass(slots=True)
+class HttpCacheEvent(HttpEvent):
+    """Event emitted when the response cache answers or revalidates a request.
+
+    ``outcome`` is ``"hit"`` for fresh entries served without a request,
+    ``"revalidated"`` when a conditional GET returned 304, and ``"miss"`` when
+    a full body had to be downloaded.
+    """
+
+    outcome: str
+    size_bytes: int
+
+
 class HttpTelemetry(Protocol):
-    """Protocol describing telemetry hooks supported by the HTTP client."""
+    """Protocol describing telemetry hooks supported by the HTTP client.
+
+    Handlers may additionally define ``on_cache(HttpCacheEvent)`` to observe
+    response cache hits and misses; the client looks the hook up lazily.
+    """
 
     def on_request(self, event: HttpRequestEvent) -> None:  # pragma: no cover - implementations only
         """Handle an HTTP request event."""
@@ -143,6 +160,9 @@ class LoggingTelemetry:
     def on_error(self, event: HttpErrorEvent) -> None:
         self._log("http.error", event)
 
+    def on_cache(self, event: HttpCacheEvent) -> None:
+        self._log("http.cache", event)
+
     @staticmethod
     def _sanitize_headers(headers: Mapping[str, str]) -> dict[str, str]:
         sanitized: dict[str, str] = {}
@@ -193,6 +213,11 @@ _RETRY_COUNTER: CounterProtocol = build_counter(
     "Total HTTP retries performed",
     ("host", "reason"),
 )
+_CACHE_COUNTER: CounterProtocol = build_counter(
+    "http_cache_requests_total",
+    "HTTP response cache lookups by outcome",
+    ("host", "outcome"),
+)
 
 
 class PrometheusTelemetry:
@@ -247,6 +272,11 @@ class PrometheusTelemetry:
             status=event.error_type,
         ).inc()
 
+    def on_cache(self, event: HttpCacheEvent) -> None:
+        if not self._enabled:
+            return
+        _CACHE_COUNTER.labels(host=event.host, outcome=event.outcome).inc()
+
 
 class TracingTelemetry:
     """Telemetry helper that emits OpenTelemetry spans for HTTP requests."""
@@ -376,10 +406,14 @@ class CompositeTelemetry:
     def on_error(self, event: HttpErrorEvent) -> None:
         self._dispatch("on_error", event)
 
+    def on_cache(self, event: HttpCacheEvent) -> None:
+        self._dispatch("on_cache", event)
+
 
 __all__ = [
     "CompositeTelemetry",
     "HttpBackoffEvent",
+    "HttpCacheEvent",
     "HttpErrorEvent",
     "HttpEvent",
     "HttpRequestEvent",
@@ -4,12 +4,14 @@ import hashlib
 import json
 import re
 import unicodedata
-from typing import Mapping, Sequence
+import xml.etree.ElementTree as ET
+from typing import Collection, Iterator, Mapping, Sequence
 
 from langdetect import detect
 from Medical_KG.ingestion.types import JSONMapping, JSONSequence, JSONValue
 
 LANGUAGE_PATTERN = re.compile(r"^[a-z]{2}")
+XML_FEED_CHUNK_SIZE = 64 * 1024
 
 
 def normalize_text(value: str) -> str:
@@ -84,3 +86,39 @@ def ensure_json_value(value: object, *, context: str) -> JSONValue:
     raise TypeError(
         f"{context} expected a JSON-serializable value, received {type(value).__name__}"
     )
+
+
+def iter_xml_elements(
+    xml: str | bytes,
+    tags: Collection[str],
+    *,
+    chunk_size: int = XML_FEED_CHUNK_SIZE,
+) -> Iterator[ET.Element]:
+    """Yield elements whose local tag name is in ``tags`` as soon as they close.
+
+    The payload is fed to an incremental parser in ``chunk_size`` slices and
+    every yielded element is detached from its parent, so the partially built
+    document never retains more than the element currently being parsed.
+    Matching elements are returned intact for the caller to inspect; target
+    tags must not nest inside one another.
+    """
+
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list[ET.Element] = []
+
+    def drain() -> Iterator[ET.Element]:
+        for event, element in parser.read_events():
+            if event == "start":
+                stack.append(element)
+                continue
+            stack.pop()
+            if element.tag.rsplit("}", 1)[-1] in tags:
+                if stack:
+                    stack[-1].remove(element)
+                yield element
+
+    for offset in range(0, len(xml), chunk_size):
+        parser.feed(xml[offset : offset + chunk_size])
+        yield from drain()
+    parser.close()
+    yield from drain()
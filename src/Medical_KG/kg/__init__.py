@@ -1,5 +1,6 @@
 """Knowledge graph schema management and writers."""
 
+from .bulk import BulkWriteStats, UnwindBatchWriter
 from .fhir import EvidenceExporter
 from .query import KgQueryApi, Query
 from .schema import CDKOSchema
@@ -8,6 +9,7 @@ from .validators import KgValidationError, KgValidator
 from .writer import KnowledgeGraphWriter
 
 __all__ = [
+    "BulkWriteStats",
     "CDKOSchema",
     "KnowledgeGraphWriter",
     "KgValidator",
@@ -18,4 +20,5 @@ __all__ = [
     "KgWriteService",
     "KgWriteResult",
     "KgWriteFailure",
+    "UnwindBatchWriter",
 ]
@@ -2,28 +2,57 @@
 
 from __future__ import annotations
 
-from typing import Mapping
+from typing import Mapping, Sequence
 
 
-def merge_nodes_statement(label: str, *, batch_size: int = 1000) -> str:
-    """Return an APOC `apoc.periodic.iterate` statement for node merges."""
+def merge_nodes_statement(label: str | Sequence[str], *, batch_size: int = 1000) -> str:
+    """Return an APOC `apoc.periodic.iterate` statement for node merges.
 
+    ``row.props`` is applied both when a node is created and when an existing one matches,
+    mirroring ``MERGE ... SET n += row.props``.
+    """
+
+    labels = [label] if isinstance(label, str) else list(label)
+    label_list = ", ".join(f'"{name}"' for name in labels)
     return (
         "CALL apoc.periodic.iterate("
         "'UNWIND $rows AS row RETURN row', "
-        f"'CALL apoc.merge.node([\"{label}\"], row.keys, row.props)', "
-        f"{{batchSize: {batch_size}, parallel: false}})"
+        f"'CALL apoc.merge.node([{label_list}], row.keys, row.props, row.props) "
+        "YIELD node RETURN count(node)', "
+        f"{{batchSize: {batch_size}, parallel: false, params: {{rows: $rows}}}})"
     )
 
 
-def merge_relationships_statement(rel_type: str, *, batch_size: int = 1000) -> str:
-    """Return an APOC statement that merges relationships in batches."""
-
+def merge_relationships_statement(
+    rel_type: str,
+    *,
+    batch_size: int = 1000,
+    start: tuple[str, str] | None = None,
+    end: tuple[str, str] | None = None,
+) -> str:
+    """Return an APOC statement that merges relationships in batches.
+
+    When ``start``/``end`` ``(label, key)`` pairs are given, rows carry endpoint key values in
+    ``row.start``/``row.end`` and properties in ``row.props``; otherwise rows must already carry
+    node references.
+    """
+
+    if start is not None and end is not None:
+        inner = (
+            f"MATCH (a:{start[0]} {{{start[1]}: row.start}}), (b:{end[0]} {{{end[1]}: row.end}}) "
+            f'CALL apoc.merge.relationship(a, "{rel_type}", {{}}, row.props, b, row.props) '
+            "YIELD rel RETURN count(rel)"
+        )
+    else:
+        inner = (
+            f'CALL apoc.merge.relationship(row.start, "{rel_type}", row.rel_props, '
+            "row.endProps, row.end)"
+        )
     return (
         "CALL apoc.periodic.iterate("
         "'UNWIND $rows AS row RETURN row', "
-        f"'CALL apoc.merge.relationship(row.start, \"{rel_type}\", row.rel_props, row.endProps, row.end)', "
-        f"{{batchSize: {batch_size}, parallel: false}})"
+        f"'{inner}', "
+        f"{{batchSize: {batch_size}, parallel: false, params: {{rows: $rows}}}})"
     )
 
 
@@ -0,0 +1,216 @@
+"""Buffered ``UNWIND`` writer that batches node and relationship merges for Neo4j."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Protocol, Sequence
+
+from .batch import merge_nodes_statement, merge_relationships_statement
+
+_TRANSIENT_ERROR_NAMES = frozenset({"TransientError", "ServiceUnavailable", "SessionExpired"})
+
+
+class Neo4jSession(Protocol):  # pragma: no cover - interface definition
+    def run(self, query: str, parameters: Mapping[str, Any] | None = None) -> Any: ...
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return ``True`` for errors that are worth retrying with the same batch.
+
+    Matches the Neo4j driver's transient/connection exceptions by class name so the driver
+    does not need to be importable, plus plain connection and timeout errors.
+    """
+
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+@dataclass(slots=True)
+class BulkWriteStats:
+    """Counters describing the work performed by an :class:`UnwindBatchWriter`."""
+
+    statements: int = 0
+    rows: int = 0
+    retries: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _NodeGroup:
+    labels: tuple[str, ...]
+    key: str
+
+
+@dataclass(frozen=True, slots=True)
+class _RelationshipGroup:
+    rel_type: str
+    start_label: str
+    start_key: str
+    end_label: str
+    end_key: str
+
+
+class UnwindBatchWriter:
+    """Accumulate merge rows and flush them as parameterised ``UNWIND $rows`` statements.
+
+    Rows are grouped by node labels or relationship type so every flush issues one statement
+    per group and batch rather than one round trip per element. Node groups are always flushed
+    before relationship groups so relationship ``MATCH`` clauses find their endpoints.
+    """
+
+    def __init__(
+        self,
+        session: Neo4jSession,
+        *,
+        batch_size: int = 1000,
+        use_apoc: bool = False,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.1,
+        retryable: Callable[[BaseException], bool] = is_transient_error,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        self._session = session
+        self._batch_size = batch_size
+        self._use_apoc = use_apoc
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._retryable = retryable
+        self._sleep = sleep
+        self._nodes: dict[_NodeGroup, list[dict[str, Any]]] = {}
+        self._relationships: dict[_RelationshipGroup, list[dict[str, Any]]] = {}
+        self.stats = BulkWriteStats()
+
+    def __enter__(self) -> UnwindBatchWriter:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows that have not been written yet."""
+
+        return sum(len(rows) for rows in self._nodes.values()) + sum(
+            len(rows) for rows in self._relationships.values()
+        )
+
+    def merge_node(
+        self,
+        labels: str | Sequence[str],
+        key: str,
+        value: Any,
+        props: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Queue ``MERGE (n:labels {key: value}) SET n += props``."""
+
+        label_tuple = (labels,) if isinstance(labels, str) else tuple(labels)
+        if not label_tuple:
+            raise ValueError("at least one node label is required")
+        group = _NodeGroup(label_tuple, key)
+        rows = self._nodes.setdefault(group, [])
+        rows.append({"keys": {key: value}, "props": dict(props or {})})
+        if len(rows) >= self._batch_size:
+            self._flush_nodes(group)
+
+    def merge_relationship(
+        self,
+        rel_type: str,
+        start: tuple[str, str, Any],
+        end: tuple[str, str, Any],
+        props: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Queue a relationship merge between existing nodes.
+
+        ``start`` and ``end`` are ``(label, key, value)`` triples identifying the endpoints.
+        """
+
+        start_label, start_key, start_value = start
+        end_label, end_key, end_value = end
+        group = _RelationshipGroup(rel_type, start_label, start_key, end_label, end_key)
+        rows = self._relationships.setdefault(group, [])
+        rows.append({"start": start_value, "end": end_value, "props": dict(props or {})})
+        if len(rows) >= self._batch_size:
+            # Endpoints may still be buffered; write them first so MATCH succeeds.
+            self._flush_all_nodes()
+            self._flush_relationships(group)
+
+    def flush(self) -> None:
+        """Write every buffered row, nodes first."""
+
+        self._flush_all_nodes()
+        for group in list(self._relationships):
+            self._flush_relationships(group)
+
+    def _flush_all_nodes(self) -> None:
+        for group in list(self._nodes):
+            self._flush_nodes(group)
+
+    def _flush_nodes(self, group: _NodeGroup) -> None:
+        rows = self._nodes.pop(group, [])
+        if rows:
+            self._execute(self._node_statement(group), rows)
+
+    def _flush_relationships(self, group: _RelationshipGroup) -> None:
+        rows = self._relationships.pop(group, [])
+        if rows:
+            self._execute(self._relationship_statement(group), rows)
+
+    def _node_statement(self, group: _NodeGroup) -> str:
+        if self._use_apoc:
+            return merge_nodes_statement(group.labels, batch_size=self._batch_size)
+        labels = ":".join(group.labels)
+        return (
+            "UNWIND $rows AS row "
+            f"MERGE (n:{labels} {{{group.key}: row.keys.{group.key}}}) "
+            "SET n += row.props"
+        )
+
+    def _relationship_statement(self, group: _RelationshipGroup) -> str:
+        if self._use_apoc:
+            return merge_relationships_statement(
+                group.rel_type,
+                batch_size=self._batch_size,
+                start=(group.start_label, group.start_key),
+                end=(group.end_label, group.end_key),
+            )
+        return (
+            "UNWIND $rows AS row "
+            f"MATCH (a:{group.start_label} {{{group.start_key}: row.start}}), "
+            f"(b:{group.end_label} {{{group.end_key}: row.end}}) "
+            f"MERGE (a)-[r:{group.rel_type}]->(b) "
+            "SET r += row.props"
+        )
+
+    def _execute(self, statement: str, rows: list[dict[str, Any]]) -> None:
+        for offset in range(0, len(rows), self._batch_size):
+            batch = rows[offset : offset + self._batch_size]
+            self._run_with_retry(statement, batch)
+            self.stats.statements += 1
+            self.stats.rows += len(batch)
+
+    def _run_with_retry(self, statement: str, rows: list[dict[str, Any]]) -> None:
+        attempt = 0
+        while True:
+            try:
+                self._session.run(statement, {"rows": rows})
+                return
+            except Exception as exc:
+                if attempt >= self._max_retries or not self._retryable(exc):
+                    raise
+                self.stats.retries += 1
+                self._sleep(self._backoff_seconds * (2**attempt))
+                attempt += 1
+
+
+__all__ = [
+    "BulkWriteStats",
+    "Neo4jSession",
+    "UnwindBatchWriter",
+    "is_transient_error",
+]
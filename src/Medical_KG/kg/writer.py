@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Mapping, MutableMapping
+from typing import Any, Callable, Dict, Iterable, Mapping, MutableMapping, Sequence
 
 
 @dataclass(slots=True)
@@ -50,26 +51,115 @@ RELATIONSHIP_ENDPOINTS: Mapping[str, tuple[str, str, str, str]] = {
 }
 
 
+_PARAMETER = re.compile(r"\$(\w+)")
+
+
+def _unwind_template(cypher: str) -> tuple[str, tuple[str, ...]]:
+    """Rewrite a parameterised statement to read its parameters from ``row``."""
+
+    names = tuple(dict.fromkeys(_PARAMETER.findall(cypher)))
+    return "UNWIND $rows AS row " + _PARAMETER.sub(r"row.\1", cypher), names
+
+
 class KnowledgeGraphWriter:
-    """Generates idempotent Cypher statements for Neo4j upserts."""
+    """Generates idempotent Cypher statements for Neo4j upserts.
+
+    Node upserts are collapsed by ``(label, key)`` with later properties overriding earlier
+    ones, and :attr:`statements` lists them ahead of relationship statements. :meth:`compile`
+    groups pending statements by Cypher template into ``UNWIND $rows`` batches. When a
+    ``sink`` is given, the writer compiles and hands batches to it whenever ``max_pending``
+    statements are buffered, so long extraction runs never hold every statement in memory.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        sink: Callable[[Sequence[WriteStatement]], None] | None = None,
+        max_pending: int | None = None,
+        batch_size: int = 1000,
+    ) -> None:
+        if max_pending is not None and max_pending <= 0:
+            raise ValueError("max_pending must be positive")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._nodes: dict[tuple[str, Any], WriteStatement] = {}
         self._statements: list[WriteStatement] = []
+        self._sink = sink
+        self._max_pending = max_pending
+        self._batch_size = batch_size
 
     @property
     def statements(self) -> Iterable[WriteStatement]:
-        return list(self._statements)
+        return [*self._nodes.values(), *self._statements]
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered (deduplicated) statements."""
+
+        return len(self._nodes) + len(self._statements)
 
     def clear(self) -> None:
+        self._nodes.clear()
         self._statements.clear()
 
+    def compile(self, *, batch_size: int | None = None) -> list[WriteStatement]:
+        """Group pending statements into ``UNWIND $rows`` batches, nodes first.
+
+        Statements sharing a Cypher template become one statement per ``batch_size`` rows;
+        each row carries only the parameters its template references.
+        """
+
+        size = batch_size or self._batch_size
+        groups: dict[str, list[Mapping[str, Any]]] = {}
+        for statement in self.statements:
+            groups.setdefault(statement.cypher, []).append(statement.parameters)
+        compiled: list[WriteStatement] = []
+        for cypher, parameter_sets in groups.items():
+            template, names = _unwind_template(cypher)
+            rows = [{name: params.get(name) for name in names} for params in parameter_sets]
+            for offset in range(0, len(rows), size):
+                batch = rows[offset : offset + size]
+                compiled.append(WriteStatement(cypher=template, parameters={"rows": batch}))
+        return compiled
+
+    def drain(self, *, batch_size: int | None = None) -> list[WriteStatement]:
+        """Compile and clear pending statements."""
+
+        compiled = self.compile(batch_size=batch_size)
+        self.clear()
+        return compiled
+
+    def flush(self) -> int:
+        """Send compiled batches to the sink and return how many statements were emitted."""
+
+        if self._sink is None:
+            raise RuntimeError("flush() requires a sink; use drain() to collect statements")
+        if not self.pending:
+            return 0
+        compiled = self.drain()
+        self._sink(compiled)
+        return len(compiled)
+
+    def _append(self, statement: WriteStatement) -> None:
+        self._statements.append(statement)
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self._sink is not None and self._max_pending is not None:
+            if self.pending >= self._max_pending:
+                self.flush()
+
     def _merge_node(self, label: str, payload: Mapping[str, Any]) -> None:
         key = NODE_KEYS.get(label)
         if key is None:
             raise ValueError(f"Unknown node label '{label}'")
         if key not in payload:
             raise ValueError(f"Payload for {label} missing key '{key}'")
+        existing = self._nodes.get((label, payload[key]))
         props = dict(payload)
+        if existing is not None:
+            # ``SET n += $props`` applied twice equals one SET with the merged mapping.
+            props = {**existing.parameters["props"], **props}
         parameters: Dict[str, Any] = {"props": props}
         if key in props:
             parameters[key] = props[key]
@@ -77,7 +167,8 @@ class KnowledgeGraphWriter:
             if alias in props and alias not in parameters:
                 parameters[alias] = props[alias]
         cypher = f"MERGE (n:{label} {{{key}: $props.{key}}}) SET n += $props"
-        self._statements.append(WriteStatement(cypher=cypher, parameters=parameters))
+        self._nodes[(label, payload[key])] = WriteStatement(cypher=cypher, parameters=parameters)
+        self._maybe_flush()
 
     def write_document(self, payload: Mapping[str, Any]) -> None:
         self._merge_node("Document", payload)
@@ -102,7 +193,7 @@ class KnowledgeGraphWriter:
             if order is not None:
                 cypher += " SET r.order = $order"
                 params["order"] = order
-            self._statements.append(WriteStatement(cypher=cypher, parameters=params))
+            self._append(WriteStatement(cypher=cypher, parameters=params))
 
     def write_concept(self, payload: Mapping[str, Any]) -> None:
         self._merge_node("Concept", payload)
@@ -116,7 +207,7 @@ class KnowledgeGraphWriter:
             "MERGE (i:Identifier {scheme: $scheme, value: $value}) SET i += $props "
             "WITH i MATCH (d:Document {uri: $doc_uri}) MERGE (d)-[:HAS_IDENTIFIER]->(i)"
         )
-        self._statements.append(
+        self._append(
             WriteStatement(
                 cypher=cypher,
                 parameters={
@@ -135,7 +226,7 @@ class KnowledgeGraphWriter:
                 "MATCH (d:Document {uri: $doc_uri}) MATCH (s:Study {nct_id: $nct_id}) "
                 "MERGE (d)-[:DESCRIBES]->(s)"
             )
-            self._statements.append(
+            self._append(
                 WriteStatement(
                     cypher=cypher, parameters={"doc_uri": document_uri, "nct_id": payload["nct_id"]}
                 )
@@ -148,7 +239,7 @@ class KnowledgeGraphWriter:
             "MERGE (s)-[:HAS_ARM]->(a)"
         )
         params = {"nct_id": study_nct_id, "arm_id": payload["id"]}
-        self._statements.append(WriteStatement(cypher=cypher, parameters=params))
+        self._append(WriteStatement(cypher=cypher, parameters=params))
 
     def write_intervention(
         self,
@@ -166,7 +257,7 @@ class KnowledgeGraphWriter:
         if dose:
             cypher += " SET r += $dose"
             params["dose"] = dict(dose)
-        self._statements.append(WriteStatement(cypher=cypher, parameters=params))
+        self._append(WriteStatement(cypher=cypher, parameters=params))
 
     def write_drug(self, payload: Mapping[str, Any]) -> None:
         self._merge_node("Drug", payload)
@@ -181,7 +272,7 @@ class KnowledgeGraphWriter:
                 "MATCH (s:Study {nct_id: $nct_id}) MATCH (o:Outcome {id: $outcome_id}) "
                 "MERGE (s)-[:HAS_OUTCOME]->(o)"
             )
-            self._statements.append(
+            self._append(
                 WriteStatement(
                     cypher=cypher, parameters={"nct_id": study_nct_id, "outcome_id": payload["id"]}
                 )
@@ -200,7 +291,7 @@ class KnowledgeGraphWriter:
                 "MATCH (d:Document {uri: $doc_uri}) MATCH (ev:EvidenceVariable {id: $ev_id}) "
                 "MERGE (d)-[:REPORTS]->(ev)"
             )
-            self._statements.append(
+            self._append(
                 WriteStatement(
                     cypher=cypher, parameters={"doc_uri": document_uri, "ev_id": payload["id"]}
                 )
@@ -225,7 +316,7 @@ class KnowledgeGraphWriter:
         self._merge_node("Evidence", payload)
         confidence = payload.get("confidence")
         rel_props = {"confidence": confidence} if confidence is not None else {}
-        self._statements.append(
+        self._append(
             WriteStatement(
                 cypher=(
                     "MATCH (e:Evidence {id: $evidence_id}) MATCH (o:Outcome {id: $outcome_id}) "
@@ -238,7 +329,7 @@ class KnowledgeGraphWriter:
                 },
             )
         )
-        self._statements.append(
+        self._append(
             WriteStatement(
                 cypher=(
                     "MATCH (e:Evidence {id: $evidence_id}) MATCH (v:EvidenceVariable {id: $variable_id}) "
@@ -248,7 +339,7 @@ class KnowledgeGraphWriter:
             )
         )
         if study_nct_id:
-            self._statements.append(
+            self._append(
                 WriteStatement(
                     cypher=(
                         "MATCH (s:Study {nct_id: $nct_id}) MATCH (e:Evidence {id: $evidence_id}) "
@@ -281,13 +372,13 @@ class KnowledgeGraphWriter:
             "ae_id": payload["id"],
             "rel_props": rel_props,
         }
-        self._statements.append(WriteStatement(cypher=cypher, parameters=params))
+        self._append(WriteStatement(cypher=cypher, parameters=params))
         if arm_id:
             cypher_arm = (
                 "MATCH (a:Arm {id: $arm_id}) MATCH (ae:AdverseEvent {id: $ae_id}) "
                 "MERGE (a)-[:HAS_AE]->(ae)"
             )
-            self._statements.append(
+            self._append(
                 WriteStatement(
                     cypher=cypher_arm, parameters={"arm_id": arm_id, "ae_id": payload["id"]}
                 )
@@ -302,7 +393,7 @@ class KnowledgeGraphWriter:
             "MERGE (s)-[:HAS_ELIGIBILITY]->(e)"
         )
         params = {"constraint_id": payload["id"], "nct_id": study_nct_id}
-        self._statements.append(WriteStatement(cypher=cypher, parameters=params))
+        self._append(WriteStatement(cypher=cypher, parameters=params))
 
     def write_extraction_activity(self, payload: Mapping[str, Any]) -> None:
         self._merge_node("ExtractionActivity", payload)
@@ -325,7 +416,7 @@ class KnowledgeGraphWriter:
         params = {"node_key": node_id, "activity_id": activity_id}
         if key != "id":
             params[key] = node_id
-        self._statements.append(WriteStatement(cypher=cypher, parameters=params))
+        self._append(WriteStatement(cypher=cypher, parameters=params))
 
     def write_relationship(
         self,
@@ -352,7 +443,7 @@ class KnowledgeGraphWriter:
             f"MATCH (end:{end_label} {{{end_key}: $end_value}}) "
             f"MERGE (start)-[:{rel_type}]->(end)"
         )
-        self._statements.append(
+        self._append(
             WriteStatement(
                 cypher=cypher,
                 parameters={
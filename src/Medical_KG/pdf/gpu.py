@@ -5,17 +5,19 @@ from __future__ import annotations
 import os
 import subprocess
 from dataclasses import dataclass
-from typing import Protocol
+
+from Medical_KG.embeddings.gpu import (
+    CommandRunner,
+    GPURequirementError,
+    device_health_monitor,
+    query_gpu_names,
+)
 
 
 class GpuNotAvailableError(RuntimeError):
     pass
 
 
-class CommandRunner(Protocol):  # pragma: no cover - interface definition
-    def run(self, command: list[str]) -> subprocess.CompletedProcess[str]: ...
-
-
 @dataclass(slots=True)
 class SubprocessRunner(CommandRunner):
     def run(self, command: list[str]) -> subprocess.CompletedProcess[str]:
@@ -23,14 +25,13 @@ class SubprocessRunner(CommandRunner):
 
 
 def detect_gpu(*, runner: CommandRunner | None = None) -> bool:
-    runner = runner or SubprocessRunner()
+    # An explicit runner is a one-off probe; otherwise reuse the shared cached status.
+    if runner is None:
+        return device_health_monitor().status().available
     try:
-        result = runner.run(["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"])
-    except FileNotFoundError:
-        return False
-    if result.returncode != 0:
+        return bool(query_gpu_names(runner))
+    except GPURequirementError:
         return False
-    return bool(result.stdout.strip())
 
 
 def ensure_gpu(require_flag: bool = True, *, runner: CommandRunner | None = None) -> None:
@@ -41,4 +42,10 @@ def ensure_gpu(require_flag: bool = True, *, runner: CommandRunner | None = None
         raise GpuNotAvailableError("GPU required for PDF processing but not available")
 
 
-__all__ = ["ensure_gpu", "detect_gpu", "GpuNotAvailableError", "CommandRunner", "SubprocessRunner"]
+__all__ = [
+    "ensure_gpu",
+    "detect_gpu",
+    "GpuNotAvailableError",
+    "CommandRunner",
+    "SubprocessRunner",
+]
@@ -88,6 +88,7 @@ class RetrievalResultModel(BaseModel):
 class TimingModel(BaseModel):
     component: str
     duration_ms: float
+    degraded: bool = False
 
     @classmethod
     def from_dataclass(cls, timing: RetrieverTiming) -> "TimingModel":
@@ -2,18 +2,77 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from threading import Lock
-from typing import Callable, Dict, Generic, Hashable, Protocol, TypeVar
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from threading import Event, Lock
+from time import monotonic
+from typing import Callable, Generic, Hashable, Protocol, TypeVar
+
+from Medical_KG.compat.prometheus import Counter, Gauge
 
 T = TypeVar("T")
 
+CACHE_REQUESTS = Counter(
+    "retrieval_cache_requests_total",
+    "Retrieval cache lookups by outcome",
+    ("cache", "outcome"),
+)
+CACHE_EVICTIONS = Counter(
+    "retrieval_cache_evictions_total",
+    "Entries removed from retrieval caches",
+    ("cache", "reason"),
+)
+CACHE_BYTES = Gauge(
+    "retrieval_cache_bytes",
+    "Estimated bytes held by a retrieval cache",
+    ("cache",),
+)
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def estimate_size(value: object, *, _depth: int = 0) -> int:
+    """Approximate the memory footprint of ``value`` in bytes.
+
+    Containers and dataclasses are walked a few levels deep so embeddings
+    (lists of floats) and retrieval responses are charged for their contents,
+    not just their outer object.
+    """
+
+    size = sys.getsizeof(value)
+    if _depth >= 4 or isinstance(value, (str, bytes, bytearray, int, float, bool)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(key, _depth=_depth + 1) + estimate_size(item, _depth=_depth + 1)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _depth=_depth + 1) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return size + sum(
+            estimate_size(getattr(value, item.name), _depth=_depth + 1) for item in fields(value)
+        )
+    return size
+
 
 @dataclass(slots=True)
 class _Entry(Generic[T]):
     value: T
-    expires_at: datetime
+    expires_at: float
+    size: int
+
+
+class _Flight(Generic[T]):
+    """A factory call in progress that concurrent misses wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.value: T | None = None
+        self.error: BaseException | None = None
 
 
 class CacheProtocol(Protocol[T]):
@@ -31,47 +90,150 @@ class CacheProtocol(Protocol[T]):
 
 
 class TTLCache(Generic[T]):
-    """Minimal thread-safe TTL cache with explicit invalidation."""
-
-    def __init__(self, ttl_seconds: int) -> None:
+    """Thread-safe LRU cache with TTL expiry, size budgets and single-flight.
+
+    Entries expire ``ttl_seconds`` after they are written, measured on the
+    monotonic clock. When more than ``max_entries`` entries or more than
+    ``max_bytes`` estimated bytes are held, the least recently used entries are
+    evicted. Concurrent :meth:`get_or_set` misses for the same key run the
+    factory once; the other callers wait for and share its result (or error).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        sizer: Callable[[object], int] = estimate_size,
+        name: str = "default",
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
         self._ttl = ttl_seconds
-        self._data: Dict[Hashable, _Entry[T]] = {}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizer = sizer
+        self._name = name
+        self._clock = clock
+        self._data: OrderedDict[Hashable, _Entry[T]] = OrderedDict()
+        self._inflight: dict[Hashable, _Flight[T]] = {}
+        self._bytes = 0
+        self._next_sweep = clock() + max(ttl_seconds, 0)
         self._lock = Lock()
 
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
     def get_or_set(self, key: Hashable, factory: Callable[[], T]) -> T:
-        now = datetime.now(timezone.utc)
         with self._lock:
-            entry = self._data.get(key)
-            if entry and entry.expires_at > now:
+            entry = self._lookup(key, self._clock())
+            if entry is not None:
+                self._record("hit")
                 return entry.value
-        value = factory()
-        expires_at = now + timedelta(seconds=self._ttl)
-        with self._lock:
-            self._data[key] = _Entry(value=value, expires_at=expires_at)
-        return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = _Flight()
+                self._inflight[key] = flight
+        if not leader:
+            self._record("coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value  # type: ignore[return-value]
+        self._record("miss")
+        try:
+            value = factory()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        else:
+            flight.value = value
+            self.set(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
 
     def get(self, key: Hashable) -> T | None:
-        now = datetime.now(timezone.utc)
         with self._lock:
-            entry = self._data.get(key)
-            if entry and entry.expires_at > now:
-                return entry.value
-            if entry:
-                del self._data[key]
-        return None
+            entry = self._lookup(key, self._clock())
+        self._record("hit" if entry is not None else "miss")
+        return entry.value if entry is not None else None
 
     def set(self, key: Hashable, value: T) -> None:
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self._ttl)
+        size = self._sizer(value)
         with self._lock:
-            self._data[key] = _Entry(value=value, expires_at=expires_at)
+            now = self._clock()
+            self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                CACHE_EVICTIONS.labels(cache=self._name, reason="oversize").inc()
+            else:
+                self._data[key] = _Entry(value=value, expires_at=now + self._ttl, size=size)
+                self._bytes += size
+            if now >= self._next_sweep:
+                self._sweep(now)
+            self._enforce_budget()
+            CACHE_BYTES.labels(cache=self._name).set(self._bytes)
 
     def invalidate(self, key: Hashable) -> None:
         with self._lock:
-            self._data.pop(key, None)
+            self._remove(key)
+            CACHE_BYTES.labels(cache=self._name).set(self._bytes)
 
     def clear(self) -> None:
         with self._lock:
             self._data.clear()
-
-
-__all__ = ["TTLCache", "CacheProtocol"]
+            self._bytes = 0
+            CACHE_BYTES.labels(cache=self._name).set(0)
+
+    def _lookup(self, key: Hashable, now: float) -> _Entry[T] | None:
+        """Return a live entry and mark it most recently used; caller holds the lock."""
+
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            CACHE_EVICTIONS.labels(cache=self._name, reason="expired").inc()
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired entries that were never read again."""
+
+        expired = [key for key, entry in self._data.items() if entry.expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        if expired:
+            CACHE_EVICTIONS.labels(cache=self._name, reason="expired").inc(len(expired))
+        self._next_sweep = now + max(self._ttl, 0)
+
+    def _enforce_budget(self) -> None:
+        evicted = 0
+        while self._data and (
+            (self._max_entries is not None and len(self._data) > self._max_entries)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            key, entry = self._data.popitem(last=False)
+            self._bytes -= entry.size
+            evicted += 1
+        if evicted:
+            CACHE_EVICTIONS.labels(cache=self._name, reason="capacity").inc(evicted)
+
+    def _record(self, outcome: str) -> None:
+        CACHE_REQUESTS.labels(cache=self._name, outcome=outcome).inc()
+
+
+__all__ = ["TTLCache", "CacheProtocol", "estimate_size"]
@@ -13,6 +13,7 @@ from .types import JSONValue, MultiGranularityConfig, NeighborMergeConfig
 class RetrieverTiming:
     component: str
     duration_ms: float
+    degraded: bool = False
 
 
 @dataclass(slots=True)
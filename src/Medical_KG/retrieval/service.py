@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from time import perf_counter
-from typing import Iterable, Mapping, Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Sequence
 
-from .caching import TTLCache
+from .caching import DEFAULT_MAX_ENTRIES, TTLCache
 from .clients import EmbeddingClient, OpenSearchClient, Reranker, SpladeEncoder, VectorSearchClient
 from .fusion import reciprocal_rank_fusion, weighted_fusion
 from .intent import IntentClassifier, IntentRule
@@ -26,6 +31,13 @@ from .neighbor import NeighborMerger
 from .ontology import OntologyExpander
 from .types import FusionScores, JSONValue, MultiGranularityConfig, NeighborMergeConfig
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from Medical_KG.embeddings.store import EmbeddingStore
+
+LOGGER = logging.getLogger(__name__)
+
+_RetrieverJob = Callable[[], list[RetrievalResult]]
+
 
 @dataclass(slots=True)
 class RetrieverConfig:
@@ -43,6 +55,10 @@ class RetrieverConfig:
     expansion_cache_seconds: int
     slo_ms: float
     multi_granularity: MultiGranularityConfig
+    component_budget_ratio: float = 0.6
+    max_fanout_workers: int = 8
+    cache_max_entries: int = DEFAULT_MAX_ENTRIES
+    cache_max_bytes: int | None = 64 * 1024 * 1024
 
 
 class RetrievalService:
@@ -57,18 +73,120 @@ class RetrievalService:
         config: RetrieverConfig,
         reranker: Reranker | None = None,
         ontology: OntologyExpander | None = None,
+        executor: Executor | None = None,
+        embedding_store: EmbeddingStore | None = None,
     ) -> None:
+        """Create the service.
+
+        Retrievers are synchronous clients, so :meth:`retrieve` fans them out
+        on ``executor`` (by default a thread pool bounded by
+        ``config.max_fanout_workers``) and waits at most
+        ``config.slo_ms * config.component_budget_ratio`` for each of them.
+        Query embeddings are also persisted in ``embedding_store`` when the
+        embedder exposes ``model`` and ``dimension`` attributes. The default
+        pool is shut down by :meth:`close` (or ``async with``); an injected
+        ``executor`` is left to its owner.
+        """
+
         self._os = opensearch
         self._vector = vector
         self._embedder = embedder
+        self._embedding_store = embedding_store
         self._splade_encoder = splade
         self._intent = IntentClassifier(intents)
         self._config = config
         self._reranker = reranker
         self._ontology = ontology or OntologyExpander()
-        self._query_cache = TTLCache[RetrievalResponse](config.query_cache_seconds)
-        self._expansion_cache = TTLCache[Mapping[str, float]](config.expansion_cache_seconds)
-        self._embedding_cache = TTLCache[Sequence[float]](config.embedding_cache_seconds)
+        max_entries = config.cache_max_entries
+        max_bytes = config.cache_max_bytes
+        self._query_cache = TTLCache[RetrievalResponse](
+            config.query_cache_seconds,
+            name="query",
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+        self._expansion_cache = TTLCache[Mapping[str, float]](
+            config.expansion_cache_seconds,
+            name="expansion",
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+        self._embedding_cache = TTLCache[Sequence[float]](
+            config.embedding_cache_seconds,
+            name="embedding",
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max(config.max_fanout_workers, 1),
+            thread_name_prefix="retrieval-fanout",
+        )
+
+    def close(self) -> None:
+        """Shut down the fan-out thread pool owned by the service."""
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> RetrievalService:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _component_budget(self) -> float:
+        """Seconds each retriever may run before it is dropped from the response."""
+
+        return max(self._config.slo_ms * self._config.component_budget_ratio, 1.0) / 1000
+
+    async def _run_component(
+        self, component: str, jobs: Sequence[_RetrieverJob], timeout: float
+    ) -> tuple[list[RetrievalResult], RetrieverTiming]:
+        """Run ``jobs`` concurrently, keeping whatever finishes within ``timeout``.
+
+        A retriever that times out or raises contributes no results; the
+        request still succeeds with the remaining components. Abandoned jobs
+        keep their worker thread until the client call returns.
+        """
+
+        loop = asyncio.get_running_loop()
+        started = perf_counter()
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(loop.run_in_executor(self._executor, job), timeout) for job in jobs),
+            return_exceptions=True,
+        )
+        results: list[RetrievalResult] = []
+        degraded = False
+        for outcome in outcomes:
+            if isinstance(outcome, asyncio.TimeoutError):
+                degraded = True
+                LOGGER.warning(
+                    "Retriever exceeded its latency budget",
+                    extra={"component": component, "budget_ms": timeout * 1000},
+                )
+            elif isinstance(outcome, Exception):
+                degraded = True
+                LOGGER.warning(
+                    "Retriever failed; continuing without it",
+                    extra={"component": component},
+                    exc_info=outcome,
+                )
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.extend(outcome)
+        timing = RetrieverTiming(
+            component=component,
+            duration_ms=(perf_counter() - started) * 1000,
+            degraded=degraded,
+        )
+        return results, timing
 
     def _context(self, request: RetrievalRequest) -> RetrieverContext:
         intent = request.intent or self._intent.detect(request.query)
@@ -105,7 +223,20 @@ class RetrievalService:
 
     def _embed(self, query: str) -> Sequence[float]:
         key = hashlib.sha256(query.encode("utf-8")).hexdigest()
-        return self._embedding_cache.get_or_set(key, lambda: list(self._embedder.embed(query)))
+        return self._embedding_cache.get_or_set(key, lambda: self._embed_uncached(query))
+
+    def _embed_uncached(self, query: str) -> list[float]:
+        store = self._embedding_store
+        model = getattr(self._embedder, "model", None)
+        dimension = getattr(self._embedder, "dimension", None)
+        if store is None or not isinstance(model, str) or not isinstance(dimension, int):
+            return list(self._embedder.embed(query))
+        cached = store.get_dense(model, dimension, [query])[0]
+        if cached is not None:
+            return cached
+        vector = list(self._embedder.embed(query))
+        store.put_dense(model, dimension, [query], [vector])
+        return vector
 
     def _bm25(
         self,
@@ -277,20 +408,18 @@ class RetrievalService:
         def record(component: str, elapsed: float) -> None:
             timings.append(RetrieverTiming(component=component, duration_ms=elapsed * 1000))
 
-        bm25_results: list[RetrievalResult]
-        splade_results: list[RetrievalResult]
-        dense_results: list[RetrievalResult]
-
         expanded_terms = self._expand(request.query)
 
-        bm25_start = perf_counter()
-        bm25_results = self._bm25(
-            request.query,
-            context,
-            index=self._config.bm25_index,
-            expanded_terms=expanded_terms,
-            granularity="chunk",
-        )
+        bm25_jobs: list[_RetrieverJob] = [
+            partial(
+                self._bm25,
+                request.query,
+                context,
+                index=self._config.bm25_index,
+                expanded_terms=expanded_terms,
+                granularity="chunk",
+            )
+        ]
         multi_config = context.multi_granularity
         if multi_config.get("enabled", False):
             indexes_value = multi_config.get("indexes", {})
@@ -301,23 +430,33 @@ class RetrievalService:
             for granularity, index in indexes.items():
                 if granularity == "chunk" or not index:
                     continue
-                extra = self._bm25(
-                    request.query,
-                    context,
-                    index=index,
-                    expanded_terms=expanded_terms,
-                    granularity=str(granularity),
+                bm25_jobs.append(
+                    partial(
+                        self._bm25,
+                        request.query,
+                        context,
+                        index=index,
+                        expanded_terms=expanded_terms,
+                        granularity=str(granularity),
+                    )
                 )
-                bm25_results.extend(extra)
-        record("bm25", perf_counter() - bm25_start)
-
-        splade_start = perf_counter()
-        splade_results = self._splade(request.query, context)
-        record("splade", perf_counter() - splade_start)
-
-        dense_start = perf_counter()
-        dense_results = self._dense(request.query, context)
-        record("dense", perf_counter() - dense_start)
+        budget = self._component_budget()
+        (
+            (bm25_results, bm25_timing),
+            (splade_results, splade_timing),
+            (
+                dense_results,
+                dense_timing,
+            ),
+        ) = await asyncio.gather(
+            self._run_component("bm25", bm25_jobs, budget),
+            self._run_component("splade", [partial(self._splade, request.query, context)], budget),
+            self._run_component("dense", [partial(self._dense, request.query, context)], budget),
+        )
+        timings.extend([bm25_timing, splade_timing, dense_timing])
+        degraded_components: list[JSONValue] = [
+            timing.component for timing in timings if timing.degraded
+        ]
 
         pools: dict[str, Sequence[RetrievalResult]] = {
             "bm25": bm25_results,
@@ -369,9 +508,12 @@ class RetrievalService:
                 "feature_flags": {
                     "rerank_enabled": context.rerank_enabled,
                 },
+                "degraded_components": degraded_components,
             },
         )
-        self._query_cache.set(cache_key, response)
+        if not degraded_components:
+            # Partial answers are not cached so the next request retries every backend.
+            self._query_cache.set(cache_key, response)
         return response
 
 
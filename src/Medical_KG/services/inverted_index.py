@@ -0,0 +1,226 @@
+"""In-process inverted index with BM25 scoring for the API retrieval service."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case word tokens used for both indexing and querying."""
+
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class _Bitmap:
+    """Growable bitmap over document ordinals."""
+
+    __slots__ = ("_bits", "count")
+
+    def __init__(self) -> None:
+        self._bits = bytearray()
+        self.count = 0
+
+    def add(self, ordinal: int) -> None:
+        byte, bit = divmod(ordinal, 8)
+        if byte >= len(self._bits):
+            self._bits.extend(bytes(byte - len(self._bits) + 1))
+        if not self._bits[byte] & (1 << bit):
+            self._bits[byte] |= 1 << bit
+            self.count += 1
+
+    def discard(self, ordinal: int) -> None:
+        byte, bit = divmod(ordinal, 8)
+        if byte < len(self._bits) and self._bits[byte] & (1 << bit):
+            self._bits[byte] &= ~(1 << bit) & 0xFF
+            self.count -= 1
+
+    def __contains__(self, ordinal: int) -> bool:
+        byte, bit = divmod(ordinal, 8)
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << bit))
+
+    def __iter__(self) -> Iterator[int]:
+        for byte, value in enumerate(self._bits):
+            if not value:
+                continue
+            for bit in range(8):
+                if value & (1 << bit):
+                    yield byte * 8 + bit
+
+
+@dataclass(slots=True)
+class IndexedChunk:
+    chunk_id: str
+    facet_types: list[str]
+    snippet: str
+
+
+@dataclass(slots=True)
+class ScoredChunk:
+    chunk: IndexedChunk
+    score: float
+
+
+class InvertedIndex:
+    """Postings-list index supporting incremental upserts, deletes and BM25 top-k.
+
+    Each term maps to a postings dict of ``ordinal -> term frequency``. Facet
+    filters are answered from per-facet-type bitmaps, and queries only touch
+    the postings of their own terms, so latency scales with the number of
+    matching chunks instead of the corpus size.
+    """
+
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75, snippet_chars: int = 160) -> None:
+        self.k1 = k1
+        self.b = b
+        self._snippet_chars = snippet_chars
+        self._postings: dict[str, dict[int, int]] = {}
+        self._facets: dict[str, _Bitmap] = {}
+        self._ordinals: dict[str, int] = {}
+        self._chunks: list[IndexedChunk | None] = []
+        self._lengths: list[int] = []
+        self._terms: list[tuple[str, ...]] = []
+        self._free: list[int] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __contains__(self, chunk_id: object) -> bool:
+        return chunk_id in self._ordinals
+
+    def upsert(self, chunk_id: str, text: str, facet_types: Sequence[str] = ()) -> None:
+        """Index ``text`` for ``chunk_id``, replacing any previous version."""
+
+        self.delete(chunk_id)
+        tokens = tokenize(text)
+        frequencies = Counter(tokens)
+        chunk = IndexedChunk(
+            chunk_id=chunk_id,
+            facet_types=list(facet_types),
+            snippet=text[: self._snippet_chars],
+        )
+        if self._free:
+            ordinal = self._free.pop()
+            self._chunks[ordinal] = chunk
+            self._lengths[ordinal] = len(tokens)
+            self._terms[ordinal] = tuple(frequencies)
+        else:
+            ordinal = len(self._chunks)
+            self._chunks.append(chunk)
+            self._lengths.append(len(tokens))
+            self._terms.append(tuple(frequencies))
+        self._ordinals[chunk_id] = ordinal
+        self._total_length += len(tokens)
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[ordinal] = frequency
+        for facet_type in chunk.facet_types:
+            self._facets.setdefault(facet_type, _Bitmap()).add(ordinal)
+
+    def delete(self, chunk_id: str) -> bool:
+        """Remove ``chunk_id`` from the index; returns ``False`` if it was absent."""
+
+        ordinal = self._ordinals.pop(chunk_id, None)
+        if ordinal is None:
+            return False
+        chunk = self._chunks[ordinal]
+        for term in self._terms[ordinal]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(ordinal, None)
+            if not postings:
+                del self._postings[term]
+        if chunk is not None:
+            for facet_type in chunk.facet_types:
+                bitmap = self._facets.get(facet_type)
+                if bitmap is not None:
+                    bitmap.discard(ordinal)
+        self._total_length -= self._lengths[ordinal]
+        self._chunks[ordinal] = None
+        self._lengths[ordinal] = 0
+        self._terms[ordinal] = ()
+        self._free.append(ordinal)
+        return True
+
+    def get(self, chunk_id: str) -> IndexedChunk | None:
+        ordinal = self._ordinals.get(chunk_id)
+        return self._chunks[ordinal] if ordinal is not None else None
+
+    def search(
+        self,
+        query: str,
+        *,
+        facet_type: str | None = None,
+        top_k: int = 5,
+        facet_bonus: float = 0.0,
+    ) -> list[ScoredChunk]:
+        """Return the ``top_k`` chunks by BM25 score.
+
+        With ``facet_type`` only chunks carrying that facet are eligible and
+        each receives ``facet_bonus``; when fewer than ``top_k`` chunks match
+        the query terms, the remainder is filled with other chunks of that
+        facet type scored by the bonus alone.
+        """
+
+        if top_k <= 0 or not self._ordinals:
+            return []
+        allowed: _Bitmap | None = None
+        if facet_type is not None:
+            allowed = self._facets.get(facet_type)
+            if allowed is None or not allowed.count:
+                return []
+        scores = self._bm25(set(tokenize(query)), allowed)
+        bonus = facet_bonus if facet_type is not None else 0.0
+        ranked = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        results = [
+            ScoredChunk(chunk=self._require_chunk(ordinal), score=score + bonus)
+            for ordinal, score in ranked
+        ]
+        if allowed is not None and bonus > 0 and len(results) < top_k:
+            for ordinal in allowed:
+                if ordinal in scores:
+                    continue
+                results.append(ScoredChunk(chunk=self._require_chunk(ordinal), score=bonus))
+                if len(results) >= top_k:
+                    break
+        return results
+
+    def _bm25(self, terms: Iterable[str], allowed: _Bitmap | None) -> dict[int, float]:
+        document_count = len(self._ordinals)
+        average_length = self._total_length / document_count if document_count else 0.0
+        k1 = self.k1
+        b = self.b
+        lengths = self._lengths
+        scores: dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            frequency_docs = len(postings)
+            idf = math.log(1.0 + (document_count - frequency_docs + 0.5) / (frequency_docs + 0.5))
+            for ordinal, frequency in postings.items():
+                if allowed is not None and ordinal not in allowed:
+                    continue
+                norm = (
+                    k1 * (1.0 - b + b * lengths[ordinal] / average_length) if average_length else k1
+                )
+                scores[ordinal] = scores.get(ordinal, 0.0) + idf * frequency * (k1 + 1.0) / (
+                    frequency + norm
+                )
+        return scores
+
+    def _require_chunk(self, ordinal: int) -> IndexedChunk:
+        chunk = self._chunks[ordinal]
+        if chunk is None:  # pragma: no cover - postings are pruned on delete
+            raise KeyError(ordinal)
+        return chunk
+
+
+__all__ = ["IndexedChunk", "InvertedIndex", "ScoredChunk", "tokenize"]
@@ -5,6 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from Medical_KG.facets.models import FacetIndexRecord
+from Medical_KG.services.inverted_index import InvertedIndex
+
+FACET_MATCH_BONUS = 1.6
 
 
 @dataclass(slots=True)
@@ -16,15 +19,16 @@ class RetrievalResult:
 
 
 class RetrievalService:
-    """Scores chunks using naive BM25-like heuristics for tests."""
+    """Scores chunks with BM25 over an in-process inverted index."""
 
-    def __init__(self) -> None:
-        self._records: dict[str, FacetIndexRecord] = {}
-        self._snippets: dict[str, str] = {}
+    def __init__(self, index: InvertedIndex | None = None) -> None:
+        self._index = index or InvertedIndex()
 
     def upsert(self, record: FacetIndexRecord, snippet: str) -> None:
-        self._records[record.chunk_id] = record
-        self._snippets[record.chunk_id] = snippet
+        self._index.upsert(record.chunk_id, snippet, record.facet_types)
+
+    def delete(self, chunk_id: str) -> bool:
+        return self._index.delete(chunk_id)
 
     def search(
         self,
@@ -33,26 +37,18 @@ class RetrievalService:
         facet_type: str | None = None,
         top_k: int = 5,
     ) -> list[RetrievalResult]:
-        query_terms = {term.lower() for term in query.split()}
-        results: list[RetrievalResult] = []
-        for chunk_id, record in self._records.items():
-            if facet_type and facet_type not in record.facet_types:
-                continue
-            text = self._snippets.get(chunk_id, "")
-            tokens = text.lower().split()
-            overlap = len(query_terms.intersection(tokens))
-            facet_bonus = 0.0
-            if facet_type and facet_type in record.facet_types:
-                facet_bonus = 1.6
-            score = overlap + facet_bonus
-            if score == 0:
-                continue
-            results.append(
-                RetrievalResult(
-                    chunk_id=chunk_id,
-                    score=score,
-                    facet_types=record.facet_types,
-                    snippet=text[:160],
-                )
+        hits = self._index.search(
+            query,
+            facet_type=facet_type or None,
+            top_k=top_k,
+            facet_bonus=FACET_MATCH_BONUS,
+        )
+        return [
+            RetrievalResult(
+                chunk_id=hit.chunk.chunk_id,
+                score=hit.score,
+                facet_types=list(hit.chunk.facet_types),
+                snippet=hit.chunk.snippet,
             )
-        return sorted(results, key=lambda item: item.score, reverse=True)[:top_k]
+            for hit in hits
+        ]
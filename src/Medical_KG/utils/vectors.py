@@ -0,0 +1,99 @@
+"""Vectorized embedding math shared by chunking, indexing, and embedding clients.
+
+Embeddings travel through the pipeline as contiguous ``float32`` matrices (one
+row per text) so similarity and pooling run as single NumPy operations rather
+than Python loops over 4096-dimensional lists. Public data structures still
+expose plain ``list[float]`` vectors; :func:`as_matrix` and :func:`to_lists`
+convert between the two representations.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union, cast
+
+import numpy as np
+import numpy.typing as npt
+
+FloatMatrix = npt.NDArray[np.float32]
+VectorLike = Union[Sequence[float], npt.NDArray[np.floating]]
+MatrixLike = Union[Sequence[Sequence[float]], npt.NDArray[np.floating]]
+
+_EPSILON = 1e-12
+
+
+def as_matrix(vectors: MatrixLike | VectorLike, *, dimension: int | None = None) -> FloatMatrix:
+    """Return ``vectors`` as a C-contiguous ``(n, dimension)`` float32 matrix."""
+
+    if isinstance(vectors, np.ndarray):
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    elif len(vectors) == 0:
+        matrix = np.zeros((0, dimension or 0), dtype=np.float32)
+    else:
+        matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.ndim != 2:
+        raise ValueError(f"expected a 2-D embedding matrix, received shape {matrix.shape}")
+    return matrix
+
+
+def to_lists(matrix: FloatMatrix) -> list[list[float]]:
+    """Convert a matrix back to the list-of-lists form used by public APIs."""
+
+    return cast(list[list[float]], matrix.astype(np.float64).tolist())
+
+
+def normalize_rows(matrix: MatrixLike) -> FloatMatrix:
+    """L2-normalise each row; all-zero rows are returned unchanged."""
+
+    values = as_matrix(matrix)
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    return cast(FloatMatrix, values / np.maximum(norms, _EPSILON))
+
+
+def cosine(left: VectorLike, right: VectorLike) -> float:
+    """Cosine similarity of two vectors (0.0 when either is all zeros)."""
+
+    return float(rowwise_cosine(as_matrix(left), as_matrix(right))[0])
+
+
+def rowwise_cosine(left: MatrixLike, right: MatrixLike) -> npt.NDArray[np.float32]:
+    """Cosine similarity of each row of ``left`` with the same row of ``right``."""
+
+    left_rows = normalize_rows(left)
+    right_rows = normalize_rows(right)
+    if left_rows.shape != right_rows.shape:
+        raise ValueError(
+            f"cannot compare matrices of shape {left_rows.shape} and {right_rows.shape}"
+        )
+    return cast(FloatMatrix, np.einsum("ij,ij->i", left_rows, right_rows))
+
+
+def adjacent_cosine(matrix: MatrixLike) -> npt.NDArray[np.float32]:
+    """Cosine similarity of every row with the next one (length ``n - 1``)."""
+
+    normalized = normalize_rows(matrix)
+    if len(normalized) < 2:
+        return np.zeros(0, dtype=np.float32)
+    return cast(FloatMatrix, np.einsum("ij,ij->i", normalized[:-1], normalized[1:]))
+
+
+def mean_pool(matrix: MatrixLike) -> FloatMatrix:
+    """Column-wise mean of the rows of ``matrix`` as a 1-D vector."""
+
+    values = as_matrix(matrix)
+    if not len(values):
+        return np.zeros(values.shape[1], dtype=np.float32)
+    return cast(FloatMatrix, values.mean(axis=0, dtype=np.float64).astype(np.float32))
+
+
+__all__ = [
+    "FloatMatrix",
+    "adjacent_cosine",
+    "as_matrix",
+    "cosine",
+    "mean_pool",
+    "normalize_rows",
+    "rowwise_cosine",
+    "to_lists",
+]
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import json
+from pathlib import Path
 from typing import Iterable
 
 from Medical_KG.catalog.loaders import ConceptLoader
 from Medical_KG.catalog.models import Concept, ConceptFamily, SynonymType
-from Medical_KG.catalog.pipeline import ConceptCatalogBuilder, LicensePolicy
+from Medical_KG.catalog.pipeline import (
+    CatalogReleaseHasher,
+    ConceptCatalogBuilder,
+    CrosswalkBuilder,
+    LicensePolicy,
+)
 from Medical_KG.catalog.state import CatalogStateStore
 
 
@@ -76,3 +83,149 @@ def test_catalog_builder_deduplication_and_crosswalk() -> None:
     assert second_run.skipped
     assert not second_run.changed_ontologies
     assert embedding_service.calls == 1
+
+
+class ChainLoader(ConceptLoader):
+    """Concepts linked pairwise (0-1 by CUI, 1-2 by code, 2-3 by xref); 4 is isolated."""
+
+    ontology = "CHAIN"
+    family = ConceptFamily.CONDITION
+    license_bucket = "open"
+
+    def __init__(self) -> None:
+        super().__init__(release_version="2025-02")
+
+    def load(self) -> Iterable[Concept]:
+        specs = [
+            ({"chain": "0"}, {}, {"umls_cui": "C1"}),
+            ({"chain": "1", "shared": "S"}, {}, {"umls_cui": "C1"}),
+            ({"chain": "2", "shared": "S"}, {"mesh": ["D9"]}, {}),
+            ({"chain": "3"}, {"mesh": ["D9"]}, {}),
+            ({"chain": "4"}, {}, {}),
+        ]
+        for index, (codes, xrefs, attributes) in enumerate(specs):
+            yield self._build(
+                iri=f"https://example.org/chain/{index}",
+                label=f"Chain {index}",
+                preferred_term=f"Chain {index}",
+                definition=None,
+                synonyms=[],
+                codes=codes,
+                xrefs=xrefs,
+                attributes=attributes,
+            )
+
+
+def test_crosswalk_links_shared_keys_and_hash_is_order_independent() -> None:
+    concepts = list(ChainLoader().load())
+    CrosswalkBuilder().apply(concepts)
+    iris = [concept.iri for concept in concepts]
+    assert concepts[0].same_as == [iris[1]]
+    assert sorted(concepts[1].same_as) == [iris[0], iris[2]]
+    assert sorted(concepts[2].same_as) == [iris[1], iris[3]]
+    assert concepts[3].same_as == [iris[2]]
+    assert concepts[4].same_as == []
+
+    hasher = CatalogReleaseHasher()
+    assert hasher.compute(concepts) == hasher.compute(list(reversed(concepts)))
+    assert hasher.compute(concepts) != hasher.compute(concepts[:4])
+
+
+def test_streaming_build_spills_audit_entries(tmp_path: Path) -> None:
+    embedding_service = RecordingEmbeddingService()
+    builder = ConceptCatalogBuilder(
+        [DummyLoader(), ChainLoader()], embedding_service=embedding_service
+    )
+    expected = ConceptCatalogBuilder([DummyLoader(), ChainLoader()]).build()
+
+    audit_path = tmp_path / "audit.jsonl"
+    result = builder.build_streaming(audit_path, batch_size=2)
+
+    assert result.release_hash == expected.release_hash
+    assert [concept.iri for concept in result.concepts] == [
+        concept.iri for concept in expected.concepts
+    ]
+    assert result.audit_log.entries == []
+    assert result.audit_log.spilled == 7
+    lines = [json.loads(line) for line in audit_path.read_text().splitlines()]
+    assert lines == result.audit_log.as_payloads()
+    assert lines[0] == {
+        "action": "concept.loaded",
+        "user": "catalog",
+        "resource": "https://example.org/dummy/1",
+        "ontology": "DUMMY",
+    }
+    assert embedding_service.calls == 3
+
+
+class VersionedLoader(ConceptLoader):
+    family = ConceptFamily.CONDITION
+    license_bucket = "open"
+
+    def __init__(self, ontology: str, release_version: str, labels: dict[str, str]) -> None:
+        super().__init__(release_version=release_version)
+        self.ontology = ontology
+        self.labels = labels
+        self.loads = 0
+
+    def load(self) -> Iterable[Concept]:
+        self.loads += 1
+        for key, label in self.labels.items():
+            yield self._build(
+                iri=f"https://example.org/{self.ontology.lower()}/{key}",
+                label=label,
+                preferred_term=label,
+                definition=None,
+                synonyms=[(f"{label} synonym", SynonymType.EXACT)],
+                codes={self.ontology.lower(): key},
+            )
+
+
+class IriRecordingEmbeddingService(RecordingEmbeddingService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.iris: list[str] = []
+
+    def embed_concepts(self, concepts) -> None:
+        super().embed_concepts(concepts)
+        self.iris.extend(concept.iri for concept in concepts)
+
+
+def test_persistent_state_rebuilds_only_changed_concepts(tmp_path: Path) -> None:
+    first_store = CatalogStateStore(path=tmp_path / "state")
+    alpha = VersionedLoader("ALPHA", "v1", {"1": "One", "2": "Two", "3": "Three"})
+    beta = VersionedLoader("BETA", "v1", {"1": "Uno"})
+    first = ConceptCatalogBuilder([alpha, beta], state_store=first_store).build()
+    assert not first.skipped
+    assert len(first.changed_concepts) == 4
+
+    store = CatalogStateStore(path=tmp_path / "state")
+    assert store.get_release_hash() == first.release_hash
+    assert store.get_release_versions() == {"ALPHA": "v1", "BETA": "v1"}
+    assert len(store.get_concept_hashes("ALPHA")) == 3
+    assert store.get_synonyms()["BETA"] == ["uno synonym"]
+
+    alpha = VersionedLoader("ALPHA", "v2", {"1": "One", "2": "Two revised"})
+    beta = VersionedLoader("BETA", "v1", {"1": "Uno"})
+    embedding_service = IriRecordingEmbeddingService()
+    builder = ConceptCatalogBuilder(
+        [alpha, beta], embedding_service=embedding_service, state_store=store
+    )
+    result = builder.build(ontologies=[])
+
+    assert beta.loads == 0
+    assert result.changed_ontologies == {"ALPHA"}
+    assert [concept.iri for concept in result.changed_concepts] == ["https://example.org/alpha/2"]
+    assert embedding_service.iris == ["https://example.org/alpha/2"]
+    assert result.tombstones == {"https://example.org/alpha/3": "ALPHA"}
+    assert result.release_versions == {"ALPHA": "v2", "BETA": "v1"}
+    assert set(result.synonym_catalog) == {"ALPHA", "BETA"}
+
+    reopened = CatalogStateStore(path=tmp_path / "state")
+    assert reopened.get_release_hash() == result.release_hash
+    assert reopened.get_tombstones() == {"https://example.org/alpha/3": "ALPHA"}
+    assert set(reopened.get_concept_hashes("ALPHA")) == {
+        "https://example.org/alpha/1",
+        "https://example.org/alpha/2",
+    }
+    assert builder.build(ontologies=["ALPHA"]).skipped
@@ -243,8 +243,9 @@ def test_concept_graph_writer_creates_nodes(
     result = builder.build()
     session = FakeSession()
     writer = ConceptGraphWriter(session)
-    writer.sync(result)
-    assert any("MERGE (c:Concept" in query for query, _ in session.queries)
+    stats = writer.sync(result)
+    assert any("MERGE (n:Concept:" in query for query, _ in session.queries)
+    assert stats.rows >= len(result.concepts)
     assert any("CALL db.index.vector.createNodeIndex" in query for query, _ in session.queries)
 
 
@@ -296,3 +297,140 @@ def test_catalog_updater_refreshes_changed_ontologies(
     assert client.bulk_operations
     skipped = updater.refresh()
     assert skipped.skipped
+
+
+def test_catalog_updater_pushes_only_changed_concepts_and_tombstones(
+    snomed_loader: SnomedCTLoader,
+    mondo_loader: MONDOLoader,
+    embedding_service: EmbeddingService,
+    tmp_path: Path,
+) -> None:
+    client = FakeOpenSearchClient()
+    session = FakeSession()
+    store = CatalogStateStore(path=tmp_path / "catalog-state")
+    CatalogUpdater(
+        builder=ConceptCatalogBuilder(
+            [snomed_loader, mondo_loader], embedding_service=embedding_service, state_store=store
+        ),
+        graph_writer=ConceptGraphWriter(session),
+        index_manager=ConceptIndexManager(client),
+        state_store=store,
+    ).refresh(force=True)
+
+    records = [
+        {
+            "conceptId": "73211009",
+            "fsn": "Diabetes mellitus (disorder)",
+            "preferred": "Diabetes mellitus",
+            "synonyms": ["Sugar diabetes", "DM"],
+            "definition": "A disorder characterized by hyperglycemia.",
+            "parents": ["237602007"],
+            "ancestors": ["64572001"],
+            "icd10": ["E11"],
+            "active": True,
+        }
+    ]
+    store = CatalogStateStore(path=tmp_path / "catalog-state")
+    client = FakeOpenSearchClient()
+    session = FakeSession()
+    updater = CatalogUpdater(
+        builder=ConceptCatalogBuilder(
+            [SnomedCTLoader(records, release_version="2025-07-31"), mondo_loader],
+            embedding_service=embedding_service,
+            state_store=store,
+        ),
+        graph_writer=ConceptGraphWriter(session),
+        index_manager=ConceptIndexManager(client),
+        state_store=store,
+    )
+    assert not updater.is_due("SNOMED")
+
+    result = updater.refresh()
+
+    assert result.changed_ontologies == {"SNOMED"}
+    assert not any(concept.ontology == "MONDO" for concept in result.concepts)
+    assert len(result.changed_concepts) == 1
+    changed_iri = result.changed_concepts[0].iri
+    (removed_iri,) = result.tombstones
+    index_ops, delete_ops = client.bulk_operations
+    assert [op["index"]["_id"] for op in index_ops[::2]] == [changed_iri]
+    assert delete_ops == [{"delete": {"_index": "concepts_v1", "_id": removed_iri}}]
+    assert any(
+        "DETACH DELETE" in query and params["iris"] == [removed_iri]
+        for query, params in session.queries
+    )
+    assert CatalogStateStore(path=tmp_path / "catalog-state").get_tombstones() == {}
+
+
+def test_catalog_updater_syncs_same_as_partners_without_clearing_embeddings(
+    snomed_loader: SnomedCTLoader,
+    embedding_service: EmbeddingService,
+    tmp_path: Path,
+) -> None:
+    store = CatalogStateStore(path=tmp_path / "catalog-state")
+    CatalogUpdater(
+        builder=ConceptCatalogBuilder(
+            [snomed_loader], embedding_service=embedding_service, state_store=store
+        ),
+        graph_writer=ConceptGraphWriter(FakeSession()),
+        index_manager=ConceptIndexManager(FakeOpenSearchClient()),
+        state_store=store,
+    ).refresh(force=True)
+
+    records = [
+        {
+            "conceptId": "73211009",
+            "fsn": "Diabetes mellitus (disorder)",
+            "preferred": "Diabetes mellitus",
+            "synonyms": ["Sugar diabetes", "DM"],
+            "definition": "A disorder characterized by hyperglycemia.",
+            "parents": ["237602007"],
+            "ancestors": ["64572001"],
+            "icd10": ["E11"],
+            "active": True,
+        },
+        {
+            "conceptId": "44054006",
+            "fsn": "Diabetes mellitus type 2 (disorder)",
+            "preferred": "Type 2 diabetes mellitus",
+            "synonyms": ["Non-insulin-dependent diabetes mellitus"],
+            "definition": "A type of diabetes mellitus.",
+            "parents": ["73211009"],
+            "ancestors": ["64572001"],
+            "icd10": ["E11"],
+            "active": True,
+        },
+    ]
+    store = CatalogStateStore(path=tmp_path / "catalog-state")
+    session = FakeSession()
+    result = CatalogUpdater(
+        builder=ConceptCatalogBuilder(
+            [SnomedCTLoader(records, release_version="2025-07-31")],
+            embedding_service=embedding_service,
+            state_store=store,
+        ),
+        graph_writer=ConceptGraphWriter(session),
+        index_manager=ConceptIndexManager(FakeOpenSearchClient()),
+        state_store=store,
+    ).refresh()
+
+    (changed,) = result.changed_concepts
+    (partner,) = [concept for concept in result.concepts if concept is not changed]
+    assert partner.iri in changed.same_as
+    node_rows = {
+        row["keys"]["iri"]: row["props"]
+        for query, params in session.queries
+        if "MERGE (n:Concept:" in query
+        for row in params["rows"]
+    }
+    assert set(node_rows) == {changed.iri, partner.iri}
+    assert node_rows[changed.iri]["embedding_qwen"]
+    assert "embedding_qwen" not in node_rows[partner.iri]
+    assert "splade_terms" not in node_rows[partner.iri]
+    same_as = {
+        (row["start"], row["end"])
+        for query, params in session.queries
+        if ":SAME_AS]" in query
+        for row in params["rows"]
+    }
+    assert {(changed.iri, partner.iri), (partner.iri, changed.iri)} <= same_as
@@ -189,14 +189,16 @@ def test_chunk_graph_writer_syncs_embeddings(embedding_service: EmbeddingService
     writer = ChunkGraphWriter(session)
     writer.sync(document.doc_id, chunks, neighbor_merges=result.neighbor_merges)
     queries = [query for query, _ in session.calls]
-    assert any("MERGE (c:Chunk" in query for query in queries)
+    assert any("MERGE (n:Chunk" in query for query in queries)
     assert any("CALL db.index.vector.createNodeIndex" in query for query in queries)
     assert any("OVERLAPS" in query for query in queries)
     assert any("SIMILAR_TO" in query for query in queries)
-    has_chunk = next(
-        params for query, params in session.calls if query.strip().startswith("MERGE (d:Document")
-    )
-    assert isinstance(has_chunk["index"], int)
+    has_chunk = next(params for query, params in session.calls if "HAS_CHUNK" in query)
+    rows = has_chunk["rows"]
+    assert isinstance(rows, list)
+    assert [row["props"]["index"] for row in rows] == list(range(len(chunks)))
+    # One UNWIND statement per label/relationship type instead of one per element.
+    assert sum("HAS_CHUNK" in query for query in queries) == 1
 
 
 def test_chunk_search_indexer_indexes_multi_granularity(
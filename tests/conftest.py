@@ -293,6 +293,7 @@ if "yaml" not in sys.modules:
 
 import pytest  # noqa: E402
 
+from Medical_KG.embeddings.gpu import reset_device_health_monitors  # noqa: E402
 from Medical_KG.ingestion.ledger import (  # noqa: E402
     LedgerAuditRecord,
     LedgerDocumentState,
@@ -315,6 +316,15 @@ def monkeypatch_fixture(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
     return monkeypatch
 
 
+@pytest.fixture(autouse=True)
+def reset_device_health_monitor() -> Iterator[None]:
+    """Give every test fresh process-wide GPU health monitors."""
+
+    reset_device_health_monitors()
+    yield
+    reset_device_health_monitors()
+
+
 _TRACE = Trace(count=True, trace=False)
 
 
@@ -505,6 +515,20 @@ class FakeLedger:
         self.writes.append(audit)
         return audit
 
+    def transition_path(
+        self,
+        doc_id: str,
+        states: Sequence[LedgerState],
+        *,
+        adapter: str | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        parameters: Mapping[str, Any] | None = None,
+    ) -> list[LedgerAuditRecord]:
+        del parameters
+        return [
+            self.update_state(doc_id, state, adapter=adapter, metadata=metadata) for state in states
+        ]
+
     def record(
         self,
         doc_id: str,
@@ -525,9 +549,14 @@ class FakeLedger:
     def get(self, doc_id: str) -> LedgerDocumentState | None:
         return self.records.get(doc_id)
 
+    def get_state(self, doc_id: str) -> LedgerState | None:
+        document = self.records.get(doc_id)
+        return document.state if document else None
+
     def entries(
-        self, *, state: LedgerState | None = None
+        self, *, state: LedgerState | None = None, with_history: bool = True
     ) -> Iterable[LedgerDocumentState]:
+        del with_history
         values = list(self.records.values())
         if state is None:
             return values
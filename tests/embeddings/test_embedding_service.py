@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Sequence
 
 import pytest
 
-from Medical_KG.embeddings.gpu import GPURequirementError, GPUValidator
+import Medical_KG.embeddings.qwen as qwen_module
+from Medical_KG.embeddings.gpu import DeviceHealthMonitor, GPURequirementError, GPUValidator
+from Medical_KG.embeddings.qwen import QwenEmbeddingClient
 from Medical_KG.embeddings.service import EmbeddingMetrics, EmbeddingService
 
 
@@ -65,6 +68,22 @@ def test_embed_texts_invokes_gpu_validator() -> None:
     assert validator.called is True
 
 
+def test_embed_texts_reuses_cached_gpu_status() -> None:
+    validator = RecordingValidator()
+    calls: list[int] = []
+    original = validator.validate
+
+    def counting_validate() -> None:
+        calls.append(1)
+        original()
+
+    service = EmbeddingService(qwen=FakeQwen(), splade=FakeSplade(), gpu_validator=validator)
+    service.device_health = DeviceHealthMonitor(counting_validate, background_refresh=False)
+    for _ in range(3):
+        service.embed_texts(["alpha"])
+    assert len(calls) == 1
+
+
 def test_embed_concepts_assigns_vectors() -> None:
     service = EmbeddingService(qwen=FakeQwen(), splade=FakeSplade())
     concept = Concept("condition example")
@@ -110,3 +129,49 @@ def test_embedding_service_records_error_on_failure(
         service.embed_texts(["alpha"])
     error_calls = stub_embedding_metrics["errors"].calls  # type: ignore[index]
     assert any(call[0] == "inc" for call in error_calls)
+
+
+def test_service_closes_pooled_qwen_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[str] = []
+
+    class _Response:
+        def __init__(self, texts: Sequence[str]) -> None:
+            self._texts = texts
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, object]:
+            return {"data": [{"embedding": [1.0, 0.0]} for _ in self._texts]}
+
+    class _Client:
+        def post(self, url: str, json: dict[str, Sequence[str]]) -> _Response:
+            return _Response(json["input"])
+
+        def close(self) -> None:
+            closed.append("sync")
+
+    class _AsyncClient:
+        async def request(self, method: str, url: str, json: dict[str, Sequence[str]]) -> _Response:
+            return _Response(json["input"])
+
+        async def aclose(self) -> None:
+            closed.append("async")
+
+    monkeypatch.setattr(qwen_module, "create_client", lambda **_: _Client())
+    monkeypatch.setattr(qwen_module, "create_async_client", lambda **_: _AsyncClient())
+    service = EmbeddingService(
+        qwen=QwenEmbeddingClient(dimension=2, api_url="http://vllm"), splade=FakeSplade()
+    )
+
+    service.embed_texts(["alpha"])
+    service.close()
+    assert closed == ["sync"]
+
+    async def _run() -> None:
+        service.embed_texts(["beta"])
+        await service.qwen.aembed(["gamma"])
+        await service.aclose()
+
+    asyncio.run(_run())
+    assert closed == ["sync", "sync", "async"]
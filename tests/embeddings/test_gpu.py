@@ -1,14 +1,40 @@
 from __future__ import annotations
 
+import subprocess
+import threading
 from types import SimpleNamespace
 
 import pytest
 
 from Medical_KG.embeddings.gpu import (
+    DeviceHealthMonitor,
     GPURequirementError,
     GPUValidator,
+    device_health_monitor,
     enforce_gpu_or_exit,
+    set_device_health_monitor,
 )
+from Medical_KG.embeddings.service import EmbeddingService
+from Medical_KG.pdf.gpu import detect_gpu
+
+
+class FakeRunner:
+    def __init__(self, stdout: str = "NVIDIA A100\n", returncode: int = 0) -> None:
+        self.stdout = stdout
+        self.returncode = returncode
+        self.commands: list[list[str]] = []
+
+    def run(self, command: list[str]) -> subprocess.CompletedProcess[str]:
+        self.commands.append(command)
+        return subprocess.CompletedProcess(command, self.returncode, self.stdout, "")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
 
 
 @pytest.fixture(autouse=True)
@@ -71,3 +97,135 @@ def test_enforce_gpu_or_exit(monkeypatch: pytest.MonkeyPatch) -> None:
     with pytest.raises(SystemExit) as excinfo:
         enforce_gpu_or_exit(validator=FailingValidator())
     assert excinfo.value.code == 99
+
+
+def test_gpu_validator_uses_injected_runner(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("REQUIRE_GPU", "1")
+    runner = FakeRunner()
+    GPUValidator(runner=runner).validate()
+    assert runner.commands and runner.commands[0][0] == "nvidia-smi"
+
+    with pytest.raises(GPURequirementError, match="no devices"):
+        GPUValidator(runner=FakeRunner(stdout="")).validate()
+    with pytest.raises(GPURequirementError, match="nvidia-smi"):
+        GPUValidator(runner=FakeRunner(returncode=9)).validate()
+
+
+def test_device_health_caches_probe_until_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("REQUIRE_GPU", "1")
+    runner = FakeRunner()
+    clock = FakeClock()
+    monitor = DeviceHealthMonitor(
+        GPUValidator(runner=runner).validate,
+        ttl_seconds=30,
+        background_refresh=False,
+        clock=clock,
+    )
+
+    for _ in range(5):
+        assert monitor.select_device() == "cuda"
+    assert len(runner.commands) == 1
+
+    clock.now = 31
+    runner.stdout = ""
+    assert monitor.select_device() == "cpu"
+    assert len(runner.commands) == 2
+    with pytest.raises(GPURequirementError, match="no devices"):
+        monitor.select_device(require=True)
+    assert len(runner.commands) == 2
+
+    runner.stdout = "NVIDIA A100"
+    monitor.invalidate()
+    assert monitor.status().available is True
+    assert len(runner.commands) == 3
+
+
+def test_device_health_refreshes_stale_status_in_background() -> None:
+    clock = FakeClock()
+    probed = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def probe() -> None:
+        calls.append(1)
+        if len(calls) > 1:
+            probed.set()
+            release.wait(timeout=5)
+            raise GPURequirementError("device lost")
+
+    monitor = DeviceHealthMonitor(probe, ttl_seconds=10, clock=clock)
+    assert monitor.status().available is True
+
+    clock.now = 11
+    # The stale healthy status is served while the re-probe runs off-thread.
+    assert monitor.status().available is True
+    assert probed.wait(timeout=5)
+    release.set()
+    refresher = monitor._refresher
+    assert refresher is not None
+    refresher.join(timeout=5)
+    assert monitor.status().available is False
+    assert monitor.status().error == "device lost"
+    assert len(calls) == 2
+
+
+def _service(validator: GPUValidator) -> EmbeddingService:
+    return EmbeddingService(
+        qwen=None, splade=None, gpu_validator=validator  # type: ignore[arg-type]
+    )
+
+
+def test_shared_device_health_is_injectable() -> None:
+    calls: list[int] = []
+
+    def probe() -> None:
+        calls.append(1)
+        raise GPURequirementError("no devices")
+
+    monitor = DeviceHealthMonitor(probe, background_refresh=False)
+    set_device_health_monitor(monitor)
+
+    assert device_health_monitor() is monitor
+    assert detect_gpu() is False
+    assert detect_gpu() is False
+    assert len(calls) == 1
+
+    set_device_health_monitor(None)
+    assert device_health_monitor() is not monitor
+
+
+def test_services_share_the_monitor_of_their_validator() -> None:
+    validator = GPUValidator(runner=FakeRunner())
+    first = _service(validator)
+    second = _service(validator)
+    other = _service(GPUValidator())
+
+    assert first.device_health is second.device_health
+    assert first.device_health is device_health_monitor(validator.validate)
+    assert other.device_health is not first.device_health
+    assert first.device_health is not device_health_monitor()
+
+
+def test_shared_monitor_keeps_validator_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    commands: list[list[str]] = []
+    monkeypatch.setattr(
+        "Medical_KG.embeddings.gpu.subprocess.run",
+        lambda command, **_: commands.append(command) or SimpleNamespace(stdout="gpu0"),
+    )
+    monkeypatch.setenv("REQUIRE_GPU", "0")
+    assert _service(GPUValidator())._select_device() == "gpu"
+    assert commands == []
+
+    monkeypatch.setenv("REQUIRE_GPU", "1")
+    no_cuda = SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False))
+    monkeypatch.setattr("Medical_KG.embeddings.gpu.load_torch", lambda: no_cuda)
+    assert _service(GPUValidator(runner=FakeRunner()))._select_device() == "cpu_fallback"
+
+    no_memory = SimpleNamespace(
+        cuda=SimpleNamespace(is_available=lambda: True, mem_get_info=lambda: (0.0, 0.0))
+    )
+    monkeypatch.setattr("Medical_KG.embeddings.gpu.load_torch", lambda: no_memory)
+    service = _service(GPUValidator(runner=FakeRunner()))
+    assert service._select_device() == "cpu_fallback"
+    assert service.device_health is not None
+    assert "memory" in (service.device_health.status().error or "")
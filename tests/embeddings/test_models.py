@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
+from typing import Any
 
 import pytest
 
@@ -74,6 +76,113 @@ def test_qwen_client_transport_override() -> None:
     assert vectors == [[5.0], [4.0]]
 
 
+class _EchoResponse:
+    def __init__(self, texts: list[str]) -> None:
+        self._texts = texts
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict[str, object]:
+        # Report items out of order; the client must sort by "index".
+        items = [
+            {"index": index, "embedding": [float(len(text))]}
+            for index, text in enumerate(self._texts)
+        ]
+        return {"data": list(reversed(items))}
+
+
+def test_qwen_client_reuses_pooled_http_client() -> None:
+    created: list[object] = []
+    batches: list[int] = []
+
+    class PooledClient:
+        def post(self, url: str, json: dict[str, Any]) -> _EchoResponse:
+            batches.append(len(json["input"]))
+            return _EchoResponse(json["input"])
+
+        def close(self) -> None:
+            raise AssertionError("factory-provided clients are not closed")
+
+    def factory() -> PooledClient:
+        created.append(1)
+        return PooledClient()
+
+    client = QwenEmbeddingClient(
+        dimension=1, batch_size=2, api_url="http://vllm", http_client_factory=factory
+    )
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    assert client.embed(texts) == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert client.embed(["ff"]) == [[2.0]]
+    assert len(created) == 1
+    assert batches == [2, 2, 1, 1]
+    client.close()
+
+
+def test_qwen_aembed_pipelines_batches_in_input_order() -> None:
+    in_flight = 0
+    peak = 0
+
+    class AsyncStub:
+        async def request(self, method: str, url: str, **kwargs: Any) -> _EchoResponse:
+            nonlocal in_flight, peak
+            texts = kwargs["json"]["input"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later batches finish first to exercise reordering.
+            await asyncio.sleep(0.02 / len(texts[0]))
+            in_flight -= 1
+            return _EchoResponse(texts)
+
+        async def aclose(self) -> None:
+            return None
+
+    client = QwenEmbeddingClient(
+        dimension=1,
+        batch_size=3,
+        min_batch_size=1,
+        api_url="http://vllm",
+        async_http_client_factory=AsyncStub,
+        max_in_flight=3,
+        target_batch_latency=60.0,
+    )
+    texts = ["x" * (index + 1) for index in range(12)]
+    vectors = asyncio.run(client.aembed(texts))
+    assert vectors == [[float(index + 1)] for index in range(12)]
+    assert 1 < peak <= 3
+
+
+def test_qwen_batch_size_adapts_to_latency_and_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = iter([0.0, 4.0, 10.0, 10.5, 20.0, 20.001])
+
+    class SlowClient:
+        def post(self, url: str, json: dict[str, Any]) -> _EchoResponse:
+            return _EchoResponse(json["input"])
+
+        def close(self) -> None:
+            return None
+
+    client = QwenEmbeddingClient(
+        dimension=1,
+        batch_size=8,
+        min_batch_size=2,
+        api_url="http://vllm",
+        http_client_factory=SlowClient,
+        target_batch_latency=1.0,
+        max_payload_bytes=10,
+    )
+    sizer = client._batch_sizer()
+    assert sizer.next_end(["aaaa", "bbbb", "cccc"], 0) == 2  # payload cap
+    assert sizer.next_end(["a" * 50], 0) == 1  # oversized text still sent alone
+
+    monkeypatch.setattr("Medical_KG.embeddings.qwen.time.perf_counter", lambda: next(clock))
+    client.embed(["a"] * 8)  # 8 texts in 4s -> shrink to min size
+    assert sizer.size == 2
+    client.embed(["a", "b"])
+    client.embed(["a", "b"])  # a near-instant batch lets it grow again
+    assert sizer.size > 2
+
+
 def test_splade_expander_filters_terms() -> None:
     expander = SPLADEExpander(top_k=2, min_weight=0.0, batch_size=2)
     expansions = expander.expand(["Alpha beta beta", ""])
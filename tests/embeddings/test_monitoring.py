@@ -97,4 +97,4 @@ def test_dashboard_definition_structure() -> None:
     monitor = EmbeddingPerformanceMonitor(FakeService())
     dashboard = monitor.dashboard_definition()
     assert dashboard["title"] == "Embedding GPU Performance"
-    assert len(dashboard["panels"]) == 3
+    assert len(dashboard["panels"]) == 4
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Sequence
+
+import pytest
+
+from Medical_KG.embeddings.monitoring import EmbeddingPerformanceMonitor
+from Medical_KG.embeddings.service import EmbeddingService
+from Medical_KG.embeddings.splade import SPLADEExpander
+from Medical_KG.embeddings.store import EmbeddingStore
+
+
+class CountingQwen:
+    model = "qwen-test"
+    dimension = 3
+    batch_size = 8
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5, -1.0] for text in texts]
+
+
+class CountingSplade(SPLADEExpander):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[list[str]] = []
+
+    def expand(self, texts: Sequence[str]) -> list[dict[str, float]]:
+        self.calls.append(list(texts))
+        return [{text: 0.25, "shared": 0.5} for text in texts]
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.alerts: list[tuple[str, str]] = []
+
+    def emit(self, alert: str, message: str) -> None:
+        self.alerts.append((alert, message))
+
+
+def test_dense_and_sparse_vectors_persist_across_reopen(tmp_path: Path) -> None:
+    store = EmbeddingStore(tmp_path, rows_per_shard=2, memory_bytes=0)
+    texts = ["alpha", "beta", "gamma"]
+    vectors = [[1.0, 2.0], [3.0, 4.0], [5.5, -6.25]]
+    store.put_dense("qwen", 2, texts, vectors)
+    store.put_sparse("splade", ["alpha"], [{"alpha": 0.5, "line\nbreak": 0.25}])
+    assert store.get_dense("qwen", 2, ["gamma", "delta"]) == [[5.5, -6.25], None]
+    store.close()
+
+    dense_dir = next((tmp_path / "dense").iterdir())
+    assert sorted(path.name for path in dense_dir.glob("shard-*.vec")) == [
+        "shard-00000.vec",
+        "shard-00001.vec",
+    ]
+    # A torn trailing entry record is ignored on reopen.
+    with (dense_dir / "entries.dat").open("ab") as handle:
+        handle.write(b"\x00" * 7)
+
+    reopened = EmbeddingStore(tmp_path, rows_per_shard=2)
+    assert reopened.get_dense("qwen", 2, texts) == vectors
+    assert reopened.get_dense("qwen", 4, ["alpha"]) == [None]
+    assert reopened.get_sparse("splade", ["alpha", "beta"]) == [
+        {"alpha": 0.5, "line\nbreak": 0.25},
+        None,
+    ]
+    stats = reopened.stats()
+    assert (stats.dense_hits, stats.dense_misses) == (3, 1)
+    assert stats.sparse_hit_rate == pytest.approx(0.5)
+    reopened.close()
+
+
+def test_float16_store_halves_row_width(tmp_path: Path) -> None:
+    store = EmbeddingStore(tmp_path, dtype="float16", memory_bytes=0)
+    store.put_dense("qwen", 4, ["alpha"], [[0.5, -0.25, 1.0, 0.1]])
+    store.close()
+    shard = next((tmp_path / "dense").iterdir()) / "shard-00000.vec"
+    assert shard.stat().st_size == 8
+
+    reopened = EmbeddingStore(tmp_path, dtype="float16")
+    (vector,) = reopened.get_dense("qwen", 4, ["alpha"])
+    assert vector == pytest.approx([0.5, -0.25, 1.0, 0.1], abs=1e-3)
+    reopened.close()
+    with pytest.raises(ValueError):
+        EmbeddingStore(tmp_path, dtype="int8")
+
+
+def test_embedding_service_only_embeds_unseen_texts(tmp_path: Path) -> None:
+    qwen = CountingQwen()
+    splade = CountingSplade()
+    store = EmbeddingStore(tmp_path)
+    service = EmbeddingService(qwen=qwen, splade=splade, store=store)  # type: ignore[arg-type]
+
+    first_dense, first_sparse = service.embed_texts(["a", "bb"], sparse_texts=["s-a", "s-bb"])
+    dense, sparse = service.embed_texts(["bb", "ccc", "a"], sparse_texts=["s-bb", "s-ccc", "s-a"])
+
+    assert qwen.calls == [["a", "bb"], ["ccc"]]
+    assert splade.calls == [["s-a", "s-bb"], ["s-ccc"]]
+    assert dense == [first_dense[1], [3.0, 0.5, -1.0], first_dense[0]]
+    assert sparse[0] == first_sparse[1]
+    assert sparse[1] == {"s-ccc": 0.25, "shared": 0.5}
+
+    service.embed_texts(["a"], sparse_texts=["s-a"])
+    assert len(qwen.calls) == 2
+
+    sink = RecordingSink()
+    monitor = EmbeddingPerformanceMonitor(service, alert_sink=sink)
+    stats = monitor.cache_stats()
+    assert (stats.dense_hits, stats.dense_misses) == (3, 3)
+    monitor.check_cache_hit_rate(threshold=0.9, min_lookups=1)
+    assert sink.alerts and sink.alerts[0][0] == "cache_hit_rate_low"
+    store.close()
+
+
+def test_memory_cache_is_bounded_by_bytes(tmp_path: Path) -> None:
+    probe = EmbeddingStore(tmp_path / "probe")
+    probe.put_dense("qwen", 4096, ["probe"], [[0.0] * 4096])
+    row_bytes = probe._dense_memory._bytes
+    probe.close()
+    assert row_bytes < 4096 * 8
+
+    store = EmbeddingStore(tmp_path / "store", memory_bytes=2 * row_bytes)
+    texts = [f"text-{index}" for index in range(3)]
+    store.put_dense("qwen", 4096, texts, [[float(index)] * 4096 for index in range(3)])
+    assert len(store._dense_memory._entries) == 2
+    assert store._dense_memory._bytes <= 2 * row_bytes
+    (oldest,) = store.get_dense("qwen", 4096, ["text-0"])
+    assert oldest == [0.0] * 4096
+    assert store.stats().dense_hits == 1
+    store.close()
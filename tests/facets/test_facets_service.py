@@ -1,8 +1,9 @@
 import pytest
 
 from Medical_KG.facets import FacetService
+from Medical_KG.facets.dedup import deduplicate_facets
 from Medical_KG.facets.models import FacetType
-from Medical_KG.facets.service import Chunk
+from Medical_KG.facets.service import Chunk, FacetStorage
 
 
 def test_generate_facets_detects_multiple_types() -> None:
@@ -68,3 +69,34 @@ def test_failed_generation_escalates_after_three_attempts() -> None:
     assert "fail-1" in service.escalation_queue
     reasons = service.failure_reasons("fail-1")
     assert reasons and any("Ratio effects" in reason for reason in reasons)
+
+
+def test_generate_for_chunks_aggregates_document_incrementally() -> None:
+    storage = FacetStorage()
+    service = FacetService(storage)
+    texts = [
+        "Grade 3 nausea occurred in 12/100 treatment arm patients.",
+        "Grade 3 nausea occurred in 12/100 treatment arm patients.",
+        "Patients receiving the treatment arm had a hazard ratio 0.68 (0.52-0.88, p=0.01).",
+    ]
+    chunks = [
+        Chunk(chunk_id=f"c-{index}", doc_id="doc-3", text=text, section="results")
+        for index, text in enumerate(texts)
+    ]
+
+    results = service.generate_for_chunks(chunks)
+
+    assert set(results) == {"c-0", "c-1", "c-2"}
+    expected = deduplicate_facets(
+        [facet for chunk in chunks for facet in service.get_facets(chunk.chunk_id)]
+    )
+    facets = service.document_facets("doc-3")
+    assert [facet.model_dump() for facet in facets] == [facet.model_dump() for facet in expected]
+
+    storage.set("c-0", "doc-3", [])
+    storage.set("c-1", "doc-4", service.get_facets("c-1"))
+    remaining = service.document_facets("doc-3")
+    assert all(facet.type != FacetType.ADVERSE_EVENT for facet in remaining)
+    assert sorted(facet.type for facet in service.document_facets("doc-4")) == sorted(
+        facet.type for facet in service.get_facets("c-1")
+    )
@@ -187,6 +187,38 @@ def test_pubmed_adapter_handles_missing_history(
     _run(_test())
 
 
+def test_pubmed_adapter_prefetches_history_pages(
+    fake_ledger: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch_json(url: str, *, params: dict[str, Any], **_: Any) -> dict[str, Any]:
+        if "esearch" in url:
+            return {"esearchresult": {"count": "6", "webenv": "W", "querykey": "1", "idlist": []}}
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        start = int(params["retstart"])
+        uids = [str(10000000 + index) for index in range(start, start + int(params["retmax"]))]
+        return {"result": {"uids": uids, **{uid: {"uid": uid, "title": uid} for uid in uids}}}
+
+    async def fake_fetch_text(url: str, **_: Any) -> str:
+        return "<PubmedArticleSet/>"
+
+    async def _test() -> list[str]:
+        adapter = PubMedAdapter(AdapterContext(fake_ledger), _stub_http_client(), prefetch_pages=3)
+        monkeypatch.setattr(adapter, "fetch_json", fake_fetch_json)
+        monkeypatch.setattr(adapter, "fetch_text", fake_fetch_text)
+        return [str(record["uid"]) async for record in adapter.fetch("sepsis", retmax=2)]
+
+    uids = _run(_test())
+    assert uids == [str(10000000 + index) for index in range(6)]
+    assert peak == 3
+
+
 def test_pubmed_rate_limit_adjusts_for_api_key(fake_ledger: Any) -> None:
     async def _inspect() -> tuple[int, int]:
         host = "eutils.ncbi.nlm.nih.gov"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -12,7 +13,9 @@ import Medical_KG.ingestion.cli_helpers as cli_helpers
 from Medical_KG.ingestion.adapters.base import AdapterContext, BaseAdapter
 from Medical_KG.ingestion.cli_helpers import (
     BatchLoadError,
+    BatchValidationError,
     LedgerResumeStats,
+    NdjsonBatchReader,
     format_cli_error,
     format_results,
     handle_ledger_resume,
@@ -104,6 +107,42 @@ def test_load_ndjson_batch_reports_progress(tmp_path: Path) -> None:
     assert updates == [(1, None), (2, None), (3, None)]
 
 
+def test_ndjson_batch_reader_splits_chunks_on_line_boundaries(tmp_path: Path) -> None:
+    batch = tmp_path / "chunks.ndjson"
+    lines = [json.dumps({"value": index, "pad": "x" * (index % 7)}) for index in range(50)]
+    lines.insert(10, "   ")
+    batch.write_text("\n".join(lines) + "\n")
+
+    reader = NdjsonBatchReader(batch, chunk_bytes=64)
+    assert reader.estimated_total == 50
+    assert [record["value"] for record in reader] == list(range(50))
+    assert reader.count == 50
+    assert reader.estimated_total == 50
+
+    batch.write_text("\n".join(lines[:30] + ["{broken"] + lines[30:]))
+    with pytest.raises(BatchLoadError, match="line 31"):
+        list(NdjsonBatchReader(batch, chunk_bytes=64))
+
+
+def test_ndjson_batch_reader_validates_in_order_on_workers(tmp_path: Path) -> None:
+    batch = tmp_path / "validated.ndjson"
+    batch.write_text("\n".join(json.dumps({"value": index}) for index in range(40)))
+
+    def _validator(record: dict[str, Any]) -> None:
+        if record["value"] == 25:
+            raise BatchValidationError("value 25 is not allowed")
+
+    seen: list[int] = []
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        reader = NdjsonBatchReader(
+            batch, validator=_validator, workers=3, chunk_bytes=48, executor=executor
+        )
+        with pytest.raises(BatchValidationError, match="value 25"):
+            for record in reader:
+                seen.append(record["value"])
+    assert seen == list(range(25))
+
+
 def test_invoke_adapter_collects_doc_ids(tmp_path: Path) -> None:
     ledger = IngestionLedger(tmp_path / "ledger.jsonl")
     adapter = _StubAdapter(AdapterContext(ledger), records=[{"id": "doc-1"}, {"id": "doc-2"}])
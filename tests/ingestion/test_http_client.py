@@ -7,6 +7,7 @@ from typing import Any, Sequence, cast
 import pytest
 
 from Medical_KG.ingestion import http_client as http_client_module
+from Medical_KG.ingestion.http_cache import HttpResponseCache
 from Medical_KG.ingestion.http_client import AsyncHttpClient, RateLimit
 from Medical_KG.ingestion.telemetry import (
     CompositeTelemetry,
@@ -497,6 +498,51 @@ def test_retry_on_transient_failure(monkeypatch: Any) -> None:
     assert len(transport.calls) == 2
 
 
+def test_retries_wait_for_a_limiter_token(monkeypatch: Any) -> None:
+    responses = [
+        HTTPX.Response(status_code=503, request=HTTPX.Request("GET", "https://example.com")),
+        HTTPX.Response(status_code=502, request=HTTPX.Request("GET", "https://example.com")),
+        HTTPX.Response(
+            status_code=200,
+            json={"ok": True},
+            request=HTTPX.Request("GET", "https://example.com"),
+        ),
+    ]
+    events: list[str] = []
+
+    async def _request(
+        self: HttpxAsyncClient, method: str, url: str, **kwargs: Any
+    ) -> HttpxResponseProtocol:
+        events.append("request")
+        return responses.pop(0)
+
+    limiter_class = http_client_module._TokenBucketLimiter
+    real_acquire = limiter_class.acquire
+
+    async def _acquire(self: Any) -> Any:
+        events.append("acquire")
+        return await real_acquire(self)
+
+    monkeypatch.setattr(limiter_class, "acquire", _acquire)
+    real_sleep = asyncio.sleep
+
+    async def _sleep(delay: float) -> None:
+        await real_sleep(0)
+
+    monkeypatch.setattr(http_client_module.asyncio, "sleep", _sleep)
+    client = AsyncHttpClient(retries=3, limits={"example.com": RateLimit(rate=10, per=1.0)})
+    monkeypatch.setattr(
+        client._client, "request", _request.__get__(client._client, HTTPX.AsyncClient)
+    )
+
+    async def _run() -> Any:
+        async with client:
+            return await client.get_json("https://example.com")
+
+    assert asyncio.run(_run()).data == {"ok": True}
+    assert events == ["acquire", "request"] * 3
+
+
 def test_rate_limiter_serializes_calls(monkeypatch: Any) -> None:
     calls: list[float] = []
 
@@ -632,3 +678,133 @@ def test_set_rate_limit_resets_existing_limiter() -> None:
     assert first is not second
     assert second.rate == 5
     asyncio.run(client.aclose())
+
+
+def test_token_bucket_allows_bursts_and_releases_waiters_in_parallel() -> None:
+    limiter = http_client_module._TokenBucketLimiter(3, 0.15)
+
+    async def _run() -> tuple[list[float], float]:
+        burst = [(await limiter.acquire()).wait_time_seconds for _ in range(3)]
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+        return burst, asyncio.get_running_loop().time() - started
+
+    burst, elapsed = asyncio.run(_run())
+    assert burst == [0.0, 0.0, 0.0]
+    # Three queued callers need three refill intervals (0.05s each), not a serialised sleep per waiter.
+    assert 0.12 <= elapsed < 0.3
+
+
+def test_token_bucket_adapts_to_throttling() -> None:
+    limiter = http_client_module._TokenBucketLimiter(10, 1.0, recovery_steps=4)
+    limiter.penalize()
+    assert limiter.fill_rate == pytest.approx(5.0)
+    limiter.penalize(retry_after=0.05)
+    assert limiter.fill_rate == pytest.approx(2.5)
+
+    async def _acquire() -> float:
+        return (await limiter.acquire()).wait_time_seconds
+
+    assert asyncio.run(_acquire()) >= 0.05
+    for _ in range(10):
+        limiter.reward()
+    assert limiter.fill_rate == pytest.approx(limiter.max_fill_rate)
+
+
+def test_http_client_backs_off_on_retry_after(monkeypatch: Any) -> None:
+    responses = [
+        HTTPX.Response(
+            status_code=429,
+            headers={"Retry-After": "0.05"},
+            request=HTTPX.Request("GET", "https://example.com"),
+        ),
+        HTTPX.Response(
+            status_code=200,
+            json={"ok": True},
+            request=HTTPX.Request("GET", "https://example.com"),
+        ),
+    ]
+
+    async def _request(
+        self: HttpxAsyncClient, method: str, url: str, **kwargs: Any
+    ) -> HttpxResponseProtocol:
+        return responses.pop(0)
+
+    client = AsyncHttpClient(retries=2, limits={"example.com": RateLimit(rate=10, per=1.0)})
+    monkeypatch.setattr(
+        client._client, "request", _request.__get__(client._client, HTTPX.AsyncClient)
+    )
+    monkeypatch.setattr(http_client_module.random, "uniform", lambda *_: 0.0)
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(http_client_module.asyncio, "sleep", _sleep)
+
+    async def _run() -> Any:
+        async with client:
+            return await client.get_json("https://example.com")
+
+    assert asyncio.run(_run()).data == {"ok": True}
+    limiter = client._get_limiter("example.com")
+    assert limiter.fill_rate < limiter.max_fill_rate
+    assert sleeps[0] == pytest.approx(0.5)
+
+
+def test_response_cache_serves_hits_and_revalidates(monkeypatch: Any, tmp_path: Any) -> None:
+    sent_headers: list[dict[str, str]] = []
+    responses = [
+        HTTPX.Response(
+            status_code=200,
+            content=b'{"version": 1}',
+            headers={"ETag": '"v1"', "Content-Type": "application/json"},
+            request=HTTPX.Request("GET", "https://example.com/mesh"),
+        ),
+        HTTPX.Response(status_code=304, request=HTTPX.Request("GET", "https://example.com/mesh")),
+    ]
+
+    async def _request(
+        self: HttpxAsyncClient, method: str, url: str, **kwargs: Any
+    ) -> HttpxResponseProtocol:
+        sent_headers.append(dict(kwargs.get("headers") or {}))
+        return responses.pop(0)
+
+    cache = HttpResponseCache(tmp_path / "cache", host_ttls={"example.com": 60.0})
+    outcomes: list[str] = []
+    client = AsyncHttpClient(cache=cache, on_cache=lambda event: outcomes.append(event.outcome))
+    monkeypatch.setattr(
+        client._client, "request", _request.__get__(client._client, HTTPX.AsyncClient)
+    )
+
+    async def _fetch() -> Any:
+        return (await client.get_json("https://example.com/mesh", params={"q": "a"})).data
+
+    async def _run() -> list[Any]:
+        async with client:
+            payloads = [await _fetch(), await _fetch()]
+            cache.host_ttls["example.com"] = 0.0
+            payloads.append(await _fetch())
+            return payloads
+
+    assert asyncio.run(_run()) == [{"version": 1}] * 3
+    assert outcomes == ["miss", "hit", "revalidated"]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    reloaded = HttpResponseCache(tmp_path / "cache")
+    assert len(reloaded) == 1
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path: Any) -> None:
+    cache = HttpResponseCache(tmp_path, max_bytes=10)
+    keys = [
+        HttpResponseCache.build_key("GET", f"https://example.com/{index}") for index in range(3)
+    ]
+    for key in keys[:2]:
+        cache.store(key, method="GET", url="u", status_code=200, headers={}, content=b"12345")
+    assert cache.lookup(keys[0]) is not None
+    cache.store(keys[2], method="GET", url="u", status_code=200, headers={}, content=b"12345")
+    assert cache.lookup(keys[1]) is None
+    assert cache.lookup(keys[0]) is not None
+    assert cache.total_bytes == 10
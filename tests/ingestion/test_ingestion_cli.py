@@ -12,6 +12,7 @@ from typer.testing import CliRunner
 from Medical_KG.ingestion import cli
 from Medical_KG.ingestion.cli_helpers import (
     BatchValidationError,
+    NdjsonBatchReader,
     chunk_parameters,
     count_ndjson_records,
     load_ndjson_batch,
@@ -341,6 +342,61 @@ def test_schema_validation_failure(tmp_path: Path) -> None:
     assert "Schema validation failed" in outcome.stderr
 
 
+def test_schema_validation_workers_use_process_pool(
+    tmp_path: Path, make_pipeline: Callable[[list[PipelineResult]], FakePipeline]
+) -> None:
+    make_pipeline([build_result(["doc-1"])])
+    batch = tmp_path / "params.ndjson"
+    schema = tmp_path / "schema.json"
+    batch.write_text("".join(json.dumps({"param": index}) + "\n" for index in range(3)))
+    schema.write_text(json.dumps({"type": "object", "required": ["param"]}))
+    options = ["--schema", str(schema), "--validation-workers", "2", "--no-stream"]
+
+    outcome = runner.invoke(cli.app, ["demo", "--batch", str(batch), "--summary-only", *options])
+    assert outcome.exit_code == 0, outcome.stdout
+    assert "validated against provided JSON schema" in outcome.stdout
+
+    batch.write_text('{"param": 1}\n{"param": 2}\n{"wrong": 3}\n')
+    outcome = runner.invoke(cli.app, ["demo", "--batch", str(batch), *options])
+    assert outcome.exit_code == 2
+    assert "Schema validation failed" in outcome.stderr
+
+    batch.write_text('{"param": 1}\n{"param": 2}\n\n{"param": 3\n')
+    outcome = runner.invoke(cli.app, ["demo", "--batch", str(batch), *options])
+    assert outcome.exit_code == 2
+    assert "Invalid JSON on line 4" in outcome.stderr
+
+
+def test_schema_validator_runs_in_spawned_workers(tmp_path: Path) -> None:
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        json.dumps(
+            {
+                "type": "object",
+                "required": ["value"],
+                "properties": {"value": {"type": "integer", "maximum": 24}},
+            }
+        )
+    )
+    validator = cli._load_json_schema_validator(schema)
+    batch = tmp_path / "batch.ndjson"
+    batch.write_text("".join(json.dumps({"value": index}) + "\n" for index in range(40)))
+
+    seen: list[int] = []
+    reader = NdjsonBatchReader(batch, validator=validator, workers=2, chunk_bytes=48)
+    with pytest.raises(BatchValidationError, match="Schema validation failed"):
+        for record in reader:
+            seen.append(record["value"])
+    assert seen == list(range(25))
+
+    lines = [json.dumps({"value": index}) for index in range(20)]
+    lines[16] = '{"value": '
+    batch.write_text("\n".join(lines) + "\n")
+    reader = NdjsonBatchReader(batch, validator=validator, workers=2, chunk_bytes=48)
+    with pytest.raises(BatchValidationError, match="Invalid JSON on line 17"):
+        list(reader)
+
+
 def test_resume_sets_flag_on_pipeline(
     tmp_path: Path, make_pipeline: Callable[[list[PipelineResult]], FakePipeline]
 ) -> None:
@@ -434,3 +490,40 @@ def test_stream_flag_emits_events(monkeypatch: pytest.MonkeyPatch) -> None:
     # Summary should be in stderr when streaming, but appears to be in stdout
     assert "Processed documents" in outcome.stdout
     assert pipeline.stream_calls, "stream_events should be invoked"
+
+
+def test_http_cache_options_reach_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    pipeline = FakePipeline([build_result(["doc-cached"])])
+    options: dict[str, Any] = {}
+
+    def _build(_ledger: Path, **pipeline_options: Any) -> FakePipeline:
+        options.update(pipeline_options)
+        return pipeline
+
+    monkeypatch.setattr(cli, "_build_pipeline", _build)
+    cache_dir = tmp_path / "http-cache"
+
+    outcome = runner.invoke(
+        cli.app,
+        [
+            "demo",
+            "--summary-only",
+            "--http-cache-dir",
+            str(cache_dir),
+            "--http-cache-ttl",
+            "eutils.ncbi.nlm.nih.gov=600",
+        ],
+    )
+
+    assert outcome.exit_code == 0, outcome.stderr
+    assert options == {
+        "http_cache_dir": cache_dir,
+        "http_cache_ttls": {"eutils.ncbi.nlm.nih.gov": 600.0},
+    }
+
+    rejected = runner.invoke(cli.app, ["demo", "--http-cache-ttl", "example.com=600"])
+    assert rejected.exit_code == 2
+    malformed = runner.invoke(
+        cli.app, ["demo", "--http-cache-dir", str(cache_dir), "--http-cache-ttl", "example.com"]
+    )
+    assert malformed.exit_code == 2
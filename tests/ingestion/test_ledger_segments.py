@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from Medical_KG.ingestion.ledger import IngestionLedger, LedgerState
+from Medical_KG.ingestion.ledger_segments import (
+    LedgerSegmentStore,
+    SegmentedIngestionLedger,
+    import_jsonl_ledger,
+)
+from Medical_KG.ingestion.pipeline import IngestionPipeline
+
+_SEQUENCE = (LedgerState.PENDING, LedgerState.FETCHING, LedgerState.FETCHED)
+
+
+def _populate(ledger: IngestionLedger, documents: int) -> None:
+    for index in range(documents):
+        for state in _SEQUENCE:
+            ledger.update_state(
+                f"doc-{index}",
+                state,
+                adapter="pubmed",
+                metadata={"index": index} if state is LedgerState.FETCHED else None,
+            )
+
+
+def test_segmented_ledger_round_trip(tmp_path: Path) -> None:
+    ledger = SegmentedIngestionLedger(tmp_path / "ledger", segment_records=4)
+    _populate(ledger, 5)
+    ledger.update_state("doc-0", LedgerState.PARSING, retry_count=2, parameters={"attempt": 1})
+    ledger.close()
+
+    reloaded = SegmentedIngestionLedger(tmp_path / "ledger", segment_records=4)
+    assert len(reloaded.store.segments()) > 1
+    document = reloaded.get("doc-0")
+    assert document is not None
+    assert document.state is LedgerState.PARSING
+    assert document.adapter == "pubmed"
+    assert document.metadata == {"index": 0}
+    assert document.retry_count == 2
+    assert [audit.new_state for audit in document.history] == [*_SEQUENCE, LedgerState.PARSING]
+    assert document.history[-1].parameters == {"attempt": 1}
+    fetched = {entry.doc_id for entry in reloaded.entries(state=LedgerState.FETCHED)}
+    assert fetched == {f"doc-{index}" for index in range(1, 5)}
+    assert reloaded.get_state("missing") is None
+
+
+def test_segmented_ledger_replays_records_after_checkpoint(tmp_path: Path) -> None:
+    ledger = SegmentedIngestionLedger(tmp_path / "ledger")
+    _populate(ledger, 3)
+    ledger.create_snapshot()
+    ledger.update_state("doc-1", LedgerState.PARSING)
+    # Simulate a crash: flush buffered segment data without writing a checkpoint.
+    ledger.store._segment_handle.flush()
+    ledger.store._blob_handle.flush()
+    ledger.store._index.close()
+
+    reloaded = SegmentedIngestionLedger(tmp_path / "ledger")
+    assert reloaded.get_state("doc-1") is LedgerState.PARSING
+    assert reloaded._state_counts[LedgerState.FETCHED] == 2
+    assert len(reloaded.get_state_history("doc-1")) == 4
+
+
+def test_segmented_ledger_auto_snapshot_checkpoints_index(tmp_path: Path) -> None:
+    ledger = SegmentedIngestionLedger(
+        tmp_path / "ledger", auto_snapshot_interval=timedelta(microseconds=1)
+    )
+    _populate(ledger, 2)
+    ledger.update_state("doc-0", LedgerState.PARSING)
+    assert not list(ledger.snapshot_dir.glob("snapshot-*"))
+    ledger.store._index.close()
+
+    reloaded = SegmentedIngestionLedger(tmp_path / "ledger")
+    assert reloaded.get_state("doc-0") is LedgerState.PARSING
+    assert reloaded.get_state("doc-1") is LedgerState.FETCHED
+
+
+def test_segment_store_handles_unusual_identifiers(tmp_path: Path) -> None:
+    ledger = SegmentedIngestionLedger(tmp_path / "ledger")
+    ledger.update_state('"quoted"\nid', LedgerState.FETCHING, error_message="boom")
+    ledger.close()
+
+    store = LedgerSegmentStore(tmp_path / "ledger")
+    assert store.doc_ids() == ['"quoted"\nid']
+    [record] = list(store.iter_records())
+    assert record.error_message == "boom"
+    store.close()
+
+
+def test_import_jsonl_ledger(tmp_path: Path) -> None:
+    source = IngestionLedger(tmp_path / "ledger.jsonl")
+    _populate(source, 2)
+    source.close()
+
+    assert import_jsonl_ledger(tmp_path / "ledger.jsonl", tmp_path / "segments") == 6
+    ledger = SegmentedIngestionLedger(tmp_path / "segments")
+    document = ledger.get("doc-1")
+    assert document is not None
+    assert document.state is LedgerState.FETCHED
+    assert document.metadata == {"index": 1}
+
+
+def test_segmented_state_queries_skip_segment_history(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger = SegmentedIngestionLedger(tmp_path / "ledger", segment_records=4)
+    _populate(ledger, 3)
+    assert [len(doc.history) for doc in ledger.entries()] == [len(_SEQUENCE)] * 3
+
+    def _no_history(ordinal: int) -> list[object]:
+        raise AssertionError("state queries must not read segment history")
+
+    monkeypatch.setattr(ledger.store, "history", _no_history)
+    assert ledger.get_state("doc-1") is LedgerState.FETCHED
+    assert all(not doc.history for doc in ledger.entries(with_history=False))
+    pipeline = IngestionPipeline(ledger)
+    pipeline._mark_failed("doc-1", "pubmed", RuntimeError("boom"))
+    assert ledger.get_state("doc-1") is LedgerState.FAILED
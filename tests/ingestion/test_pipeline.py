@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
-from Medical_KG.ingestion.adapters.base import AdapterContext, BaseAdapter
+import pytest
+
+from Medical_KG.ingestion.adapters.base import AdapterConcurrency, AdapterContext, BaseAdapter
 from Medical_KG.ingestion.adapters.guidelines import NiceGuidelineAdapter
 from Medical_KG.ingestion.events import (
     AdapterStateChange,
@@ -19,6 +22,7 @@ from Medical_KG.ingestion.events import (
 from Medical_KG.ingestion.ledger import IngestionLedger, LedgerState
 from Medical_KG.ingestion.models import Document, IngestionResult
 from Medical_KG.ingestion.pipeline import IngestionPipeline, PipelineResult
+from Medical_KG.utils.optional_dependencies import get_httpx_module
 
 
 class _StubAdapter(BaseAdapter):
@@ -675,3 +679,251 @@ def test_pipeline_records_consumption_modes(monkeypatch, tmp_path: Path) -> None
     asyncio.run(pipeline_async.run_async("stub"))
     modes = {record.get("mode") for record in counter.records}
     assert modes == {"stream_events", "run_async"}
+
+
+class _SlowParseAdapter(_StubAdapter):
+    def parse(self, raw: dict[str, Any]) -> Document:
+        # Earlier records parse slower so unordered completion differs from fetch order.
+        time.sleep(0.01 * (5 - int(raw["id"].split("-")[1])))
+        return super().parse(raw)
+
+
+def test_pipeline_concurrency_preserves_fetch_order(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    records = [{"id": f"doc-{index}", "content": "ok"} for index in range(5)]
+    adapter = _SlowParseAdapter(AdapterContext(ledger), records=records)
+    pipeline = IngestionPipeline(
+        ledger,
+        registry=_Registry(adapter),
+        client_factory=lambda: _NoopClient(),
+    )
+
+    ordered = pipeline.run("stub", concurrency=4)
+    assert ordered[0].doc_ids == [record["id"] for record in records]
+    assert all(ledger.get_state(record["id"]) is LedgerState.COMPLETED for record in records)
+
+    ledger = IngestionLedger(tmp_path / "unordered.jsonl")
+    adapter = _SlowParseAdapter(AdapterContext(ledger), records=records)
+    pipeline = IngestionPipeline(
+        ledger,
+        registry=_Registry(adapter),
+        client_factory=lambda: _NoopClient(),
+    )
+    unordered = pipeline.run("stub", concurrency=5, preserve_order=False)
+    assert sorted(unordered[0].doc_ids) == sorted(ordered[0].doc_ids)
+    assert unordered[0].doc_ids != ordered[0].doc_ids
+
+
+class _BrokenParseAdapter(_StubAdapter):
+    def parse(self, raw: dict[str, Any]) -> Document:
+        if raw.get("broken"):
+            raise ValueError("unparseable record")
+        return super().parse(raw)
+
+
+def test_adapter_concurrency_records_parse_failures(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    records = [{"id": "doc-0"}, {"id": "doc-1", "broken": True}, {"id": "doc-2"}]
+    adapter = _BrokenParseAdapter(AdapterContext(ledger), records=records)
+
+    async def _collect() -> list[str]:
+        return [
+            result.document.doc_id
+            async for result in adapter.iter_results(concurrency=AdapterConcurrency(workers=2))
+        ]
+
+    with pytest.raises(ValueError, match="unparseable"):
+        asyncio.run(_collect())
+    assert ledger.get_state("doc-0") is LedgerState.COMPLETED
+    assert ledger.get_state(str(records[1])) is LedgerState.FAILED
+    assert ledger.get_state("doc-2") is None
+
+
+class _BatchAdapter(_StubAdapter):
+    """Fetch one document per ``batch`` invocation, failing or timing out on request."""
+
+    def __init__(self, context: AdapterContext, *, timeouts: dict[str, int] | None = None) -> None:
+        super().__init__(context, records=[])
+        self.timeouts = dict(timeouts or {})
+        self.active = 0
+        self.peak = 0
+
+    async def fetch(  # type: ignore[override]
+        self, *_: Any, batch: str, fail: bool = False, **__: Any
+    ) -> Iterable[dict[str, Any]]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.timeouts.get(batch, 0) > 0:
+                self.timeouts[batch] -= 1
+                raise TimeoutError(f"{batch} timed out")
+            if fail:
+                error = RuntimeError(f"{batch} is broken")
+                setattr(error, "doc_id", f"{batch}-doc")
+                raise error
+            yield {"id": f"{batch}-doc"}
+        finally:
+            self.active -= 1
+
+
+class _FlakyValidateAdapter(_BatchAdapter):
+    """Time out inside ``validate`` for the first ``validate_timeouts`` documents."""
+
+    def __init__(self, context: AdapterContext, *, validate_timeouts: int) -> None:
+        super().__init__(context)
+        self.validate_timeouts = validate_timeouts
+
+    def validate(self, document: Document) -> None:
+        if self.validate_timeouts > 0:
+            self.validate_timeouts -= 1
+            raise TimeoutError(f"{document.doc_id} validation timed out")
+
+
+def _stream_batches(
+    pipeline: IngestionPipeline, params: list[dict[str, Any]], **kwargs: Any
+) -> list[PipelineEvent]:
+    async def _collect() -> list[PipelineEvent]:
+        return [event async for event in pipeline.stream_events("stub", params=params, **kwargs)]
+
+    return asyncio.run(_collect())
+
+
+def test_stream_events_continue_after_failed_invocation(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    adapter = _BatchAdapter(AdapterContext(ledger))
+    pipeline = IngestionPipeline(
+        ledger, registry=_Registry(adapter), client_factory=lambda: _NoopClient()
+    )
+
+    events = _stream_batches(
+        pipeline, [{"batch": "a"}, {"batch": "b", "fail": True}, {"batch": "c"}]
+    )
+
+    completed = [event.document.doc_id for event in events if isinstance(event, DocumentCompleted)]
+    assert completed == ["a-doc", "c-doc"]
+    failures = [event for event in events if isinstance(event, DocumentFailed)]
+    assert [(event.doc_id, event.error_type) for event in failures] == [("b-doc", "RuntimeError")]
+    assert ledger.get_state("b-doc") is LedgerState.FAILED
+    states = [event for event in events if isinstance(event, AdapterStateChange)]
+    assert "invocation_failed" in [event.new_state for event in states]
+    assert states[-1].new_state == "completed"
+    assert states[-1].reason == "1 of 3 invocations failed (RuntimeError=1)"
+
+
+def test_stream_events_retry_transient_invocation_errors(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    adapter = _BatchAdapter(AdapterContext(ledger), timeouts={"a": 2, "b": 2})
+    pipeline = IngestionPipeline(
+        ledger, registry=_Registry(adapter), client_factory=lambda: _NoopClient()
+    )
+
+    events = _stream_batches(pipeline, [{"batch": "a"}], invocation_retries=2, retry_backoff=0)
+    assert [e.document.doc_id for e in events if isinstance(e, DocumentCompleted)] == ["a-doc"]
+
+    events = _stream_batches(pipeline, [{"batch": "b"}], invocation_retries=1, retry_backoff=0)
+    failures = [event for event in events if isinstance(event, DocumentFailed)]
+    assert len(failures) == 1
+    assert failures[0].error_type == "TimeoutError"
+    assert failures[0].retry_count == 1
+    assert failures[0].is_retryable
+    assert [e for e in events if isinstance(e, AdapterStateChange)][-1].new_state == "failed"
+
+
+def test_stream_events_retry_transient_errors_raised_inside_adapter(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    adapter = _FlakyValidateAdapter(AdapterContext(ledger), validate_timeouts=1)
+    pipeline = IngestionPipeline(
+        ledger, registry=_Registry(adapter), client_factory=lambda: _NoopClient()
+    )
+
+    events = _stream_batches(pipeline, [{"batch": "a"}], invocation_retries=1, retry_backoff=0)
+
+    assert [e.document.doc_id for e in events if isinstance(e, DocumentCompleted)] == ["a-doc"]
+    assert ledger.get("a-doc").state is LedgerState.COMPLETED
+
+
+def test_stream_events_record_adapter_failure_once(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    adapter = _FlakyValidateAdapter(AdapterContext(ledger), validate_timeouts=1)
+    pipeline = IngestionPipeline(
+        ledger, registry=_Registry(adapter), client_factory=lambda: _NoopClient()
+    )
+
+    events = _stream_batches(pipeline, [{"batch": "a"}])
+
+    failures = [event for event in events if isinstance(event, DocumentFailed)]
+    assert len(failures) == 1
+    assert failures[0].is_retryable
+    history = ledger.get_state_history("a-doc")
+    assert [record.new_state for record in history].count(LedgerState.FAILED) == 1
+
+
+def test_stream_events_run_invocations_in_parallel(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    adapter = _BatchAdapter(AdapterContext(ledger))
+    pipeline = IngestionPipeline(
+        ledger, registry=_Registry(adapter), client_factory=lambda: _NoopClient()
+    )
+    params = [{"batch": f"batch-{index}"} for index in range(6)]
+
+    events = _stream_batches(pipeline, params, max_parallel_invocations=3)
+
+    completed = {event.document.doc_id for event in events if isinstance(event, DocumentCompleted)}
+    assert completed == {f"batch-{index}-doc" for index in range(6)}
+    assert adapter.peak == 3
+    with pytest.raises(ValueError, match="max_parallel_invocations"):
+        _stream_batches(pipeline, params, max_parallel_invocations=0)
+
+
+class _HttpRegistry:
+    """Build an adapter that fetches one JSON document through the pipeline's client."""
+
+    def get_adapter(self, source: str, context: AdapterContext, client: Any) -> BaseAdapter:
+        adapter = _StubAdapter(context, records=[])
+
+        async def fetch(*_: Any, **__: Any) -> Any:
+            response = await client.get_json("https://example.com/record")
+            yield {"id": response.data["id"]}
+
+        adapter.fetch = fetch  # type: ignore[method-assign]
+        return adapter
+
+
+def test_http_cache_revalidates_on_second_run(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    httpx = get_httpx_module()
+    statuses: list[int] = []
+    sent_headers: list[dict[str, str]] = []
+
+    async def _request(self: Any, method: str, url: str, **kwargs: Any) -> Any:
+        headers = dict(kwargs.get("headers") or {})
+        sent_headers.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            response = httpx.Response(status_code=304, request=httpx.Request(method, url))
+        else:
+            response = httpx.Response(
+                status_code=200,
+                json={"id": "cached-doc"},
+                headers={"ETag": '"v1"'},
+                request=httpx.Request(method, url),
+            )
+        statuses.append(response.status_code)
+        return response
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", _request)
+
+    for run in range(2):
+        pipeline = IngestionPipeline(
+            IngestionLedger(tmp_path / f"ledger-{run}.jsonl"),
+            registry=_HttpRegistry(),
+            http_cache_dir=tmp_path / "http-cache",
+            http_cache_ttls={"example.com": 0.0},
+        )
+        events = _stream_batches(pipeline, [{}])
+        completed = [e.document.doc_id for e in events if isinstance(e, DocumentCompleted)]
+        assert completed == ["cached-doc"]
+
+    assert statuses == [200, 304]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from Medical_KG.ingestion.adapters.base import AdapterContext, BaseAdapter
+from Medical_KG.ingestion.events import BatchProgress, DocumentCompleted, PipelineEvent
+from Medical_KG.ingestion.ledger import IngestionLedger, LedgerState
+from Medical_KG.ingestion.models import Document
+from Medical_KG.ingestion.sharding import (
+    LedgerShard,
+    ShardedIngestionPipeline,
+    discover_ledger_shards,
+    merge_ledger_shards,
+    partition_invocations,
+    shard_ledger_path,
+)
+
+
+class _IdAdapter(BaseAdapter[dict[str, Any]]):
+    source = "ids"
+
+    async def fetch(self, ids: list[str], **_: Any) -> AsyncIterator[dict[str, Any]]:
+        for identifier in ids:
+            yield {"id": identifier}
+
+    def parse(self, raw: dict[str, Any]) -> Document:
+        return Document(
+            doc_id=raw["id"], source=self.source, content=raw["id"], metadata={}, raw=raw
+        )
+
+
+class _IdRegistry:
+    """Module-level registry so spawned workers can unpickle it."""
+
+    def get_adapter(self, source: str, context: AdapterContext, client: Any) -> BaseAdapter[Any]:
+        return _IdAdapter(context)
+
+    def available_sources(self) -> list[str]:
+        return ["ids"]
+
+
+def test_partition_splits_id_lists_date_ranges_and_batches() -> None:
+    shards = partition_invocations([{"ids": ["a", "b", "c", "d", "e"], "page_size": 5}], 2)
+    assert [shard[0]["ids"] for shard in shards] == [["a", "b", "c"], ["d", "e"]]
+    assert all(shard[0]["page_size"] == 5 for shard in shards)
+
+    windows = partition_invocations([{"start_date": "2024-01-01", "end_date": "2024-01-04"}], 3)
+    assert [(shard[0]["start_date"], shard[0]["end_date"]) for shard in windows] == [
+        ("2024-01-01", "2024-01-02"),
+        ("2024-01-03", "2024-01-03"),
+        ("2024-01-04", "2024-01-04"),
+    ]
+
+    batches = partition_invocations([{"page": index} for index in range(5)], 2)
+    assert [[entry["page"] for entry in shard] for shard in batches] == [[0, 2, 4], [1, 3]]
+    assert len(partition_invocations([{"term": "asthma"}], 4)) == 1
+
+
+def test_merge_ledger_shards_skips_conflicting_documents(tmp_path: Path) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    canonical = IngestionLedger(ledger_path)
+    canonical.update_state("existing", LedgerState.FETCHING)
+    canonical.close()
+
+    path = [LedgerState.FETCHED, LedgerState.PARSING, LedgerState.PARSED]
+    for shard in range(2):
+        ledger = LedgerShard(ledger_path, shard_ledger_path(ledger_path, shard))
+        assert ledger.get_state("existing") is LedgerState.FETCHING
+        ledger.transition_path("shared", [LedgerState.FETCHING, *path])
+        ledger.update_state(f"doc-{shard}", LedgerState.FETCHING)
+        ledger.close()
+
+    assert IngestionLedger(ledger_path).get_state("shared") is None
+    canonical = IngestionLedger(ledger_path)
+    applied = merge_ledger_shards(canonical, discover_ledger_shards(ledger_path))
+
+    assert applied == 6
+    assert discover_ledger_shards(ledger_path) == []
+    reloaded = IngestionLedger(ledger_path)
+    assert reloaded.get_state("shared") is LedgerState.PARSED
+    assert reloaded.get_state("doc-0") is LedgerState.FETCHING
+    assert reloaded.get_state("doc-1") is LedgerState.FETCHING
+    assert len(reloaded.get_state_history("shared")) == 4
+
+
+def test_sharded_pipeline_aggregates_worker_events(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    pipeline = ShardedIngestionPipeline(
+        ledger, workers=2, start_method="fork", registry=_IdRegistry()
+    )
+    ids = [f"doc-{index}" for index in range(6)]
+
+    async def _collect() -> list[PipelineEvent]:
+        return [event async for event in pipeline.stream_events("ids", params=[{"ids": ids}])]
+
+    events = asyncio.run(_collect())
+
+    completed = sorted(
+        event.document.doc_id for event in events if isinstance(event, DocumentCompleted)
+    )
+    assert completed == ids
+    assert len({event.pipeline_id for event in events}) == 1
+    final_progress = [event for event in events if isinstance(event, BatchProgress)][-1]
+    assert final_progress.completed_count == len(ids)
+    assert all(ledger.get_state(doc_id) is LedgerState.COMPLETED for doc_id in ids)
+    assert discover_ledger_shards(ledger.path) == []
+    reloaded = IngestionLedger(ledger.path)
+    assert all(reloaded.get_state(doc_id) is LedgerState.COMPLETED for doc_id in ids)
+
+
+def test_sharded_pipeline_runs_unpartitioned_generator_in_process(tmp_path: Path) -> None:
+    ledger = IngestionLedger(tmp_path / "ledger.jsonl")
+    pipeline = ShardedIngestionPipeline(ledger, workers=2, registry=_IdRegistry())
+    params = (entry for entry in [{"ids": ["doc-0"]}])
+
+    async def _collect() -> list[PipelineEvent]:
+        return [event async for event in pipeline.stream_events("ids", params=params)]
+
+    events = asyncio.run(_collect())
+
+    completed = [event.document.doc_id for event in events if isinstance(event, DocumentCompleted)]
+    assert completed == ["doc-0"]
+    assert ledger.get_state("doc-0") is LedgerState.COMPLETED
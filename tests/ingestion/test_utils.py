@@ -34,3 +34,19 @@ def test_canonical_json_sorts_keys() -> None:
     payload = {"b": 1, "a": 2}
     encoded = utils.canonical_json(payload)
     assert encoded == b'{"a":2,"b":1}'
+
+
+def test_iter_xml_elements_streams_and_detaches_matches() -> None:
+    xml = (
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><ListRecords>'
+        + "".join(f"<record><id>{index}</id></record>" for index in range(5))
+        + "<resumptionToken>next</resumptionToken></ListRecords></OAI-PMH>"
+    )
+    stream = utils.iter_xml_elements(xml, {"record", "resumptionToken"}, chunk_size=16)
+    first = next(stream)
+    assert first.findtext("{http://www.openarchives.org/OAI/2.0/}id") == "0"
+    rest = list(stream)
+    assert [element.tag.rsplit("}", 1)[-1] for element in rest] == ["record"] * 4 + [
+        "resumptionToken"
+    ]
+    assert rest[-1].text == "next"
@@ -0,0 +1,88 @@
+from typing import Any, Mapping
+
+import pytest
+
+from Medical_KG.kg.bulk import UnwindBatchWriter, is_transient_error
+
+
+class TransientError(Exception):
+    """Stand-in for ``neo4j.exceptions.TransientError``."""
+
+
+class RecordingSession:
+    def __init__(self, failures: list[Exception] | None = None) -> None:
+        self.calls: list[tuple[str, list[dict[str, Any]]]] = []
+        self._failures = list(failures or [])
+
+    def run(self, query: str, parameters: Mapping[str, Any] | None = None) -> None:
+        if self._failures:
+            raise self._failures.pop(0)
+        self.calls.append((query, list((parameters or {})["rows"])))
+
+
+def test_rows_are_grouped_and_flushed_in_batches() -> None:
+    session = RecordingSession()
+    writer = UnwindBatchWriter(session, batch_size=1000)
+    for index in range(2500):
+        writer.merge_node("Chunk", "id", f"c{index}", {"index": index})
+        writer.merge_relationship(
+            "HAS_CHUNK", ("Document", "id", "d1"), ("Chunk", "id", f"c{index}")
+        )
+    writer.merge_node(("Concept", "Condition"), "iri", "iri:1")
+    writer.flush()
+
+    assert writer.pending == 0
+    statements = [query for query, _ in session.calls]
+    assert len(statements) == 7
+    assert all(query.startswith("UNWIND $rows AS row") for query in statements)
+    assert sum("MERGE (n:Concept:Condition {iri: row.keys.iri})" in q for q in statements) == 1
+    assert [len(rows) for query, rows in session.calls if "HAS_CHUNK" in query] == [1000, 1000, 500]
+    # Every relationship batch is written after the chunk nodes it matches on.
+    first_rel = next(i for i, query in enumerate(statements) if "HAS_CHUNK" in query)
+    assert sum("MERGE (n:Chunk" in query for query in statements[:first_rel]) == 1
+    assert writer.stats.statements == 7
+    assert writer.stats.rows == 5001
+
+
+def test_transient_errors_retry_the_batch() -> None:
+    session = RecordingSession([TransientError("deadlock"), ConnectionError("reset")])
+    delays: list[float] = []
+    writer = UnwindBatchWriter(session, backoff_seconds=0.5, sleep=delays.append)
+    with writer:
+        writer.merge_node("Chunk", "id", "c1")
+    assert len(session.calls) == 1
+    assert writer.stats.retries == 2
+    assert delays == [0.5, 1.0]
+
+    failing = UnwindBatchWriter(RecordingSession([ValueError("syntax")]), sleep=delays.append)
+    failing.merge_node("Chunk", "id", "c1")
+    with pytest.raises(ValueError):
+        failing.flush()
+    assert not is_transient_error(ValueError("syntax"))
+
+
+def test_apoc_mode_uses_periodic_iterate() -> None:
+    session = RecordingSession()
+    writer = UnwindBatchWriter(session, batch_size=50, use_apoc=True)
+    writer.merge_node(("Concept", "Drug"), "iri", "iri:1", {"label": "aspirin"})
+    writer.merge_relationship("IS_A", ("Concept", "iri", "iri:1"), ("Concept", "iri", "iri:0"))
+    writer.flush()
+    (node_query, node_rows), (rel_query, _) = session.calls
+    assert 'apoc.merge.node(["Concept", "Drug"]' in node_query
+    assert "batchSize: 50" in node_query
+    assert node_rows == [{"keys": {"iri": "iri:1"}, "props": {"label": "aspirin"}}]
+    assert 'apoc.merge.relationship(a, "IS_A"' in rel_query
+    assert "MATCH (a:Concept {iri: row.start})" in rel_query
+
+
+@pytest.mark.parametrize("use_apoc", [False, True])
+def test_node_merges_update_matched_nodes(use_apoc: bool) -> None:
+    session = RecordingSession()
+    writer = UnwindBatchWriter(session, use_apoc=use_apoc)
+    writer.merge_node("Concept", "iri", "iri:1", {"label": "aspirin"})
+    writer.flush()
+    ((query, _),) = session.calls
+    if use_apoc:
+        assert 'apoc.merge.node(["Concept"], row.keys, row.props, row.props)' in query
+    else:
+        assert "MERGE (n:Concept {iri: row.keys.iri}) SET n += row.props" in query
@@ -159,3 +159,56 @@ def test_constraint_violation_raises(writer: KnowledgeGraphWriter) -> None:
     with pytest.raises(ValueError):
         _execute(writer, driver)
     assert driver.get_node("Document", "doc://two") is None
+
+
+def test_duplicate_node_upserts_are_collapsed(writer: KnowledgeGraphWriter) -> None:
+    writer.write_concept({"iri": "iri:1", "label": "Old", "code": "C1"})
+    writer.write_relationship(
+        "SAME_AS", "iri:1", "iri:2", start_label="Concept", end_label="Concept"
+    )
+    writer.write_concept({"iri": "iri:1", "label": "New", "synonym": None})
+    statements = list(writer.statements)
+    assert len(statements) == 2
+    assert statements[0].parameters["props"] == {
+        "iri": "iri:1",
+        "label": "New",
+        "code": "C1",
+        "synonym": None,
+    }
+    assert "SAME_AS" in statements[1].cypher
+
+
+def test_compile_groups_templates_into_unwind_batches(writer: KnowledgeGraphWriter) -> None:
+    writer.write_document({"uri": "doc://1", "id": "doc-1"})
+    for index in range(5):
+        writer.write_chunk({"id": f"chunk-{index}"}, document_uri="doc://1", order=index)
+    compiled = writer.compile(batch_size=2)
+    assert all(stmt.cypher.startswith("UNWIND $rows AS row ") for stmt in compiled)
+    assert [len(stmt.parameters["rows"]) for stmt in compiled] == [1, 2, 2, 1, 2, 2, 1]
+    assert "MERGE (n:Chunk {id: row.props.id}) SET n += row.props" in compiled[1].cypher
+    relationship = compiled[-1]
+    assert relationship.cypher.endswith("MERGE (d)-[r:HAS_CHUNK]->(c) SET r.order = row.order")
+    assert relationship.parameters["rows"] == [
+        {"doc_uri": "doc://1", "chunk_id": "chunk-4", "order": 4}
+    ]
+
+
+def test_streaming_flush_bounds_pending_statements() -> None:
+    batches: list[list[WriteStatement]] = []
+    writer = KnowledgeGraphWriter(sink=lambda batch: batches.append(list(batch)), max_pending=4)
+    writer.write_document({"uri": "doc://1", "id": "doc-1"})
+    for index in range(10):
+        writer.write_chunk({"id": f"chunk-{index}"}, document_uri="doc://1")
+        assert writer.pending < 4
+    writer.flush()
+    assert writer.pending == 0
+    rows = [
+        row
+        for batch in batches
+        for stmt in batch
+        if "HAS_CHUNK" in stmt.cypher
+        for row in stmt.parameters["rows"]
+    ]
+    assert [row["chunk_id"] for row in rows] == [f"chunk-{index}" for index in range(10)]
+    with pytest.raises(RuntimeError):
+        KnowledgeGraphWriter().flush()
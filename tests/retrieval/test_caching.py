@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Mapping, Sequence
+import threading
+import time
+from typing import Iterator, Mapping, Sequence
 
 import pytest
 
@@ -61,8 +63,8 @@ def cache_service(
     fake_splade_encoder: FakeSpladeEncoder,
     cache_rules: list[IntentRule],
     cache_config: RetrieverConfig,
-) -> RetrievalService:
-    return RetrievalService(
+) -> Iterator[RetrievalService]:
+    service = RetrievalService(
         opensearch=fake_opensearch_client,
         vector=fake_vector_client,
         embedder=fake_query_embedder,
@@ -71,6 +73,8 @@ def cache_service(
         config=cache_config,
         reranker=None,
     )
+    yield service
+    service.close()
 
 
 def test_ttl_cache_basic_cycle() -> None:
@@ -94,6 +98,61 @@ def test_ttl_cache_invalidation() -> None:
     assert cache.get("key") is None
 
 
+def test_ttl_cache_evicts_least_recently_used_within_budgets() -> None:
+    cache: TTLCache[str] = TTLCache(ttl_seconds=10, max_entries=2, sizer=len)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+
+    sized: TTLCache[str] = TTLCache(ttl_seconds=10, max_entries=None, max_bytes=10, sizer=len)
+    sized.set("a", "12345")
+    sized.set("b", "12345")
+    sized.set("c", "123")
+    assert sized.get("a") is None
+    assert sized.total_bytes == 8
+    sized.set("huge", "x" * 11)
+    assert sized.get("huge") is None
+
+
+def test_ttl_cache_sweeps_unread_expired_entries() -> None:
+    now = [0.0]
+    cache: TTLCache[int] = TTLCache(ttl_seconds=5, clock=lambda: now[0])
+    for index in range(10):
+        cache.set(f"old-{index}", index)
+    now[0] = 6.0
+    cache.set("fresh", 1)
+    assert len(cache) == 1
+    assert cache.get("fresh") == 1
+
+
+def test_ttl_cache_coalesces_concurrent_misses() -> None:
+    cache: TTLCache[int] = TTLCache(ttl_seconds=10)
+    calls: list[int] = []
+    release = threading.Event()
+
+    def factory() -> int:
+        calls.append(1)
+        release.wait(timeout=5)
+        return 42
+
+    results: list[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_set("key", factory)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert results == [42] * 5
+    assert len(calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_query_cache_hits(
     cache_service: RetrievalService, fake_opensearch_client: FakeOpenSearchClient
@@ -150,8 +209,9 @@ async def test_embedding_cache_reuses_vectors(
         ontology=CountingOntology(),
     )
     request = RetrievalRequest(query="query")
-    await service.retrieve(request)
-    await service.retrieve(request)
+    async with service:
+        await service.retrieve(request)
+        await service.retrieve(request)
     assert embedder.calls == ["query"]
 
 
@@ -187,6 +247,7 @@ async def test_expansion_cache_avoids_duplicate_calls(
         ontology=ontology,
     )
     request = RetrievalRequest(query="query")
-    await service.retrieve(request)
-    await service.retrieve(request)
+    async with service:
+        await service.retrieve(request)
+        await service.retrieve(request)
     assert ontology.calls == ["query"]
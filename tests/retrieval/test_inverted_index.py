@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from Medical_KG.services.inverted_index import InvertedIndex
+
+
+def _build_index() -> InvertedIndex:
+    index = InvertedIndex()
+    index.upsert("c1", "Hazard ratio for overall survival was 0.72.", ["endpoint"])
+    index.upsert("c2", "Adverse events included nausea and fatigue.", ["ae"])
+    index.upsert("c3", "The hazard ratio favoured pembrolizumab; hazard was reduced.", ["endpoint"])
+    index.upsert("c4", "Patients were randomised to pembrolizumab or placebo.", ["pico"])
+    return index
+
+
+def test_bm25_ranks_matching_chunks_and_applies_facet_filter() -> None:
+    index = _build_index()
+
+    hits = index.search("hazard ratio", top_k=5)
+    assert [hit.chunk.chunk_id for hit in hits] == ["c3", "c1"]
+    assert hits[0].score > hits[1].score > 0
+
+    filtered = index.search("pembrolizumab", facet_type="pico", top_k=5)
+    assert [hit.chunk.chunk_id for hit in filtered] == ["c4"]
+    assert index.search("pembrolizumab", facet_type="missing") == []
+
+
+def test_facet_filter_pads_results_with_facet_bonus() -> None:
+    index = _build_index()
+    hits = index.search("survival", facet_type="endpoint", top_k=5, facet_bonus=1.6)
+    assert [hit.chunk.chunk_id for hit in hits] == ["c1", "c3"]
+    assert hits[0].score > 1.6
+    assert hits[1].score == 1.6
+
+
+def test_upsert_replaces_and_delete_removes_postings() -> None:
+    index = _build_index()
+    index.upsert("c1", "Median progression-free survival", ["endpoint"])
+    assert [hit.chunk.chunk_id for hit in index.search("hazard", top_k=5)] == ["c3"]
+    assert index.get("c1") is not None and index.get("c1").snippet.startswith("Median")
+
+    assert index.delete("c3") is True
+    assert index.delete("c3") is False
+    assert index.search("hazard") == []
+    padded = index.search("x", facet_type="endpoint", facet_bonus=1.0)
+    assert [hit.chunk.chunk_id for hit in padded] == ["c1"]
+    index.upsert("c5", "New hazard chunk", ["endpoint"])
+    assert len(index) == 4
+    assert [hit.chunk.chunk_id for hit in index.search("hazard")] == ["c5"]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Mapping, Sequence, cast
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Mapping, Sequence, cast
 
 import pytest
 
@@ -97,7 +99,7 @@ def retrieval_service(
     fake_splade_encoder: FakeSpladeEncoder,
     retrieval_rules: list[IntentRule],
     retrieval_config: RetrieverConfig,
-) -> RetrievalService:
+) -> Iterator[RetrievalService]:
     ontology = StubOntology({"pembrolizumab": {"keytruda": 1.0}})
     service = RetrievalService(
         opensearch=fake_opensearch_client,
@@ -109,7 +111,8 @@ def retrieval_service(
         reranker=FakeReranker(),
         ontology=ontology,
     )
-    return service
+    yield service
+    service.close()
 
 
 @pytest.mark.asyncio
@@ -185,7 +188,8 @@ async def test_hybrid_fusion_falls_back_to_rrf(
         reranker=None,
         ontology=StubOntology(),
     )
-    response = await service.retrieve(RetrievalRequest(query="pembrolizumab"))
+    async with service:
+        response = await service.retrieve(RetrievalRequest(query="pembrolizumab"))
     assert response.results, "RRF fallback should yield results"
     assert all(result.scores.fused is not None for result in response.results)
 
@@ -245,7 +249,8 @@ async def test_rank_normalization_and_deduplication(
         reranker=None,
         ontology=StubOntology(),
     )
-    response = await service.retrieve(RetrievalRequest(query="pembrolizumab"))
+    async with service:
+        response = await service.retrieve(RetrievalRequest(query="pembrolizumab"))
     shared = [result for result in response.results if result.chunk_id == "shared-chunk"]
     assert len(shared) == 1
     result = shared[0]
@@ -386,5 +391,77 @@ async def test_rrf_fallback_when_no_results(
         reranker=None,
         ontology=StubOntology(),
     )
-    response = await empty_service.retrieve(RetrievalRequest(query="no-results"))
+    async with empty_service:
+        response = await empty_service.retrieve(RetrievalRequest(query="no-results"))
     assert response.results == []
+
+
+class SlowVectorClient(FakeVectorClient):
+    def query(self, *, index: str, embedding: Sequence[float], top_k: int) -> Sequence[VectorHit]:
+        time.sleep(0.5)
+        return super().query(index=index, embedding=embedding, top_k=top_k)
+
+
+@pytest.mark.asyncio
+async def test_slow_retriever_degrades_within_budget(
+    fake_opensearch_client: FakeOpenSearchClient,
+    fake_query_embedder: FakeQwenEmbedder,
+    fake_splade_encoder: FakeSpladeEncoder,
+    retrieval_rules: list[IntentRule],
+    retrieval_config: RetrieverConfig,
+) -> None:
+    retrieval_config.slo_ms = 100.0
+    service = RetrievalService(
+        opensearch=fake_opensearch_client,
+        vector=SlowVectorClient(hits=make_vector_hits([{"chunk_id": "slow", "doc_id": "d"}])),
+        embedder=fake_query_embedder,
+        splade=fake_splade_encoder,
+        intents=retrieval_rules,
+        config=retrieval_config,
+        reranker=None,
+        ontology=StubOntology(),
+    )
+    started = time.perf_counter()
+    async with service:
+        response = await service.retrieve(RetrievalRequest(query="pembrolizumab", top_k=5))
+    assert time.perf_counter() - started < 0.4
+    assert response.results
+    assert all(result.chunk_id != "slow" for result in response.results)
+    assert response.metadata["degraded_components"] == ["dense"]
+    timings = {timing.component: timing for timing in response.timings}
+    assert timings["dense"].degraded and not timings["bm25"].degraded
+    cache_key = service._cache_key(RetrievalRequest(query="pembrolizumab", top_k=5))
+    assert service._query_cache.get(cache_key) is None
+
+
+@pytest.mark.asyncio
+async def test_close_shuts_down_only_the_owned_executor(
+    fake_opensearch_client: FakeOpenSearchClient,
+    fake_vector_client: FakeVectorClient,
+    fake_query_embedder: FakeQwenEmbedder,
+    fake_splade_encoder: FakeSpladeEncoder,
+    retrieval_rules: list[IntentRule],
+    retrieval_config: RetrieverConfig,
+) -> None:
+    def build(executor: ThreadPoolExecutor | None = None) -> RetrievalService:
+        return RetrievalService(
+            opensearch=fake_opensearch_client,
+            vector=fake_vector_client,
+            embedder=fake_query_embedder,
+            splade=fake_splade_encoder,
+            intents=retrieval_rules,
+            config=retrieval_config,
+            ontology=StubOntology(),
+            executor=executor,
+        )
+
+    async with build() as service:
+        response = await service.retrieve(RetrievalRequest(query="pembrolizumab"))
+    assert response.results
+    with pytest.raises(RuntimeError, match="shutdown"):
+        service._executor.submit(lambda: None)
+
+    with ThreadPoolExecutor(max_workers=1) as injected:
+        shared = build(injected)
+        shared.close()
+        assert injected.submit(lambda: 42).result() == 42
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
@@ -15,7 +16,9 @@ from Medical_KG.ingestion.ledger import (
     InvalidStateTransition,
     LedgerAuditRecord,
     LedgerCorruption,
+    LedgerHistoryStore,
     LedgerState,
+    LedgerTransition,
     get_valid_next_states,
     is_retryable_state,
     is_terminal_state,
@@ -85,16 +88,156 @@ def test_snapshot_round_trip(tmp_path: Path) -> None:
     assert state.state is LedgerState.FETCHED
 
 
+def test_background_snapshot_does_not_block_transitions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = IngestionLedger(ledger_path, auto_snapshot_interval=timedelta(days=7))
+    ledger.update_state("doc-1", LedgerState.FETCHING)
+    release = threading.Event()
+    frozen_states: list[LedgerState] = []
+    original_write = ledger._write_snapshot
+
+    def _blocked_write(job):  # type: ignore[no-untyped-def]
+        release.wait(timeout=5)
+        frozen_states.append(job.documents["doc-1"].state)
+        original_write(job)
+
+    monkeypatch.setattr(ledger, "_write_snapshot", _blocked_write)
+    ledger._last_snapshot_at = datetime.now(timezone.utc) - timedelta(days=8)
+    ledger.update_state("doc-1", LedgerState.FETCHED)
+    ledger.update_state("doc-1", LedgerState.PARSING)
+    ledger.update_state("doc-2", LedgerState.FETCHING)
+    release.set()
+    ledger.wait_for_snapshot()
+
+    assert frozen_states == [LedgerState.FETCHED]
+    (snapshot,) = sorted(ledger.snapshot_dir.glob("*.ndjson"))
+    lines = snapshot.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0])["document_count"] == 1
+    assert not list(tmp_path.glob("ledger.jsonl.*.rotated"))
+    assert len(ledger_path.read_text(encoding="utf-8").splitlines()) == 2
+    reloaded = IngestionLedger(ledger_path)
+    assert reloaded.get_state("doc-1") is LedgerState.PARSING
+    assert reloaded.get_state("doc-2") is LedgerState.FETCHING
+    assert [audit.new_state for audit in reloaded.get_state_history("doc-1")] == [
+        LedgerState.FETCHING,
+        LedgerState.FETCHED,
+        LedgerState.PARSING,
+    ]
+
+
+def test_interrupted_snapshot_replays_rotated_log(tmp_path: Path) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = IngestionLedger(ledger_path, auto_snapshot_interval=timedelta(days=7))
+    ledger.update_state("doc-1", LedgerState.FETCHING)
+    with ledger._lock:
+        ledger._begin_snapshot(None)
+    ledger.update_state("doc-1", LedgerState.FETCHED)
+    ledger.close()
+    assert len(list(tmp_path.glob("ledger.jsonl.*.rotated"))) == 1
+
+    reloaded = IngestionLedger(ledger_path)
+    assert reloaded.get_state("doc-1") is LedgerState.FETCHED
+    reloaded.create_snapshot()
+    assert not list(tmp_path.glob("ledger.jsonl.*.rotated"))
+    assert IngestionLedger(ledger_path).get_state("doc-1") is LedgerState.FETCHED
+
+
+def test_legacy_json_snapshot_still_loads(tmp_path: Path) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    snapshot_dir = ledger_path.with_suffix(".snapshots")
+    snapshot_dir.mkdir()
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc).isoformat()
+    legacy = {
+        "version": "1.0",
+        "created_at": created_at,
+        "document_count": 1,
+        "states": {
+            "doc-1": {
+                "state": "FETCHED",
+                "updated_at": created_at,
+                "adapter": "stub",
+                "metadata": {"source": "legacy"},
+                "retry_count": 0,
+                "history": [],
+            }
+        },
+    }
+    (snapshot_dir / "snapshot-20250101T000000Z.json").write_text(
+        json.dumps(legacy, indent=2), encoding="utf-8"
+    )
+    ledger = IngestionLedger(ledger_path)
+    document = ledger.get("doc-1")
+    assert document is not None
+    assert document.state is LedgerState.FETCHED
+    assert document.metadata == {"source": "legacy"}
+
+
 def test_stuck_documents_detection(tmp_path: Path) -> None:
     ledger = IngestionLedger(tmp_path / "ledger.jsonl", auto_snapshot_interval=timedelta(days=7))
-    ledger.update_state("doc-stuck", LedgerState.FETCHING)
-    document = ledger.get("doc-stuck")
-    assert document is not None
-    document.updated_at = datetime.now(timezone.utc) - timedelta(hours=5)
+    stale = (datetime.now(timezone.utc) - timedelta(hours=5)).timestamp()
+    ledger.merge_audits(
+        [
+            LedgerAuditRecord(
+                doc_id="doc-stuck",
+                old_state=LedgerState.PENDING,
+                new_state=LedgerState.FETCHING,
+                timestamp=stale,
+                adapter=None,
+            )
+        ]
+    )
     stuck = ledger.get_stuck_documents(threshold_hours=1)
     assert stuck and stuck[0].doc_id == "doc-stuck"
 
 
+def test_state_index_and_stuck_heap_follow_transitions(tmp_path: Path) -> None:
+    path = tmp_path / "ledger.jsonl"
+    ledger = IngestionLedger(path, auto_snapshot_interval=timedelta(days=7))
+    stale = (datetime.now(timezone.utc) - timedelta(hours=5)).timestamp()
+    ledger.merge_audits(
+        [
+            LedgerAuditRecord(
+                doc_id=f"doc-{index}",
+                old_state=LedgerState.PENDING,
+                new_state=LedgerState.FETCHING,
+                timestamp=stale,
+                adapter=None,
+            )
+            for index in range(3)
+        ]
+    )
+    ledger.update_state("doc-fresh", LedgerState.FETCHING)
+
+    assert [doc.doc_id for doc in ledger.get_stuck_documents(threshold_hours=1)] == [
+        "doc-0",
+        "doc-1",
+        "doc-2",
+    ]
+    # Detection does not consume the heap: a second call reports the same documents.
+    assert len(ledger.get_stuck_documents(threshold_hours=1)) == 3
+
+    ledger.update_state("doc-0", LedgerState.FETCHED)
+    ledger.update_state("doc-1", LedgerState.FAILED)
+    stuck = ledger.get_stuck_documents(threshold_hours=1)
+    assert [doc.doc_id for doc in stuck] == ["doc-2"]
+    assert [doc.doc_id for doc in ledger.entries(state=LedgerState.FETCHING)] == [
+        "doc-2",
+        "doc-fresh",
+    ]
+    assert [doc.doc_id for doc in ledger.get_documents_by_state(LedgerState.FETCHED)] == ["doc-0"]
+    counts = ledger.count_by_state()
+    assert counts[LedgerState.FETCHING] == 2
+    assert counts[LedgerState.FAILED] == 1
+    assert counts[LedgerState.COMPLETED] == 0
+
+    reloaded = IngestionLedger(path, auto_snapshot_interval=timedelta(days=7))
+    assert [doc.doc_id for doc in reloaded.get_stuck_documents(threshold_hours=1)] == ["doc-2"]
+    assert reloaded.count_by_state() == counts
+    assert [doc.doc_id for doc in reloaded.get_documents_by_state(LedgerState.FAILED)] == ["doc-1"]
+
+
 def test_update_state_rejects_string_values(tmp_path: Path) -> None:
     ledger = IngestionLedger(tmp_path / "ledger.jsonl")
     with pytest.raises(TypeError) as excinfo:
@@ -179,6 +322,143 @@ def test_delta_application(tmp_path: Path) -> None:
     assert loaded["doc-1"].state is LedgerState.PARSING
 
 
+def test_transition_path_writes_single_group_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = IngestionLedger(ledger_path)
+    commits: list[int] = []
+    original_commit = ledger._commit
+
+    def _counting_commit() -> None:
+        commits.append(len(ledger._pending_writes))
+        original_commit()
+
+    monkeypatch.setattr(ledger, "_commit", _counting_commit)
+    audits = ledger.transition_path(
+        "doc-1",
+        [LedgerState.FETCHING, LedgerState.FETCHED, LedgerState.PARSING],
+        adapter="stub",
+        metadata={"source": "stub"},
+    )
+    assert [audit.new_state for audit in audits] == [
+        LedgerState.FETCHING,
+        LedgerState.FETCHED,
+        LedgerState.PARSING,
+    ]
+    assert commits == [3]
+    assert len(ledger_path.read_text(encoding="utf-8").splitlines()) == 3
+    reloaded = IngestionLedger(ledger_path)
+    assert [audit.new_state for audit in reloaded.get_state_history("doc-1")] == [
+        LedgerState.FETCHING,
+        LedgerState.FETCHED,
+        LedgerState.PARSING,
+    ]
+
+
+def test_history_store_round_trips_sparse_fields(tmp_path: Path) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = IngestionLedger(ledger_path, auto_snapshot_interval=timedelta(days=7))
+    ledger.update_state("doc-1", LedgerState.FETCHING, adapter="pubmed", metadata={"a": 1})
+    ledger.update_state(
+        "doc-1",
+        LedgerState.FETCHED,
+        adapter="pubmed",
+        metadata={"a": 1, "b": [1, 2]},
+        duration_seconds=0.25,
+        parameters={"attempt": 1},
+    )
+    ledger.update_state("doc-1", LedgerState.PARSING, metadata={"b": [1, 2]})
+    ledger.update_state("doc-1", LedgerState.FAILED, error=ValueError("broken"), retry_count=2)
+    ledger.update_state("doc-1", LedgerState.RETRYING)
+    expected = [audit.to_dict() for audit in ledger.get_state_history("doc-1")]
+
+    assert [entry["metadata"] for entry in expected] == [
+        {"a": 1},
+        {"a": 1, "b": [1, 2]},
+        {"b": [1, 2]},
+        {},
+        {},
+    ]
+    assert expected[1]["parameters"] == {"attempt": 1}
+    assert expected[1]["duration_seconds"] == 0.25
+    assert expected[3]["error_type"] == "ValueError"
+    assert expected[3]["retry_count"] == 2
+    assert expected[4]["adapter"] is None
+    # Materialised records are copies; mutating them leaves the ledger untouched.
+    ledger.get_state_history("doc-1")[1].metadata["a"] = 99
+    assert [audit.to_dict() for audit in ledger.get_state_history("doc-1")] == expected
+
+    document = ledger.get("doc-1")
+    assert document is not None
+    assert [audit.to_dict() for audit in document.history] == expected
+    listed = {doc.doc_id: doc for doc in ledger.entries()}
+    assert [audit.to_dict() for audit in listed["doc-1"].history] == expected
+    by_state = ledger.get_documents_by_state(listed["doc-1"].state)
+    assert [audit.to_dict() for audit in by_state[0].history] == expected
+    assert all(not doc.history for doc in ledger.entries(with_history=False))
+
+    persisted = [LedgerAuditRecord.from_dict(entry).to_dict() for entry in expected]
+    reloaded = IngestionLedger(ledger_path, auto_snapshot_interval=timedelta(days=7))
+    assert [audit.to_dict() for audit in reloaded.get_state_history("doc-1")] == persisted
+    reloaded.create_snapshot()
+    from_snapshot = IngestionLedger(ledger_path, auto_snapshot_interval=timedelta(days=7))
+    assert [audit.to_dict() for audit in from_snapshot.get_state_history("doc-1")] == persisted
+
+
+def test_history_store_limit_hides_later_records() -> None:
+    store = LedgerHistoryStore()
+    timestamp = datetime.now(timezone.utc).timestamp()
+    for offset, (old, new) in enumerate(
+        [
+            (LedgerState.PENDING, LedgerState.FETCHING),
+            (LedgerState.FETCHING, LedgerState.FETCHED),
+        ]
+    ):
+        store.append(
+            LedgerAuditRecord(
+                doc_id="doc-1",
+                old_state=old,
+                new_state=new,
+                timestamp=timestamp + offset,
+                adapter="stub",
+            )
+        )
+    limit = len(store)
+    store.append(
+        LedgerAuditRecord(
+            doc_id="doc-1",
+            old_state=LedgerState.FETCHED,
+            new_state=LedgerState.PARSING,
+            timestamp=timestamp + 2,
+            adapter="stub",
+        )
+    )
+    assert [audit.new_state for audit in store.history("doc-1", limit=limit)] == [
+        LedgerState.FETCHING,
+        LedgerState.FETCHED,
+    ]
+    assert len(store.history("doc-1")) == 3
+    assert store.history("missing") == []
+    assert abs(store.history("doc-1")[0].timestamp - timestamp) < 1e-6
+
+
+def test_update_states_batch_rejects_invalid_batch_atomically(tmp_path: Path) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = IngestionLedger(ledger_path)
+    with pytest.raises(InvalidStateTransition):
+        ledger.update_states_batch(
+            [
+                LedgerTransition("doc-1", LedgerState.FETCHING),
+                LedgerTransition("doc-2", LedgerState.FETCHING),
+                LedgerTransition("doc-1", LedgerState.COMPLETED),
+            ]
+        )
+    assert ledger.get("doc-1") is None
+    assert ledger.get("doc-2") is None
+    assert not ledger_path.exists() or ledger_path.read_text(encoding="utf-8") == ""
+
+
 def test_terminal_retryable_helpers() -> None:
     assert is_terminal_state(LedgerState.COMPLETED) is True
     assert is_retryable_state(LedgerState.FAILED) is True
@@ -94,6 +94,7 @@ def test_retrieval_service_combines_scores() -> None:
     service = _service()
     request = RetrievalRequest(query="heart failure", top_k=5)
     response = asyncio.run(service.retrieve(request))
+    service.close()
     assert response.results, "Expected fused results"
     first = response.results[0]
     assert first.scores.fused is not None
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from Medical_KG.chunking.chunker import Chunk
+from Medical_KG.chunking.indexing import ChunkIndexer
+from Medical_KG.chunking.tagger import ClinicalIntent
+from Medical_KG.embeddings.qwen import QwenEmbeddingClient
+from Medical_KG.utils.vectors import (
+    adjacent_cosine,
+    as_matrix,
+    cosine,
+    mean_pool,
+    normalize_rows,
+    rowwise_cosine,
+    to_lists,
+)
+
+
+def _reference_cosine(left: list[float], right: list[float]) -> float:
+    dot = sum(a * b for a, b in zip(left, right))
+    norm_left = math.sqrt(sum(a * a for a in left)) or 1.0
+    norm_right = math.sqrt(sum(b * b for b in right)) or 1.0
+    return dot / (norm_left * norm_right)
+
+
+def test_batched_similarities_match_pairwise_reference() -> None:
+    rows = [[1.0, 0.0, 2.0], [0.5, 1.0, 2.0], [0.0, 0.0, 0.0], [-1.0, 3.0, 0.25]]
+    matrix = as_matrix(rows)
+    assert matrix.dtype == np.float32 and matrix.flags.c_contiguous
+
+    expected = [_reference_cosine(left, right) for left, right in zip(rows, rows[1:])]
+    assert adjacent_cosine(matrix).tolist() == pytest.approx(expected, abs=1e-6)
+    assert rowwise_cosine(rows[:2], rows[2:]).tolist() == pytest.approx(
+        [_reference_cosine(rows[0], rows[2]), _reference_cosine(rows[1], rows[3])], abs=1e-6
+    )
+    assert cosine(rows[0], rows[3]) == pytest.approx(_reference_cosine(rows[0], rows[3]), abs=1e-6)
+
+    norms = np.linalg.norm(normalize_rows(matrix), axis=1)
+    assert norms.tolist() == pytest.approx([1.0, 1.0, 0.0, 1.0], abs=1e-6)
+    assert to_lists(mean_pool(rows[:2])) == pytest.approx([0.75, 0.5, 2.0])
+    assert as_matrix([], dimension=3).shape == (0, 3)
+    assert adjacent_cosine(rows[:1]).size == 0
+
+
+def test_qwen_embed_array_matches_list_api() -> None:
+    client = QwenEmbeddingClient(dimension=16)
+    matrix = client.embed_array(["alpha", "beta"])
+    assert matrix.shape == (2, 16) and matrix.dtype == np.float32
+    assert to_lists(matrix) == client.embed(["alpha", "beta"])
+    assert client.embed(["alpha"])[0] == client._deterministic_vector("alpha")
+
+
+def _chunk(index: int, embedding: list[float] | None) -> Chunk:
+    return Chunk(
+        chunk_id=f"c{index}",
+        doc_id="doc",
+        text=f"chunk {index}",
+        start=index,
+        end=index + 1,
+        tokens=2,
+        intent=ClinicalIntent.GENERAL,
+        embedding_qwen=embedding,
+    )
+
+
+def test_neighbor_merge_uses_matrix_and_skips_missing_embeddings() -> None:
+    chunks = [
+        _chunk(0, [1.0, 0.0]),
+        _chunk(1, [0.9, 0.1]),
+        _chunk(2, None),
+        _chunk(3, [0.0, 1.0]),
+        _chunk(4, [0.1, 1.0]),
+    ]
+    indexer = ChunkIndexer()
+    merges = indexer.neighbor_merge(chunks, min_cosine=0.9)
+    assert [(left.chunk_id, right.chunk_id) for left, right in merges] == [
+        ("c0", "c1"),
+        ("c3", "c4"),
+    ]
+
+    matrix = as_matrix([[1.0, 0.0], [0.0, 1.0], [0.0, 1.0]])
+    merges = indexer.neighbor_merge(chunks[:3], min_cosine=0.9, embeddings=matrix)
+    assert [(left.chunk_id, right.chunk_id) for left, right in merges] == [("c1", "c2")]